@@ -1,13 +1,29 @@
-from fastapi import FastAPI, Request, APIRouter
+from fastapi import FastAPI, Request, APIRouter, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse, FileResponse
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
+import anyio
 
 from app.routers import auth, users, folders, documents, approval_forms, approval_routes, applications
+from app.services.supabase_auth import token_verifier
+from app.services.upload_sessions import keep_upload_sessions_swept
+from app.utils.auth import password_hasher
 
-app = FastAPI(title="Document Management System API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    async with anyio.create_task_group() as tasks:
+        if token_verifier.jwks_url:
+            tasks.start_soon(token_verifier.keep_keys_fresh)
+        tasks.start_soon(keep_upload_sessions_swept)
+        yield
+        tasks.cancel_scope.cancel()
+
+
+app = FastAPI(title="Document Management System API", lifespan=lifespan)
 
 # Disable CORS. Do not remove this for full-stack development.
 app.add_middleware(
@@ -16,6 +32,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # Allows all methods
     allow_headers=["*"],  # Allows all headers
+    expose_headers=["X-Next-Cursor", "ETag", "Content-Range", "Accept-Ranges"],
 )
 
 api_router = APIRouter(prefix="/api")
@@ -33,17 +50,16 @@ app.include_router(api_router)
 os.makedirs("uploads", exist_ok=True)
 os.makedirs("frontend", exist_ok=True)
 
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
 app.mount("/assets", StaticFiles(directory="frontend/assets"), name="assets")
 
 @app.get("/healthz")
 async def healthz():
-    return {"status": "ok"}
+    return {"status": "ok", "password_hashing": password_hasher.stats()}
 
 @app.get("/{full_path:path}", response_class=HTMLResponse)
 async def serve_frontend(request: Request, full_path: str):
     if full_path.startswith("api/") or full_path == "healthz" or full_path.startswith("uploads/"):
-        return {"detail": "Not Found"}
+        raise HTTPException(status_code=404, detail="Not Found")
     
     index_path = Path("frontend/index.html")
     if index_path.exists():
@@ -35,12 +35,28 @@ class Folder(BaseModel):
     id: str
     name: str
     parent_id: Optional[str] = None
+    # Materialized path of folder ids from the root, e.g. "/root_id/child_id/".
+    path: str = ""
     created_by: str
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
     access_list: List[FolderAccess] = []
 
 
+class FolderStats(BaseModel):
+    folder_id: str
+    document_count: int = 0
+    total_size: int = 0
+
+
+class ProcessingStatus(str, Enum):
+    PENDING = "pending"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
 class Document(BaseModel):
     id: str
     name: str
@@ -49,11 +65,59 @@ class Document(BaseModel):
     file_type: str
     file_size: int
     created_by: str
+    content_hash: Optional[str] = None
+    version: int = 1
+    processing_status: Optional[ProcessingStatus] = None
+    artifacts: List[str] = []
+    created_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now)
+    metadata: Dict[str, Any] = {}
+
+
+class DocumentVersion(BaseModel):
+    document_id: str
+    version: int
+    file_path: str
+    file_type: str
+    file_size: int
+    content_hash: Optional[str] = None
+    created_by: str
+    created_at: datetime = Field(default_factory=datetime.now)
+
+
+class UploadSession(BaseModel):
+    id: str
+    name: str
+    folder_id: str
+    file_type: str
+    file_size: int
+    chunk_size: int
+    created_by: str
+    expires_at: datetime
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
     metadata: Dict[str, Any] = {}
 
 
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class Job(BaseModel):
+    id: str
+    kind: str
+    target_id: str
+    created_by: str
+    status: JobStatus = JobStatus.PENDING
+    progress: Dict[str, int] = {}
+    error: Optional[str] = None
+    created_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now)
+
+
 class FormFieldType(str, Enum):
     TEXT = "text"
     TEXTAREA = "textarea"
@@ -98,9 +162,6 @@ class ApprovalStatus(str, Enum):
 class ApprovalStep(BaseModel):
     id: str
     approver_id: str
-    status: ApprovalStatus = ApprovalStatus.PENDING
-    comment: Optional[str] = None
-    approved_at: Optional[datetime] = None
     order: int
 
 
@@ -114,6 +175,14 @@ class ApprovalRoute(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.now)
 
 
+class ApplicationStepRecord(BaseModel):
+    step_id: str
+    approver_id: str
+    status: ApprovalStatus
+    comment: Optional[str] = None
+    approved_at: datetime = Field(default_factory=datetime.now)
+
+
 class Application(BaseModel):
     id: str
     form_id: str
@@ -122,6 +191,7 @@ class Application(BaseModel):
     current_step: int = 0
     status: ApprovalStatus = ApprovalStatus.DRAFT
     form_data: Dict[str, Any] = {}
+    step_history: List[ApplicationStepRecord] = []
     document_id: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
@@ -1,15 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from typing import List
 from app.utils.auth import get_current_user
+from app.utils.pagination import PageParams
 from app.schemas.schemas import (
     ApplicationCreate, ApplicationResponse, ApplicationUpdate,
     ApplicationSubmit, ApplicationApprove, ApplicationReject
 )
-from app.services.database import (
-    create_application, get_application_by_id, get_applications_by_applicant,
-    get_applications_for_approval, update_application, delete_application,
-    submit_application, approve_application_step, reject_application_step
-)
+from app.services.processing import schedule_processing
+from app.services.repository import repo
 from app.models.models import User, UserRole, ApprovalStatus
 
 router = APIRouter(
@@ -24,7 +22,7 @@ async def create_new_application(
     application: ApplicationCreate, 
     current_user: User = Depends(get_current_user)
 ):
-    new_application = create_application(
+    new_application = await repo.applications.create(
         form_id=application.form_id,
         route_id=application.route_id,
         applicant_id=current_user.id,
@@ -35,22 +33,22 @@ async def create_new_application(
 
 
 @router.get("/", response_model=List[ApplicationResponse])
-async def read_applications(current_user: User = Depends(get_current_user)):
-    applications = get_applications_by_applicant(current_user.id)
+async def read_applications(page: PageParams = Depends(), current_user: User = Depends(get_current_user)):
+    applications = await repo.applications.by_applicant(current_user.id, after=page.after, limit=page.limit)
     
-    return applications
+    return page.respond(applications, ApplicationResponse)
 
 
 @router.get("/for-approval", response_model=List[ApplicationResponse])
-async def read_applications_for_approval(current_user: User = Depends(get_current_user)):
-    applications = get_applications_for_approval(current_user.id)
+async def read_applications_for_approval(page: PageParams = Depends(), current_user: User = Depends(get_current_user)):
+    applications = await repo.applications.for_approval(current_user.id, after=page.after, limit=page.limit)
     
-    return applications
+    return page.respond(applications, ApplicationResponse)
 
 
 @router.get("/{application_id}", response_model=ApplicationResponse)
 async def read_application(application_id: str, current_user: User = Depends(get_current_user)):
-    application = get_application_by_id(application_id)
+    application = await repo.applications.by_id(application_id)
     if not application:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -76,7 +74,7 @@ async def update_application_info(
     application_data: ApplicationUpdate, 
     current_user: User = Depends(get_current_user)
 ):
-    application = get_application_by_id(application_id)
+    application = await repo.applications.by_id(application_id)
     if not application:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -91,14 +89,14 @@ async def update_application_info(
         )
     
     update_data = application_data.dict(exclude_unset=True)
-    updated_application = update_application(application_id, **update_data)
+    updated_application = await repo.applications.update(application_id, **update_data)
     
     return updated_application
 
 
 @router.delete("/{application_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_application_item(application_id: str, current_user: User = Depends(get_current_user)):
-    application = get_application_by_id(application_id)
+    application = await repo.applications.by_id(application_id)
     if not application:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -112,7 +110,7 @@ async def delete_application_item(application_id: str, current_user: User = Depe
             detail="Not enough permissions to delete this application or application is not in draft status"
         )
     
-    delete_application(application_id)
+    await repo.applications.delete(application_id)
     
     return None
 
@@ -122,7 +120,7 @@ async def submit_application_for_approval(
     submit_data: ApplicationSubmit,
     current_user: User = Depends(get_current_user)
 ):
-    application = get_application_by_id(submit_data.application_id)
+    application = await repo.applications.by_id(submit_data.application_id)
     if not application:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -136,7 +134,7 @@ async def submit_application_for_approval(
             detail="Not enough permissions to submit this application or application is not in draft status"
         )
     
-    submitted_application = submit_application(submit_data.application_id)
+    submitted_application = await repo.applications.submit(submit_data.application_id)
     if not submitted_application:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -151,14 +149,14 @@ async def approve_application(
     approve_data: ApplicationApprove,
     current_user: User = Depends(get_current_user)
 ):
-    application = get_application_by_id(approve_data.application_id)
+    application = await repo.applications.by_id(approve_data.application_id)
     if not application:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Application not found"
         )
     
-    approved_application = approve_application_step(
+    approved_application = await repo.applications.approve_step(
         approve_data.application_id,
         current_user.id,
         approve_data.comment
@@ -170,6 +168,12 @@ async def approve_application(
             detail="Failed to approve application or you are not the current approver"
         )
     
+    if approved_application.document_id:
+        # The PDF is rendered in the background; the document reports its progress.
+        document = await repo.documents.by_id(approved_application.document_id)
+        if document:
+            await schedule_processing(document)
+    
     return approved_application
 
 
@@ -178,14 +182,14 @@ async def reject_application(
     reject_data: ApplicationReject,
     current_user: User = Depends(get_current_user)
 ):
-    application = get_application_by_id(reject_data.application_id)
+    application = await repo.applications.by_id(reject_data.application_id)
     if not application:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Application not found"
         )
     
-    rejected_application = reject_application_step(
+    rejected_application = await repo.applications.reject_step(
         reject_data.application_id,
         current_user.id,
         reject_data.comment
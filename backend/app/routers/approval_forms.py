@@ -1,14 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from typing import List, Optional
 from app.utils.auth import get_current_user
+from app.utils.pagination import PageParams
 from app.schemas.schemas import (
     ApprovalFormCreate, ApprovalFormResponse, ApprovalFormUpdate,
     FormInitialize
 )
-from app.services.database import (
-    create_approval_form, get_approval_form_by_id, get_all_approval_forms,
-    update_approval_form, delete_approval_form
-)
+from app.services.repository import repo
 from app.models.models import User, UserRole
 
 router = APIRouter(
@@ -23,7 +21,7 @@ async def create_new_approval_form(
     form: ApprovalFormCreate, 
     current_user: User = Depends(get_current_user)
 ):
-    new_form = create_approval_form(
+    new_form = await repo.forms.create(
         name=form.name,
         created_by=current_user.id,
         description=form.description,
@@ -35,15 +33,15 @@ async def create_new_approval_form(
 
 
 @router.get("/", response_model=List[ApprovalFormResponse])
-async def read_approval_forms(current_user: User = Depends(get_current_user)):
-    forms = get_all_approval_forms()
+async def read_approval_forms(page: PageParams = Depends(), current_user: User = Depends(get_current_user)):
+    forms = await repo.forms.all(after=page.after, limit=page.limit)
     
-    return forms
+    return page.respond(forms, ApprovalFormResponse)
 
 
 @router.get("/{form_id}", response_model=ApprovalFormResponse)
 async def read_approval_form(form_id: str, current_user: User = Depends(get_current_user)):
-    form = get_approval_form_by_id(form_id)
+    form = await repo.forms.by_id(form_id)
     if not form:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -59,7 +57,7 @@ async def update_approval_form_info(
     form_data: ApprovalFormUpdate, 
     current_user: User = Depends(get_current_user)
 ):
-    form = get_approval_form_by_id(form_id)
+    form = await repo.forms.by_id(form_id)
     if not form:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -73,14 +71,14 @@ async def update_approval_form_info(
         )
     
     update_data = form_data.dict(exclude_unset=True)
-    updated_form = update_approval_form(form_id, **update_data)
+    updated_form = await repo.forms.update(form_id, **update_data)
     
     return updated_form
 
 
 @router.delete("/{form_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_approval_form_item(form_id: str, current_user: User = Depends(get_current_user)):
-    form = get_approval_form_by_id(form_id)
+    form = await repo.forms.by_id(form_id)
     if not form:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -93,7 +91,7 @@ async def delete_approval_form_item(form_id: str, current_user: User = Depends(g
             detail="Not enough permissions to delete this form"
         )
     
-    delete_approval_form(form_id)
+    await repo.forms.delete(form_id)
     
     return None
 
@@ -103,7 +101,7 @@ async def initialize_form(
     init_data: FormInitialize,
     current_user: User = Depends(get_current_user)
 ):
-    form = get_approval_form_by_id(init_data.form_id)
+    form = await repo.forms.by_id(init_data.form_id)
     if not form:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,14 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from typing import List
+from uuid import uuid4
 from app.utils.auth import get_current_user
+from app.utils.pagination import PageParams
 from app.schemas.schemas import (
-    ApprovalRouteCreate, ApprovalRouteResponse, ApprovalRouteUpdate
+    ApprovalRouteCreate, ApprovalRouteResponse, ApprovalRouteUpdate, ApprovalStepCreate
 )
-from app.services.database import (
-    create_approval_route, get_approval_route_by_id, get_all_approval_routes,
-    update_approval_route, delete_approval_route
-)
-from app.models.models import User, UserRole
+from app.services.repository import repo
+from app.models.models import User, UserRole, ApprovalStep
 
 router = APIRouter(
     prefix="/approval-routes",
@@ -17,31 +16,41 @@ router = APIRouter(
 )
 
 
+def build_route_steps(steps: List[ApprovalStepCreate], existing: List[ApprovalStep] = ()) -> List[ApprovalStep]:
+    # A step keeps its id across edits, matched by its order, so the step ids
+    # recorded in application histories stay valid.
+    step_ids = {step.order: step.id for step in existing}
+    return [
+        ApprovalStep(id=step_ids.get(step.order) or str(uuid4()), approver_id=step.approver_id, order=step.order)
+        for step in steps
+    ]
+
+
 @router.post("/", response_model=ApprovalRouteResponse)
 async def create_new_approval_route(
     route: ApprovalRouteCreate, 
     current_user: User = Depends(get_current_user)
 ):
-    new_route = create_approval_route(
+    new_route = await repo.routes.create(
         name=route.name,
         created_by=current_user.id,
         description=route.description,
-        steps=route.steps
+        steps=build_route_steps(route.steps)
     )
     
     return new_route
 
 
 @router.get("/", response_model=List[ApprovalRouteResponse])
-async def read_approval_routes(current_user: User = Depends(get_current_user)):
-    routes = get_all_approval_routes()
+async def read_approval_routes(page: PageParams = Depends(), current_user: User = Depends(get_current_user)):
+    routes = await repo.routes.all(after=page.after, limit=page.limit)
     
-    return routes
+    return page.respond(routes, ApprovalRouteResponse)
 
 
 @router.get("/{route_id}", response_model=ApprovalRouteResponse)
 async def read_approval_route(route_id: str, current_user: User = Depends(get_current_user)):
-    route = get_approval_route_by_id(route_id)
+    route = await repo.routes.by_id(route_id)
     if not route:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -57,7 +66,7 @@ async def update_approval_route_info(
     route_data: ApprovalRouteUpdate, 
     current_user: User = Depends(get_current_user)
 ):
-    route = get_approval_route_by_id(route_id)
+    route = await repo.routes.by_id(route_id)
     if not route:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -71,14 +80,21 @@ async def update_approval_route_info(
         )
     
     update_data = route_data.dict(exclude_unset=True)
-    updated_route = update_approval_route(route_id, **update_data)
+    if route_data.steps is not None:
+        update_data["steps"] = build_route_steps(route_data.steps, route.steps)
+    updated_route = await repo.routes.update(route_id, **update_data)
+    if not updated_route:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Route steps cannot change while applications are pending on it"
+        )
     
     return updated_route
 
 
 @router.delete("/{route_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_approval_route_item(route_id: str, current_user: User = Depends(get_current_user)):
-    route = get_approval_route_by_id(route_id)
+    route = await repo.routes.by_id(route_id)
     if not route:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -91,6 +107,6 @@ async def delete_approval_route_item(route_id: str, current_user: User = Depends
             detail="Not enough permissions to delete this route"
         )
     
-    delete_approval_route(route_id)
+    await repo.routes.delete(route_id)
     
     return None
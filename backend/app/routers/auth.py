@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Form
+from fastapi import APIRouter, Depends, HTTPException, status, Form, Header
 from fastapi.security import OAuth2PasswordRequestForm
 from app.schemas.schemas import Token, UserCreate, UserResponse
 from app.services.supabase import supabase
+from app.services.supabase_auth import InvalidToken, get_profile, token_verifier
 from typing import Optional
 
 router = APIRouter(tags=["authentication"])
@@ -88,7 +89,7 @@ async def register_user(user_data: UserCreate):
 
 
 @router.get("/me", response_model=UserResponse)
-async def read_users_me(authorization: Optional[str] = None):
+async def read_users_me(authorization: Optional[str] = Header(None)):
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -99,39 +100,29 @@ async def read_users_me(authorization: Optional[str] = None):
     token = authorization.replace("Bearer ", "")
     
     try:
-        user = supabase.auth.get_user(token)
-        
-        if not user or not user.user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
-        user_query = supabase.table("users").select("*").eq("id", user.user.id).execute()
-        
-        if not user_query.data or len(user_query.data) == 0:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found"
-            )
-        
-        user_data = user_query.data[0]
-        
-        return UserResponse(
-            id=user_data["id"],
-            username=user_data["username"],
-            email=user_data["email"],
-            full_name=user_data["full_name"],
-            role=user_data["role"]
-        )
-    
-    except Exception as e:
+        claims = await token_verifier.claims(token)
+    except InvalidToken as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Authentication failed: {str(e)}",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    
+    try:
+        user_data = await get_profile(claims["sub"])
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Failed to load user profile: {str(e)}"
+        )
+    
+    if not user_data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    
+    return UserResponse(**user_data)
 
 
 @router.get("/debug/users")
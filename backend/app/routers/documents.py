@@ -1,15 +1,38 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query, Request
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+import copy
 import json
+import logging
+import mimetypes
 import os
-import shutil
+import anyio
 from app.utils.auth import get_current_user
-from app.schemas.schemas import DocumentCreate, DocumentResponse, DocumentUpdate
-from app.services.database import (
-    create_document, get_document_by_id, get_documents_by_folder,
-    update_document, delete_document, get_folder_by_id
+from app.utils.files import file_response
+from app.utils.pagination import MAX_PAGE_SIZE, PageParams
+from app.utils.permissions import (
+    FolderPermissionChecker, get_permission_checker, get_folder_or_404, require_document_permission
 )
-from app.models.models import User, UserRole, FolderPermission
+from app.schemas.schemas import (
+    DocumentCreate, DocumentResponse, DocumentUpdate, DocumentVersionResponse,
+    DocumentBatchMove, DocumentBatchMetadata, DocumentBatchDelete, BulkUploadError, BulkUploadResponse,
+    UploadSessionCreate, UploadSessionResponse, UploadChunkResponse
+)
+from app.services.deletion import delete_documents_and_files
+from app.services.processing import schedule_processing
+from app.services.repository import repo
+from app.services.upload_sessions import session_expiry
+from app.services.storage import (
+    BULK_UPLOAD_CONCURRENCY, MAX_UPLOAD_SIZE, UPLOAD_CHUNK_SIZE, ArchiveMember, InvalidChunk,
+    ReceivedUpload, UploadTooLarge, assemble_chunks, blob_lock, commit_blob, discard_chunks,
+    artifact_path, discard_upload, list_chunks, receive_archive, receive_upload, remove_blob,
+    save_chunk
+)
+from app.models.models import User, UserRole, Document, DocumentVersion, FolderPermission, UploadSession
+
+DEFAULT_PAGE_SIZE = 100
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/documents",
@@ -23,205 +46,597 @@ async def upload_document(
     file: UploadFile = File(...),
     folder_id: str = Form(...),
     metadata: Optional[str] = Form(None),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    checker: FolderPermissionChecker = Depends(get_permission_checker)
 ):
-    folder = get_folder_by_id(folder_id)
-    if not folder:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Folder not found"
-        )
+    folder = await get_folder_or_404(folder_id)
+    await checker.require(folder, FolderPermission.WRITE, "Not enough permissions to upload to this folder")
     
-    has_permission = False
-    for access in folder.access_list:
-        if access.user_id == current_user.id and access.permission in [FolderPermission.WRITE, FolderPermission.ADMIN]:
-            has_permission = True
-            break
+    metadata_dict = parse_metadata(metadata)
     
-    if not has_permission and current_user.role != UserRole.ADMIN:
+    try:
+        received = await receive_upload(file)
+    except UploadTooLarge as e:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions to upload to this folder"
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
         )
     
-    os.makedirs("uploads", exist_ok=True)
-    
-    file_path = f"uploads/{file.filename}"
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-    
-    metadata_dict = {}
-    if metadata:
-        try:
-            metadata_dict = json.loads(metadata)
-        except json.JSONDecodeError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid metadata format"
-            )
-    
-    document = create_document(
+    return await store_document(
+        received,
         name=file.filename,
         folder_id=folder_id,
-        file_path=file_path,
         file_type=file.content_type or "application/octet-stream",
-        file_size=os.path.getsize(file_path),
         created_by=current_user.id,
         metadata=metadata_dict
     )
+
+
+def parse_metadata(metadata: Optional[str]) -> Dict[str, Any]:
+    if not metadata:
+        return {}
+    try:
+        return json.loads(metadata)
+    except json.JSONDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid metadata format"
+        )
+
+
+async def store_document(received: ReceivedUpload, **fields):
+    """Commit a received upload to the blob store, create its document and queue its processing."""
+    async with blob_lock([received.sha256]):
+        try:
+            stored = await commit_blob(received)
+        except BaseException:
+            await discard_upload(received)
+            raise
+        try:
+            document = await repo.documents.create(
+                file_path=stored.path,
+                file_size=stored.size,
+                content_hash=stored.sha256,
+                **fields
+            )
+        except BaseException:
+            if stored.created:
+                await remove_blob(stored.sha256)
+            raise
     
-    return document
+    return await schedule_processing(document)
 
 
-@router.get("/", response_model=List[DocumentResponse])
-async def read_documents(folder_id: Optional[str] = None, current_user: User = Depends(get_current_user)):
-    if folder_id:
-        folder = get_folder_by_id(folder_id)
-        if not folder:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Folder not found"
+async def store_version(document: Document, received: ReceivedUpload, file_type: str, created_by: str) -> Document:
+    """Commit a received upload as the new current version of `document` and queue its processing."""
+    if received.sha256 == document.content_hash:
+        await discard_upload(received)
+        return document
+    
+    async with blob_lock([received.sha256]):
+        try:
+            stored = await commit_blob(received)
+        except BaseException:
+            await discard_upload(received)
+            raise
+        try:
+            updated = await repo.documents.add_version(
+                document.id,
+                file_path=stored.path,
+                file_type=file_type,
+                file_size=stored.size,
+                content_hash=stored.sha256,
+                created_by=created_by
             )
-        
-        has_access = False
-        for access in folder.access_list:
-            if access.user_id == current_user.id:
-                has_access = True
-                break
-        
-        if not has_access and current_user.role != UserRole.ADMIN:
+        except BaseException:
+            if stored.created:
+                await remove_blob(stored.sha256)
+            raise
+        if not updated:
+            if stored.created:
+                await remove_blob(stored.sha256)
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not enough permissions to access this folder"
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Document not found"
             )
-        
-        documents = get_documents_by_folder(folder_id)
-    else:
-        documents = []
-        
-    return documents
+    
+    return await schedule_processing(updated)
 
 
-@router.get("/{document_id}", response_model=DocumentResponse)
-async def read_document(document_id: str, current_user: User = Depends(get_current_user)):
-    document = get_document_by_id(document_id)
-    if not document:
+async def get_documents_or_404(document_ids: List[str]) -> List[Document]:
+    document_ids = list(dict.fromkeys(document_ids))
+    documents = await repo.documents.by_ids(document_ids)
+    missing = set(document_ids) - {document.id for document in documents}
+    if missing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Document not found"
+            detail=f"Documents not found: {', '.join(sorted(missing))}"
         )
+    return documents
+
+
+async def require_document_folders(checker: FolderPermissionChecker, documents: List[Document],
+                                   level: FolderPermission, detail: str) -> None:
+    """Check `level` once per folder holding any of `documents`."""
+    for folder_id in {document.folder_id for document in documents}:
+        folder = await get_folder_or_404(folder_id)
+        await checker.require(folder, level, detail)
+
+
+@router.post("/batch", response_model=BulkUploadResponse)
+async def upload_documents(
+    files: List[UploadFile] = File(...),
+    folder_id: str = Form(...),
+    metadata: Optional[str] = Form(None),
+    extract_archives: bool = Form(False),
+    current_user: User = Depends(get_current_user),
+    checker: FolderPermissionChecker = Depends(get_permission_checker)
+):
+    folder = await get_folder_or_404(folder_id)
+    await checker.require(folder, FolderPermission.WRITE, "Not enough permissions to upload to this folder")
+    
+    metadata_dict = parse_metadata(metadata)
+    result = BulkUploadResponse()
+    limiter = anyio.CapacityLimiter(BULK_UPLOAD_CONCURRENCY)
+    
+    async def upload(file: UploadFile):
+        async with limiter:
+            if not file.filename:
+                result.errors.append(BulkUploadError(name="", detail="File has no name"))
+                return
+            try:
+                members = await receive_archive(file) if extract_archives else None
+                if members is None:
+                    try:
+                        members = [ArchiveMember(name=file.filename, upload=await receive_upload(file))]
+                    except UploadTooLarge as e:
+                        members = [ArchiveMember(name=file.filename, error=str(e))]
+                    file_type = file.content_type
+                else:
+                    file_type = None
+            except Exception:
+                logger.exception("Receiving upload %s failed", file.filename)
+                result.errors.append(BulkUploadError(name=file.filename, detail="Failed to receive file"))
+                return
+            
+            # Each member succeeds or fails on its own; documents already
+            # created stay and are reported alongside the errors.
+            for member in members:
+                name = os.path.basename(member.name)
+                if member.error or not name:
+                    if member.upload:
+                        await discard_upload(member.upload)
+                    result.errors.append(BulkUploadError(name=member.name, detail=member.error or "File has no name"))
+                    continue
+                try:
+                    document = await store_document(
+                        member.upload,
+                        name=name,
+                        folder_id=folder_id,
+                        file_type=file_type or mimetypes.guess_type(name)[0] or "application/octet-stream",
+                        created_by=current_user.id,
+                        metadata=copy.deepcopy(metadata_dict)
+                    )
+                except Exception:
+                    logger.exception("Storing upload %s failed", name)
+                    result.errors.append(BulkUploadError(name=name, detail="Failed to store document"))
+                    continue
+                result.documents.append(document)
+    
+    async with anyio.create_task_group() as task_group:
+        for file in files:
+            task_group.start_soon(upload, file)
+    
+    return result
+
+
+@router.post("/batch/move", response_model=List[DocumentResponse])
+async def move_documents(
+    batch: DocumentBatchMove,
+    checker: FolderPermissionChecker = Depends(get_permission_checker)
+):
+    documents = await get_documents_or_404(batch.document_ids)
+    await require_document_folders(
+        checker, documents, FolderPermission.WRITE, "Not enough permissions to update these documents"
+    )
+    target_folder = await get_folder_or_404(batch.folder_id, "Target folder not found")
+    await checker.require(
+        target_folder, FolderPermission.WRITE,
+        "Not enough permissions to move document to target folder"
+    )
+    
+    return await repo.documents.update_many({
+        document.id: {"folder_id": batch.folder_id} for document in documents
+    })
+
+
+@router.post("/batch/metadata", response_model=List[DocumentResponse])
+async def update_documents_metadata(
+    batch: DocumentBatchMetadata,
+    checker: FolderPermissionChecker = Depends(get_permission_checker)
+):
+    documents = await get_documents_or_404(batch.document_ids)
+    await require_document_folders(
+        checker, documents, FolderPermission.WRITE, "Not enough permissions to update these documents"
+    )
+    
+    return await repo.documents.update_many({
+        document.id: {"metadata": batch.metadata if batch.replace else {**document.metadata, **batch.metadata}}
+        for document in documents
+    })
+
+
+@router.post("/batch/delete", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_documents(
+    batch: DocumentBatchDelete,
+    checker: FolderPermissionChecker = Depends(get_permission_checker)
+):
+    documents = await get_documents_or_404(batch.document_ids)
+    await require_document_folders(
+        checker, documents, FolderPermission.ADMIN, "Not enough permissions to delete these documents"
+    )
     
-    folder = get_folder_by_id(document.folder_id)
-    if not folder:
+    await delete_documents_and_files([document.id for document in documents])
+    return None
+
+
+def chunk_count(session: UploadSession) -> int:
+    return -(-session.file_size // session.chunk_size)
+
+
+def chunk_length(session: UploadSession, index: int) -> int:
+    return min(session.chunk_size, session.file_size - index * session.chunk_size)
+
+
+async def get_upload_session_or_404(session_id: str, user: User) -> UploadSession:
+    session = await repo.uploads.by_id(session_id)
+    if not session or session.created_by != user.id or session.expires_at <= datetime.now():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Folder not found"
+            detail="Upload session not found"
         )
+    return session
+
+
+async def upload_session_response(session: UploadSession) -> UploadSessionResponse:
+    chunks = await list_chunks(session.id)
+    return UploadSessionResponse(
+        **session.model_dump(),
+        chunk_count=chunk_count(session),
+        received_chunks=sorted(index for index, size in chunks.items() if size == chunk_length(session, index))
+    )
+
+
+@router.post("/uploads", response_model=UploadSessionResponse)
+async def create_upload_session(
+    upload: UploadSessionCreate,
+    current_user: User = Depends(get_current_user),
+    checker: FolderPermissionChecker = Depends(get_permission_checker)
+):
+    folder = await get_folder_or_404(upload.folder_id)
+    await checker.require(folder, FolderPermission.WRITE, "Not enough permissions to upload to this folder")
     
-    has_access = False
-    for access in folder.access_list:
-        if access.user_id == current_user.id:
-            has_access = True
-            break
-    
-    if not has_access and current_user.role != UserRole.ADMIN:
+    if upload.file_size > MAX_UPLOAD_SIZE:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions to access this document"
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(UploadTooLarge(MAX_UPLOAD_SIZE))
         )
     
-    return document
+    session = await repo.uploads.create(
+        name=upload.name,
+        folder_id=upload.folder_id,
+        file_type=upload.file_type,
+        file_size=upload.file_size,
+        chunk_size=UPLOAD_CHUNK_SIZE,
+        created_by=current_user.id,
+        expires_at=session_expiry(),
+        metadata=upload.metadata
+    )
+    
+    return await upload_session_response(session)
 
 
-@router.put("/{document_id}", response_model=DocumentResponse)
-async def update_document_info(
-    document_id: str, 
-    document_data: DocumentUpdate, 
+@router.get("/uploads/{session_id}", response_model=UploadSessionResponse)
+async def read_upload_session(
+    session_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    session = await get_upload_session_or_404(session_id, current_user)
+    return await upload_session_response(session)
+
+
+@router.put("/uploads/{session_id}/chunks/{index}", response_model=UploadChunkResponse)
+async def upload_chunk(
+    session_id: str,
+    index: int,
+    request: Request,
     current_user: User = Depends(get_current_user)
 ):
-    document = get_document_by_id(document_id)
-    if not document:
+    session = await get_upload_session_or_404(session_id, current_user)
+    if not 0 <= index < chunk_count(session):
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Document not found"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Chunk index out of range"
         )
     
-    folder = get_folder_by_id(document.folder_id)
-    if not folder:
+    try:
+        received = await save_chunk(session.id, index, request.stream(), chunk_length(session, index))
+    except InvalidChunk as e:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Folder not found"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
     
-    has_permission = False
-    for access in folder.access_list:
-        if access.user_id == current_user.id and access.permission in [FolderPermission.WRITE, FolderPermission.ADMIN]:
-            has_permission = True
-            break
+    return UploadChunkResponse(index=index, size=received.size, sha256=received.sha256)
+
+
+@router.post("/uploads/{session_id}/commit", response_model=DocumentResponse)
+async def commit_upload_session(
+    session_id: str,
+    current_user: User = Depends(get_current_user),
+    checker: FolderPermissionChecker = Depends(get_permission_checker)
+):
+    session = await get_upload_session_or_404(session_id, current_user)
+    folder = await get_folder_or_404(session.folder_id)
+    await checker.require(folder, FolderPermission.WRITE, "Not enough permissions to upload to this folder")
     
-    if not has_permission and current_user.role != UserRole.ADMIN:
+    chunks = await list_chunks(session.id)
+    missing = [index for index in range(chunk_count(session)) if chunks.get(index) != chunk_length(session, index)]
+    if missing:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions to update this document"
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Missing chunks: {', '.join(map(str, missing[:100]))}"
         )
     
-    if document_data.folder_id and document_data.folder_id != document.folder_id:
-        target_folder = get_folder_by_id(document_data.folder_id)
-        if not target_folder:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Target folder not found"
-            )
-        
-        has_target_permission = False
-        for access in target_folder.access_list:
-            if access.user_id == current_user.id and access.permission in [FolderPermission.WRITE, FolderPermission.ADMIN]:
-                has_target_permission = True
-                break
-        
-        if not has_target_permission and current_user.role != UserRole.ADMIN:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not enough permissions to move document to target folder"
-            )
+    received = await assemble_chunks(session.id, chunk_count(session))
+    if not await repo.uploads.delete(session.id):
+        await discard_upload(received)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upload session not found"
+        )
+    await discard_chunks(session.id)
     
-    update_data = document_data.dict(exclude_unset=True)
-    updated_document = update_document(document_id, **update_data)
+    return await store_document(
+        received,
+        name=session.name,
+        folder_id=session.folder_id,
+        file_type=session.file_type,
+        created_by=current_user.id,
+        metadata=session.metadata
+    )
+
+
+@router.delete("/uploads/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def abort_upload_session(
+    session_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    session = await get_upload_session_or_404(session_id, current_user)
+    await repo.uploads.delete(session.id)
+    await discard_chunks(session.id)
+    return None
+
+
+@router.get("/", response_model=List[DocumentResponse])
+async def read_documents(
+    folder_id: Optional[str] = None,
+    offset: int = Query(0, ge=0),
+    page: PageParams = Depends(),
+    checker: FolderPermissionChecker = Depends(get_permission_checker)
+):
+    """
+    List the documents of `folder_id` or, without it, the documents in every
+    folder the caller can access, a page of DEFAULT_PAGE_SIZE at a time.
+    `offset` and `cursor` are alternatives and cannot be combined.
+    """
+    if offset and page.after:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use either offset or cursor, not both"
+        )
     
-    return updated_document
+    if folder_id:
+        folder = await get_folder_or_404(folder_id)
+        await checker.require(folder, FolderPermission.READ, "Not enough permissions to access this folder")
+        
+        stop = offset + page.limit if page.limit is not None else None
+        documents = (await repo.documents.by_folder(folder_id, after=page.after, limit=stop))[offset:]
+    else:
+        page.limit = page.limit or DEFAULT_PAGE_SIZE
+        documents = await repo.documents.by_user(
+            checker.user.id,
+            limit=page.limit,
+            offset=offset,
+            after=page.after
+        )
+        
+    return page.respond(documents, DocumentResponse)
 
 
-@router.delete("/{document_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_document_item(document_id: str, current_user: User = Depends(get_current_user)):
-    document = get_document_by_id(document_id)
-    if not document:
+@router.get("/search", response_model=List[DocumentResponse])
+async def search_documents(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    current_user: User = Depends(get_current_user)
+):
+    user_id = None if current_user.role == UserRole.ADMIN else current_user.id
+    return await repo.documents.search(q, user_id=user_id, limit=limit, offset=offset)
+
+
+@router.get("/{document_id}", response_model=DocumentResponse)
+async def read_document(
+    document: Document = Depends(require_document_permission(FolderPermission.READ))
+):
+    return document
+
+
+@router.get("/{document_id}/content")
+async def download_document(
+    request: Request,
+    document: Document = Depends(require_document_permission(FolderPermission.READ))
+):
+    return await file_response(
+        request,
+        document.file_path,
+        media_type=document.file_type,
+        filename=document.name,
+        etag=document.content_hash
+    )
+
+
+async def artifact_response(request: Request, document: Document, artifact: str, media_type: str, extension: str):
+    if artifact not in document.artifacts:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Document not found"
+            detail=f"No {artifact} available for this document"
         )
     
-    folder = get_folder_by_id(document.folder_id)
-    if not folder:
+    return await file_response(
+        request,
+        artifact_path(document.file_path, artifact),
+        media_type=media_type,
+        filename=f"{document.name}.{extension}"
+    )
+
+
+@router.get("/{document_id}/thumbnail")
+async def download_document_thumbnail(
+    request: Request,
+    document: Document = Depends(require_document_permission(FolderPermission.READ))
+):
+    return await artifact_response(request, document, "thumbnail", "image/png", "png")
+
+
+@router.get("/{document_id}/text")
+async def download_document_text(
+    request: Request,
+    document: Document = Depends(require_document_permission(FolderPermission.READ))
+):
+    return await artifact_response(request, document, "text", "text/plain; charset=utf-8", "txt")
+
+
+@router.post("/{document_id}/process", response_model=DocumentResponse)
+async def process_document(
+    document: Document = Depends(require_document_permission(
+        FolderPermission.WRITE, "Not enough permissions to update this document"
+    ))
+):
+    return await schedule_processing(document)
+
+
+async def get_document_version_or_404(document: Document, version: int) -> DocumentVersion:
+    document_version = await repo.documents.version(document.id, version)
+    if not document_version:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Folder not found"
+            detail="Document version not found"
+        )
+    return document_version
+
+
+@router.get("/{document_id}/versions", response_model=List[DocumentVersionResponse])
+async def read_document_versions(
+    document: Document = Depends(require_document_permission(FolderPermission.READ))
+):
+    return await repo.documents.versions(document.id)
+
+
+@router.post("/{document_id}/versions", response_model=DocumentResponse)
+async def upload_document_version(
+    file: UploadFile = File(...),
+    current_user: User = Depends(get_current_user),
+    document: Document = Depends(require_document_permission(
+        FolderPermission.WRITE, "Not enough permissions to update this document"
+    ))
+):
+    try:
+        received = await receive_upload(file)
+    except UploadTooLarge as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
         )
     
-    has_permission = False
-    for access in folder.access_list:
-        if access.user_id == current_user.id and access.permission == FolderPermission.ADMIN:
-            has_permission = True
-            break
+    return await store_version(document, received, file.content_type or document.file_type, current_user.id)
+
+
+@router.get("/{document_id}/versions/{version}/content")
+async def download_document_version(
+    version: int,
+    request: Request,
+    document: Document = Depends(require_document_permission(FolderPermission.READ))
+):
+    document_version = await get_document_version_or_404(document, version)
+    return await file_response(
+        request,
+        document_version.file_path,
+        media_type=document_version.file_type,
+        filename=document.name,
+        etag=document_version.content_hash
+    )
+
+
+@router.post("/{document_id}/versions/{version}/restore", response_model=DocumentResponse)
+async def restore_document_version(
+    version: int,
+    current_user: User = Depends(get_current_user),
+    document: Document = Depends(require_document_permission(
+        FolderPermission.WRITE, "Not enough permissions to update this document"
+    ))
+):
+    document_version = await get_document_version_or_404(document, version)
+    if document_version.version == document.version:
+        return document
     
-    if not has_permission and current_user.role != UserRole.ADMIN:
+    # Restoring adds a new version pointing at the old content, so history is
+    # never rewritten and the blob is shared rather than copied.
+    async with blob_lock([document_version.content_hash or document_version.file_path]):
+        restored = await repo.documents.add_version(
+            document.id,
+            file_path=document_version.file_path,
+            file_type=document_version.file_type,
+            file_size=document_version.file_size,
+            content_hash=document_version.content_hash,
+            created_by=current_user.id
+        )
+    if not restored:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions to delete this document"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Document not found"
         )
     
-    if os.path.exists(document.file_path):
-        os.remove(document.file_path)
+    return await schedule_processing(restored)
+
+
+@router.put("/{document_id}", response_model=DocumentResponse)
+async def update_document_info(
+    document_data: DocumentUpdate, 
+    document: Document = Depends(require_document_permission(
+        FolderPermission.WRITE, "Not enough permissions to update this document"
+    )),
+    checker: FolderPermissionChecker = Depends(get_permission_checker)
+):
+    if document_data.folder_id and document_data.folder_id != document.folder_id:
+        target_folder = await get_folder_or_404(document_data.folder_id, "Target folder not found")
+        await checker.require(
+            target_folder, FolderPermission.WRITE,
+            "Not enough permissions to move document to target folder"
+        )
+    
+    update_data = document_data.dict(exclude_unset=True)
+    updated_document = await repo.documents.update(document.id, **update_data)
     
-    delete_document(document_id)
+    return updated_document
+
+
+@router.delete("/{document_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_document_item(
+    document: Document = Depends(require_document_permission(
+        FolderPermission.ADMIN, "Not enough permissions to delete this document"
+    ))
+):
+    await delete_documents_and_files([document.id])
     
     return None
@@ -1,13 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from typing import List, Optional
 from app.utils.auth import get_current_user
-from app.schemas.schemas import FolderCreate, FolderResponse, FolderUpdate, FolderAccessBase
-from app.services.database import (
-    create_folder, get_folder_by_id, get_folders_by_parent,
-    get_user_accessible_folders, update_folder, delete_folder,
-    add_folder_access, remove_folder_access
+from app.utils.pagination import PageParams, paginate
+from app.utils.permissions import (
+    FolderPermissionChecker, get_permission_checker, get_folder_or_404,
+    require_folder_permission
 )
-from app.models.models import User, UserRole, FolderPermission
+from app.schemas.schemas import (
+    FolderCreate, FolderResponse, FolderUpdate, FolderMove, FolderCopy, FolderAccessBase, FolderTreeNode,
+    JobResponse
+)
+from app.services.deletion import schedule_folder_deletion
+from app.services.repository import repo
+from app.models.models import User, UserRole, Folder, FolderPermission
 
 router = APIRouter(
     prefix="/folders",
@@ -17,28 +22,19 @@ router = APIRouter(
 
 
 @router.post("/", response_model=FolderResponse)
-async def create_new_folder(folder: FolderCreate, current_user: User = Depends(get_current_user)):
+async def create_new_folder(
+    folder: FolderCreate,
+    current_user: User = Depends(get_current_user),
+    checker: FolderPermissionChecker = Depends(get_permission_checker)
+):
     if folder.parent_id:
-        parent_folder = get_folder_by_id(folder.parent_id)
-        if not parent_folder:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Parent folder not found"
-            )
-        
-        has_permission = False
-        for access in parent_folder.access_list:
-            if access.user_id == current_user.id and access.permission in [FolderPermission.WRITE, FolderPermission.ADMIN]:
-                has_permission = True
-                break
-        
-        if not has_permission and current_user.role != UserRole.ADMIN:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not enough permissions to create folder in this location"
-            )
+        parent_folder = await get_folder_or_404(folder.parent_id, "Parent folder not found")
+        await checker.require(
+            parent_folder, FolderPermission.WRITE,
+            "Not enough permissions to create folder in this location"
+        )
     
-    new_folder = create_folder(
+    new_folder = await repo.folders.create(
         name=folder.name,
         created_by=current_user.id,
         parent_id=folder.parent_id
@@ -48,154 +44,202 @@ async def create_new_folder(folder: FolderCreate, current_user: User = Depends(g
 
 
 @router.get("/", response_model=List[FolderResponse])
-async def read_folders(parent_id: Optional[str] = None, current_user: User = Depends(get_current_user)):
-    if parent_id:
-        folders = get_folders_by_parent(parent_id)
-        
-        if current_user.role != UserRole.ADMIN:
-            folders = [
-                folder for folder in folders 
-                if any(access.user_id == current_user.id for access in folder.access_list)
-            ]
+async def read_folders(
+    parent_id: Optional[str] = None,
+    page: PageParams = Depends(),
+    current_user: User = Depends(get_current_user),
+    checker: FolderPermissionChecker = Depends(get_permission_checker)
+):
+    if parent_id and current_user.role == UserRole.ADMIN:
+        folders = await repo.folders.by_parent(parent_id, after=page.after, limit=page.limit)
+    elif parent_id:
+        folders = paginate([
+            folder for folder in await repo.folders.by_parent(parent_id, after=page.after)
+            if await checker.has_permission(folder.id, FolderPermission.READ)
+        ], page)
     else:
-        folders = get_user_accessible_folders(current_user.id)
+        folders = await repo.folders.accessible(current_user.id, after=page.after, limit=page.limit)
     
-    return folders
+    return page.respond(folders, FolderResponse)
 
 
-@router.get("/{folder_id}", response_model=FolderResponse)
-async def read_folder(folder_id: str, current_user: User = Depends(get_current_user)):
-    folder = get_folder_by_id(folder_id)
-    if not folder:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Folder not found"
+@router.get("/tree", response_model=List[FolderTreeNode])
+async def read_folder_tree(
+    root_id: Optional[str] = None,
+    depth: Optional[int] = Query(None, ge=0),
+    current_user: User = Depends(get_current_user),
+    checker: FolderPermissionChecker = Depends(get_permission_checker)
+):
+    """
+    Return the folders visible to the caller as nested trees, each folder with
+    the number and total size of the documents directly in it. `root_id`
+    limits the result to one subtree and `depth` to that many levels below
+    each root.
+    """
+    if root_id:
+        root = await get_folder_or_404(root_id)
+        await checker.require(root, FolderPermission.READ, "Not enough permissions to access this folder")
+        roots = [root]
+    elif current_user.role == UserRole.ADMIN:
+        roots = await repo.folders.by_parent(None)
+    else:
+        # Grants are inherited, so the trees start at granted folders that
+        # have no granted ancestor.
+        granted = await repo.folders.accessible(current_user.id)
+        granted_ids = {folder.id for folder in granted}
+        roots = [
+            folder for folder in granted
+            if not granted_ids.intersection(folder.path.strip("/").split("/")[:-1])
+        ]
+    
+    folders = await repo.folders.subtrees([root.id for root in roots], depth)
+    stats = {entry.folder_id: entry for entry in await repo.folders.stats([folder.id for folder in folders])}
+    
+    nodes = {}
+    trees = []
+    for folder in folders:
+        folder_stats = stats.get(folder.id)
+        node = nodes[folder.id] = FolderTreeNode(
+            id=folder.id,
+            name=folder.name,
+            parent_id=folder.parent_id,
+            path=folder.path,
+            document_count=folder_stats.document_count if folder_stats else 0,
+            total_size=folder_stats.total_size if folder_stats else 0
         )
+        parent = nodes.get(folder.parent_id)
+        if parent is not None:
+            parent.children.append(node)
+        else:
+            trees.append(node)
     
-    has_access = False
-    for access in folder.access_list:
-        if access.user_id == current_user.id:
-            has_access = True
-            break
-    
-    if not has_access and current_user.role != UserRole.ADMIN:
+    return trees
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def read_folder_job(job_id: str, current_user: User = Depends(get_current_user)):
+    job = await repo.jobs.by_id(job_id)
+    if not job or (job.created_by != current_user.id and current_user.role != UserRole.ADMIN):
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions to access this folder"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
         )
-    
+    return job
+
+
+@router.get("/{folder_id}", response_model=FolderResponse)
+async def read_folder(
+    folder: Folder = Depends(require_folder_permission(
+        FolderPermission.READ, "Not enough permissions to access this folder"
+    ))
+):
     return folder
 
 
 @router.put("/{folder_id}", response_model=FolderResponse)
 async def update_folder_info(
-    folder_id: str, 
-    folder_data: FolderUpdate, 
-    current_user: User = Depends(get_current_user)
+    folder_data: FolderUpdate,
+    folder: Folder = Depends(require_folder_permission(
+        FolderPermission.ADMIN, "Not enough permissions to update this folder"
+    ))
 ):
-    folder = get_folder_by_id(folder_id)
-    if not folder:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Folder not found"
-        )
-    
-    has_permission = False
-    for access in folder.access_list:
-        if access.user_id == current_user.id and access.permission == FolderPermission.ADMIN:
-            has_permission = True
-            break
-    
-    if not has_permission and current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions to update this folder"
-        )
-    
     update_data = folder_data.dict(exclude_unset=True)
-    updated_folder = update_folder(folder_id, **update_data)
+    updated_folder = await repo.folders.update(folder.id, **update_data)
     
     return updated_folder
 
 
-@router.delete("/{folder_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_folder_item(folder_id: str, current_user: User = Depends(get_current_user)):
-    folder = get_folder_by_id(folder_id)
-    if not folder:
+async def get_target_parent(
+    parent_id: Optional[str], checker: FolderPermissionChecker, detail: str
+) -> Optional[Folder]:
+    if not parent_id:
+        return None
+    parent = await get_folder_or_404(parent_id, "Parent folder not found")
+    await checker.require(parent, FolderPermission.WRITE, detail)
+    return parent
+
+
+@router.post("/{folder_id}/move", response_model=FolderResponse)
+async def move_folder_item(
+    move: FolderMove,
+    folder: Folder = Depends(require_folder_permission(
+        FolderPermission.ADMIN, "Not enough permissions to move this folder"
+    )),
+    checker: FolderPermissionChecker = Depends(get_permission_checker)
+):
+    parent = await get_target_parent(
+        move.parent_id, checker, "Not enough permissions to move folder to this location"
+    )
+    if parent and parent.path.startswith(folder.path):
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Folder not found"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot move a folder into itself or one of its subfolders"
         )
     
-    has_permission = False
-    for access in folder.access_list:
-        if access.user_id == current_user.id and access.permission == FolderPermission.ADMIN:
-            has_permission = True
-            break
-    
-    if not has_permission and current_user.role != UserRole.ADMIN:
+    moved = await repo.folders.move(folder.id, move.parent_id)
+    if not moved:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions to delete this folder"
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Folder tree changed during the move, please retry"
         )
-    
-    delete_folder(folder_id)
-    return None
+    return moved
 
 
-@router.post("/{folder_id}/access", response_model=FolderResponse)
-async def add_user_access(
-    folder_id: str, 
-    access: FolderAccessBase, 
-    current_user: User = Depends(get_current_user)
+@router.post("/{folder_id}/copy", response_model=FolderResponse)
+async def copy_folder_item(
+    copy: FolderCopy,
+    folder: Folder = Depends(require_folder_permission(
+        FolderPermission.READ, "Not enough permissions to copy this folder"
+    )),
+    current_user: User = Depends(get_current_user),
+    checker: FolderPermissionChecker = Depends(get_permission_checker)
 ):
-    folder = get_folder_by_id(folder_id)
-    if not folder:
+    """
+    Copy the folder with its subfolders and documents. The copies share the
+    stored files of the originals, so no file content is duplicated.
+    """
+    await get_target_parent(copy.parent_id, checker, "Not enough permissions to copy folder to this location")
+    
+    copied = await repo.folders.copy(folder.id, copy.parent_id, current_user.id, copy.name)
+    if not copied:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Folder not found"
         )
-    
-    has_permission = False
-    for folder_access in folder.access_list:
-        if folder_access.user_id == current_user.id and folder_access.permission == FolderPermission.ADMIN:
-            has_permission = True
-            break
-    
-    if not has_permission and current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions to manage access for this folder"
-        )
-    
-    updated_folder = add_folder_access(folder_id, access.user_id, access.permission)
+    return copied
+
+
+@router.delete("/{folder_id}", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def delete_folder_item(
+    folder: Folder = Depends(require_folder_permission(
+        FolderPermission.ADMIN, "Not enough permissions to delete this folder"
+    )),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Start deleting the folder with its subfolders, documents and stored files.
+    Returns the job at once; poll `/folders/jobs/{job_id}` for its progress.
+    """
+    return await schedule_folder_deletion(folder, current_user.id)
+
+
+@router.post("/{folder_id}/access", response_model=FolderResponse)
+async def add_user_access(
+    access: FolderAccessBase,
+    folder: Folder = Depends(require_folder_permission(
+        FolderPermission.ADMIN, "Not enough permissions to manage access for this folder"
+    ))
+):
+    updated_folder = await repo.folders.add_access(folder.id, access.user_id, access.permission)
     return updated_folder
 
 
 @router.delete("/{folder_id}/access/{user_id}", response_model=FolderResponse)
 async def remove_user_access(
-    folder_id: str, 
-    user_id: str, 
-    current_user: User = Depends(get_current_user)
+    user_id: str,
+    folder: Folder = Depends(require_folder_permission(
+        FolderPermission.ADMIN, "Not enough permissions to manage access for this folder"
+    ))
 ):
-    folder = get_folder_by_id(folder_id)
-    if not folder:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Folder not found"
-        )
-    
-    has_permission = False
-    for access in folder.access_list:
-        if access.user_id == current_user.id and access.permission == FolderPermission.ADMIN:
-            has_permission = True
-            break
-    
-    if not has_permission and current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions to manage access for this folder"
-        )
-    
-    updated_folder = remove_folder_access(folder_id, user_id)
+    updated_folder = await repo.folders.remove_access(folder.id, user_id)
     return updated_folder
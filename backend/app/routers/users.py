@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from typing import List
 from app.utils.auth import get_current_user, get_password_hash
+from app.utils.pagination import PageParams
 from app.schemas.schemas import UserResponse, UserUpdate
-from app.services.database import get_all_users, get_user_by_id, update_user, delete_user
+from app.services.repository import repo
 from app.models.models import User, UserRole
 
 router = APIRouter(
@@ -13,13 +14,14 @@ router = APIRouter(
 
 
 @router.get("/", response_model=List[UserResponse])
-async def read_users(current_user: User = Depends(get_current_user)):
+async def read_users(page: PageParams = Depends(), current_user: User = Depends(get_current_user)):
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions"
         )
-    return get_all_users()
+    users = await repo.users.all(after=page.after, limit=page.limit)
+    return page.respond(users, UserResponse)
 
 
 @router.get("/{user_id}", response_model=UserResponse)
@@ -30,7 +32,7 @@ async def read_user(user_id: str, current_user: User = Depends(get_current_user)
             detail="Not enough permissions"
         )
     
-    user = get_user_by_id(user_id)
+    user = await repo.users.by_id(user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -51,7 +53,7 @@ async def update_user_info(
             detail="Not enough permissions"
         )
     
-    if not get_user_by_id(user_id):
+    if not await repo.users.by_id(user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
@@ -60,7 +62,7 @@ async def update_user_info(
     update_data = user_data.dict(exclude_unset=True)
     
     if "password" in update_data:
-        update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
+        update_data["hashed_password"] = await get_password_hash(update_data.pop("password"))
     
     if "role" in update_data and current_user.role != UserRole.ADMIN:
         raise HTTPException(
@@ -68,7 +70,7 @@ async def update_user_info(
             detail="Not enough permissions to change role"
         )
     
-    updated_user = update_user(user_id, **update_data)
+    updated_user = await repo.users.update(user_id, **update_data)
     return updated_user
 
 
@@ -80,11 +82,11 @@ async def delete_user_account(user_id: str, current_user: User = Depends(get_cur
             detail="Not enough permissions"
         )
     
-    if not get_user_by_id(user_id):
+    if not await repo.users.by_id(user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    delete_user(user_id)
+    await repo.users.delete(user_id)
     return None
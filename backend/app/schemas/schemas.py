@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, EmailStr, Field
-from app.models.models import UserRole, FolderPermission, ApprovalStatus, FormFieldType
+from app.models.models import UserRole, FolderPermission, ApprovalStatus, FormFieldType, ProcessingStatus, JobStatus
 
 
 class UserBase(BaseModel):
@@ -54,17 +54,48 @@ class FolderCreate(FolderBase):
 
 class FolderUpdate(BaseModel):
     name: Optional[str] = None
+
+
+class FolderMove(BaseModel):
     parent_id: Optional[str] = None
 
 
+class FolderCopy(BaseModel):
+    parent_id: Optional[str] = None
+    name: Optional[str] = None
+
+
 class FolderResponse(FolderBase):
     id: str
+    path: str = ""
     created_by: str
     created_at: datetime
     updated_at: datetime
     access_list: List[FolderAccessBase]
 
 
+class FolderTreeNode(BaseModel):
+    id: str
+    name: str
+    parent_id: Optional[str] = None
+    path: str
+    document_count: int = 0
+    total_size: int = 0
+    children: List["FolderTreeNode"] = []
+
+
+class JobResponse(BaseModel):
+    id: str
+    kind: str
+    target_id: str
+    status: JobStatus
+    progress: Dict[str, int] = {}
+    error: Optional[str] = None
+    created_by: str
+    created_at: datetime
+    updated_at: datetime
+
+
 class DocumentBase(BaseModel):
     name: str
     folder_id: str
@@ -86,11 +117,71 @@ class DocumentResponse(DocumentBase):
     id: str
     file_path: str
     file_size: int
+    content_hash: Optional[str] = None
+    version: int = 1
+    processing_status: Optional[ProcessingStatus] = None
+    artifacts: List[str] = []
     created_by: str
     created_at: datetime
     updated_at: datetime
 
 
+class DocumentVersionResponse(BaseModel):
+    document_id: str
+    version: int
+    file_type: str
+    file_size: int
+    content_hash: Optional[str] = None
+    created_by: str
+    created_at: datetime
+
+
+class DocumentBatchMove(BaseModel):
+    document_ids: List[str] = Field(..., min_length=1, max_length=1000)
+    folder_id: str
+
+
+class DocumentBatchMetadata(BaseModel):
+    document_ids: List[str] = Field(..., min_length=1, max_length=1000)
+    metadata: Dict[str, Any]
+    replace: bool = False
+
+
+class DocumentBatchDelete(BaseModel):
+    document_ids: List[str] = Field(..., min_length=1, max_length=1000)
+
+
+class BulkUploadError(BaseModel):
+    name: str
+    detail: str
+
+
+class BulkUploadResponse(BaseModel):
+    documents: List[DocumentResponse] = []
+    errors: List[BulkUploadError] = []
+
+
+class UploadSessionCreate(DocumentBase):
+    file_size: int = Field(..., ge=0)
+
+
+class UploadSessionResponse(DocumentBase):
+    id: str
+    file_size: int
+    chunk_size: int
+    chunk_count: int
+    received_chunks: List[int] = []
+    created_by: str
+    created_at: datetime
+    expires_at: datetime
+
+
+class UploadChunkResponse(BaseModel):
+    index: int
+    size: int
+    sha256: str
+
+
 class FormFieldBase(BaseModel):
     name: str
     label: str
@@ -154,16 +245,11 @@ class ApprovalStepCreate(ApprovalStepBase):
 
 class ApprovalStepUpdate(BaseModel):
     approver_id: Optional[str] = None
-    status: Optional[ApprovalStatus] = None
-    comment: Optional[str] = None
     order: Optional[int] = None
 
 
 class ApprovalStepResponse(ApprovalStepBase):
     id: str
-    status: ApprovalStatus
-    comment: Optional[str] = None
-    approved_at: Optional[datetime] = None
 
 
 class ApprovalRouteBase(BaseModel):
@@ -203,11 +289,20 @@ class ApplicationUpdate(BaseModel):
     form_data: Optional[Dict[str, Any]] = None
 
 
+class ApplicationStepRecordResponse(BaseModel):
+    step_id: str
+    approver_id: str
+    status: ApprovalStatus
+    comment: Optional[str] = None
+    approved_at: datetime
+
+
 class ApplicationResponse(ApplicationBase):
     id: str
     applicant_id: str
     current_step: int
     status: ApprovalStatus
+    step_history: List[ApplicationStepRecordResponse] = []
     document_id: Optional[str] = None
     created_at: datetime
     updated_at: datetime
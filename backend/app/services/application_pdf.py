@@ -0,0 +1,184 @@
+"""
+PDF rendering of approved applications: the form's fields filled in with the
+application's values, followed by its approval history. Rendering runs in
+worker processes, so this module must not import the store. A form's layout
+is compiled once per worker and cached by form id and revision, so a batch of
+approvals on the same form only pays for filling in values.
+"""
+
+import hashlib
+import io
+import os
+import tempfile
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+from xml.sax.saxutils import escape
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import mm
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from app.models.models import Application, ApprovalForm, FormFieldType
+from app.services.storage import UPLOAD_DIR, ReceivedUpload
+
+LAYOUT_CACHE_SIZE = int(os.getenv("APPLICATION_LAYOUT_CACHE_SIZE", "64"))
+
+# A CID font ships with reportlab and covers Japanese as well as Latin text,
+# so no font files need to be installed.
+FONT = "HeiseiKakuGo-W5"
+pdfmetrics.registerFont(UnicodeCIDFont(FONT))
+
+TITLE_STYLE = ParagraphStyle("title", fontName=FONT, fontSize=16, leading=20, spaceAfter=4 * mm)
+HEADING_STYLE = ParagraphStyle("heading", fontName=FONT, fontSize=12, leading=16, spaceBefore=6 * mm, spaceAfter=2 * mm)
+BODY_STYLE = ParagraphStyle("body", fontName=FONT, fontSize=9, leading=12)
+TABLE_STYLE = TableStyle([
+    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ("BACKGROUND", (0, 0), (0, -1), colors.whitesmoke),
+])
+HISTORY_STYLE = TableStyle([
+    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ("BACKGROUND", (0, 0), (-1, 0), colors.whitesmoke),
+])
+FIELD_COLUMNS = [50 * mm, 120 * mm]
+HISTORY_COLUMNS = [10 * mm, 40 * mm, 25 * mm, 35 * mm, 60 * mm]
+
+
+class FieldRow(NamedTuple):
+    name: str
+    label: str
+    format: Callable[[Any], str]
+
+
+class FormLayout(NamedTuple):
+    title: str
+    description: str
+    rows: List[FieldRow]
+
+
+_layouts: "OrderedDict[Tuple[str, datetime], FormLayout]" = OrderedDict()
+
+
+def _format_text(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _format_checkbox(value: Any) -> str:
+    if isinstance(value, list):
+        return ", ".join(map(str, value))
+    return "Yes" if value else "No"
+
+
+def _format_date(value: Any) -> str:
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value).strftime("%Y-%m-%d")
+        except ValueError:
+            return value
+    return _format_text(value)
+
+
+def _format_number(value: Any) -> str:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return f"{value:,}"
+    return _format_text(value)
+
+
+FORMATTERS: Dict[FormFieldType, Callable[[Any], str]] = {
+    FormFieldType.CHECKBOX: _format_checkbox,
+    FormFieldType.DATE: _format_date,
+    FormFieldType.NUMBER: _format_number,
+}
+
+
+def _compile_layout(form: ApprovalForm) -> FormLayout:
+    rows = [
+        FieldRow(field.name, field.label, FORMATTERS.get(field.type, _format_text))
+        for field in sorted(form.fields, key=lambda field: field.order)
+    ]
+    return FormLayout(title=form.name, description=form.description or "", rows=rows)
+
+
+def form_layout(form: ApprovalForm) -> FormLayout:
+    """Return the compiled layout of `form`; editing the form changes its revision and recompiles it."""
+    key = (form.id, form.updated_at)
+    layout = _layouts.get(key)
+    if layout is None:
+        layout = _layouts[key] = _compile_layout(form)
+        if len(_layouts) > LAYOUT_CACHE_SIZE:
+            _layouts.popitem(last=False)
+    else:
+        _layouts.move_to_end(key)
+    return layout
+
+
+def _paragraph(text: str) -> Paragraph:
+    return Paragraph(escape(text).replace("\n", "<br/>"), BODY_STYLE)
+
+
+def _build(layout: FormLayout, application: Application, names: Dict[str, str]) -> List[Any]:
+    story: List[Any] = [Paragraph(escape(layout.title), TITLE_STYLE)]
+    if layout.description:
+        story.append(_paragraph(layout.description))
+    story.append(Spacer(0, 2 * mm))
+    story.append(_paragraph(
+        f"Application {application.id}\n"
+        f"Applicant: {names.get(application.applicant_id, application.applicant_id)}\n"
+        f"Submitted: {application.created_at:%Y-%m-%d %H:%M}"
+    ))
+
+    story.append(Paragraph("Form", HEADING_STYLE))
+    known = {row.name for row in layout.rows}
+    rows = [(row.label, row.format(application.form_data.get(row.name))) for row in layout.rows]
+    # Values without a field (e.g. the field was removed after submission) are kept rather than dropped.
+    rows += [(name, _format_text(value)) for name, value in application.form_data.items() if name not in known]
+    if rows:
+        table = Table([[_paragraph(label), _paragraph(value)] for label, value in rows],
+                      colWidths=FIELD_COLUMNS)
+        table.setStyle(TABLE_STYLE)
+        story.append(table)
+
+    story.append(Paragraph("Approval history", HEADING_STYLE))
+    history = [[_paragraph(heading) for heading in ("#", "Approver", "Decision", "Date", "Comment")]]
+    for number, record in enumerate(application.step_history, 1):
+        history.append([
+            _paragraph(str(number)),
+            _paragraph(names.get(record.approver_id, record.approver_id)),
+            _paragraph(record.status.value),
+            _paragraph(f"{record.approved_at:%Y-%m-%d %H:%M}"),
+            _paragraph(record.comment or ""),
+        ])
+    table = Table(history, colWidths=HISTORY_COLUMNS, repeatRows=1)
+    table.setStyle(HISTORY_STYLE)
+    story.append(table)
+    return story
+
+
+def render_application(form: ApprovalForm, application: Application, names: Dict[str, str]) -> ReceivedUpload:
+    """
+    Render `application` to a temporary file in the upload directory, ready to
+    be committed to the blob store. `names` maps user ids to display names.
+    Runs in a worker process.
+    """
+    buffer = io.BytesIO()
+    document = SimpleDocTemplate(
+        buffer, pagesize=A4, title=f"{form.name} - {application.id}",
+        leftMargin=20 * mm, rightMargin=20 * mm, topMargin=20 * mm, bottomMargin=20 * mm,
+        invariant=True
+    )
+    document.build(_build(form_layout(form), application, names))
+    data = buffer.getvalue()
+
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=UPLOAD_DIR, prefix=".upload-")
+    try:
+        with os.fdopen(fd, "wb") as output:
+            output.write(data)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return ReceivedUpload(temp_path=temp_path, size=len(data), sha256=hashlib.sha256(data).hexdigest())
@@ -1,25 +1,178 @@
 """
 In-memory database service for the document management system.
 This is a simplified implementation for development purposes.
-In a production environment, you would use a real database.
+Set DATABASE_URL to store data in PostgreSQL instead (see app.services.postgres).
 """
 
-from typing import Dict, List, Optional, Any
+import os
+from contextlib import contextmanager
+
+from typing import Dict, List, Optional, Any, Hashable, Iterable, Iterator, Tuple
+from bisect import bisect_left, bisect_right, insort
+from heapq import merge, nlargest
+from itertools import islice
+from math import log, log1p
 from uuid import uuid4
 from datetime import datetime
 from app.models.models import (
-    User, Folder, Document, ApprovalForm, ApprovalRoute, 
+    User, Folder, FolderStats, Document, DocumentVersion, UploadSession, Job, ApprovalForm, ApprovalRoute, 
     Application, UserRole, FolderPermission, FolderAccess,
-    ApprovalStatus, ApprovalStep, FormField
+    ApprovalStatus, ApprovalStep, FormField, ApplicationStepRecord
 )
+from app.services.search import metadata_text, tokenize
 
 users: Dict[str, User] = {}
 folders: Dict[str, Folder] = {}
 documents: Dict[str, Document] = {}
+# Version history, oldest first; the document record mirrors the last entry.
+document_versions: Dict[str, List[DocumentVersion]] = {}
+upload_sessions: Dict[str, UploadSession] = {}
+jobs: Dict[str, Job] = {}
 approval_forms: Dict[str, ApprovalForm] = {}
 approval_routes: Dict[str, ApprovalRoute] = {}
 applications: Dict[str, Application] = {}
 
+# Listings are ordered by (created_at, id). SortKey lists are kept sorted so
+# pages can start at a cursor with a bisect instead of a scan.
+SortKey = Tuple[datetime, str]
+
+users_by_created: List[SortKey] = []
+approval_forms_by_created: List[SortKey] = []
+approval_routes_by_created: List[SortKey] = []
+
+# Secondary indexes. Each maps a lookup key to the sorted keys of the
+# matching records.
+users_by_username: Dict[str, str] = {}
+users_by_email: Dict[str, str] = {}
+folders_by_parent: Dict[Optional[str], List[SortKey]] = {}
+documents_by_folder: Dict[str, List[SortKey]] = {}
+applications_by_applicant: Dict[str, List[SortKey]] = {}
+# Approver inbox: approver_id -> pending applications waiting on their step.
+pending_applications_by_approver: Dict[str, List[SortKey]] = {}
+
+# Reverse ACL index: user_id -> {folder_id: permission}, mirroring every
+# folder's access_list.
+folder_access_by_user: Dict[str, Dict[str, FolderPermission]] = {}
+
+# Effective ACL cache: folder_id -> {user_id: permission}, combining each
+# folder's own grants with those inherited from its ancestors. Folders without
+# grants of their own share their parent's dict, so entries are replaced,
+# never mutated in place.
+effective_folder_access: Dict[str, Dict[str, FolderPermission]] = {}
+
+# Per-folder document counts and sizes, adjusted as documents come and go.
+folder_stats: Dict[str, FolderStats] = {}
+
+# Blob reference counts: content hash -> number of document versions storing it.
+blob_references: Dict[str, int] = {}
+
+# Search index: term -> {document_id: weight}. document_terms keeps each
+# document's own terms so an update or delete only touches its postings.
+search_postings: Dict[str, Dict[str, float]] = {}
+document_terms: Dict[str, Dict[str, float]] = {}
+document_texts: Dict[str, str] = {}
+
+# Document fields copied onto the current version when they change.
+VERSION_FIELDS = {"file_path", "file_type", "file_size", "content_hash"}
+
+# Field weights, in the same proportions as PostgreSQL's ts_rank A/B/C.
+SEARCH_WEIGHTS = {"name": 1.0, "metadata": 0.4, "text": 0.2}
+
+PERMISSION_LEVELS = {
+    FolderPermission.READ: 1,
+    FolderPermission.WRITE: 2,
+    FolderPermission.ADMIN: 3,
+}
+
+
+def _sort_key(record: Any) -> SortKey:
+    return (record.created_at, record.id)
+
+
+def _sorted_remove(keys: List[SortKey], key: SortKey) -> None:
+    position = bisect_left(keys, key)
+    if position < len(keys) and keys[position] == key:
+        del keys[position]
+
+
+def _index_add(index: Dict[Hashable, List[SortKey]], key: Hashable, record: Any) -> None:
+    insort(index.setdefault(key, []), _sort_key(record))
+
+
+def _index_remove(index: Dict[Hashable, List[SortKey]], key: Hashable, record: Any) -> None:
+    keys = index.get(key)
+    if keys is None:
+        return
+    _sorted_remove(keys, _sort_key(record))
+    if not keys:
+        del index[key]
+
+
+def _page(keys: List[SortKey], store: Dict[str, Any], after: Optional[SortKey] = None,
+          limit: Optional[int] = None) -> List[Any]:
+    """Return up to `limit` records whose keys sort after the `after` cursor."""
+    start = bisect_right(keys, after) if after else 0
+    stop = start + limit if limit is not None else None
+    return [store[record_id] for _, record_id in keys[start:stop]]
+
+
+def _revoke_access_index(user_id: str, folder_id: str) -> None:
+    grants = folder_access_by_user.get(user_id)
+    if grants is None:
+        return
+    grants.pop(folder_id, None)
+    if not grants:
+        del folder_access_by_user[user_id]
+
+
+def max_permission(
+    first: Optional[FolderPermission], second: Optional[FolderPermission]
+) -> Optional[FolderPermission]:
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return first if PERMISSION_LEVELS[first] >= PERMISSION_LEVELS[second] else second
+
+
+def _compute_effective_access(folder: Folder) -> Dict[str, FolderPermission]:
+    inherited = effective_folder_access.get(folder.parent_id, {}) if folder.parent_id else {}
+    if not folder.access_list:
+        return inherited
+    
+    effective = dict(inherited)
+    for access in folder.access_list:
+        effective[access.user_id] = max_permission(effective.get(access.user_id), access.permission)
+    return effective
+
+
+def _refresh_effective_access(folder_id: str) -> None:
+    """Recompute the effective ACL of a folder and its subtree, parents before children."""
+    stack = [folder_id]
+    visited = set()
+    while stack:
+        current_id = stack.pop()
+        folder = folders.get(current_id)
+        if folder is None or current_id in visited:
+            continue
+        visited.add(current_id)
+        effective_folder_access[current_id] = _compute_effective_access(folder)
+        stack.extend(child_id for _, child_id in folders_by_parent.get(current_id, ()))
+
+
+def _folder_path(parent_id: Optional[str], folder_id: str) -> str:
+    parent = folders.get(parent_id) if parent_id else None
+    return f"{parent.path if parent else '/'}{folder_id}/"
+
+
+def _refresh_paths(folder_id: str) -> None:
+    """Recompute the materialized paths of a folder's subtree after it moved."""
+    stack = [folder_id]
+    while stack:
+        folder = folders[stack.pop()]
+        folder.path = _folder_path(folder.parent_id, folder.id)
+        stack.extend(child_id for _, child_id in folders_by_parent.get(folder.id, ()))
+
 
 def create_user(username: str, email: str, hashed_password: str, full_name: Optional[str] = None, 
                 role: UserRole = UserRole.USER) -> User:
@@ -33,6 +186,9 @@ def create_user(username: str, email: str, hashed_password: str, full_name: Opti
         role=role
     )
     users[user_id] = user
+    insort(users_by_created, _sort_key(user))
+    users_by_username[username] = user_id
+    users_by_email[email] = user_id
     return user
 
 
@@ -41,21 +197,17 @@ def get_user_by_id(user_id: str) -> Optional[User]:
 
 
 def get_user_by_username(username: str) -> Optional[User]:
-    for user in users.values():
-        if user.username == username:
-            return user
-    return None
+    user_id = users_by_username.get(username)
+    return users.get(user_id) if user_id else None
 
 
 def get_user_by_email(email: str) -> Optional[User]:
-    for user in users.values():
-        if user.email == email:
-            return user
-    return None
+    user_id = users_by_email.get(email)
+    return users.get(user_id) if user_id else None
 
 
-def get_all_users() -> List[User]:
-    return list(users.values())
+def get_all_users(after: Optional[SortKey] = None, limit: Optional[int] = None) -> List[User]:
+    return _page(users_by_created, users, after, limit)
 
 
 def update_user(user_id: str, **kwargs) -> Optional[User]:
@@ -63,20 +215,35 @@ def update_user(user_id: str, **kwargs) -> Optional[User]:
     if not user:
         return None
     
+    old_username, old_email = user.username, user.email
+    
     for key, value in kwargs.items():
         if hasattr(user, key):
             setattr(user, key, value)
     
+    if user.username != old_username:
+        users_by_username.pop(old_username, None)
+        users_by_username[user.username] = user_id
+    if user.email != old_email:
+        users_by_email.pop(old_email, None)
+        users_by_email[user.email] = user_id
+    
     user.updated_at = datetime.now()
     users[user_id] = user
     return user
 
 
 def delete_user(user_id: str) -> bool:
-    if user_id in users:
-        del users[user_id]
-        return True
-    return False
+    user = users.pop(user_id, None)
+    if not user:
+        return False
+    
+    _sorted_remove(users_by_created, _sort_key(user))
+    if users_by_username.get(user.username) == user_id:
+        del users_by_username[user.username]
+    if users_by_email.get(user.email) == user_id:
+        del users_by_email[user.email]
+    return True
 
 
 def create_folder(name: str, created_by: str, parent_id: Optional[str] = None) -> Folder:
@@ -85,10 +252,14 @@ def create_folder(name: str, created_by: str, parent_id: Optional[str] = None) -
         id=folder_id,
         name=name,
         parent_id=parent_id,
+        path=_folder_path(parent_id, folder_id),
         created_by=created_by,
         access_list=[FolderAccess(user_id=created_by, permission=FolderPermission.ADMIN)]
     )
     folders[folder_id] = folder
+    _index_add(folders_by_parent, parent_id, folder)
+    folder_access_by_user.setdefault(created_by, {})[folder_id] = FolderPermission.ADMIN
+    effective_folder_access[folder_id] = _compute_effective_access(folder)
     return folder
 
 
@@ -96,15 +267,23 @@ def get_folder_by_id(folder_id: str) -> Optional[Folder]:
     return folders.get(folder_id)
 
 
-def get_folders_by_parent(parent_id: Optional[str]) -> List[Folder]:
-    return [folder for folder in folders.values() if folder.parent_id == parent_id]
+def get_folders_by_parent(parent_id: Optional[str], after: Optional[SortKey] = None,
+                          limit: Optional[int] = None) -> List[Folder]:
+    return _page(folders_by_parent.get(parent_id, []), folders, after, limit)
 
 
-def get_user_accessible_folders(user_id: str) -> List[Folder]:
-    return [
-        folder for folder in folders.values() 
-        if any(access.user_id == user_id for access in folder.access_list)
-    ]
+def get_user_accessible_folders(user_id: str, after: Optional[SortKey] = None,
+                                limit: Optional[int] = None) -> List[Folder]:
+    keys = sorted(_sort_key(folders[folder_id]) for folder_id in folder_access_by_user.get(user_id, ()))
+    return _page(keys, folders, after, limit)
+
+
+def get_folder_permission(folder_id: str, user_id: str) -> Optional[FolderPermission]:
+    return folder_access_by_user.get(user_id, {}).get(folder_id)
+
+
+def get_effective_folder_permission(folder_id: str, user_id: str) -> Optional[FolderPermission]:
+    return effective_folder_access.get(folder_id, {}).get(user_id)
 
 
 def update_folder(folder_id: str, **kwargs) -> Optional[Folder]:
@@ -112,8 +291,9 @@ def update_folder(folder_id: str, **kwargs) -> Optional[Folder]:
     if not folder:
         return None
     
+    # Re-parenting goes through move_folder, which keeps the derived state in step.
     for key, value in kwargs.items():
-        if hasattr(folder, key):
+        if hasattr(folder, key) and key not in ("parent_id", "path"):
             setattr(folder, key, value)
     
     folder.updated_at = datetime.now()
@@ -121,11 +301,85 @@ def update_folder(folder_id: str, **kwargs) -> Optional[Folder]:
     return folder
 
 
+def move_folder(folder_id: str, parent_id: Optional[str]) -> Optional[Folder]:
+    """
+    Re-parent a folder. Only the moved subtree's paths and effective access
+    are recomputed. Returns None if either folder does not exist or the new
+    parent lies inside the moved subtree.
+    """
+    folder = folders.get(folder_id)
+    parent = folders.get(parent_id) if parent_id else None
+    if not folder or (parent_id and (not parent or parent.path.startswith(folder.path))):
+        return None
+    
+    if folder.parent_id != parent_id:
+        _index_remove(folders_by_parent, folder.parent_id, folder)
+        folder.parent_id = parent_id
+        _index_add(folders_by_parent, parent_id, folder)
+        _refresh_paths(folder_id)
+        _refresh_effective_access(folder_id)
+        folder.updated_at = datetime.now()
+    return folder
+
+
+def copy_folder(folder_id: str, parent_id: Optional[str], created_by: str,
+                name: Optional[str] = None) -> Optional[Folder]:
+    """
+    Copy a folder's subtree under `parent_id`, owned by `created_by` like newly
+    created folders. Copied documents keep their version history and share the
+    stored files of the originals; the blob reference counts keep a file alive
+    while any copy uses it. Returns the copy of the folder, or None if either
+    folder does not exist.
+    """
+    if folder_id not in folders or (parent_id and parent_id not in folders):
+        return None
+    
+    # The subtree is listed before copying, so copying into it terminates.
+    copies: Dict[str, str] = {}
+    for folder in get_folder_subtrees([folder_id]):
+        if folder.id == folder_id:
+            copy = create_folder(name or folder.name, created_by, parent_id)
+        else:
+            copy = create_folder(folder.name, created_by, copies[folder.parent_id])
+        copies[folder.id] = copy.id
+        for _, document_id in list(documents_by_folder.get(folder.id, ())):
+            _copy_document(documents[document_id], copy.id, created_by)
+    return folders[copies[folder_id]]
+
+
 def delete_folder(folder_id: str) -> bool:
-    if folder_id in folders:
-        del folders[folder_id]
-        return True
-    return False
+    folder = folders.pop(folder_id, None)
+    if not folder:
+        return False
+    
+    _index_remove(folders_by_parent, folder.parent_id, folder)
+    for access in folder.access_list:
+        _revoke_access_index(access.user_id, folder_id)
+    effective_folder_access.pop(folder_id, None)
+    folder_stats.pop(folder_id, None)
+    return True
+
+
+def get_folder_subtrees(root_ids: Iterable[str], max_depth: Optional[int] = None) -> List[Folder]:
+    """
+    Return the given folders and their descendants down to `max_depth` levels
+    below each root, parents before children and siblings in creation order.
+    """
+    result = []
+    queue = [(root_id, 0) for root_id in root_ids if root_id in folders]
+    seen = set()
+    for folder_id, depth in queue:
+        if folder_id in seen:
+            continue
+        seen.add(folder_id)
+        result.append(folders[folder_id])
+        if max_depth is None or depth < max_depth:
+            queue.extend((child_id, depth + 1) for _, child_id in folders_by_parent.get(folder_id, ()))
+    return result
+
+
+def get_folder_stats(folder_ids: Iterable[str]) -> List[FolderStats]:
+    return [folder_stats[folder_id] for folder_id in folder_ids if folder_id in folder_stats]
 
 
 def add_folder_access(folder_id: str, user_id: str, permission: FolderPermission) -> Optional[Folder]:
@@ -136,6 +390,8 @@ def add_folder_access(folder_id: str, user_id: str, permission: FolderPermission
     folder.access_list = [access for access in folder.access_list if access.user_id != user_id]
     
     folder.access_list.append(FolderAccess(user_id=user_id, permission=permission))
+    folder_access_by_user.setdefault(user_id, {})[folder_id] = permission
+    _refresh_effective_access(folder_id)
     folder.updated_at = datetime.now()
     folders[folder_id] = folder
     return folder
@@ -147,13 +403,62 @@ def remove_folder_access(folder_id: str, user_id: str) -> Optional[Folder]:
         return None
     
     folder.access_list = [access for access in folder.access_list if access.user_id != user_id]
+    _revoke_access_index(user_id, folder_id)
+    _refresh_effective_access(folder_id)
     folder.updated_at = datetime.now()
     folders[folder_id] = folder
     return folder
 
 
+def _count_document(document: Document, sign: int) -> None:
+    stats = folder_stats.get(document.folder_id)
+    if stats is None:
+        stats = folder_stats[document.folder_id] = FolderStats(folder_id=document.folder_id)
+    stats.document_count += sign
+    stats.total_size += sign * document.file_size
+
+
+def _add_blob_reference(content_hash: Optional[str]) -> None:
+    if content_hash:
+        blob_references[content_hash] = blob_references.get(content_hash, 0) + 1
+
+
+def _remove_blob_reference(content_hash: Optional[str]) -> None:
+    if content_hash and content_hash in blob_references:
+        blob_references[content_hash] -= 1
+        if not blob_references[content_hash]:
+            del blob_references[content_hash]
+
+
+def _unindex_search(document_id: str) -> None:
+    for term in document_terms.pop(document_id, {}):
+        postings = search_postings[term]
+        del postings[document_id]
+        if not postings:
+            del search_postings[term]
+
+
+def _index_search(document: Document) -> None:
+    _unindex_search(document.id)
+    counts: Dict[str, float] = {}
+    fields = (
+        ("name", document.name),
+        ("metadata", metadata_text(document.metadata)),
+        ("text", document_texts.get(document.id, "")),
+    )
+    for field, text in fields:
+        for term in tokenize(text):
+            counts[term] = counts.get(term, 0.0) + SEARCH_WEIGHTS[field]
+
+    terms = {term: log1p(count) for term, count in counts.items()}
+    document_terms[document.id] = terms
+    for term, weight in terms.items():
+        search_postings.setdefault(term, {})[document.id] = weight
+
+
 def create_document(name: str, folder_id: str, file_path: str, file_type: str, 
-                   file_size: int, created_by: str, metadata: Dict[str, Any] = None) -> Document:
+                   file_size: int, created_by: str, metadata: Dict[str, Any] = None,
+                   content_hash: Optional[str] = None) -> Document:
     document_id = str(uuid4())
     document = Document(
         id=document_id,
@@ -163,24 +468,93 @@ def create_document(name: str, folder_id: str, file_path: str, file_type: str,
         file_type=file_type,
         file_size=file_size,
         created_by=created_by,
+        content_hash=content_hash,
         metadata=metadata or {}
     )
     documents[document_id] = document
+    document_versions[document_id] = [_current_version(document, created_by)]
+    _index_add(documents_by_folder, folder_id, document)
+    _count_document(document, 1)
+    _add_blob_reference(content_hash)
+    _index_search(document)
     return document
 
 
+def _copy_document(document: Document, folder_id: str, created_by: str) -> Document:
+    now = datetime.now()
+    copy = document.model_copy(deep=True, update={
+        "id": str(uuid4()), "folder_id": folder_id, "created_by": created_by, "created_at": now, "updated_at": now
+    })
+    documents[copy.id] = copy
+    document_versions[copy.id] = [
+        version.model_copy(update={"document_id": copy.id}) for version in document_versions[document.id]
+    ]
+    for version in document_versions[copy.id]:
+        _add_blob_reference(version.content_hash)
+    if document.id in document_texts:
+        document_texts[copy.id] = document_texts[document.id]
+    _index_add(documents_by_folder, folder_id, copy)
+    _count_document(copy, 1)
+    _index_search(copy)
+    return copy
+
+
+def _current_version(document: Document, created_by: str) -> DocumentVersion:
+    return DocumentVersion(
+        document_id=document.id,
+        version=document.version,
+        file_path=document.file_path,
+        file_type=document.file_type,
+        file_size=document.file_size,
+        content_hash=document.content_hash,
+        created_by=created_by
+    )
+
+
 def get_document_by_id(document_id: str) -> Optional[Document]:
     return documents.get(document_id)
 
 
-def get_documents_by_folder(folder_id: str) -> List[Document]:
-    return [doc for doc in documents.values() if doc.folder_id == folder_id]
+def get_documents_by_ids(document_ids: Iterable[str]) -> List[Document]:
+    return [documents[document_id] for document_id in document_ids if document_id in documents]
+
+
+def get_documents_by_folder(folder_id: str, after: Optional[SortKey] = None,
+                            limit: Optional[int] = None) -> List[Document]:
+    return _page(documents_by_folder.get(folder_id, []), documents, after, limit)
+
 
+def iter_user_accessible_folder_ids(user_id: str) -> Iterator[str]:
+    """Yield every folder the user can see: direct grants and, since grants are inherited, their subtrees."""
+    seen = set()
+    for root_id in list(folder_access_by_user.get(user_id, ())):
+        stack = [root_id]
+        while stack:
+            folder_id = stack.pop()
+            if folder_id in seen or folder_id not in folders:
+                continue
+            seen.add(folder_id)
+            yield folder_id
+            stack.extend(child_id for _, child_id in reversed(folders_by_parent.get(folder_id, [])))
 
-def get_documents_by_user(user_id: str) -> List[Document]:
-    user_folders = get_user_accessible_folders(user_id)
-    folder_ids = [folder.id for folder in user_folders]
-    return [doc for doc in documents.values() if doc.folder_id in folder_ids]
+
+def iter_documents_by_folders(folder_ids: Iterable[str], after: Optional[SortKey] = None) -> Iterator[Document]:
+    """Yield the documents of several folders in (created_at, id) order, merging the per-folder indexes."""
+    streams = []
+    for folder_id in folder_ids:
+        keys = documents_by_folder.get(folder_id)
+        if keys:
+            start = bisect_right(keys, after) if after else 0
+            streams.append(islice(keys, start, None))
+    for _, document_id in merge(*streams):
+        yield documents[document_id]
+
+
+def get_documents_by_user(user_id: str, limit: Optional[int] = None, offset: int = 0,
+                          after: Optional[SortKey] = None) -> List[Document]:
+    results = iter_documents_by_folders(iter_user_accessible_folder_ids(user_id), after)
+    stop = offset + limit if limit is not None else None
+    return list(islice(results, offset, stop))
 
 
 def update_document(document_id: str, **kwargs) -> Optional[Document]:
@@ -188,20 +562,229 @@ def update_document(document_id: str, **kwargs) -> Optional[Document]:
     if not document:
         return None
     
+    old_folder_id = document.folder_id
+    old_content_hash = document.content_hash
+    counted = "folder_id" in kwargs or "file_size" in kwargs
+    if counted:
+        _count_document(document, -1)
+    
     for key, value in kwargs.items():
         if hasattr(document, key):
             setattr(document, key, value)
     
+    if counted:
+        _count_document(document, 1)
+    if document.folder_id != old_folder_id:
+        _index_remove(documents_by_folder, old_folder_id, document)
+        _index_add(documents_by_folder, document.folder_id, document)
+    if document.content_hash != old_content_hash:
+        _remove_blob_reference(old_content_hash)
+        _add_blob_reference(document.content_hash)
+    if VERSION_FIELDS.intersection(kwargs):
+        current = document_versions[document_id][-1]
+        for key in VERSION_FIELDS:
+            setattr(current, key, getattr(document, key))
+    if "name" in kwargs or "metadata" in kwargs:
+        _index_search(document)
+    
     document.updated_at = datetime.now()
     documents[document_id] = document
     return document
 
 
+def update_documents(updates: Dict[str, Dict[str, Any]]) -> List[Document]:
+    """Apply per-document updates ({document_id: fields}) in one call, returning the updated documents."""
+    updated = (update_document(document_id, **kwargs) for document_id, kwargs in updates.items())
+    return [document for document in updated if document]
+
+
 def delete_document(document_id: str) -> bool:
-    if document_id in documents:
-        del documents[document_id]
-        return True
-    return False
+    document = documents.pop(document_id, None)
+    if not document:
+        return False
+    
+    _index_remove(documents_by_folder, document.folder_id, document)
+    _count_document(document, -1)
+    for version in document_versions.pop(document_id, []):
+        _remove_blob_reference(version.content_hash)
+    _unindex_search(document_id)
+    document_texts.pop(document_id, None)
+    return True
+
+
+def delete_documents(document_ids: Iterable[str]) -> List[Document]:
+    """Delete several documents, returning the ones that existed."""
+    deleted = [documents[document_id] for document_id in document_ids if document_id in documents]
+    for document in deleted:
+        delete_document(document.id)
+    return deleted
+
+
+def create_document_version(document_id: str, file_path: str, file_type: str, file_size: int,
+                            created_by: str, content_hash: Optional[str] = None) -> Optional[Document]:
+    """
+    Make new content the current version of a document. Earlier versions stay
+    in its history; derived artifacts and extracted text belong to the old
+    content and are dropped.
+    """
+    document = documents.get(document_id)
+    if not document:
+        return None
+    
+    _count_document(document, -1)
+    document.version += 1
+    document.file_path = file_path
+    document.file_type = file_type
+    document.file_size = file_size
+    _count_document(document, 1)
+    document.content_hash = content_hash
+    document.processing_status = None
+    document.artifacts = []
+    document.updated_at = datetime.now()
+    document_versions[document_id].append(_current_version(document, created_by))
+    _add_blob_reference(content_hash)
+    document_texts.pop(document_id, None)
+    _index_search(document)
+    return document
+
+
+def get_document_versions(document_id: str) -> List[DocumentVersion]:
+    """Return the versions of a document, newest first."""
+    return list(reversed(document_versions.get(document_id, [])))
+
+
+def get_document_version(document_id: str, version: int) -> Optional[DocumentVersion]:
+    versions = document_versions.get(document_id, [])
+    # Versions are numbered from 1 without gaps.
+    return versions[version - 1] if 0 < version <= len(versions) else None
+
+
+def get_versions_of_documents(document_ids: Iterable[str]) -> List[DocumentVersion]:
+    return [version for document_id in document_ids for version in document_versions.get(document_id, [])]
+
+
+def count_blob_references(content_hash: str) -> int:
+    return blob_references.get(content_hash, 0)
+
+
+@contextmanager
+def lock_blobs(keys: List[str]) -> Iterator[None]:
+    """
+    Hold the locks on stored files, given by content hash or legacy path,
+    across processes. The in-memory store lives in one process, whose own
+    lock (storage.blob_lock) already suffices.
+    """
+    yield
+
+
+def count_file_references(file_path: str) -> int:
+    """Count the versions using a file stored before content addressing, which has no blob reference count."""
+    return sum(
+        1 for versions in document_versions.values() for version in versions
+        if version.file_path == file_path and not version.content_hash
+    )
+
+
+def set_document_text(document_id: str, text: str) -> bool:
+    """Attach extracted text to a document for searching."""
+    document = documents.get(document_id)
+    if not document:
+        return False
+    document_texts[document_id] = text
+    _index_search(document)
+    return True
+
+
+def search_documents(query: str, user_id: Optional[str] = None, limit: Optional[int] = None,
+                     offset: int = 0) -> List[Document]:
+    """
+    Rank the documents matching every term of `query`. Only the postings of the
+    query terms are read, starting from the rarest. With `user_id`, results are
+    limited to folders the user can access.
+    """
+    terms = list(dict.fromkeys(tokenize(query)))
+    postings = sorted((search_postings.get(term, {}) for term in terms), key=len)
+    if not postings or not postings[0]:
+        return []
+
+    idf = [log(1 + len(documents) / len(term_postings)) for term_postings in postings]
+    scores = {}
+    for document_id in postings[0]:
+        score = 0.0
+        for term_postings, term_idf in zip(postings, idf):
+            weight = term_postings.get(document_id)
+            if weight is None:
+                break
+            score += weight * term_idf
+        else:
+            if user_id and user_id not in effective_folder_access.get(documents[document_id].folder_id, {}):
+                continue
+            scores[document_id] = score
+
+    rank = lambda item: (item[1], item[0])
+    if limit is None:
+        results = sorted(scores.items(), key=rank, reverse=True)
+    else:
+        results = nlargest(offset + limit, scores.items(), key=rank)
+    return [documents[document_id] for document_id, _ in results[offset:]]
+
+
+def create_upload_session(name: str, folder_id: str, file_type: str, file_size: int, chunk_size: int,
+                          created_by: str, expires_at: datetime, metadata: Dict[str, Any] = None) -> UploadSession:
+    session_id = str(uuid4())
+    session = UploadSession(
+        id=session_id,
+        name=name,
+        folder_id=folder_id,
+        file_type=file_type,
+        file_size=file_size,
+        chunk_size=chunk_size,
+        created_by=created_by,
+        expires_at=expires_at,
+        metadata=metadata or {}
+    )
+    upload_sessions[session_id] = session
+    return session
+
+
+def get_upload_session_by_id(session_id: str) -> Optional[UploadSession]:
+    return upload_sessions.get(session_id)
+
+
+def delete_upload_session(session_id: str) -> bool:
+    return upload_sessions.pop(session_id, None) is not None
+
+
+def get_expired_upload_sessions(now: datetime, limit: Optional[int] = None) -> List[UploadSession]:
+    expired = sorted(
+        (session for session in upload_sessions.values() if session.expires_at <= now),
+        key=lambda session: session.expires_at
+    )
+    return expired[:limit]
+
+
+def create_job(kind: str, target_id: str, created_by: str) -> Job:
+    job_id = str(uuid4())
+    job = Job(id=job_id, kind=kind, target_id=target_id, created_by=created_by)
+    jobs[job_id] = job
+    return job
+
+
+def get_job_by_id(job_id: str) -> Optional[Job]:
+    return jobs.get(job_id)
+
+
+def update_job(job_id: str, **kwargs) -> Optional[Job]:
+    job = jobs.get(job_id)
+    if not job:
+        return None
+    
+    for key, value in kwargs.items():
+        if hasattr(job, key):
+            setattr(job, key, value)
+    
+    job.updated_at = datetime.now()
+    return job
 
 
 def create_approval_form(name: str, created_by: str, description: Optional[str] = None, 
@@ -216,6 +799,7 @@ def create_approval_form(name: str, created_by: str, description: Optional[str]
         target_folder_id=target_folder_id
     )
     approval_forms[form_id] = form
+    insort(approval_forms_by_created, _sort_key(form))
     return form
 
 
@@ -223,8 +807,8 @@ def get_approval_form_by_id(form_id: str) -> Optional[ApprovalForm]:
     return approval_forms.get(form_id)
 
 
-def get_all_approval_forms() -> List[ApprovalForm]:
-    return list(approval_forms.values())
+def get_all_approval_forms(after: Optional[SortKey] = None, limit: Optional[int] = None) -> List[ApprovalForm]:
+    return _page(approval_forms_by_created, approval_forms, after, limit)
 
 
 def update_approval_form(form_id: str, **kwargs) -> Optional[ApprovalForm]:
@@ -242,10 +826,12 @@ def update_approval_form(form_id: str, **kwargs) -> Optional[ApprovalForm]:
 
 
 def delete_approval_form(form_id: str) -> bool:
-    if form_id in approval_forms:
-        del approval_forms[form_id]
-        return True
-    return False
+    form = approval_forms.pop(form_id, None)
+    if not form:
+        return False
+    
+    _sorted_remove(approval_forms_by_created, _sort_key(form))
+    return True
 
 
 def create_approval_route(name: str, created_by: str, description: Optional[str] = None, 
@@ -259,6 +845,7 @@ def create_approval_route(name: str, created_by: str, description: Optional[str]
         created_by=created_by
     )
     approval_routes[route_id] = route
+    insort(approval_routes_by_created, _sort_key(route))
     return route
 
 
@@ -266,15 +853,25 @@ def get_approval_route_by_id(route_id: str) -> Optional[ApprovalRoute]:
     return approval_routes.get(route_id)
 
 
-def get_all_approval_routes() -> List[ApprovalRoute]:
-    return list(approval_routes.values())
+def get_all_approval_routes(after: Optional[SortKey] = None, limit: Optional[int] = None) -> List[ApprovalRoute]:
+    return _page(approval_routes_by_created, approval_routes, after, limit)
 
 
 def update_approval_route(route_id: str, **kwargs) -> Optional[ApprovalRoute]:
+    """
+    Update a route. Pending applications follow the route's steps, so the
+    steps cannot change while any exist; returns None then, as for a missing
+    route.
+    """
     route = approval_routes.get(route_id)
     if not route:
         return None
     
+    if "steps" in kwargs and any(
+        app.route_id == route_id and app.status == ApprovalStatus.PENDING for app in applications.values()
+    ):
+        return None
+    
     for key, value in kwargs.items():
         if hasattr(route, key):
             setattr(route, key, value)
@@ -285,10 +882,15 @@ def update_approval_route(route_id: str, **kwargs) -> Optional[ApprovalRoute]:
 
 
 def delete_approval_route(route_id: str) -> bool:
-    if route_id in approval_routes:
-        del approval_routes[route_id]
-        return True
-    return False
+    if route_id not in approval_routes:
+        return False
+    
+    for app in applications.values():
+        if app.route_id == route_id:
+            _unindex_pending_application(app)
+    route = approval_routes.pop(route_id)
+    _sorted_remove(approval_routes_by_created, _sort_key(route))
+    return True
 
 
 def create_application(form_id: str, route_id: str, applicant_id: str, 
@@ -303,6 +905,7 @@ def create_application(form_id: str, route_id: str, applicant_id: str,
         status=ApprovalStatus.DRAFT
     )
     applications[application_id] = application
+    _index_add(applications_by_applicant, applicant_id, application)
     return application
 
 
@@ -310,20 +913,35 @@ def get_application_by_id(application_id: str) -> Optional[Application]:
     return applications.get(application_id)
 
 
-def get_applications_by_applicant(applicant_id: str) -> List[Application]:
-    return [app for app in applications.values() if app.applicant_id == applicant_id]
+def get_applications_by_applicant(applicant_id: str, after: Optional[SortKey] = None,
+                                  limit: Optional[int] = None) -> List[Application]:
+    return _page(applications_by_applicant.get(applicant_id, []), applications, after, limit)
 
 
-def get_applications_for_approval(approver_id: str) -> List[Application]:
-    result = []
-    for app in applications.values():
-        if app.status == ApprovalStatus.PENDING:
-            route = approval_routes.get(app.route_id)
-            if route and app.current_step < len(route.steps):
-                step = route.steps[app.current_step]
-                if step.approver_id == approver_id and step.status == ApprovalStatus.PENDING:
-                    result.append(app)
-    return result
+def get_applications_for_approval(approver_id: str, after: Optional[SortKey] = None,
+                                  limit: Optional[int] = None) -> List[Application]:
+    return _page(pending_applications_by_approver.get(approver_id, []), applications, after, limit)
+
+
+def _current_approver_id(application: Application) -> Optional[str]:
+    if application.status != ApprovalStatus.PENDING:
+        return None
+    route = approval_routes.get(application.route_id)
+    if not route or application.current_step >= len(route.steps):
+        return None
+    return route.steps[application.current_step].approver_id
+
+
+def _index_pending_application(application: Application) -> None:
+    approver_id = _current_approver_id(application)
+    if approver_id:
+        _index_add(pending_applications_by_approver, approver_id, application)
+
+
+def _unindex_pending_application(application: Application) -> None:
+    approver_id = _current_approver_id(application)
+    if approver_id:
+        _index_remove(pending_applications_by_approver, approver_id, application)
 
 
 def update_application(application_id: str, **kwargs) -> Optional[Application]:
@@ -331,20 +949,29 @@ def update_application(application_id: str, **kwargs) -> Optional[Application]:
     if not application:
         return None
     
+    old_applicant_id = application.applicant_id
+    
     for key, value in kwargs.items():
         if hasattr(application, key):
             setattr(application, key, value)
     
+    if application.applicant_id != old_applicant_id:
+        _index_remove(applications_by_applicant, old_applicant_id, application)
+        _index_add(applications_by_applicant, application.applicant_id, application)
+    
     application.updated_at = datetime.now()
     applications[application_id] = application
     return application
 
 
 def delete_application(application_id: str) -> bool:
-    if application_id in applications:
-        del applications[application_id]
-        return True
-    return False
+    application = applications.pop(application_id, None)
+    if not application:
+        return False
+    
+    _index_remove(applications_by_applicant, application.applicant_id, application)
+    _unindex_pending_application(application)
+    return True
 
 
 def submit_application(application_id: str) -> Optional[Application]:
@@ -353,6 +980,7 @@ def submit_application(application_id: str) -> Optional[Application]:
         return None
     
     application.status = ApprovalStatus.PENDING
+    _index_pending_application(application)
     application.updated_at = datetime.now()
     applications[application_id] = application
     return application
@@ -371,11 +999,16 @@ def approve_application_step(application_id: str, approver_id: str, comment: Opt
     if current_step.approver_id != approver_id:
         return None
     
-    current_step.status = ApprovalStatus.APPROVED
-    current_step.comment = comment
-    current_step.approved_at = datetime.now()
-    route.steps[application.current_step] = current_step
+    # Route steps are a template shared by every application on the route;
+    # progress is recorded on the application itself.
+    application.step_history.append(ApplicationStepRecord(
+        step_id=current_step.id,
+        approver_id=approver_id,
+        status=ApprovalStatus.APPROVED,
+        comment=comment
+    ))
     
+    _unindex_pending_application(application)
     application.current_step += 1
     if application.current_step >= len(route.steps):
         application.status = ApprovalStatus.APPROVED
@@ -385,17 +1018,20 @@ def approve_application_step(application_id: str, approver_id: str, comment: Opt
             document = create_document(
                 name=f"Application {application.id}",
                 folder_id=form.target_folder_id,
-                file_path=f"/applications/{application.id}.pdf",  # This would be a real file path in production
+                # Rendered after the request by app.services.processing, which
+                # fills in the stored path, size and content hash.
+                file_path=f"/applications/{application.id}.pdf",
                 file_type="application/pdf",
-                file_size=0,  # This would be the real file size in production
+                file_size=0,
                 created_by=application.applicant_id,
                 metadata={"application_id": application.id, "form_data": application.form_data}
             )
             application.document_id = document.id
+    else:
+        _index_pending_application(application)
     
     application.updated_at = datetime.now()
     applications[application_id] = application
-    approval_routes[route.id] = route
     
     return application
 
@@ -413,27 +1049,33 @@ def reject_application_step(application_id: str, approver_id: str, comment: Opti
     if current_step.approver_id != approver_id:
         return None
     
-    current_step.status = ApprovalStatus.REJECTED
-    current_step.comment = comment
-    current_step.approved_at = datetime.now()
-    route.steps[application.current_step] = current_step
+    application.step_history.append(ApplicationStepRecord(
+        step_id=current_step.id,
+        approver_id=approver_id,
+        status=ApprovalStatus.REJECTED,
+        comment=comment
+    ))
     
+    _unindex_pending_application(application)
     application.status = ApprovalStatus.REJECTED
     application.updated_at = datetime.now()
     
     applications[application_id] = application
-    approval_routes[route.id] = route
     
     return application
 
 
 def init_data():
-    from app.utils.auth import get_password_hash
+    from app.utils.auth import pwd_context
+    
+    # Runs once at import, before the event loop starts; both sample users
+    # share a password, so it is hashed once.
+    hashed_password = pwd_context.hash("password")
     
     admin = create_user(
         username="admin",
         email="admin@example.com",
-        hashed_password=get_password_hash("password"),
+        hashed_password=hashed_password,
         full_name="Admin User",
         role=UserRole.ADMIN
     )
@@ -441,7 +1083,7 @@ def init_data():
     user = create_user(
         username="user",
         email="user@example.com",
-        hashed_password=get_password_hash("password"),
+        hashed_password=hashed_password,
         full_name="Regular User",
         role=UserRole.USER
     )
@@ -516,7 +1158,6 @@ def init_data():
             ApprovalStep(
                 id=str(uuid4()),
                 approver_id=admin.id,
-                status=ApprovalStatus.PENDING,
                 order=1
             )
         ]
@@ -534,4 +1175,54 @@ def init_data():
     )
 
 
-init_data()
+STORE_FUNCTIONS = (
+    "create_user", "get_user_by_id", "get_user_by_username", "get_user_by_email",
+    "get_all_users", "update_user", "delete_user",
+    "create_folder", "get_folder_by_id", "get_folders_by_parent", "get_user_accessible_folders",
+    "get_folder_permission", "get_effective_folder_permission", "update_folder", "delete_folder",
+    "move_folder", "copy_folder",
+    "get_folder_subtrees", "get_folder_stats",
+    "add_folder_access", "remove_folder_access",
+    "create_document", "get_document_by_id", "get_documents_by_ids", "get_documents_by_folder",
+    "iter_user_accessible_folder_ids", "iter_documents_by_folders", "get_documents_by_user",
+    "update_document", "update_documents", "delete_document", "delete_documents", "count_blob_references", "lock_blobs",
+    "count_file_references",
+    "create_document_version", "get_document_versions", "get_document_version", "get_versions_of_documents",
+    "set_document_text", "search_documents",
+    "create_upload_session", "get_upload_session_by_id", "delete_upload_session", "get_expired_upload_sessions",
+    "create_job", "get_job_by_id", "update_job",
+    "create_approval_form", "get_approval_form_by_id", "get_all_approval_forms",
+    "update_approval_form", "delete_approval_form",
+    "create_approval_route", "get_approval_route_by_id", "get_all_approval_routes",
+    "update_approval_route", "delete_approval_route",
+    "create_application", "get_application_by_id", "get_applications_by_applicant",
+    "get_applications_for_approval", "update_application", "delete_application",
+    "submit_application", "approve_application_step", "reject_application_step",
+)
+
+
+def use_store(store: Any) -> None:
+    """Route the module-level store functions to another backend with the same signatures."""
+    module = globals()
+    for name in STORE_FUNCTIONS:
+        module[name] = getattr(store, name)
+
+
+database_url = os.getenv("DATABASE_URL")
+query_timeout = float(os.getenv("DATABASE_QUERY_TIMEOUT", "10"))
+max_concurrent_queries = int(os.getenv("DATABASE_MAX_CONCURRENCY", "10"))
+
+if database_url:
+    from app.services.postgres import PostgresStore
+    
+    store = PostgresStore(
+        database_url,
+        max_size=max_concurrent_queries,
+        statement_timeout=query_timeout
+    )
+    use_store(store)
+    with store.setup_lock():
+        if not get_all_users(limit=1):
+            init_data()
+else:
+    init_data()
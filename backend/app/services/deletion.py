@@ -0,0 +1,96 @@
+"""
+Deleting documents together with their stored files, and deleting whole
+folder subtrees. A subtree is deleted by a background job that walks it
+through the parent to children index, always removing a folder without
+subfolders, so it holds no more than the path from the root in memory and
+picks up folders added while it runs. Documents go in batches of
+FOLDER_DELETE_BATCH_SIZE, each taking the blob lock on its own, so uploads
+and other deletions interleave with a large job instead of waiting for it.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Dict, List, Set
+import anyio
+from app.models.models import Document, DocumentVersion, Folder, Job, JobStatus
+from app.services.repository import repo
+from app.services.storage import blob_lock, remove_blob, remove_file
+
+FOLDER_DELETE_BATCH_SIZE = int(os.getenv("FOLDER_DELETE_BATCH_SIZE", "100"))
+
+logger = logging.getLogger(__name__)
+
+_jobs: Set[asyncio.Task] = set()
+
+
+def _file_keys(versions: List[DocumentVersion]) -> Set[str]:
+    return {version.content_hash or version.file_path for version in versions}
+
+
+async def delete_documents_and_files(document_ids: List[str]) -> List[Document]:
+    """Delete documents, then unlink the files of all their versions once nothing else references them."""
+    keys = _file_keys(await repo.documents.versions_of(document_ids))
+    while True:
+        async with blob_lock(keys):
+            versions = await repo.documents.versions_of(document_ids)
+            if not _file_keys(versions) <= keys:
+                # A version was added before the locks were taken; lock its file too.
+                keys |= _file_keys(versions)
+                continue
+            deleted = await repo.documents.delete_many(document_ids)
+            deleted_ids = {document.id for document in deleted}
+            versions = [version for version in versions if version.document_id in deleted_ids]
+            for path in {version.file_path for version in versions if not version.content_hash}:
+                if not await repo.documents.file_references(path):
+                    await remove_file(path)
+            for content_hash in {version.content_hash for version in versions if version.content_hash}:
+                if not await repo.documents.blob_references(content_hash):
+                    await remove_blob(content_hash)
+            return deleted
+
+
+async def _delete_folder_documents(job_id: str, folder_id: str, progress: Dict[str, int]) -> None:
+    while True:
+        batch = await repo.documents.by_folder(folder_id, limit=FOLDER_DELETE_BATCH_SIZE)
+        if not batch:
+            return
+        deleted = await delete_documents_and_files([document.id for document in batch])
+        progress["documents_deleted"] += len(deleted)
+        await repo.jobs.update(job_id, progress=dict(progress))
+        # The in-memory store never suspends, so yield between batches explicitly.
+        await anyio.sleep(0)
+
+
+async def _delete_subtree(job_id: str, root_id: str) -> None:
+    progress = {"folders_deleted": 0, "documents_deleted": 0}
+    await repo.jobs.update(job_id, status=JobStatus.RUNNING, progress=dict(progress))
+    try:
+        path = [root_id]
+        while path:
+            children = await repo.folders.by_parent(path[-1], limit=1)
+            if children:
+                path.append(children[0].id)
+                continue
+            folder_id = path.pop()
+            await _delete_folder_documents(job_id, folder_id, progress)
+            if not await repo.folders.delete(folder_id):
+                continue
+            progress["folders_deleted"] += 1
+            if progress["folders_deleted"] % FOLDER_DELETE_BATCH_SIZE == 0:
+                await repo.jobs.update(job_id, progress=dict(progress))
+                await anyio.sleep(0)
+    except Exception:
+        logger.exception("Deleting folder %s failed", root_id)
+        await repo.jobs.update(job_id, status=JobStatus.FAILED, progress=progress, error="Deleting the folder failed")
+        return
+    await repo.jobs.update(job_id, status=JobStatus.COMPLETED, progress=progress)
+
+
+async def schedule_folder_deletion(folder: Folder, created_by: str) -> Job:
+    """Start deleting `folder` with its subfolders, documents and files; returns the job to poll."""
+    job = await repo.jobs.create(kind="delete_folder", target_id=folder.id, created_by=created_by)
+    task = asyncio.get_running_loop().create_task(_delete_subtree(job.id, folder.id))
+    _jobs.add(task)
+    task.add_done_callback(_jobs.discard)
+    return job
@@ -0,0 +1,86 @@
+"""
+Derived artifacts for stored documents: a PNG thumbnail (images, and the
+first-page image of scanned PDFs) and extracted plain text, written next to
+the stored file. These functions run in worker processes, so this module
+must not import the store.
+"""
+
+import io
+import os
+import tempfile
+from typing import Dict, List
+from PIL import Image
+from pypdf import PdfReader
+from app.services.storage import ARTIFACT_SUFFIXES, artifact_path
+
+THUMBNAIL_SIZE = (256, 256)
+MAX_EXTRACTED_TEXT = 1024 * 1024
+TEXT_TYPES = ("text/", "application/json", "application/xml")
+
+
+def _write_artifact(path: str, data: bytes) -> None:
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".artifact-")
+    try:
+        with os.fdopen(fd, "wb") as buffer:
+            buffer.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def _thumbnail(image: Image.Image) -> bytes:
+    image.thumbnail(THUMBNAIL_SIZE)
+    if image.mode not in ("RGB", "RGBA", "L", "LA"):
+        image = image.convert("RGBA")
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def _pdf_artifacts(path: str) -> Dict[str, bytes]:
+    reader = PdfReader(path)
+    artifacts = {}
+
+    text = []
+    length = 0
+    for page in reader.pages:
+        page_text = page.extract_text() or ""
+        text.append(page_text)
+        length += len(page_text)
+        if length >= MAX_EXTRACTED_TEXT:
+            break
+    if length:
+        artifacts["text"] = "\n".join(text)[:MAX_EXTRACTED_TEXT].encode()
+
+    if reader.pages:
+        images = list(reader.pages[0].images)
+        if images:
+            largest = max(images, key=lambda image: image.image.width * image.image.height)
+            artifacts["thumbnail"] = _thumbnail(largest.image)
+    return artifacts
+
+
+def derive_artifacts(path: str, file_type: str) -> List[str]:
+    """
+    Write the artifacts for the file at `path` and return their names. Runs in
+    a worker process. Stored files are content-addressed, so artifacts already
+    derived for the same content are reused.
+    """
+    existing = [name for name in ARTIFACT_SUFFIXES if os.path.exists(artifact_path(path, name))]
+    if existing:
+        return existing
+
+    artifacts: Dict[str, bytes] = {}
+    if file_type.startswith("image/"):
+        with Image.open(path) as image:
+            artifacts["thumbnail"] = _thumbnail(image)
+    elif file_type == "application/pdf":
+        artifacts.update(_pdf_artifacts(path))
+    elif file_type.startswith(TEXT_TYPES):
+        with open(path, "rb") as source:
+            artifacts["text"] = source.read(MAX_EXTRACTED_TEXT).decode("utf-8", errors="replace").encode()
+
+    for name, data in artifacts.items():
+        _write_artifact(artifact_path(path, name), data)
+    return sorted(artifacts)
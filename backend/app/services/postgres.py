@@ -0,0 +1,1197 @@
+"""
+PostgreSQL storage backend for the document management system.
+PostgresStore implements the same functions as app.services.database and is
+selected by setting DATABASE_URL; see database.use_store.
+"""
+
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Tuple, Union
+from uuid import uuid4
+from contextlib import contextmanager
+from datetime import datetime
+from enum import Enum
+import psycopg
+from psycopg.rows import dict_row
+from psycopg.types.json import Jsonb
+from psycopg_pool import ConnectionPool
+from pydantic_core import to_jsonable_python
+from app.services.search import metadata_text, search_terms
+from app.models.models import (
+    User, Folder, FolderStats, Document, DocumentVersion, UploadSession, Job, ApprovalForm, ApprovalRoute,
+    Application, UserRole, FolderPermission, ApprovalStatus,
+    ApprovalStep, FormField, ApplicationStepRecord
+)
+
+SortKey = Tuple[datetime, str]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    username TEXT NOT NULL UNIQUE,
+    email TEXT NOT NULL UNIQUE,
+    hashed_password TEXT NOT NULL,
+    full_name TEXT,
+    role TEXT NOT NULL,
+    created_at TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP NOT NULL
+);
+CREATE INDEX IF NOT EXISTS users_created_idx ON users (created_at, id);
+
+CREATE TABLE IF NOT EXISTS folders (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    parent_id TEXT,
+    created_by TEXT NOT NULL,
+    created_at TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP NOT NULL
+);
+CREATE INDEX IF NOT EXISTS folders_parent_idx ON folders (parent_id, created_at, id);
+-- Byte-wise collation so a subtree is one contiguous range of the path index.
+ALTER TABLE folders ADD COLUMN IF NOT EXISTS path TEXT COLLATE "C";
+CREATE INDEX IF NOT EXISTS folders_path_idx ON folders (path);
+
+CREATE TABLE IF NOT EXISTS folder_access (
+    folder_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    permission TEXT NOT NULL,
+    granted_at TIMESTAMP NOT NULL DEFAULT now(),
+    PRIMARY KEY (folder_id, user_id)
+);
+CREATE INDEX IF NOT EXISTS folder_access_user_idx ON folder_access (user_id, folder_id);
+
+CREATE TABLE IF NOT EXISTS documents (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    folder_id TEXT NOT NULL,
+    file_path TEXT NOT NULL,
+    file_type TEXT NOT NULL,
+    file_size BIGINT NOT NULL,
+    created_by TEXT NOT NULL,
+    content_hash TEXT,
+    processing_status TEXT,
+    artifacts JSONB NOT NULL DEFAULT '[]',
+    created_at TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP NOT NULL,
+    metadata JSONB NOT NULL DEFAULT '{}'
+);
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS content_hash TEXT;
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS processing_status TEXT;
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS artifacts JSONB NOT NULL DEFAULT '[]';
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
+CREATE INDEX IF NOT EXISTS documents_folder_idx ON documents (folder_id, created_at, id);
+CREATE INDEX IF NOT EXISTS documents_content_hash_idx ON documents (content_hash);
+
+CREATE TABLE IF NOT EXISTS document_versions (
+    document_id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    file_path TEXT NOT NULL,
+    file_type TEXT NOT NULL,
+    file_size BIGINT NOT NULL,
+    content_hash TEXT,
+    created_by TEXT NOT NULL,
+    created_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (document_id, version)
+);
+CREATE INDEX IF NOT EXISTS document_versions_content_hash_idx ON document_versions (content_hash);
+
+CREATE TABLE IF NOT EXISTS folder_stats (
+    folder_id TEXT PRIMARY KEY,
+    document_count BIGINT NOT NULL DEFAULT 0,
+    total_size BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE OR REPLACE FUNCTION count_folder_documents() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE folder_stats
+        SET document_count = document_count - 1, total_size = total_size - OLD.file_size
+        WHERE folder_id = OLD.folder_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO folder_stats (folder_id, document_count, total_size) VALUES (NEW.folder_id, 1, NEW.file_size)
+        ON CONFLICT (folder_id) DO UPDATE
+        SET document_count = folder_stats.document_count + 1, total_size = folder_stats.total_size + NEW.file_size;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS documents_folder_stats ON documents;
+CREATE TRIGGER documents_folder_stats
+AFTER INSERT OR DELETE OR UPDATE OF folder_id, file_size ON documents
+FOR EACH ROW EXECUTE FUNCTION count_folder_documents();
+
+CREATE TABLE IF NOT EXISTS document_search (
+    document_id TEXT PRIMARY KEY,
+    content TEXT NOT NULL DEFAULT '',
+    search_vector TSVECTOR NOT NULL
+);
+CREATE INDEX IF NOT EXISTS document_search_vector_idx ON document_search USING GIN (search_vector);
+
+CREATE TABLE IF NOT EXISTS upload_sessions (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    folder_id TEXT NOT NULL,
+    file_type TEXT NOT NULL,
+    file_size BIGINT NOT NULL,
+    chunk_size BIGINT NOT NULL,
+    created_by TEXT NOT NULL,
+    created_at TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP NOT NULL,
+    metadata JSONB NOT NULL DEFAULT '{}'
+);
+ALTER TABLE upload_sessions ADD COLUMN IF NOT EXISTS expires_at TIMESTAMP NOT NULL DEFAULT now() + interval '1 day';
+CREATE INDEX IF NOT EXISTS upload_sessions_expires_idx ON upload_sessions (expires_at);
+
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    target_id TEXT NOT NULL,
+    created_by TEXT NOT NULL,
+    status TEXT NOT NULL,
+    progress JSONB NOT NULL DEFAULT '{}',
+    error TEXT,
+    created_at TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS approval_forms (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT,
+    fields JSONB NOT NULL DEFAULT '[]',
+    created_by TEXT NOT NULL,
+    target_folder_id TEXT,
+    created_at TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP NOT NULL
+);
+CREATE INDEX IF NOT EXISTS approval_forms_created_idx ON approval_forms (created_at, id);
+
+CREATE TABLE IF NOT EXISTS approval_routes (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT,
+    steps JSONB NOT NULL DEFAULT '[]',
+    created_by TEXT NOT NULL,
+    created_at TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP NOT NULL
+);
+CREATE INDEX IF NOT EXISTS approval_routes_created_idx ON approval_routes (created_at, id);
+
+CREATE TABLE IF NOT EXISTS applications (
+    id TEXT PRIMARY KEY,
+    form_id TEXT NOT NULL,
+    route_id TEXT NOT NULL,
+    applicant_id TEXT NOT NULL,
+    current_step INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    form_data JSONB NOT NULL DEFAULT '{}',
+    step_history JSONB NOT NULL DEFAULT '[]',
+    document_id TEXT,
+    current_approver_id TEXT,
+    created_at TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP NOT NULL
+);
+CREATE INDEX IF NOT EXISTS applications_applicant_idx ON applications (applicant_id, created_at, id);
+CREATE INDEX IF NOT EXISTS applications_route_idx ON applications (route_id);
+CREATE INDEX IF NOT EXISTS applications_inbox_idx ON applications (current_approver_id, created_at, id)
+    WHERE current_approver_id IS NOT NULL;
+"""
+
+FOLDER_SELECT = """
+SELECT f.*, COALESCE(
+    (SELECT json_agg(json_build_object('user_id', fa.user_id, 'permission', fa.permission)
+                     ORDER BY fa.granted_at)
+     FROM folder_access fa WHERE fa.folder_id = f.id),
+    '[]'
+) AS access_list
+FROM folders f
+"""
+
+# Rebuilds one document's search vector from its name and metadata terms and
+# either the given text terms or those stored before. Terms come from
+# app.services.search so both backends match alike; weights A/B/C rank name
+# matches above metadata above body text.
+REFRESH_SEARCH = """
+INSERT INTO document_search (document_id, content, search_vector)
+SELECT %(id)s, c.content,
+    setweight(to_tsvector('simple', %(name)s), 'A')
+    || setweight(to_tsvector('simple', %(metadata)s), 'B')
+    || setweight(to_tsvector('simple', c.content), 'C')
+FROM (
+    SELECT COALESCE(%(content)s::text, (SELECT content FROM document_search WHERE document_id = %(id)s), '') AS content
+) c
+ON CONFLICT (document_id) DO UPDATE SET content = EXCLUDED.content, search_vector = EXCLUDED.search_vector
+"""
+
+# Fills in the materialized path of every folder from its parent's; folders
+# whose parent no longer exists are treated as roots.
+BUILD_FOLDER_PATHS = """
+WITH RECURSIVE tree (id, path) AS (
+    SELECT id, '/' || id || '/' FROM folders f
+    WHERE parent_id IS NULL OR NOT EXISTS (SELECT 1 FROM folders p WHERE p.id = f.parent_id)
+    UNION ALL
+    SELECT f.id, t.path || f.id || '/' FROM folders f JOIN tree t ON f.parent_id = t.id
+)
+UPDATE folders f SET path = t.path FROM tree t WHERE f.id = t.id AND f.path IS DISTINCT FROM t.path
+"""
+
+# Number of levels in a materialized path below the root.
+PATH_DEPTH = "(length({0}) - length(replace({0}, '/', '')) - 2)"
+
+# Folders d in the subtree of r: paths from "/a/b/" up to, but excluding,
+# "/a/b0" ('0' sorts right after '/'), a range scan of the C-collated index.
+SUBTREE_OF_ROOT = "d.path >= r.path AND d.path < left(r.path, -1) || '0'"
+
+# The folders a user can reach: the subtrees of the folders granted to them.
+DESCENDANTS_CTE = f"""
+WITH accessible (id) AS (
+    SELECT DISTINCT d.id FROM folder_access fa
+    JOIN folders r ON r.id = fa.folder_id
+    JOIN folders d ON {SUBTREE_OF_ROOT}
+    WHERE fa.user_id = %s
+)
+"""
+
+# A user's strongest grant on a folder or any of its ancestors, whose ids
+# are the segments of the folder's materialized path.
+EFFECTIVE_PERMISSION = """
+SELECT fa.permission FROM folders f
+JOIN folder_access fa ON fa.user_id = %s AND fa.folder_id = ANY(string_to_array(trim(BOTH '/' FROM f.path), '/'))
+WHERE f.id = %s
+ORDER BY CASE fa.permission WHEN 'admin' THEN 3 WHEN 'write' THEN 2 ELSE 1 END DESC
+LIMIT 1
+"""
+
+# Copies a document's content columns onto its current version row.
+SYNC_CURRENT_VERSION = """
+UPDATE document_versions v
+SET file_path = d.file_path, file_type = d.file_type, file_size = d.file_size, content_hash = d.content_hash
+FROM documents d
+WHERE d.id = %s AND v.document_id = d.id AND v.version = d.version
+"""
+
+VERSION_COLUMNS = {"file_path", "file_type", "file_size", "content_hash"}
+
+# Advisory lock key taken by move_folder.
+MOVE_FOLDERS_LOCK = 0x666f6c64
+
+# Advisory lock namespace for stored files; the second key is the hash of
+# the content hash or legacy path.
+BLOB_LOCKS = 0x626c6f62
+
+# Advisory lock key held while a process creates the schema, backfills or
+# seeds data, so several workers starting at once take turns.
+SETUP_LOCK = 0x73657475
+
+# Copies documents, with their versions and search entries, given parallel
+# arrays of old ids, new ids and target folder ids. The copies reference the
+# same stored files; counting version rows keeps those alive while any copy
+# uses them.
+COPY_DOCUMENTS = (
+    """
+    INSERT INTO documents (id, name, folder_id, file_path, file_type, file_size, created_by, content_hash,
+                           version, processing_status, artifacts, created_at, updated_at, metadata)
+    SELECT m.new_id, d.name, m.folder_id, d.file_path, d.file_type, d.file_size, %(created_by)s, d.content_hash,
+           d.version, d.processing_status, d.artifacts, %(now)s, %(now)s, d.metadata
+    FROM unnest(%(old)s::text[], %(new)s::text[], %(folder)s::text[]) AS m(old_id, new_id, folder_id)
+    JOIN documents d ON d.id = m.old_id
+    """,
+    """
+    INSERT INTO document_versions (document_id, version, file_path, file_type, file_size, content_hash,
+                                   created_by, created_at)
+    SELECT m.new_id, v.version, v.file_path, v.file_type, v.file_size, v.content_hash, v.created_by, v.created_at
+    FROM unnest(%(old)s::text[], %(new)s::text[]) AS m(old_id, new_id)
+    JOIN document_versions v ON v.document_id = m.old_id
+    """,
+    """
+    INSERT INTO document_search (document_id, content, search_vector)
+    SELECT m.new_id, s.content, s.search_vector
+    FROM unnest(%(old)s::text[], %(new)s::text[]) AS m(old_id, new_id)
+    JOIN document_search s ON s.document_id = m.old_id
+    """,
+)
+
+JSON_COLUMNS = {"metadata", "fields", "steps", "form_data", "step_history", "artifacts", "progress"}
+
+
+def _page_clause(after: Optional[SortKey], limit: Optional[int], prefix: str = "") -> Tuple[str, List[Any]]:
+    clause = ""
+    params: List[Any] = []
+    if after:
+        clause += f" AND ({prefix}created_at, {prefix}id) > (%s, %s)"
+        params.extend(after)
+    clause += f" ORDER BY {prefix}created_at, {prefix}id LIMIT %s"
+    params.append(limit)
+    return clause, params
+
+
+def _db_value(column: str, value: Any) -> Any:
+    if column in JSON_COLUMNS:
+        return Jsonb(to_jsonable_python(value))
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _search_params(document: Document, text: Optional[str] = None) -> Dict[str, Any]:
+    return {
+        "id": document.id,
+        "name": search_terms(document.name),
+        "metadata": search_terms(metadata_text(document.metadata)),
+        "content": search_terms(text) if text is not None else None,
+    }
+
+
+def _subtree_bounds(path: str) -> Tuple[str, str]:
+    """The [low, high) range of paths in the subtree of `path`; see SUBTREE_OF_ROOT."""
+    return path, path[:-1] + "0"
+
+
+def _insert_statement(table: str, record: Any, exclude: Iterable[str] = ()) -> Tuple[str, List[Any]]:
+    data = {
+        key: _db_value(key, value)
+        for key, value in record.__dict__.items()
+        if key not in exclude
+    }
+    columns = ", ".join(data)
+    placeholders = ", ".join(["%s"] * len(data))
+    return f"INSERT INTO {table} ({columns}) VALUES ({placeholders})", list(data.values())
+
+
+def _current_version(document: Document, created_by: str) -> DocumentVersion:
+    return DocumentVersion(
+        document_id=document.id,
+        version=document.version,
+        file_path=document.file_path,
+        file_type=document.file_type,
+        file_size=document.file_size,
+        content_hash=document.content_hash,
+        created_by=created_by
+    )
+
+
+def _update_statement(table: str, model: Any, record_id: str, kwargs: Dict[str, Any],
+                      exclude: Iterable[str] = ()) -> Tuple[str, List[Any]]:
+    data = {
+        key: _db_value(key, value)
+        for key, value in kwargs.items()
+        if key in model.model_fields and key not in ("id", "created_at") and key not in exclude
+    }
+    data["updated_at"] = datetime.now()
+    assignments = ", ".join(f"{key} = %s" for key in data)
+    return f"UPDATE {table} SET {assignments} WHERE id = %s", [*data.values(), record_id]
+
+
+class PostgresStore:
+    """Store backend keeping every entity in PostgreSQL, accessed through a connection pool."""
+
+    def __init__(self, conninfo: str, min_size: int = 1, max_size: int = 10,
+                 statement_timeout: Optional[float] = None):
+        connection_kwargs = {"row_factory": dict_row, "autocommit": True}
+        if statement_timeout:
+            connection_kwargs["options"] = f"-c statement_timeout={int(statement_timeout * 1000)}"
+        self.conninfo = conninfo
+        self.pool = ConnectionPool(
+            conninfo,
+            min_size=min_size,
+            max_size=max_size,
+            kwargs=connection_kwargs,
+            open=True
+        )
+        with self.setup_lock():
+            with self.pool.connection() as conn:
+                conn.execute(SCHEMA)
+            self._version_unversioned_documents()
+            self._index_unsearchable_documents()
+            self._backfill_folder_tree()
+
+    def close(self) -> None:
+        self.pool.close()
+
+    @contextmanager
+    def setup_lock(self) -> Iterator[None]:
+        """
+        Hold the setup advisory lock for the block. The lock lives on its own
+        connection, outside the pool, so the block can use pooled connections
+        freely.
+        """
+        with psycopg.connect(self.conninfo, autocommit=True) as conn:
+            conn.execute("SELECT pg_advisory_lock(%s)", [SETUP_LOCK])
+            try:
+                yield
+            finally:
+                conn.execute("SELECT pg_advisory_unlock(%s)", [SETUP_LOCK])
+
+    def _version_unversioned_documents(self) -> None:
+        self._execute(
+            """INSERT INTO document_versions
+                (document_id, version, file_path, file_type, file_size, content_hash, created_by, created_at)
+            SELECT id, version, file_path, file_type, file_size, content_hash, created_by, created_at
+            FROM documents d
+            WHERE NOT EXISTS (SELECT 1 FROM document_versions v WHERE v.document_id = d.id)"""
+        )
+
+    def _backfill_folder_tree(self) -> None:
+        if self._fetch_one("SELECT 1 FROM folders WHERE path IS NULL LIMIT 1"):
+            self._execute(BUILD_FOLDER_PATHS)
+        self._execute(
+            """INSERT INTO folder_stats (folder_id, document_count, total_size)
+            SELECT folder_id, count(*), sum(file_size) FROM documents d
+            WHERE NOT EXISTS (SELECT 1 FROM folder_stats s WHERE s.folder_id = d.folder_id)
+            GROUP BY folder_id"""
+        )
+
+    def _index_unsearchable_documents(self) -> None:
+        rows = self._fetch_all(
+            """SELECT d.* FROM documents d
+            WHERE NOT EXISTS (SELECT 1 FROM document_search s WHERE s.document_id = d.id)"""
+        )
+        for row in rows:
+            self._execute(REFRESH_SEARCH, _search_params(Document(**row)))
+
+    def _fetch_one(self, query: str, params: Iterable[Any] = ()) -> Optional[Dict[str, Any]]:
+        with self.pool.connection() as conn:
+            return conn.execute(query, list(params), prepare=True).fetchone()
+
+    def _fetch_all(self, query: str, params: Iterable[Any] = ()) -> List[Dict[str, Any]]:
+        with self.pool.connection() as conn:
+            return conn.execute(query, list(params), prepare=True).fetchall()
+
+    def _execute(self, query: str, params: Union[Iterable[Any], Dict[str, Any]] = ()) -> int:
+        with self.pool.connection() as conn:
+            params = params if isinstance(params, dict) else list(params)
+            return conn.execute(query, params, prepare=True).rowcount
+
+    def _insert(self, table: str, record: Any, exclude: Iterable[str] = ()) -> None:
+        self._execute(*_insert_statement(table, record, exclude))
+
+    def _update(self, table: str, model: Any, record_id: str, kwargs: Dict[str, Any],
+                exclude: Iterable[str] = ()) -> bool:
+        return self._execute(*_update_statement(table, model, record_id, kwargs, exclude)) > 0
+
+    def _delete(self, table: str, record_id: str) -> bool:
+        return self._execute(f"DELETE FROM {table} WHERE id = %s", [record_id]) > 0
+
+    # Users
+
+    def create_user(self, username: str, email: str, hashed_password: str, full_name: Optional[str] = None,
+                    role: UserRole = UserRole.USER) -> User:
+        user = User(
+            id=str(uuid4()),
+            username=username,
+            email=email,
+            hashed_password=hashed_password,
+            full_name=full_name,
+            role=role
+        )
+        self._insert("users", user)
+        return user
+
+    def get_user_by_id(self, user_id: str) -> Optional[User]:
+        row = self._fetch_one("SELECT * FROM users WHERE id = %s", [user_id])
+        return User(**row) if row else None
+
+    def get_user_by_username(self, username: str) -> Optional[User]:
+        row = self._fetch_one("SELECT * FROM users WHERE username = %s", [username])
+        return User(**row) if row else None
+
+    def get_user_by_email(self, email: str) -> Optional[User]:
+        row = self._fetch_one("SELECT * FROM users WHERE email = %s", [email])
+        return User(**row) if row else None
+
+    def get_all_users(self, after: Optional[SortKey] = None, limit: Optional[int] = None) -> List[User]:
+        clause, params = _page_clause(after, limit)
+        return [User(**row) for row in self._fetch_all(f"SELECT * FROM users WHERE TRUE{clause}", params)]
+
+    def update_user(self, user_id: str, **kwargs) -> Optional[User]:
+        if not self._update("users", User, user_id, kwargs):
+            return None
+        return self.get_user_by_id(user_id)
+
+    def delete_user(self, user_id: str) -> bool:
+        return self._delete("users", user_id)
+
+    # Folders
+
+    def create_folder(self, name: str, created_by: str, parent_id: Optional[str] = None) -> Folder:
+        folder_id = str(uuid4())
+        with self.pool.connection() as conn:
+            with conn.transaction():
+                parent = conn.execute(
+                    "SELECT path FROM folders WHERE id = %s", [parent_id]
+                ).fetchone() if parent_id else None
+                folder = Folder(
+                    id=folder_id,
+                    name=name,
+                    parent_id=parent_id,
+                    path=f"{parent['path'] if parent else '/'}{folder_id}/",
+                    created_by=created_by
+                )
+                conn.execute(*_insert_statement("folders", folder, exclude=["access_list"]), prepare=True)
+                # The creator's grant commits with the folder, so no reader
+                # ever sees a folder nobody administers.
+                conn.execute(
+                    """INSERT INTO folder_access (folder_id, user_id, permission, granted_at)
+                    VALUES (%s, %s, %s, clock_timestamp())""",
+                    [folder_id, created_by, FolderPermission.ADMIN.value],
+                    prepare=True
+                )
+        return self.get_folder_by_id(folder_id)
+
+    def get_folder_by_id(self, folder_id: str) -> Optional[Folder]:
+        row = self._fetch_one(f"{FOLDER_SELECT} WHERE f.id = %s", [folder_id])
+        return Folder(**row) if row else None
+
+    def get_folders_by_parent(self, parent_id: Optional[str], after: Optional[SortKey] = None,
+                              limit: Optional[int] = None) -> List[Folder]:
+        clause, params = _page_clause(after, limit, "f.")
+        rows = self._fetch_all(
+            f"{FOLDER_SELECT} WHERE f.parent_id IS NOT DISTINCT FROM %s{clause}", [parent_id, *params]
+        )
+        return [Folder(**row) for row in rows]
+
+    def get_user_accessible_folders(self, user_id: str, after: Optional[SortKey] = None,
+                                    limit: Optional[int] = None) -> List[Folder]:
+        clause, params = _page_clause(after, limit, "f.")
+        rows = self._fetch_all(
+            f"{FOLDER_SELECT} WHERE f.id IN (SELECT folder_id FROM folder_access WHERE user_id = %s){clause}",
+            [user_id, *params]
+        )
+        return [Folder(**row) for row in rows]
+
+    def get_folder_permission(self, folder_id: str, user_id: str) -> Optional[FolderPermission]:
+        row = self._fetch_one(
+            "SELECT permission FROM folder_access WHERE folder_id = %s AND user_id = %s",
+            [folder_id, user_id]
+        )
+        return FolderPermission(row["permission"]) if row else None
+
+    def get_effective_folder_permission(self, folder_id: str, user_id: str) -> Optional[FolderPermission]:
+        row = self._fetch_one(EFFECTIVE_PERMISSION, [user_id, folder_id])
+        return FolderPermission(row["permission"]) if row else None
+
+    def update_folder(self, folder_id: str, **kwargs) -> Optional[Folder]:
+        # Re-parenting goes through move_folder, which keeps the paths in step.
+        if not self._update("folders", Folder, folder_id, kwargs, exclude=["access_list", "path", "parent_id"]):
+            return None
+        return self.get_folder_by_id(folder_id)
+
+    def move_folder(self, folder_id: str, parent_id: Optional[str]) -> Optional[Folder]:
+        with self.pool.connection() as conn:
+            with conn.transaction():
+                # Two moves that each look valid alone can together form a
+                # cycle, so moves take turns.
+                conn.execute("SELECT pg_advisory_xact_lock(%s)", [MOVE_FOLDERS_LOCK])
+                folder = conn.execute("SELECT path, parent_id FROM folders WHERE id = %s", [folder_id]).fetchone()
+                parent = conn.execute(
+                    "SELECT path FROM folders WHERE id = %s", [parent_id]
+                ).fetchone() if parent_id else None
+                if not folder or (parent_id and (not parent or parent["path"].startswith(folder["path"]))):
+                    return None
+                if folder["parent_id"] != parent_id:
+                    conn.execute(
+                        "UPDATE folders SET parent_id = %s, updated_at = %s WHERE id = %s",
+                        [parent_id, datetime.now(), folder_id]
+                    )
+                    self._move_subtree(conn, folder["path"], f"{parent['path'] if parent else '/'}{folder_id}/")
+        return self.get_folder_by_id(folder_id)
+
+    def copy_folder(self, folder_id: str, parent_id: Optional[str], created_by: str,
+                    name: Optional[str] = None) -> Optional[Folder]:
+        with self.pool.connection() as conn:
+            with conn.transaction():
+                root = conn.execute("SELECT path FROM folders WHERE id = %s", [folder_id]).fetchone()
+                parent = conn.execute(
+                    "SELECT path FROM folders WHERE id = %s", [parent_id]
+                ).fetchone() if parent_id else None
+                if not root or (parent_id and not parent):
+                    return None
+                
+                sources = conn.execute(
+                    f"""SELECT id, parent_id, name FROM folders WHERE path >= %s AND path < %s
+                    ORDER BY {PATH_DEPTH.format('path')}, created_at, id""",
+                    list(_subtree_bounds(root["path"]))
+                ).fetchall()
+                copies: Dict[str, Folder] = {}
+                for source in sources:
+                    is_root = source["id"] == folder_id
+                    copy_parent = parent if is_root else {"path": copies[source["parent_id"]].path}
+                    copy_id = str(uuid4())
+                    copies[source["id"]] = copy = Folder(
+                        id=copy_id,
+                        name=(name or source["name"]) if is_root else source["name"],
+                        parent_id=parent_id if is_root else copies[source["parent_id"]].id,
+                        path=f"{copy_parent['path'] if copy_parent else '/'}{copy_id}/",
+                        created_by=created_by
+                    )
+                    conn.execute(*_insert_statement("folders", copy, exclude=["access_list"]))
+                with conn.cursor() as cursor:
+                    cursor.executemany(
+                        """INSERT INTO folder_access (folder_id, user_id, permission, granted_at)
+                        VALUES (%s, %s, %s, clock_timestamp())""",
+                        [(copy.id, created_by, FolderPermission.ADMIN.value) for copy in copies.values()]
+                    )
+                
+                documents = conn.execute(
+                    "SELECT id, folder_id FROM documents WHERE folder_id = ANY(%s) ORDER BY created_at, id",
+                    [list(copies)]
+                ).fetchall()
+                mapping = {
+                    "old": [row["id"] for row in documents],
+                    "new": [str(uuid4()) for _ in documents],
+                    "folder": [copies[row["folder_id"]].id for row in documents],
+                    "created_by": created_by,
+                    "now": datetime.now(),
+                }
+                for statement in COPY_DOCUMENTS:
+                    conn.execute(statement, mapping)
+        return self.get_folder_by_id(copies[folder_id].id)
+
+    @staticmethod
+    def _move_subtree(conn: Any, old_path: str, new_path: str) -> None:
+        conn.execute(
+            "UPDATE folders SET path = %s || substr(path, %s) WHERE path >= %s AND path < %s",
+            [new_path, len(old_path) + 1, *_subtree_bounds(old_path)]
+        )
+
+    def get_folder_subtrees(self, root_ids: Iterable[str], max_depth: Optional[int] = None) -> List[Folder]:
+        depth = ""
+        params: List[Any] = [list(root_ids)]
+        if max_depth is not None:
+            depth = f" AND {PATH_DEPTH.format('d.path')} - {PATH_DEPTH.format('r.path')} <= %s"
+            params.append(max_depth)
+        rows = self._fetch_all(
+            f"""{FOLDER_SELECT}
+            WHERE f.id IN (
+                SELECT d.id FROM folders r JOIN folders d ON {SUBTREE_OF_ROOT}
+                WHERE r.id = ANY(%s){depth}
+            )
+            ORDER BY {PATH_DEPTH.format('f.path')}, f.created_at, f.id""",
+            params
+        )
+        return [Folder(**row) for row in rows]
+
+    def get_folder_stats(self, folder_ids: Iterable[str]) -> List[FolderStats]:
+        rows = self._fetch_all("SELECT * FROM folder_stats WHERE folder_id = ANY(%s)", [list(folder_ids)])
+        return [FolderStats(**row) for row in rows]
+
+    def delete_folder(self, folder_id: str) -> bool:
+        with self.pool.connection() as conn:
+            with conn.transaction():
+                conn.execute("DELETE FROM folder_access WHERE folder_id = %s", [folder_id], prepare=True)
+                conn.execute("DELETE FROM folder_stats WHERE folder_id = %s", [folder_id], prepare=True)
+                return conn.execute("DELETE FROM folders WHERE id = %s", [folder_id], prepare=True).rowcount > 0
+
+    def add_folder_access(self, folder_id: str, user_id: str, permission: FolderPermission) -> Optional[Folder]:
+        with self.pool.connection() as conn:
+            with conn.transaction():
+                updated = conn.execute(
+                    "UPDATE folders SET updated_at = %s WHERE id = %s", [datetime.now(), folder_id], prepare=True
+                ).rowcount
+                if not updated:
+                    return None
+                conn.execute(
+                    """INSERT INTO folder_access (folder_id, user_id, permission, granted_at)
+                    VALUES (%s, %s, %s, clock_timestamp())
+                    ON CONFLICT (folder_id, user_id)
+                    DO UPDATE SET permission = EXCLUDED.permission, granted_at = EXCLUDED.granted_at""",
+                    [folder_id, user_id, permission.value],
+                    prepare=True
+                )
+        return self.get_folder_by_id(folder_id)
+
+    def remove_folder_access(self, folder_id: str, user_id: str) -> Optional[Folder]:
+        with self.pool.connection() as conn:
+            with conn.transaction():
+                updated = conn.execute(
+                    "UPDATE folders SET updated_at = %s WHERE id = %s", [datetime.now(), folder_id], prepare=True
+                ).rowcount
+                if not updated:
+                    return None
+                conn.execute(
+                    "DELETE FROM folder_access WHERE folder_id = %s AND user_id = %s",
+                    [folder_id, user_id],
+                    prepare=True
+                )
+        return self.get_folder_by_id(folder_id)
+
+    # Documents
+
+    def create_document(self, name: str, folder_id: str, file_path: str, file_type: str,
+                        file_size: int, created_by: str, metadata: Dict[str, Any] = None,
+                        content_hash: Optional[str] = None) -> Document:
+        document = Document(
+            id=str(uuid4()),
+            name=name,
+            folder_id=folder_id,
+            file_path=file_path,
+            file_type=file_type,
+            file_size=file_size,
+            created_by=created_by,
+            content_hash=content_hash,
+            metadata=metadata or {}
+        )
+        with self.pool.connection() as conn:
+            with conn.transaction():
+                conn.execute(*_insert_statement("documents", document))
+                conn.execute(*_insert_statement("document_versions", _current_version(document, created_by)))
+                conn.execute(REFRESH_SEARCH, _search_params(document), prepare=True)
+        return document
+
+    def get_document_by_id(self, document_id: str) -> Optional[Document]:
+        row = self._fetch_one("SELECT * FROM documents WHERE id = %s", [document_id])
+        return Document(**row) if row else None
+
+    def get_documents_by_folder(self, folder_id: str, after: Optional[SortKey] = None,
+                                limit: Optional[int] = None) -> List[Document]:
+        clause, params = _page_clause(after, limit)
+        rows = self._fetch_all(f"SELECT * FROM documents WHERE folder_id = %s{clause}", [folder_id, *params])
+        return [Document(**row) for row in rows]
+
+    def iter_user_accessible_folder_ids(self, user_id: str) -> Iterator[str]:
+        rows = self._fetch_all(f"{DESCENDANTS_CTE} SELECT id FROM accessible", [user_id])
+        return (row["id"] for row in rows)
+
+    def iter_documents_by_folders(self, folder_ids: Iterable[str],
+                                  after: Optional[SortKey] = None) -> Iterator[Document]:
+        clause, params = _page_clause(after, None)
+        rows = self._fetch_all(
+            f"SELECT * FROM documents WHERE folder_id = ANY(%s){clause}", [list(folder_ids), *params]
+        )
+        return (Document(**row) for row in rows)
+
+    def get_documents_by_user(self, user_id: str, limit: Optional[int] = None, offset: int = 0,
+                              after: Optional[SortKey] = None) -> List[Document]:
+        clause, params = _page_clause(after, limit)
+        rows = self._fetch_all(
+            f"""{DESCENDANTS_CTE}
+            SELECT * FROM documents WHERE folder_id IN (SELECT id FROM accessible){clause} OFFSET %s""",
+            [user_id, *params, offset]
+        )
+        return [Document(**row) for row in rows]
+
+    def get_documents_by_ids(self, document_ids: Iterable[str]) -> List[Document]:
+        rows = self._fetch_all("SELECT * FROM documents WHERE id = ANY(%s)", [list(document_ids)])
+        return [Document(**row) for row in rows]
+
+    def update_document(self, document_id: str, **kwargs) -> Optional[Document]:
+        if not self._update("documents", Document, document_id, kwargs):
+            return None
+        if VERSION_COLUMNS.intersection(kwargs):
+            self._execute(SYNC_CURRENT_VERSION, [document_id])
+        document = self.get_document_by_id(document_id)
+        if document and ("name" in kwargs or "metadata" in kwargs):
+            self._execute(REFRESH_SEARCH, _search_params(document))
+        return document
+
+    def update_documents(self, updates: Dict[str, Dict[str, Any]]) -> List[Document]:
+        updated = []
+        with self.pool.connection() as conn:
+            with conn.transaction():
+                for document_id, kwargs in updates.items():
+                    query, params = _update_statement("documents", Document, document_id, kwargs)
+                    row = conn.execute(f"{query} RETURNING *", params).fetchone()
+                    if row:
+                        document = Document(**row)
+                        updated.append(document)
+                        if VERSION_COLUMNS.intersection(kwargs):
+                            conn.execute(SYNC_CURRENT_VERSION, [document_id], prepare=True)
+                        if "name" in kwargs or "metadata" in kwargs:
+                            conn.execute(REFRESH_SEARCH, _search_params(document), prepare=True)
+        return updated
+
+    def delete_document(self, document_id: str) -> bool:
+        return bool(self.delete_documents([document_id]))
+
+    def delete_documents(self, document_ids: Iterable[str]) -> List[Document]:
+        document_ids = list(document_ids)
+        with self.pool.connection() as conn:
+            with conn.transaction():
+                conn.execute("DELETE FROM document_search WHERE document_id = ANY(%s)", [document_ids], prepare=True)
+                conn.execute("DELETE FROM document_versions WHERE document_id = ANY(%s)", [document_ids], prepare=True)
+                rows = conn.execute(
+                    "DELETE FROM documents WHERE id = ANY(%s) RETURNING *", [document_ids], prepare=True
+                ).fetchall()
+        return [Document(**row) for row in rows]
+
+    def count_blob_references(self, content_hash: str) -> int:
+        row = self._fetch_one(
+            "SELECT count(*) AS total FROM document_versions WHERE content_hash = %s", [content_hash]
+        )
+        return row["total"]
+
+    @contextmanager
+    def lock_blobs(self, keys: List[str]) -> Iterator[None]:
+        """
+        Hold transaction-level advisory locks on the given stored files, so
+        processes sharing the database take turns committing and releasing
+        them. Callers pass the keys sorted, so two lockers cannot deadlock.
+        """
+        with self.pool.connection() as conn:
+            with conn.transaction():
+                for key in keys:
+                    conn.execute("SELECT pg_advisory_xact_lock(%s, hashtext(%s))", [BLOB_LOCKS, key], prepare=True)
+                yield
+
+    def count_file_references(self, file_path: str) -> int:
+        row = self._fetch_one(
+            "SELECT count(*) AS total FROM document_versions WHERE file_path = %s AND content_hash IS NULL",
+            [file_path]
+        )
+        return row["total"]
+
+    def create_document_version(self, document_id: str, file_path: str, file_type: str, file_size: int,
+                                created_by: str, content_hash: Optional[str] = None) -> Optional[Document]:
+        with self.pool.connection() as conn:
+            with conn.transaction():
+                row = conn.execute(
+                    """UPDATE documents
+                    SET version = version + 1, file_path = %s, file_type = %s, file_size = %s, content_hash = %s,
+                        processing_status = NULL, artifacts = '[]', updated_at = %s
+                    WHERE id = %s
+                    RETURNING *""",
+                    [file_path, file_type, file_size, content_hash, datetime.now(), document_id]
+                ).fetchone()
+                if not row:
+                    return None
+                document = Document(**row)
+                conn.execute(*_insert_statement("document_versions", _current_version(document, created_by)))
+                conn.execute(REFRESH_SEARCH, _search_params(document, ""), prepare=True)
+        return document
+
+    def get_document_versions(self, document_id: str) -> List[DocumentVersion]:
+        rows = self._fetch_all(
+            "SELECT * FROM document_versions WHERE document_id = %s ORDER BY version DESC", [document_id]
+        )
+        return [DocumentVersion(**row) for row in rows]
+
+    def get_document_version(self, document_id: str, version: int) -> Optional[DocumentVersion]:
+        row = self._fetch_one(
+            "SELECT * FROM document_versions WHERE document_id = %s AND version = %s", [document_id, version]
+        )
+        return DocumentVersion(**row) if row else None
+
+    def get_versions_of_documents(self, document_ids: Iterable[str]) -> List[DocumentVersion]:
+        rows = self._fetch_all("SELECT * FROM document_versions WHERE document_id = ANY(%s)", [list(document_ids)])
+        return [DocumentVersion(**row) for row in rows]
+
+    def set_document_text(self, document_id: str, text: str) -> bool:
+        document = self.get_document_by_id(document_id)
+        if not document:
+            return False
+        self._execute(REFRESH_SEARCH, _search_params(document, text))
+        return True
+
+    def search_documents(self, query: str, user_id: Optional[str] = None, limit: Optional[int] = None,
+                         offset: int = 0) -> List[Document]:
+        terms = search_terms(query)
+        if not terms:
+            return []
+        prefix, access, params = "", "", [terms]
+        if user_id:
+            prefix, access, params = DESCENDANTS_CTE, " AND d.folder_id IN (SELECT id FROM accessible)", [user_id, terms]
+        rows = self._fetch_all(
+            f"""{prefix}
+            SELECT d.* FROM plainto_tsquery('simple', %s) q
+            JOIN document_search s ON s.search_vector @@ q
+            JOIN documents d ON d.id = s.document_id
+            WHERE TRUE{access}
+            ORDER BY ts_rank(s.search_vector, q) DESC, d.id DESC LIMIT %s OFFSET %s""",
+            [*params, limit, offset]
+        )
+        return [Document(**row) for row in rows]
+
+    # Upload sessions
+
+    def create_upload_session(self, name: str, folder_id: str, file_type: str, file_size: int, chunk_size: int,
+                              created_by: str, expires_at: datetime, metadata: Dict[str, Any] = None) -> UploadSession:
+        session = UploadSession(
+            id=str(uuid4()),
+            name=name,
+            folder_id=folder_id,
+            file_type=file_type,
+            file_size=file_size,
+            chunk_size=chunk_size,
+            created_by=created_by,
+            expires_at=expires_at,
+            metadata=metadata or {}
+        )
+        self._insert("upload_sessions", session)
+        return session
+
+    def get_upload_session_by_id(self, session_id: str) -> Optional[UploadSession]:
+        row = self._fetch_one("SELECT * FROM upload_sessions WHERE id = %s", [session_id])
+        return UploadSession(**row) if row else None
+
+    def delete_upload_session(self, session_id: str) -> bool:
+        return self._delete("upload_sessions", session_id)
+
+    def get_expired_upload_sessions(self, now: datetime, limit: Optional[int] = None) -> List[UploadSession]:
+        rows = self._fetch_all(
+            "SELECT * FROM upload_sessions WHERE expires_at <= %s ORDER BY expires_at LIMIT %s", [now, limit]
+        )
+        return [UploadSession(**row) for row in rows]
+
+    # Jobs
+
+    def create_job(self, kind: str, target_id: str, created_by: str) -> Job:
+        job = Job(id=str(uuid4()), kind=kind, target_id=target_id, created_by=created_by)
+        self._insert("jobs", job)
+        return job
+
+    def get_job_by_id(self, job_id: str) -> Optional[Job]:
+        row = self._fetch_one("SELECT * FROM jobs WHERE id = %s", [job_id])
+        return Job(**row) if row else None
+
+    def update_job(self, job_id: str, **kwargs) -> Optional[Job]:
+        if not self._update("jobs", Job, job_id, kwargs):
+            return None
+        return self.get_job_by_id(job_id)
+
+    # Approval forms
+
+    def create_approval_form(self, name: str, created_by: str, description: Optional[str] = None,
+                             fields: List[FormField] = None, target_folder_id: Optional[str] = None) -> ApprovalForm:
+        form = ApprovalForm(
+            id=str(uuid4()),
+            name=name,
+            description=description,
+            fields=fields or [],
+            created_by=created_by,
+            target_folder_id=target_folder_id
+        )
+        self._insert("approval_forms", form)
+        return form
+
+    def get_approval_form_by_id(self, form_id: str) -> Optional[ApprovalForm]:
+        row = self._fetch_one("SELECT * FROM approval_forms WHERE id = %s", [form_id])
+        return ApprovalForm(**row) if row else None
+
+    def get_all_approval_forms(self, after: Optional[SortKey] = None, limit: Optional[int] = None) -> List[ApprovalForm]:
+        clause, params = _page_clause(after, limit)
+        rows = self._fetch_all(f"SELECT * FROM approval_forms WHERE TRUE{clause}", params)
+        return [ApprovalForm(**row) for row in rows]
+
+    def update_approval_form(self, form_id: str, **kwargs) -> Optional[ApprovalForm]:
+        if not self._update("approval_forms", ApprovalForm, form_id, kwargs):
+            return None
+        return self.get_approval_form_by_id(form_id)
+
+    def delete_approval_form(self, form_id: str) -> bool:
+        return self._delete("approval_forms", form_id)
+
+    # Approval routes
+
+    def create_approval_route(self, name: str, created_by: str, description: Optional[str] = None,
+                              steps: List[ApprovalStep] = None) -> ApprovalRoute:
+        route = ApprovalRoute(
+            id=str(uuid4()),
+            name=name,
+            description=description,
+            steps=steps or [],
+            created_by=created_by
+        )
+        self._insert("approval_routes", route)
+        return route
+
+    def get_approval_route_by_id(self, route_id: str) -> Optional[ApprovalRoute]:
+        row = self._fetch_one("SELECT * FROM approval_routes WHERE id = %s", [route_id])
+        return ApprovalRoute(**row) if row else None
+
+    def get_all_approval_routes(self, after: Optional[SortKey] = None,
+                                limit: Optional[int] = None) -> List[ApprovalRoute]:
+        clause, params = _page_clause(after, limit)
+        rows = self._fetch_all(f"SELECT * FROM approval_routes WHERE TRUE{clause}", params)
+        return [ApprovalRoute(**row) for row in rows]
+
+    def update_approval_route(self, route_id: str, **kwargs) -> Optional[ApprovalRoute]:
+        with self.pool.connection() as conn:
+            with conn.transaction():
+                # The row lock keeps submit_application from making an
+                # application pending while the steps change.
+                if not conn.execute(
+                    "SELECT 1 FROM approval_routes WHERE id = %s FOR UPDATE", [route_id], prepare=True
+                ).fetchone():
+                    return None
+                if "steps" in kwargs and conn.execute(
+                    "SELECT 1 FROM applications WHERE route_id = %s AND status = %s LIMIT 1",
+                    [route_id, ApprovalStatus.PENDING.value],
+                    prepare=True
+                ).fetchone():
+                    return None
+                data = {
+                    key: _db_value(key, value)
+                    for key, value in kwargs.items()
+                    if key in ApprovalRoute.model_fields and key not in ("id", "created_at")
+                }
+                data["updated_at"] = datetime.now()
+                assignments = ", ".join(f"{key} = %s" for key in data)
+                conn.execute(f"UPDATE approval_routes SET {assignments} WHERE id = %s", [*data.values(), route_id])
+        return self.get_approval_route_by_id(route_id)
+
+    def delete_approval_route(self, route_id: str) -> bool:
+        with self.pool.connection() as conn:
+            with conn.transaction():
+                conn.execute(
+                    "UPDATE applications SET current_approver_id = NULL WHERE route_id = %s",
+                    [route_id],
+                    prepare=True
+                )
+                return conn.execute(
+                    "DELETE FROM approval_routes WHERE id = %s", [route_id], prepare=True
+                ).rowcount > 0
+
+    # Applications
+
+    def create_application(self, form_id: str, route_id: str, applicant_id: str,
+                           form_data: Dict[str, Any] = None) -> Application:
+        application = Application(
+            id=str(uuid4()),
+            form_id=form_id,
+            route_id=route_id,
+            applicant_id=applicant_id,
+            form_data=form_data or {},
+            status=ApprovalStatus.DRAFT
+        )
+        self._insert("applications", application)
+        return application
+
+    def get_application_by_id(self, application_id: str) -> Optional[Application]:
+        row = self._fetch_one("SELECT * FROM applications WHERE id = %s", [application_id])
+        return self._application(row) if row else None
+
+    def get_applications_by_applicant(self, applicant_id: str, after: Optional[SortKey] = None,
+                                      limit: Optional[int] = None) -> List[Application]:
+        clause, params = _page_clause(after, limit)
+        rows = self._fetch_all(f"SELECT * FROM applications WHERE applicant_id = %s{clause}", [applicant_id, *params])
+        return [self._application(row) for row in rows]
+
+    def get_applications_for_approval(self, approver_id: str, after: Optional[SortKey] = None,
+                                      limit: Optional[int] = None) -> List[Application]:
+        clause, params = _page_clause(after, limit)
+        rows = self._fetch_all(
+            f"SELECT * FROM applications WHERE current_approver_id = %s{clause}", [approver_id, *params]
+        )
+        return [self._application(row) for row in rows]
+
+    def update_application(self, application_id: str, **kwargs) -> Optional[Application]:
+        if not self._update("applications", Application, application_id, kwargs):
+            return None
+        return self.get_application_by_id(application_id)
+
+    def delete_application(self, application_id: str) -> bool:
+        return self._delete("applications", application_id)
+
+    def submit_application(self, application_id: str) -> Optional[Application]:
+        application = self.get_application_by_id(application_id)
+        if not application or application.status != ApprovalStatus.DRAFT:
+            return None
+
+        with self.pool.connection() as conn:
+            with conn.transaction():
+                # Shares the route's row lock with update_approval_route.
+                route = conn.execute(
+                    "SELECT steps FROM approval_routes WHERE id = %s FOR SHARE", [application.route_id], prepare=True
+                ).fetchone()
+                steps = route["steps"] if route else []
+                approver_id = None
+                if application.current_step < len(steps):
+                    approver_id = steps[application.current_step]["approver_id"]
+                updated = conn.execute(
+                    """UPDATE applications SET status = %s, current_approver_id = %s, updated_at = %s
+                    WHERE id = %s AND status = %s""",
+                    [ApprovalStatus.PENDING.value, approver_id, datetime.now(), application_id,
+                     ApprovalStatus.DRAFT.value],
+                    prepare=True
+                ).rowcount
+        return self.get_application_by_id(application_id) if updated else None
+
+    def approve_application_step(self, application_id: str, approver_id: str,
+                                 comment: Optional[str] = None) -> Optional[Application]:
+        return self._decide_step(application_id, approver_id, comment, ApprovalStatus.APPROVED)
+
+    def reject_application_step(self, application_id: str, approver_id: str,
+                                comment: Optional[str] = None) -> Optional[Application]:
+        return self._decide_step(application_id, approver_id, comment, ApprovalStatus.REJECTED)
+
+    def _decide_step(self, application_id: str, approver_id: str, comment: Optional[str],
+                     decision: ApprovalStatus) -> Optional[Application]:
+        with self.pool.connection() as conn:
+            with conn.transaction():
+                row = conn.execute(
+                    "SELECT * FROM applications WHERE id = %s FOR UPDATE", [application_id], prepare=True
+                ).fetchone()
+                if not row:
+                    return None
+                application = self._application(row)
+                if application.status != ApprovalStatus.PENDING:
+                    return None
+
+                route_row = conn.execute(
+                    "SELECT * FROM approval_routes WHERE id = %s", [application.route_id], prepare=True
+                ).fetchone()
+                route = ApprovalRoute(**route_row) if route_row else None
+                if not route or application.current_step >= len(route.steps):
+                    return None
+
+                current_step = route.steps[application.current_step]
+                if current_step.approver_id != approver_id:
+                    return None
+
+                application.step_history.append(ApplicationStepRecord(
+                    step_id=current_step.id,
+                    approver_id=approver_id,
+                    status=decision,
+                    comment=comment
+                ))
+
+                next_approver_id = None
+                if decision == ApprovalStatus.REJECTED:
+                    application.status = ApprovalStatus.REJECTED
+                else:
+                    application.current_step += 1
+                    if application.current_step >= len(route.steps):
+                        application.status = ApprovalStatus.APPROVED
+                        form_row = conn.execute(
+                            "SELECT * FROM approval_forms WHERE id = %s", [application.form_id], prepare=True
+                        ).fetchone()
+                        if form_row and form_row["target_folder_id"]:
+                            document = Document(
+                                id=str(uuid4()),
+                                name=f"Application {application.id}",
+                                folder_id=form_row["target_folder_id"],
+                                file_path=f"/applications/{application.id}.pdf",
+                                file_type="application/pdf",
+                                file_size=0,
+                                created_by=application.applicant_id,
+                                metadata={"application_id": application.id, "form_data": application.form_data}
+                            )
+                            conn.execute(*_insert_statement("documents", document))
+                            conn.execute(*_insert_statement(
+                                "document_versions", _current_version(document, application.applicant_id)
+                            ))
+                            conn.execute(REFRESH_SEARCH, _search_params(document), prepare=True)
+                            application.document_id = document.id
+                    else:
+                        next_approver_id = route.steps[application.current_step].approver_id
+
+                application.updated_at = datetime.now()
+                conn.execute(
+                    """UPDATE applications
+                    SET status = %s, current_step = %s, step_history = %s, document_id = %s,
+                        current_approver_id = %s, updated_at = %s
+                    WHERE id = %s""",
+                    [
+                        application.status.value, application.current_step,
+                        _db_value("step_history", application.step_history), application.document_id,
+                        next_approver_id, application.updated_at, application.id
+                    ],
+                    prepare=True
+                )
+        return application
+
+    @staticmethod
+    def _application(row: Dict[str, Any]) -> Application:
+        row = dict(row)
+        row.pop("current_approver_id", None)
+        return Application(**row)
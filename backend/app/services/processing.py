@@ -0,0 +1,140 @@
+"""
+Background processing of uploaded documents.
+After an upload the document is queued for processing, which derives its
+thumbnail and text artifacts (see app.services.derivatives) and adds the text
+to the search index. Documents created by approving an application have no
+content yet; their PDF is rendered first (see app.services.application_pdf)
+and committed to the blob store. The work runs in
+worker processes so it never competes with request handling; when the queue
+is full the document is marked skipped instead of making the upload wait.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Dict, Optional, Set
+import anyio
+from anyio import to_process
+from app.models.models import Document, ProcessingStatus
+from app.services.application_pdf import render_application
+from app.services.derivatives import derive_artifacts
+from app.services.repository import repo
+from app.services.storage import artifact_path, blob_lock, commit_blob, discard_upload, remove_blob
+
+PROCESSING_WORKERS = int(os.getenv("PROCESSING_WORKERS", "2"))
+PROCESSING_QUEUE_SIZE = int(os.getenv("PROCESSING_QUEUE_SIZE", "100"))
+
+logger = logging.getLogger(__name__)
+
+_jobs: Set[asyncio.Task] = set()
+_limiter: Optional[anyio.CapacityLimiter] = None
+
+
+def _worker_limiter() -> anyio.CapacityLimiter:
+    global _limiter
+    if _limiter is None:
+        _limiter = anyio.CapacityLimiter(PROCESSING_WORKERS)
+    return _limiter
+
+
+async def _is_current(document_id: str, path: str) -> bool:
+    document = await repo.documents.by_id(document_id)
+    return document is not None and document.file_path == path
+
+
+async def _process(document_id: str, path: str, file_type: str) -> None:
+    async with _worker_limiter():
+        if not await _is_current(document_id, path):
+            return
+        await repo.documents.update(document_id, processing_status=ProcessingStatus.PROCESSING)
+        try:
+            artifacts = await to_process.run_sync(derive_artifacts, path, file_type)
+        except Exception:
+            logger.exception("Processing document %s failed", document_id)
+            artifacts = None
+
+    # A document deleted, or replaced by a newer version, while processing
+    # keeps the status written by the newer version's own job.
+    if not await _is_current(document_id, path):
+        return
+    if artifacts is None:
+        await repo.documents.update(document_id, processing_status=ProcessingStatus.FAILED)
+        return
+    if "text" in artifacts:
+        text = await anyio.Path(artifact_path(path, "text")).read_text(encoding="utf-8")
+        await repo.documents.set_text(document_id, text)
+    await repo.documents.update(document_id, processing_status=ProcessingStatus.COMPLETED, artifacts=artifacts)
+
+
+async def _display_names(user_ids: Set[str]) -> Dict[str, str]:
+    names = {}
+    for user_id in user_ids:
+        user = await repo.users.by_id(user_id)
+        if user:
+            names[user_id] = user.full_name or user.username
+    return names
+
+
+async def _render(document_id: str, application_id: str) -> None:
+    async with _worker_limiter():
+        await repo.documents.update(document_id, processing_status=ProcessingStatus.PROCESSING)
+        try:
+            application = await repo.applications.by_id(application_id)
+            form = await repo.forms.by_id(application.form_id)
+            names = await _display_names(
+                {application.applicant_id} | {record.approver_id for record in application.step_history}
+            )
+            received = await to_process.run_sync(render_application, form, application, names)
+        except Exception:
+            logger.exception("Rendering application %s failed", application_id)
+            await repo.documents.update(document_id, processing_status=ProcessingStatus.FAILED)
+            return
+
+    async with blob_lock([received.sha256]):
+        try:
+            stored = await commit_blob(received)
+        except BaseException:
+            await discard_upload(received)
+            raise
+        document = await repo.documents.update(
+            document_id, file_path=stored.path, file_size=stored.size, content_hash=stored.sha256
+        )
+        if not document:
+            # Deleted while rendering.
+            if not await repo.documents.blob_references(stored.sha256):
+                await remove_blob(stored.sha256)
+            return
+
+    await _process(document.id, document.file_path, document.file_type)
+
+
+async def _unrendered_application(document: Document) -> Optional[str]:
+    """
+    The application whose PDF `document` is waiting for, if it has no content
+    yet. Metadata can be edited by anyone who can write the document, so it is
+    only a hint; the application must name the document as its own.
+    """
+    application_id = document.metadata.get("application_id")
+    if document.content_hash or not application_id:
+        return None
+    application = await repo.applications.by_id(application_id)
+    if not application or application.document_id != document.id:
+        return None
+    return application.id
+
+
+async def schedule_processing(document: Document) -> Document:
+    """Queue `document` for processing without waiting for it; returns the document with its new status."""
+    if len(_jobs) >= PROCESSING_QUEUE_SIZE:
+        return await repo.documents.update(document.id, processing_status=ProcessingStatus.SKIPPED) or document
+
+    document = await repo.documents.update(document.id, processing_status=ProcessingStatus.PENDING) or document
+    application_id = await _unrendered_application(document)
+    if application_id:
+        work = _render(document.id, application_id)
+    else:
+        work = _process(document.id, document.file_path, document.file_type)
+    job = asyncio.get_running_loop().create_task(work)
+    _jobs.add(job)
+    job.add_done_callback(_jobs.discard)
+    return document
@@ -0,0 +1,321 @@
+"""
+Async access to the store for request handlers.
+The in-memory store never blocks, so its functions are called inline. When a
+database backend is configured, each call runs on a bounded worker pool with a
+timeout, so a slow query holds one worker instead of the event loop.
+"""
+
+import os
+import time
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Iterable, Optional
+import anyio
+from fastapi import HTTPException, status
+from app.services import database
+from app.utils.cache import ExpiringCache
+
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "10000"))
+USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", "5"))
+
+
+class Repository:
+    def __init__(self, offload: bool, max_concurrency: int, timeout: float):
+        self.offload = offload
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._limiter: Optional[anyio.CapacityLimiter] = None
+
+        self.users = UserRepository(self)
+        self.folders = FolderRepository(self)
+        self.documents = DocumentRepository(self)
+        self.uploads = UploadSessionRepository(self)
+        self.jobs = JobRepository(self)
+        self.forms = ApprovalFormRepository(self)
+        self.routes = ApprovalRouteRepository(self)
+        self.applications = ApplicationRepository(self)
+
+    async def run(self, function: Callable[..., Any], *args, **kwargs) -> Any:
+        if not self.offload:
+            return function(*args, **kwargs)
+
+        if self._limiter is None:
+            self._limiter = anyio.CapacityLimiter(self.max_concurrency)
+        try:
+            with anyio.fail_after(self.timeout):
+                return await anyio.to_thread.run_sync(
+                    partial(function, *args, **kwargs), cancellable=True, limiter=self._limiter
+                )
+        except TimeoutError:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database query timed out"
+            )
+
+    async def run_to_completion(self, function: Callable[..., Any], *args) -> Any:
+        """Like run, but never abandons the call; for calls that take or release locks."""
+        if not self.offload:
+            return function(*args)
+        return await anyio.to_thread.run_sync(function, *args)
+
+
+class _Namespace:
+    def __init__(self, repo: Repository):
+        self._run = repo.run
+        self._run_to_completion = repo.run_to_completion
+
+
+class UserRepository(_Namespace):
+    """
+    Besides plain lookups, keeps a bounded cache of user records for
+    authenticating requests. Changes made through this repository drop the
+    entry at once, but invalidation does not reach other processes: there a
+    deactivated user, or one whose role was lowered, is still authenticated
+    with the old record until the entry expires, USER_CACHE_TTL seconds
+    after it was fetched. Keep the TTL short, or 0 to disable the cache.
+    """
+
+    def __init__(self, repo: Repository):
+        super().__init__(repo)
+        self._cache = ExpiringCache(USER_CACHE_SIZE)
+        self._generation = 0
+
+    async def create(self, **kwargs):
+        return await self._run(database.create_user, **kwargs)
+
+    async def by_id(self, user_id: str):
+        return await self._run(database.get_user_by_id, user_id)
+
+    async def cached(self, user_id: str):
+        user = self._cache.get(user_id)
+        if user is None:
+            generation = self._generation
+            user = await self.by_id(user_id)
+            # Skip caching if the user changed while it was being fetched.
+            if user is not None and generation == self._generation:
+                self._cache.put(user_id, user, time.time() + USER_CACHE_TTL)
+        return user
+
+    def invalidate(self, user_id: str) -> None:
+        self._generation += 1
+        self._cache.pop(user_id)
+
+    async def by_username(self, username: str):
+        return await self._run(database.get_user_by_username, username)
+
+    async def by_email(self, email: str):
+        return await self._run(database.get_user_by_email, email)
+
+    async def all(self, after=None, limit=None):
+        return await self._run(database.get_all_users, after=after, limit=limit)
+
+    async def update(self, user_id: str, **kwargs):
+        try:
+            return await self._run(database.update_user, user_id, **kwargs)
+        finally:
+            self.invalidate(user_id)
+
+    async def delete(self, user_id: str):
+        try:
+            return await self._run(database.delete_user, user_id)
+        finally:
+            self.invalidate(user_id)
+
+
+class FolderRepository(_Namespace):
+    async def create(self, **kwargs):
+        return await self._run(database.create_folder, **kwargs)
+
+    async def by_id(self, folder_id: str):
+        return await self._run(database.get_folder_by_id, folder_id)
+
+    async def by_parent(self, parent_id: Optional[str], after=None, limit=None):
+        return await self._run(database.get_folders_by_parent, parent_id, after=after, limit=limit)
+
+    async def accessible(self, user_id: str, after=None, limit=None):
+        return await self._run(database.get_user_accessible_folders, user_id, after=after, limit=limit)
+
+    async def effective_permission(self, folder_id: str, user_id: str):
+        return await self._run(database.get_effective_folder_permission, folder_id, user_id)
+
+    async def update(self, folder_id: str, **kwargs):
+        return await self._run(database.update_folder, folder_id, **kwargs)
+
+    async def delete(self, folder_id: str):
+        return await self._run(database.delete_folder, folder_id)
+
+    async def move(self, folder_id: str, parent_id: Optional[str]):
+        return await self._run(database.move_folder, folder_id, parent_id)
+
+    async def copy(self, folder_id: str, parent_id: Optional[str], created_by: str, name: Optional[str] = None):
+        return await self._run(database.copy_folder, folder_id, parent_id, created_by, name)
+
+    async def subtrees(self, root_ids, max_depth: Optional[int] = None):
+        return await self._run(database.get_folder_subtrees, root_ids, max_depth)
+
+    async def stats(self, folder_ids):
+        return await self._run(database.get_folder_stats, folder_ids)
+
+    async def add_access(self, folder_id: str, user_id: str, permission):
+        return await self._run(database.add_folder_access, folder_id, user_id, permission)
+
+    async def remove_access(self, folder_id: str, user_id: str):
+        return await self._run(database.remove_folder_access, folder_id, user_id)
+
+
+class DocumentRepository(_Namespace):
+    @asynccontextmanager
+    async def lock_blobs(self, keys: Iterable[str]) -> AsyncIterator[None]:
+        """Hold the cross-process locks on the given stored files for the block; see database.lock_blobs."""
+        lock = database.lock_blobs(sorted(set(keys)))
+        await self._run_to_completion(lock.__enter__)
+        try:
+            yield
+        finally:
+            await self._run_to_completion(lock.__exit__, None, None, None)
+
+    async def create(self, **kwargs):
+        return await self._run(database.create_document, **kwargs)
+
+    async def by_id(self, document_id: str):
+        return await self._run(database.get_document_by_id, document_id)
+
+    async def by_ids(self, document_ids):
+        return await self._run(database.get_documents_by_ids, document_ids)
+
+    async def by_folder(self, folder_id: str, after=None, limit=None):
+        return await self._run(database.get_documents_by_folder, folder_id, after=after, limit=limit)
+
+    async def by_user(self, user_id: str, limit=None, offset: int = 0, after=None):
+        return await self._run(database.get_documents_by_user, user_id, limit=limit, offset=offset, after=after)
+
+    async def update(self, document_id: str, **kwargs):
+        return await self._run(database.update_document, document_id, **kwargs)
+
+    async def search(self, query: str, user_id: Optional[str] = None, limit=None, offset: int = 0):
+        return await self._run(database.search_documents, query, user_id=user_id, limit=limit, offset=offset)
+
+    async def set_text(self, document_id: str, text: str):
+        return await self._run(database.set_document_text, document_id, text)
+
+    async def update_many(self, updates):
+        return await self._run(database.update_documents, updates)
+
+    async def delete(self, document_id: str):
+        return await self._run(database.delete_document, document_id)
+
+    async def delete_many(self, document_ids):
+        return await self._run(database.delete_documents, document_ids)
+
+    async def blob_references(self, content_hash: str):
+        return await self._run(database.count_blob_references, content_hash)
+
+    async def file_references(self, file_path: str):
+        return await self._run(database.count_file_references, file_path)
+
+    async def add_version(self, document_id: str, **kwargs):
+        return await self._run(database.create_document_version, document_id, **kwargs)
+
+    async def versions(self, document_id: str):
+        return await self._run(database.get_document_versions, document_id)
+
+    async def version(self, document_id: str, version: int):
+        return await self._run(database.get_document_version, document_id, version)
+
+    async def versions_of(self, document_ids):
+        return await self._run(database.get_versions_of_documents, document_ids)
+
+
+class UploadSessionRepository(_Namespace):
+    async def create(self, **kwargs):
+        return await self._run(database.create_upload_session, **kwargs)
+
+    async def by_id(self, session_id: str):
+        return await self._run(database.get_upload_session_by_id, session_id)
+
+    async def delete(self, session_id: str):
+        return await self._run(database.delete_upload_session, session_id)
+
+    async def expired(self, now, limit: Optional[int] = None):
+        return await self._run(database.get_expired_upload_sessions, now, limit)
+
+
+class JobRepository(_Namespace):
+    async def create(self, **kwargs):
+        return await self._run(database.create_job, **kwargs)
+
+    async def by_id(self, job_id: str):
+        return await self._run(database.get_job_by_id, job_id)
+
+    async def update(self, job_id: str, **kwargs):
+        return await self._run(database.update_job, job_id, **kwargs)
+
+
+class ApprovalFormRepository(_Namespace):
+    async def create(self, **kwargs):
+        return await self._run(database.create_approval_form, **kwargs)
+
+    async def by_id(self, form_id: str):
+        return await self._run(database.get_approval_form_by_id, form_id)
+
+    async def all(self, after=None, limit=None):
+        return await self._run(database.get_all_approval_forms, after=after, limit=limit)
+
+    async def update(self, form_id: str, **kwargs):
+        return await self._run(database.update_approval_form, form_id, **kwargs)
+
+    async def delete(self, form_id: str):
+        return await self._run(database.delete_approval_form, form_id)
+
+
+class ApprovalRouteRepository(_Namespace):
+    async def create(self, **kwargs):
+        return await self._run(database.create_approval_route, **kwargs)
+
+    async def by_id(self, route_id: str):
+        return await self._run(database.get_approval_route_by_id, route_id)
+
+    async def all(self, after=None, limit=None):
+        return await self._run(database.get_all_approval_routes, after=after, limit=limit)
+
+    async def update(self, route_id: str, **kwargs):
+        return await self._run(database.update_approval_route, route_id, **kwargs)
+
+    async def delete(self, route_id: str):
+        return await self._run(database.delete_approval_route, route_id)
+
+
+class ApplicationRepository(_Namespace):
+    async def create(self, **kwargs):
+        return await self._run(database.create_application, **kwargs)
+
+    async def by_id(self, application_id: str):
+        return await self._run(database.get_application_by_id, application_id)
+
+    async def by_applicant(self, applicant_id: str, after=None, limit=None):
+        return await self._run(database.get_applications_by_applicant, applicant_id, after=after, limit=limit)
+
+    async def for_approval(self, approver_id: str, after=None, limit=None):
+        return await self._run(database.get_applications_for_approval, approver_id, after=after, limit=limit)
+
+    async def update(self, application_id: str, **kwargs):
+        return await self._run(database.update_application, application_id, **kwargs)
+
+    async def delete(self, application_id: str):
+        return await self._run(database.delete_application, application_id)
+
+    async def submit(self, application_id: str):
+        return await self._run(database.submit_application, application_id)
+
+    async def approve_step(self, application_id: str, approver_id: str, comment: Optional[str] = None):
+        return await self._run(database.approve_application_step, application_id, approver_id, comment)
+
+    async def reject_step(self, application_id: str, approver_id: str, comment: Optional[str] = None):
+        return await self._run(database.reject_application_step, application_id, approver_id, comment)
+
+
+repo = Repository(
+    offload=bool(database.database_url),
+    max_concurrency=database.max_concurrent_queries,
+    timeout=database.query_timeout
+)
@@ -0,0 +1,34 @@
+"""
+Text normalisation shared by the search indexes of every store backend, so a
+query matches the same terms in memory and in PostgreSQL.
+"""
+
+import re
+from typing import Any, List
+
+_WORD = re.compile(r"[^\W_]+")
+_CJK = re.compile(r"[\u3040-\u30ff\u3400-\u9fff\uf900-\ufaff\uac00-\ud7af]")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase search terms; CJK runs, which have no spaces, become bigrams."""
+    terms = []
+    for word in _WORD.findall(text.lower()):
+        if len(word) > 1 and _CJK.search(word):
+            terms.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            terms.append(word)
+    return terms
+
+
+def metadata_text(value: Any) -> str:
+    if isinstance(value, dict):
+        return " ".join(f"{key} {metadata_text(item)}" for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return " ".join(metadata_text(item) for item in value)
+    return "" if value is None else str(value)
+
+
+def search_terms(text: str) -> str:
+    """The terms of `text` joined by spaces, ready for to_tsvector('simple', ...)."""
+    return " ".join(tokenize(text))
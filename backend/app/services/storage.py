@@ -0,0 +1,358 @@
+"""
+File storage for uploaded documents.
+Uploads are streamed in chunks to a temporary file and hashed on the way in.
+Content is stored once per SHA-256 under uploads/<aa>/<bb>/<hash>; documents
+with the same content share the blob, which is removed with its last
+reference, together with the thumbnail and text artifacts derived from it
+(<blob>.thumbnail.png, <blob>.txt). Resumable uploads stage numbered chunks under
+uploads/.sessions/<session_id>/ until they are assembled into one file, or
+until the session expires after UPLOAD_SESSION_TTL seconds.
+Disk writes and hashing run on worker threads so large files never block the
+event loop.
+"""
+
+import hashlib
+import os
+import shutil
+import tarfile
+import tempfile
+import zipfile
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, BinaryIO, Dict, Iterable, List, Optional
+import anyio
+from fastapi import UploadFile
+from pydantic import BaseModel
+from app.services.repository import repo
+
+UPLOAD_DIR = "uploads"
+CHUNK_SIZE = 1024 * 1024
+MAX_UPLOAD_SIZE = int(os.getenv("MAX_UPLOAD_SIZE", str(1024 * 1024 * 1024)))
+UPLOAD_SESSION_DIR = os.path.join(UPLOAD_DIR, ".sessions")
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(8 * 1024 * 1024)))
+UPLOAD_SESSION_TTL = int(os.getenv("UPLOAD_SESSION_TTL", str(24 * 60 * 60)))
+BULK_UPLOAD_CONCURRENCY = int(os.getenv("BULK_UPLOAD_CONCURRENCY", "4"))
+MAX_ARCHIVE_SIZE = int(os.getenv("MAX_ARCHIVE_SIZE", str(4 * 1024 * 1024 * 1024)))
+MAX_ARCHIVE_MEMBERS = int(os.getenv("MAX_ARCHIVE_MEMBERS", "1000"))
+ARTIFACT_SUFFIXES = {"thumbnail": ".thumbnail.png", "text": ".txt"}
+
+_blob_lock: Optional[anyio.Lock] = None
+
+
+class UploadTooLarge(Exception):
+    def __init__(self, max_size: int):
+        super().__init__(f"Upload exceeds the maximum size of {max_size} bytes")
+        self.max_size = max_size
+
+
+class InvalidChunk(Exception):
+    pass
+
+
+class ReceivedUpload(BaseModel):
+    temp_path: str
+    size: int
+    sha256: str
+
+
+class ArchiveMember(BaseModel):
+    name: str
+    upload: Optional[ReceivedUpload] = None
+    error: Optional[str] = None
+
+
+class StoredFile(BaseModel):
+    path: str
+    size: int
+    sha256: str
+    created: bool
+
+
+@asynccontextmanager
+async def blob_lock(keys: Iterable[str]) -> AsyncIterator[None]:
+    """
+    Serialises blob commits and releases with the document writes that
+    reference them, so a blob is never unlinked while a new document is
+    being attached to it. `keys` are the content hashes (or, for files stored
+    before content addressing, the paths) of the files involved; the store
+    locks them across processes, and tasks in this process take turns.
+    """
+    global _blob_lock
+    if _blob_lock is None:
+        _blob_lock = anyio.Lock()
+    async with _blob_lock:
+        async with repo.documents.lock_blobs(keys):
+            yield
+
+
+def blob_path(content_hash: str) -> str:
+    return os.path.join(UPLOAD_DIR, content_hash[:2], content_hash[2:4], content_hash)
+
+
+def artifact_path(path: str, artifact: str) -> str:
+    return path + ARTIFACT_SUFFIXES[artifact]
+
+
+def _session_dir(session_id: str) -> str:
+    return os.path.join(UPLOAD_SESSION_DIR, session_id)
+
+
+def _chunk_path(session_id: str, index: int) -> str:
+    return os.path.join(_session_dir(session_id), f"{index:08d}")
+
+
+def _write_chunk(buffer: BinaryIO, digest, chunk: bytes) -> None:
+    digest.update(chunk)
+    buffer.write(chunk)
+
+
+def _discard(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _place_blob(temp_path: str, path: str) -> bool:
+    if os.path.exists(path):
+        _discard(temp_path)
+        return False
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    os.replace(temp_path, path)
+    return True
+
+
+async def _read_upload(upload: UploadFile) -> AsyncIterator[bytes]:
+    while True:
+        chunk = await upload.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        yield chunk
+
+
+async def _spool(chunks: AsyncIterator[bytes], max_size: int, directory: str) -> ReceivedUpload:
+    await anyio.to_thread.run_sync(lambda: os.makedirs(directory, exist_ok=True))
+    fd, temp_path = await anyio.to_thread.run_sync(
+        lambda: tempfile.mkstemp(dir=directory, prefix=".upload-")
+    )
+
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as buffer:
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > max_size:
+                    raise UploadTooLarge(max_size)
+                await anyio.to_thread.run_sync(_write_chunk, buffer, digest, chunk)
+    except BaseException:
+        await anyio.to_thread.run_sync(_discard, temp_path)
+        raise
+
+    return ReceivedUpload(temp_path=temp_path, size=size, sha256=digest.hexdigest())
+
+
+async def receive_upload(upload: UploadFile, max_size: Optional[int] = None) -> ReceivedUpload:
+    """Stream `upload` to a temporary file, returning its exact size and SHA-256 hash."""
+    max_size = max_size or MAX_UPLOAD_SIZE
+    if upload.size is not None and upload.size > max_size:
+        raise UploadTooLarge(max_size)
+    return await _spool(_read_upload(upload), max_size, UPLOAD_DIR)
+
+
+def _spool_file(source: BinaryIO, max_size: int) -> ReceivedUpload:
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=UPLOAD_DIR, prefix=".upload-")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as buffer:
+            while True:
+                chunk = source.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_size:
+                    raise UploadTooLarge(max_size)
+                _write_chunk(buffer, digest, chunk)
+    except BaseException:
+        _discard(temp_path)
+        raise
+    return ReceivedUpload(temp_path=temp_path, size=size, sha256=digest.hexdigest())
+
+
+def _extract_member(name: str, open_member, max_size: int) -> ArchiveMember:
+    try:
+        with open_member() as source:
+            return ArchiveMember(name=name, upload=_spool_file(source, max_size))
+    except (zipfile.BadZipFile, tarfile.TarError, EOFError):
+        return ArchiveMember(name=name, error="Unreadable archive member")
+
+
+def _extract_members(entries, max_size: int) -> List[ArchiveMember]:
+    """
+    Extract members in order until the archive's total extracted size would
+    exceed MAX_ARCHIVE_SIZE or it has more than MAX_ARCHIVE_MEMBERS members;
+    the member that crosses a limit is reported as an error and the rest are
+    skipped, so a small archive cannot expand to fill the disk.
+    """
+    members = []
+    remaining = MAX_ARCHIVE_SIZE
+    try:
+        for name, open_member in entries:
+            if len(members) >= MAX_ARCHIVE_MEMBERS:
+                members.append(ArchiveMember(
+                    name=name, error=f"Archive has more than {MAX_ARCHIVE_MEMBERS} files; the rest were skipped"
+                ))
+                break
+            limit = min(max_size, remaining)
+            try:
+                member = _extract_member(name, open_member, limit)
+            except UploadTooLarge as e:
+                if limit < max_size:
+                    members.append(ArchiveMember(
+                        name=name,
+                        error=f"Archive expands beyond {MAX_ARCHIVE_SIZE} bytes; the rest were skipped"
+                    ))
+                    break
+                member = ArchiveMember(name=name, error=str(e))
+            members.append(member)
+            if member.upload:
+                remaining -= member.upload.size
+    except BaseException:
+        for member in members:
+            if member.upload:
+                _discard(member.upload.temp_path)
+        raise
+    return members
+
+
+def _extract_archive(archive: BinaryIO, max_size: int) -> Optional[List[ArchiveMember]]:
+    archive.seek(0)
+    if zipfile.is_zipfile(archive):
+        archive.seek(0)
+        with zipfile.ZipFile(archive) as zip_file:
+            return _extract_members((
+                (info.filename, lambda info=info: zip_file.open(info))
+                for info in zip_file.infolist() if not info.is_dir()
+            ), max_size)
+
+    archive.seek(0)
+    try:
+        tar_file = tarfile.open(fileobj=archive, mode="r:*")
+    except tarfile.TarError:
+        archive.seek(0)
+        return None
+    with tar_file:
+        return _extract_members((
+            (info.name, lambda info=info: tar_file.extractfile(info))
+            for info in tar_file if info.isfile()
+        ), max_size)
+
+
+async def receive_archive(upload: UploadFile, max_size: Optional[int] = None) -> Optional[List[ArchiveMember]]:
+    """
+    Unpack a zip or tar upload into one received upload per regular member,
+    each limited to `max_size` and all together to MAX_ARCHIVE_SIZE. Returns
+    None when the upload is not an archive.
+    """
+    max_size = max_size or MAX_UPLOAD_SIZE
+    return await anyio.to_thread.run_sync(_extract_archive, upload.file, max_size)
+
+
+async def commit_blob(received: ReceivedUpload) -> StoredFile:
+    """Move a received upload into the blob store; content already stored is not written again."""
+    path = blob_path(received.sha256)
+    created = await anyio.to_thread.run_sync(_place_blob, received.temp_path, path)
+    return StoredFile(path=path, size=received.size, sha256=received.sha256, created=created)
+
+
+async def discard_upload(received: ReceivedUpload) -> None:
+    await anyio.to_thread.run_sync(_discard, received.temp_path)
+
+
+def _remove_with_artifacts(path: str) -> None:
+    _discard(path)
+    for artifact in ARTIFACT_SUFFIXES:
+        _discard(artifact_path(path, artifact))
+
+
+async def remove_file(path: str) -> None:
+    """Remove a stored file and any artifacts derived from it."""
+    await anyio.to_thread.run_sync(_remove_with_artifacts, path)
+
+
+async def remove_blob(content_hash: str) -> None:
+    await remove_file(blob_path(content_hash))
+
+
+async def save_chunk(session_id: str, index: int, chunks: AsyncIterator[bytes], size: int) -> ReceivedUpload:
+    """
+    Stage chunk `index` of an upload session. The chunk must be exactly `size`
+    bytes; a re-sent chunk atomically replaces the previous copy.
+    """
+    try:
+        received = await _spool(chunks, size, _session_dir(session_id))
+    except UploadTooLarge:
+        raise InvalidChunk(f"Chunk {index} must be {size} bytes")
+    if received.size != size:
+        await discard_upload(received)
+        raise InvalidChunk(f"Chunk {index} must be {size} bytes")
+
+    await anyio.to_thread.run_sync(os.replace, received.temp_path, _chunk_path(session_id, index))
+    return received
+
+
+def _list_chunks(session_id: str) -> Dict[int, int]:
+    try:
+        entries = list(os.scandir(_session_dir(session_id)))
+    except FileNotFoundError:
+        return {}
+    return {int(entry.name): entry.stat().st_size for entry in entries if entry.name.isdigit()}
+
+
+async def list_chunks(session_id: str) -> Dict[int, int]:
+    """Return the staged chunks of an upload session as {index: size}."""
+    return await anyio.to_thread.run_sync(_list_chunks, session_id)
+
+
+def _assemble(session_id: str, chunk_count: int) -> ReceivedUpload:
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=UPLOAD_DIR, prefix=".upload-")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as buffer:
+            for index in range(chunk_count):
+                with open(_chunk_path(session_id, index), "rb") as chunk_file:
+                    while True:
+                        chunk = chunk_file.read(CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        size += len(chunk)
+                        _write_chunk(buffer, digest, chunk)
+    except BaseException:
+        _discard(temp_path)
+        raise
+    return ReceivedUpload(temp_path=temp_path, size=size, sha256=digest.hexdigest())
+
+
+async def assemble_chunks(session_id: str, chunk_count: int) -> ReceivedUpload:
+    """Concatenate the staged chunks of a session into one received upload, hashing it on the way."""
+    return await anyio.to_thread.run_sync(_assemble, session_id, chunk_count)
+
+
+async def discard_chunks(session_id: str) -> None:
+    await anyio.to_thread.run_sync(lambda: shutil.rmtree(_session_dir(session_id), ignore_errors=True))
+
+
+def _idle_session_dirs(idle_since: float) -> List[str]:
+    try:
+        entries = list(os.scandir(UPLOAD_SESSION_DIR))
+    except FileNotFoundError:
+        return []
+    return [entry.name for entry in entries if entry.is_dir() and entry.stat().st_mtime < idle_since]
+
+
+async def idle_session_dirs(idle_since: float) -> List[str]:
+    """Return the ids of staged sessions that have not received a chunk since the `idle_since` timestamp."""
+    return await anyio.to_thread.run_sync(_idle_session_dirs, idle_since)
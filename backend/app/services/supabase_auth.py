@@ -0,0 +1,127 @@
+"""
+Local verification of Supabase access tokens, so authenticating a request
+makes no call to Supabase. Tokens signed with the project's shared secret
+(HS256) are checked against SUPABASE_JWT_SECRET; tokens signed with the
+project's asymmetric keys are checked against its JWKS, which is kept in
+memory and refreshed in the background every SUPABASE_JWKS_REFRESH seconds.
+A token naming a key that is not cached triggers one early refresh, at most
+every SUPABASE_JWKS_MIN_REFRESH seconds, to pick up rotated keys. Verified
+claims are cached until the token expires and rows of the `users` table for
+SUPABASE_PROFILE_TTL seconds.
+"""
+
+import hashlib
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+import anyio
+import httpx
+from jose import JWTError, jwt
+from app.services.supabase import supabase, supabase_url
+from app.utils.cache import ExpiringCache
+
+SUPABASE_JWT_SECRET = os.getenv("SUPABASE_JWT_SECRET")
+SUPABASE_JWKS_URL = os.getenv("SUPABASE_JWKS_URL", f"{supabase_url.rstrip('/')}/auth/v1/.well-known/jwks.json")
+SUPABASE_JWT_AUDIENCE = os.getenv("SUPABASE_JWT_AUDIENCE", "authenticated")
+SUPABASE_JWKS_REFRESH = float(os.getenv("SUPABASE_JWKS_REFRESH", "600"))
+SUPABASE_JWKS_MIN_REFRESH = float(os.getenv("SUPABASE_JWKS_MIN_REFRESH", "30"))
+SUPABASE_PROFILE_TTL = float(os.getenv("SUPABASE_PROFILE_TTL", "300"))
+SUPABASE_CACHE_SIZE = int(os.getenv("SUPABASE_CACHE_SIZE", "10000"))
+
+ASYMMETRIC_ALGORITHMS = ["RS256", "ES256"]
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidToken(Exception):
+    pass
+
+
+class SupabaseTokenVerifier:
+    def __init__(self, jwks_url: Optional[str], jwt_secret: Optional[str], audience: Optional[str]):
+        self.jwks_url = jwks_url
+        self.jwt_secret = jwt_secret
+        self.audience = audience
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._refreshed_at = float("-inf")
+        self._claims = ExpiringCache(SUPABASE_CACHE_SIZE)
+
+    async def refresh_keys(self) -> None:
+        self._refreshed_at = time.monotonic()
+        async with httpx.AsyncClient(timeout=10) as client:
+            response = await client.get(self.jwks_url)
+            response.raise_for_status()
+        self._keys = {key["kid"]: key for key in response.json().get("keys", []) if "kid" in key}
+
+    async def keep_keys_fresh(self) -> None:
+        """Refresh the signing keys every SUPABASE_JWKS_REFRESH seconds until cancelled."""
+        while True:
+            try:
+                await self.refresh_keys()
+            except (httpx.HTTPError, ValueError):
+                logger.warning("Refreshing the Supabase signing keys failed", exc_info=True)
+            await anyio.sleep(SUPABASE_JWKS_REFRESH)
+
+    def _signing_key(self, header: Dict[str, Any]) -> Tuple[Any, List[str]]:
+        if header.get("alg") == "HS256":
+            if not self.jwt_secret:
+                raise InvalidToken("Tokens signed with the shared secret are not accepted")
+            return self.jwt_secret, ["HS256"]
+        key = self._keys.get(header.get("kid"))
+        if key is None:
+            raise KeyError(header.get("kid"))
+        return key, [key["alg"]] if "alg" in key else ASYMMETRIC_ALGORITHMS
+
+    def _decode(self, token: str) -> Dict[str, Any]:
+        key, algorithms = self._signing_key(jwt.get_unverified_header(token))
+        return jwt.decode(token, key, algorithms=algorithms, audience=self.audience)
+
+    async def claims(self, token: str) -> Dict[str, Any]:
+        """Return the verified claims of `token`, raising InvalidToken if it is not a valid Supabase token."""
+        token_key = hashlib.sha256(token.encode()).hexdigest()
+        claims = self._claims.get(token_key)
+        if claims is not None:
+            return claims
+        
+        try:
+            try:
+                claims = self._decode(token)
+            except KeyError:
+                if not self.jwks_url or time.monotonic() - self._refreshed_at < SUPABASE_JWKS_MIN_REFRESH:
+                    raise
+                try:
+                    await self.refresh_keys()
+                except (httpx.HTTPError, ValueError) as error:
+                    raise InvalidToken("Signing keys are unavailable") from error
+                claims = self._decode(token)
+        except KeyError:
+            raise InvalidToken("Unknown signing key")
+        except JWTError as error:
+            raise InvalidToken(str(error)) from error
+        
+        if "sub" not in claims:
+            raise InvalidToken("Token has no subject")
+        if "exp" in claims:
+            self._claims.put(token_key, claims, claims["exp"])
+        return claims
+
+
+token_verifier = SupabaseTokenVerifier(SUPABASE_JWKS_URL or None, SUPABASE_JWT_SECRET, SUPABASE_JWT_AUDIENCE)
+
+_profiles = ExpiringCache(SUPABASE_CACHE_SIZE)
+
+
+def _fetch_profile(user_id: str) -> Optional[Dict[str, Any]]:
+    query = supabase.table("users").select("*").eq("id", user_id).execute()
+    return query.data[0] if query.data else None
+
+
+async def get_profile(user_id: str) -> Optional[Dict[str, Any]]:
+    """The user's row of the `users` table; misses are fetched on a worker thread."""
+    profile = _profiles.get(user_id)
+    if profile is None:
+        profile = await anyio.to_thread.run_sync(_fetch_profile, user_id)
+        if profile is not None:
+            _profiles.put(user_id, profile, time.time() + SUPABASE_PROFILE_TTL)
+    return profile
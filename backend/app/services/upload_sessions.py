@@ -0,0 +1,57 @@
+"""
+Expiry of resumable upload sessions. A session expires UPLOAD_SESSION_TTL
+seconds after it is created; a periodic sweep deletes expired sessions with
+their staged chunks, and also removes chunk directories whose session no
+longer exists, such as those left behind by a restart of the in-memory store.
+"""
+
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Optional
+import anyio
+from app.services.repository import repo
+from app.services.storage import UPLOAD_SESSION_TTL, discard_chunks, idle_session_dirs
+
+UPLOAD_SESSION_SWEEP_INTERVAL = float(os.getenv("UPLOAD_SESSION_SWEEP_INTERVAL", "3600"))
+UPLOAD_SESSION_SWEEP_BATCH_SIZE = 100
+
+logger = logging.getLogger(__name__)
+
+
+def session_expiry() -> datetime:
+    return datetime.now() + timedelta(seconds=UPLOAD_SESSION_TTL)
+
+
+async def sweep_upload_sessions(now: Optional[datetime] = None) -> int:
+    """Delete sessions that expired by `now` and orphaned chunk directories; returns the sessions deleted."""
+    now = now or datetime.now()
+    swept = 0
+    while True:
+        expired = await repo.uploads.expired(now, limit=UPLOAD_SESSION_SWEEP_BATCH_SIZE)
+        if not expired:
+            break
+        for session in expired:
+            # A commit racing the sweep finds its session gone and discards
+            # what it assembled, so the chunks can go regardless.
+            if await repo.uploads.delete(session.id):
+                swept += 1
+            await discard_chunks(session.id)
+
+    idle_since = (now - timedelta(seconds=UPLOAD_SESSION_TTL)).timestamp()
+    for session_id in await idle_session_dirs(idle_since):
+        if not await repo.uploads.by_id(session_id):
+            await discard_chunks(session_id)
+    return swept
+
+
+async def keep_upload_sessions_swept() -> None:
+    """Sweep expired upload sessions every UPLOAD_SESSION_SWEEP_INTERVAL seconds until cancelled."""
+    while True:
+        try:
+            swept = await sweep_upload_sessions()
+            if swept:
+                logger.info("Removed %d expired upload sessions", swept)
+        except Exception:
+            logger.exception("Sweeping expired upload sessions failed")
+        await anyio.sleep(UPLOAD_SESSION_SWEEP_INTERVAL)
@@ -1,25 +1,90 @@
+import hashlib
+import os
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Tuple
+import anyio
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from app.utils.cache import ExpiringCache
 
 SECRET_KEY = "YOUR_SECRET_KEY_HERE"  # In production, use a secure environment variable
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 1)))
+PASSWORD_HASH_QUEUE_SIZE = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", "100"))
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+# User ids of tokens whose signature has been checked, keyed by the token's
+# SHA-256 so raw tokens are not kept in memory, until the token expires.
+_verified_tokens = ExpiringCache(TOKEN_CACHE_SIZE)
 
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
 
+class PasswordHasherPool:
+    """
+    Runs bcrypt on worker threads (bcrypt releases the GIL), at most
+    `workers` at a time, so hashing never holds the event loop. Callers beyond
+    that wait in a queue of at most `max_queue`; further calls are refused with
+    503 rather than letting a burst of logins pile up. Counters describing the
+    queue are returned by stats().
+    """
 
-def get_password_hash(password):
-    return pwd_context.hash(password)
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._limiter: Optional[anyio.CapacityLimiter] = None
+
+    async def run(self, function: Callable[..., Any], *args) -> Any:
+        if self._limiter is None:
+            self._limiter = anyio.CapacityLimiter(self.workers)
+        
+        if not self._limiter.available_tokens and self._limiter.statistics().tasks_waiting >= self.max_queue:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many password operations in progress",
+                headers={"Retry-After": "1"},
+            )
+        
+        queued_at = time.monotonic()
+        
+        def timed() -> Tuple[float, Any]:
+            return time.monotonic() - queued_at, function(*args)
+        
+        wait, result = await anyio.to_thread.run_sync(timed, limiter=self._limiter)
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.completed += 1
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "running": self._limiter.borrowed_tokens if self._limiter else 0,
+            "waiting": self._limiter.statistics().tasks_waiting if self._limiter else 0,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "average_wait_ms": round(1000 * self.total_wait / self.completed, 3) if self.completed else 0.0,
+            "max_wait_ms": round(1000 * self.max_wait, 3),
+        }
+
+
+password_hasher = PasswordHasherPool(PASSWORD_HASH_WORKERS, PASSWORD_HASH_QUEUE_SIZE)
+
+
+async def get_password_hash(password: str) -> str:
+    return await password_hasher.run(pwd_context.hash, password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
@@ -39,16 +104,21 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
+    token_key = hashlib.sha256(token.encode()).hexdigest()
+    user_id: Optional[str] = _verified_tokens.get(token_key)
+    if user_id is None:
+        try:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+            user_id = payload.get("sub")
+            if user_id is None:
+                raise credentials_exception
+        except JWTError:
             raise credentials_exception
-    except JWTError:
-        raise credentials_exception
+        if "exp" in payload:
+            _verified_tokens.put(token_key, user_id, payload["exp"])
     
-    from app.services.database import get_user_by_id
-    user = get_user_by_id(user_id)
+    from app.services.repository import repo
+    user = await repo.users.cached(user_id)
     if user is None:
         raise credentials_exception
     return user
@@ -0,0 +1,142 @@
+"""
+Conditional and partial file responses.
+Files are never read into memory: full responses go through FileResponse
+(which uses the server's zero-copy pathsend extension when available) and
+single byte ranges are streamed from disk in chunks.
+"""
+
+import os
+from email.utils import formatdate, parsedate_to_datetime
+from typing import AsyncIterator, Optional, Tuple
+from urllib.parse import quote
+import anyio
+from fastapi import HTTPException, Request, status
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from app.services.storage import CHUNK_SIZE
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+class _WholeFileResponse(FileResponse):
+    """
+    A FileResponse that sends the whole file even if the request has a Range
+    header; newer Starlette versions would otherwise answer the ranges that
+    file_response chose to ignore themselves.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        headers = [(name, value) for name, value in scope["headers"] if name != b"range"]
+        await super().__call__({**scope, "headers": headers}, receive, send)
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Return the [start, end) byte span of a single-range header. Malformed and
+    multi-range headers return None and are answered with the whole file.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, separator, last = spec.strip().partition("-")
+    if not separator:
+        return None
+    try:
+        if not first:
+            length = int(last)
+            if length <= 0 or size == 0:
+                raise RangeNotSatisfiable()
+            return max(size - length, 0), size
+        start = int(first)
+        end = int(last) if last else size - 1
+    except ValueError:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable()
+    if start > end:
+        return None
+    return start, min(end, size - 1) + 1
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    tags = [tag.strip() for tag in header.split(",")]
+    return "*" in tags or etag in (tag[2:] if tag.startswith("W/") else tag for tag in tags)
+
+
+def _not_modified(request: Request, etag: str, mtime: float) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+async def _read_span(path: str, start: int, end: int) -> AsyncIterator[bytes]:
+    async with await anyio.open_file(path, "rb") as file:
+        await file.seek(start)
+        remaining = end - start
+        while remaining:
+            chunk = await file.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+async def file_response(request: Request, path: str, media_type: str, filename: str,
+                        etag: Optional[str] = None) -> Response:
+    """
+    Serve `path` honouring If-None-Match, If-Modified-Since, If-Range and
+    single-range Range requests. `etag` defaults to one derived from the
+    file's mtime and size; content-addressed files should pass their hash.
+    """
+    try:
+        stat_result = await anyio.to_thread.run_sync(os.stat, path)
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Document content not found"
+        )
+
+    size = stat_result.st_size
+    etag = f'"{etag}"' if etag else f'"{int(stat_result.st_mtime):x}-{size:x}"'
+    last_modified = formatdate(stat_result.st_mtime, usegmt=True)
+    headers = {
+        "etag": etag,
+        "last-modified": last_modified,
+        "accept-ranges": "bytes",
+        "content-disposition": f"inline; filename*=utf-8''{quote(filename)}",
+    }
+
+    if _not_modified(request, etag, stat_result.st_mtime):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range in (etag, last_modified)):
+        try:
+            span = _parse_range(range_header, size)
+        except RangeNotSatisfiable:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={"content-range": f"bytes */{size}"}
+            )
+        if span is not None:
+            start, end = span
+            headers["content-range"] = f"bytes {start}-{end - 1}/{size}"
+            headers["content-length"] = str(end - start)
+            return StreamingResponse(
+                _read_span(path, start, end),
+                status_code=status.HTTP_206_PARTIAL_CONTENT,
+                media_type=media_type,
+                headers=headers
+            )
+
+    return _WholeFileResponse(path, media_type=media_type, headers=headers, stat_result=stat_result)
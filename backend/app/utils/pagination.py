@@ -0,0 +1,79 @@
+import base64
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Set, Tuple, Type
+from fastapi import HTTPException, Query, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+MAX_PAGE_SIZE = 1000
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(record: Any) -> str:
+    raw = f"{record.created_at.isoformat()}|{record.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        created_at, record_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), record_id
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+class PageParams:
+    """
+    Keyset pagination and field projection for list endpoints.
+    Listings are ordered by (created_at, id). When a full page is returned, the
+    cursor for the next one is sent in the X-Next-Cursor header, so the body
+    stays a plain list. Without `limit` the whole listing is returned.
+    """
+
+    def __init__(
+        self,
+        response: Response,
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+        cursor: Optional[str] = Query(None),
+        fields: Optional[str] = Query(None, description="Comma-separated response fields to return")
+    ):
+        self.response = response
+        self.limit = limit
+        self.after = decode_cursor(cursor) if cursor else None
+        self.fields = [name.strip() for name in fields.split(",") if name.strip()] if fields else None
+
+    def respond(self, items: Sequence[Any], response_model: Type[BaseModel]) -> Any:
+        headers = {}
+        if self.limit is not None and len(items) == self.limit:
+            headers[NEXT_CURSOR_HEADER] = encode_cursor(items[-1])
+
+        if not self.fields:
+            self.response.headers.update(headers)
+            return items
+
+        include = self._projection(response_model)
+        content = [jsonable_encoder(item, include=include) for item in items]
+        return JSONResponse(content=content, headers=headers)
+
+    def _projection(self, response_model: Type[BaseModel]) -> Set[str]:
+        unknown = [name for name in self.fields if name not in response_model.model_fields]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown)}"
+            )
+        return set(self.fields)
+
+
+def paginate(items: List[Any], page: PageParams) -> List[Any]:
+    """Apply the page's cursor and limit to an already filtered listing."""
+    items = sorted(items, key=lambda item: (item.created_at, item.id))
+    if page.after:
+        items = [item for item in items if (item.created_at, item.id) > page.after]
+    if page.limit is not None:
+        items = items[:page.limit]
+    return items
@@ -0,0 +1,97 @@
+from typing import Dict, Optional
+from fastapi import Depends, HTTPException, status
+from app.utils.auth import get_current_user
+from app.models.models import User, UserRole, Document, Folder, FolderPermission
+from app.services.database import PERMISSION_LEVELS
+from app.services.repository import repo
+
+
+class FolderPermissionChecker:
+    """
+    Checks a user's effective folder permissions for one request.
+    Grants on a folder also apply beneath it; inheritance is resolved ahead of
+    time by the store's effective ACL cache, so each check is a dict lookup.
+    Results are memoised for the request, so checking many documents in the
+    same folder costs one store call.
+    """
+
+    def __init__(self, user: User):
+        self.user = user
+        self._effective: Dict[str, Optional[FolderPermission]] = {}
+
+    async def effective_permission(self, folder_id: str) -> Optional[FolderPermission]:
+        if folder_id not in self._effective:
+            self._effective[folder_id] = await repo.folders.effective_permission(folder_id, self.user.id)
+        return self._effective[folder_id]
+
+    async def has_permission(self, folder_id: str, level: FolderPermission) -> bool:
+        if self.user.role == UserRole.ADMIN:
+            return True
+        permission = await self.effective_permission(folder_id)
+        return permission is not None and PERMISSION_LEVELS[permission] >= PERMISSION_LEVELS[level]
+
+    async def require(self, folder: Folder, level: FolderPermission, detail: str) -> None:
+        if not await self.has_permission(folder.id, level):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=detail
+            )
+
+
+async def get_permission_checker(current_user: User = Depends(get_current_user)) -> FolderPermissionChecker:
+    return FolderPermissionChecker(current_user)
+
+
+async def get_folder_or_404(folder_id: str, detail: str = "Folder not found") -> Folder:
+    folder = await repo.folders.by_id(folder_id)
+    if not folder:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=detail
+        )
+    return folder
+
+
+def require_folder_permission(
+    level: FolderPermission,
+    detail: str = "Not enough permissions to access this folder"
+):
+    """Dependency factory that resolves the `folder_id` path parameter and checks `level` on it."""
+
+    async def dependency(
+        folder_id: str,
+        checker: FolderPermissionChecker = Depends(get_permission_checker)
+    ) -> Folder:
+        folder = await get_folder_or_404(folder_id)
+        await checker.require(folder, level, detail)
+        return folder
+
+    return dependency
+
+
+async def get_document_or_404(document_id: str) -> Document:
+    document = await repo.documents.by_id(document_id)
+    if not document:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Document not found"
+        )
+    return document
+
+
+def require_document_permission(
+    level: FolderPermission,
+    detail: str = "Not enough permissions to access this document"
+):
+    """Dependency factory that resolves the `document_id` path parameter and checks `level` on its folder."""
+
+    async def dependency(
+        document_id: str,
+        checker: FolderPermissionChecker = Depends(get_permission_checker)
+    ) -> Document:
+        document = await get_document_or_404(document_id)
+        folder = await get_folder_or_404(document.folder_id)
+        await checker.require(folder, level, detail)
+        return document
+
+    return dependency
@@ -63,7 +63,7 @@ Please change the parent <Route path="${T}"> to <Route path="${T==="/"?"*":`${T}
 `)}getSetCookie(){return this.get("set-cookie")||[]}get[Symbol.toStringTag](){return"AxiosHeaders"}static from(r){return r instanceof this?r:new this(r)}static concat(r,...o){const a=new this(r);return o.forEach(l=>a.set(l)),a}static accessor(r){const a=(this[wm]=this[wm]={accessors:{}}).accessors,l=this.prototype;function u(c){const f=va(c);a[f]||(UE(l,c),a[f]=!0)}return V.isArray(r)?r.forEach(u):u(r),this}};Jt.accessor(["Content-Type","Content-Length","Accept","Accept-Encoding","User-Agent","Authorization"]);V.reduceDescriptors(Jt.prototype,({value:t},r)=>{let o=r[0].toUpperCase()+r.slice(1);return{get:()=>t,set(a){this[o]=a}}});V.freezeMethods(Jt);function Bc(t,r){const o=this||Da,a=r||o,l=Jt.from(a.headers);let u=a.data;return V.forEach(t,function(f){u=f.call(o,u,l.normalize(),r?r.status:void 0)}),l.normalize(),u}function Wg(t){return!!(t&&t.__CANCEL__)}function gi(t,r,o){Fe.call(this,t??"canceled",Fe.ERR_CANCELED,r,o),this.name="CanceledError"}V.inherits(gi,Fe,{__CANCEL__:!0});function Kg(t,r,o){const a=o.config.validateStatus;!o.status||!a||a(o.status)?t(o):r(new Fe("Request failed with status code "+o.status,[Fe.ERR_BAD_REQUEST,Fe.ERR_BAD_RESPONSE][Math.floor(o.status/100)-4],o.config,o.request,o))}function $E(t){const r=/^([-+\w]{1,25})(:?\/\/|:)/.exec(t);return r&&r[1]||""}function BE(t,r){t=t||10;const o=new Array(t),a=new Array(t);let l=0,u=0,c;return r=r!==void 0?r:1e3,function(p){const m=Date.now(),v=a[u];c||(c=m),o[l]=p,a[l]=m;let w=u,S=0;for(;w!==l;)S+=o[w++],w=w%t;if(l=(l+1)%t,l===u&&(u=(u+1)%t),m-c<r)return;const R=v&&m-v;return R?Math.round(S*1e3/R):void 0}}function HE(t,r){let o=0,a=1e3/r,l,u;const c=(m,v=Date.now())=>{o=v,l=null,u&&(clearTimeout(u),u=null),t.apply(null,m)};return[(...m)=>{const v=Date.now(),w=v-o;w>=a?c(m,v):(l=m,u||(u=setTimeout(()=>{u=null,c(l)},a-w)))},()=>l&&c(l)]}const ms=(t,r,o=3)=>{let a=0;const l=BE(50,250);return HE(u=>{const c=u.loaded,f=u.lengthComputable?u.total:void 0,p=c-a,m=l(p),v=c<=f;a=c;const w={loaded:c,total:f,progress:f?c/f:void 0,bytes:p,rate:m||void 0,estimated:m&&f&&v?(f-c)/m:void 0,event:u,lengthComputable:f!=null,[r?"download":"upload"]:!0};t(w)},o)},xm=(t,r)=>{const o=t!=null;return[a=>r[0]({lengthComputable:o,total:t,loaded:a}),r[1]]},Sm=t=>(...r)=>V.asap(()=>t(...r)),VE=_t.hasStandardBrowserEnv?((t,r)=>o=>(o=new URL(o,_t.origin),t.protocol===o.protocol&&t.host===o.host&&(r||t.port===o.port)))(new URL(_t.origin),_t.navigator&&/(msie|trident)/i.test(_t.navigator.userAgent)):()=>!0,WE=_t.hasStandardBrowserEnv?{write(t,r,o,a,l,u){const c=[t+"="+encodeURIComponent(r)];V.isNumber(o)&&c.push("expires="+new Date(o).toGMTString()),V.isString(a)&&c.push("path="+a),V.isString(l)&&c.push("domain="+l),u===!0&&c.push("secure"),document.cookie=c.join("; ")},read(t){const r=document.cookie.match(new RegExp("(^|;\\s*)("+t+")=([^;]*)"));return r?decodeURIComponent(r[3]):null},remove(t){this.write(t,"",Date.now()-864e5)}}:{write(){},read(){return null},remove(){}};function KE(t){return/^([a-z][a-z\d+\-.]*:)?\/\//i.test(t)}function GE(t,r){return r?t.replace(/\/?\/$/,"")+"/"+r.replace(/^\/+/,""):t}function Gg(t,r,o){let a=!KE(r);return t&&(a||o==!1)?GE(t,r):r}const Em=t=>t instanceof Jt?{...t}:t;function Co(t,r){r=r||{};const o={};function a(m,v,w,S){return V.isPlainObject(m)&&V.isPlainObject(v)?V.merge.call({caseless:S},m,v):V.isPlainObject(v)?V.merge({},v):V.isArray(v)?v.slice():v}function l(m,v,w,S){if(V.isUndefined(v)){if(!V.isUndefined(m))return a(void 0,m,w,S)}else return a(m,v,w,S)}function u(m,v){if(!V.isUndefined(v))return a(void 0,v)}function c(m,v){if(V.isUndefined(v)){if(!V.isUndefined(m))return a(void 0,m)}else return a(void 0,v)}function f(m,v,w){if(w in r)return a(m,v);if(w in t)return a(void 0,m)}const p={url:u,method:u,data:u,baseURL:c,transformRequest:c,transformResponse:c,paramsSerializer:c,timeout:c,timeoutMessage:c,withCredentials:c,withXSRFToken:c,adapter:c,responseType:c,xsrfCookieName:c,xsrfHeaderName:c,onUploadProgress:c,onDownloadProgress:c,decompress:c,maxContentLength:c,maxBodyLength:c,beforeRedirect:c,transport:c,httpAgent:c,httpsAgent:c,cancelToken:c,socketPath:c,responseEncoding:c,validateStatus:f,headers:(m,v,w)=>l(Em(m),Em(v),w,!0)};return V.forEach(Object.keys(Object.assign({},t,r)),function(v){const w=p[v]||l,S=w(t[v],r[v],v);V.isUndefined(S)&&w!==f||(o[v]=S)}),o}const qg=t=>{const r=Co({},t);let{data:o,withXSRFToken:a,xsrfHeaderName:l,xsrfCookieName:u,headers:c,auth:f}=r;r.headers=c=Jt.from(c),r.url=Bg(Gg(r.baseURL,r.url,r.allowAbsoluteUrls),t.params,t.paramsSerializer),f&&c.set("Authorization","Basic "+btoa((f.username||"")+":"+(f.password?unescape(encodeURIComponent(f.password)):"")));let p;if(V.isFormData(o)){if(_t.hasStandardBrowserEnv||_t.hasStandardBrowserWebWorkerEnv)c.setContentType(void 0);else if((p=c.getContentType())!==!1){const[m,...v]=p?p.split(";").map(w=>w.trim()).filter(Boolean):[];c.setContentType([m||"multipart/form-data",...v].join("; "))}}if(_t.hasStandardBrowserEnv&&(a&&V.isFunction(a)&&(a=a(r)),a||a!==!1&&VE(r.url))){const m=l&&u&&WE.read(u);m&&c.set(l,m)}return r},qE=typeof XMLHttpRequest<"u",YE=qE&&function(t){return new Promise(function(o,a){const l=qg(t);let u=l.data;const c=Jt.from(l.headers).normalize();let{responseType:f,onUploadProgress:p,onDownloadProgress:m}=l,v,w,S,R,C;function E(){R&&R(),C&&C(),l.cancelToken&&l.cancelToken.unsubscribe(v),l.signal&&l.signal.removeEventListener("abort",v)}let k=new XMLHttpRequest;k.open(l.method.toUpperCase(),l.url,!0),k.timeout=l.timeout;function b(){if(!k)return;const P=Jt.from("getAllResponseHeaders"in k&&k.getAllResponseHeaders()),F={data:!f||f==="text"||f==="json"?k.responseText:k.response,status:k.status,statusText:k.statusText,headers:P,config:t,request:k};Kg(function(W){o(W),E()},function(W){a(W),E()},F),k=null}"onloadend"in k?k.onloadend=b:k.onreadystatechange=function(){!k||k.readyState!==4||k.status===0&&!(k.responseURL&&k.responseURL.indexOf("file:")===0)||setTimeout(b)},k.onabort=function(){k&&(a(new Fe("Request aborted",Fe.ECONNABORTED,t,k)),k=null)},k.onerror=function(){a(new Fe("Network Error",Fe.ERR_NETWORK,t,k)),k=null},k.ontimeout=function(){let j=l.timeout?"timeout of "+l.timeout+"ms exceeded":"timeout exceeded";const F=l.transitional||Hg;l.timeoutErrorMessage&&(j=l.timeoutErrorMessage),a(new Fe(j,F.clarifyTimeoutError?Fe.ETIMEDOUT:Fe.ECONNABORTED,t,k)),k=null},u===void 0&&c.setContentType(null),"setRequestHeader"in k&&V.forEach(c.toJSON(),function(j,F){k.setRequestHeader(F,j)}),V.isUndefined(l.withCredentials)||(k.withCredentials=!!l.withCredentials),f&&f!=="json"&&(k.responseType=l.responseType),m&&([S,C]=ms(m,!0),k.addEventListener("progress",S)),p&&k.upload&&([w,R]=ms(p),k.upload.addEventListener("progress",w),k.upload.addEventListener("loadend",R)),(l.cancelToken||l.signal)&&(v=P=>{k&&(a(!P||P.type?new gi(null,t,k):P),k.abort(),k=null)},l.cancelToken&&l.cancelToken.subscribe(v),l.signal&&(l.signal.aborted?v():l.signal.addEventListener("abort",v)));const T=$E(l.url);if(T&&_t.protocols.indexOf(T)===-1){a(new Fe("Unsupported protocol "+T+":",Fe.ERR_BAD_REQUEST,t));return}k.send(u||null)})},QE=(t,r)=>{const{length:o}=t=t?t.filter(Boolean):[];if(r||o){let a=new AbortController,l;const u=function(m){if(!l){l=!0,f();const v=m instanceof Error?m:this.reason;a.abort(v instanceof Fe?v:new gi(v instanceof Error?v.message:v))}};let c=r&&setTimeout(()=>{c=null,u(new Fe(`timeout ${r} of ms exceeded`,Fe.ETIMEDOUT))},r);const f=()=>{t&&(c&&clearTimeout(c),c=null,t.forEach(m=>{m.unsubscribe?m.unsubscribe(u):m.removeEventListener("abort",u)}),t=null)};t.forEach(m=>m.addEventListener("abort",u));const{signal:p}=a;return p.unsubscribe=()=>V.asap(f),p}},XE=function*(t,r){let o=t.byteLength;if(o<r){yield t;return}let a=0,l;for(;a<o;)l=a+r,yield t.slice(a,l),a=l},JE=async function*(t,r){for await(const o of ZE(t))yield*XE(o,r)},ZE=async function*(t){if(t[Symbol.asyncIterator]){yield*t;return}const r=t.getReader();try{for(;;){const{done:o,value:a}=await r.read();if(o)break;yield a}}finally{await r.cancel()}},Cm=(t,r,o,a)=>{const l=JE(t,r);let u=0,c,f=p=>{c||(c=!0,a&&a(p))};return new ReadableStream({async pull(p){try{const{done:m,value:v}=await l.next();if(m){f(),p.close();return}let w=v.byteLength;if(o){let S=u+=w;o(S)}p.enqueue(new Uint8Array(v))}catch(m){throw f(m),m}},cancel(p){return f(p),l.return()}},{highWaterMark:2})},Os=typeof fetch=="function"&&typeof Request=="function"&&typeof Response=="function",Yg=Os&&typeof ReadableStream=="function",eC=Os&&(typeof TextEncoder=="function"?(t=>r=>t.encode(r))(new TextEncoder):async t=>new Uint8Array(await new Response(t).arrayBuffer())),Qg=(t,...r)=>{try{return!!t(...r)}catch{return!1}},tC=Yg&&Qg(()=>{let t=!1;const r=new Request(_t.origin,{body:new ReadableStream,method:"POST",get duplex(){return t=!0,"half"}}).headers.has("Content-Type");return t&&!r}),km=64*1024,ud=Yg&&Qg(()=>V.isReadableStream(new Response("").body)),gs={stream:ud&&(t=>t.body)};Os&&(t=>{["text","arrayBuffer","blob","formData","stream"].forEach(r=>{!gs[r]&&(gs[r]=V.isFunction(t[r])?o=>o[r]():(o,a)=>{throw new Fe(`Response type '${r}' is not supported`,Fe.ERR_NOT_SUPPORT,a)})})})(new Response);const nC=async t=>{if(t==null)return 0;if(V.isBlob(t))return t.size;if(V.isSpecCompliantForm(t))return(await new Request(_t.origin,{method:"POST",body:t}).arrayBuffer()).byteLength;if(V.isArrayBufferView(t)||V.isArrayBuffer(t))return t.byteLength;if(V.isURLSearchParams(t)&&(t=t+""),V.isString(t))return(await eC(t)).byteLength},rC=async(t,r)=>{const o=V.toFiniteNumber(t.getContentLength());return o??nC(r)},oC=Os&&(async t=>{let{url:r,method:o,data:a,signal:l,cancelToken:u,timeout:c,onDownloadProgress:f,onUploadProgress:p,responseType:m,headers:v,withCredentials:w="same-origin",fetchOptions:S}=qg(t);m=m?(m+"").toLowerCase():"text";let R=QE([l,u&&u.toAbortSignal()],c),C;const E=R&&R.unsubscribe&&(()=>{R.unsubscribe()});let k;try{if(p&&tC&&o!=="get"&&o!=="head"&&(k=await rC(v,a))!==0){let F=new Request(r,{method:"POST",body:a,duplex:"half"}),_;if(V.isFormData(a)&&(_=F.headers.get("content-type"))&&v.setContentType(_),F.body){const[W,U]=xm(k,ms(Sm(p)));a=Cm(F.body,km,W,U)}}V.isString(w)||(w=w?"include":"omit");const b="credentials"in Request.prototype;C=new Request(r,{...S,signal:R,method:o.toUpperCase(),headers:v.normalize().toJSON(),body:a,duplex:"half",credentials:b?w:void 0});let T=await fetch(C);const P=ud&&(m==="stream"||m==="response");if(ud&&(f||P&&E)){const F={};["status","statusText","headers"].forEach(Y=>{F[Y]=T[Y]});const _=V.toFiniteNumber(T.headers.get("content-length")),[W,U]=f&&xm(_,ms(Sm(f),!0))||[];T=new Response(Cm(T.body,km,W,()=>{U&&U(),E&&E()}),F)}m=m||"text";let j=await gs[V.findKey(gs,m)||"text"](T,t);return!P&&E&&E(),await new Promise((F,_)=>{Kg(F,_,{data:j,headers:Jt.from(T.headers),status:T.status,statusText:T.statusText,config:t,request:C})})}catch(b){throw E&&E(),b&&b.name==="TypeError"&&/Load failed|fetch/i.test(b.message)?Object.assign(new Fe("Network Error",Fe.ERR_NETWORK,t,C),{cause:b.cause||b}):Fe.from(b,b&&b.code,t,C)}}),cd={http:wE,xhr:YE,fetch:oC};V.forEach(cd,(t,r)=>{if(t){try{Object.defineProperty(t,"name",{value:r})}catch{}Object.defineProperty(t,"adapterName",{value:r})}});const Rm=t=>`- ${t}`,iC=t=>V.isFunction(t)||t===null||t===!1,Xg={getAdapter:t=>{t=V.isArray(t)?t:[t];const{length:r}=t;let o,a;const l={};for(let u=0;u<r;u++){o=t[u];let c;if(a=o,!iC(o)&&(a=cd[(c=String(o)).toLowerCase()],a===void 0))throw new Fe(`Unknown adapter '${c}'`);if(a)break;l[c||"#"+u]=a}if(!a){const u=Object.entries(l).map(([f,p])=>`adapter ${f} `+(p===!1?"is not supported by the environment":"is not available in the build"));let c=r?u.length>1?`since :
 `+u.map(Rm).join(`
 `):" "+Rm(u[0]):"as no adapter specified";throw new Fe("There is no suitable adapter to dispatch the request "+c,"ERR_NOT_SUPPORT")}return a},adapters:cd};function Hc(t){if(t.cancelToken&&t.cancelToken.throwIfRequested(),t.signal&&t.signal.aborted)throw new gi(null,t)}function bm(t){return Hc(t),t.headers=Jt.from(t.headers),t.data=Bc.call(t,t.transformRequest),["post","put","patch"].indexOf(t.method)!==-1&&t.headers.setContentType("application/x-www-form-urlencoded",!1),Xg.getAdapter(t.adapter||Da.adapter)(t).then(function(a){return Hc(t),a.data=Bc.call(t,t.transformResponse,a),a.headers=Jt.from(a.headers),a},function(a){return Wg(a)||(Hc(t),a&&a.response&&(a.response.data=Bc.call(t,t.transformResponse,a.response),a.response.headers=Jt.from(a.response.headers))),Promise.reject(a)})}const Jg="1.9.0",Ls={};["object","boolean","number","function","string","symbol"].forEach((t,r)=>{Ls[t]=function(a){return typeof a===t||"a"+(r<1?"n ":" ")+t}});const Nm={};Ls.transitional=function(r,o,a){function l(u,c){return"[Axios v"+Jg+"] Transitional option '"+u+"'"+c+(a?". "+a:"")}return(u,c,f)=>{if(r===!1)throw new Fe(l(c," has been removed"+(o?" in "+o:"")),Fe.ERR_DEPRECATED);return o&&!Nm[c]&&(Nm[c]=!0,console.warn(l(c," has been deprecated since v"+o+" and will be removed in the near future"))),r?r(u,c,f):!0}};Ls.spelling=function(r){return(o,a)=>(console.warn(`${a} is likely a misspelling of ${r}`),!0)};function aC(t,r,o){if(typeof t!="object")throw new Fe("options must be an object",Fe.ERR_BAD_OPTION_VALUE);const a=Object.keys(t);let l=a.length;for(;l-- >0;){const u=a[l],c=r[u];if(c){const f=t[u],p=f===void 0||c(f,u,t);if(p!==!0)throw new Fe("option "+u+" must be "+p,Fe.ERR_BAD_OPTION_VALUE);continue}if(o!==!0)throw new Fe("Unknown option "+u,Fe.ERR_BAD_OPTION)}}const ls={assertOptions:aC,validators:Ls},Vn=ls.validators;let Eo=class{constructor(r){this.defaults=r||{},this.interceptors={request:new ym,response:new ym}}async request(r,o){try{return await this._request(r,o)}catch(a){if(a instanceof Error){let l={};Error.captureStackTrace?Error.captureStackTrace(l):l=new Error;const u=l.stack?l.stack.replace(/^.+\n/,""):"";try{a.stack?u&&!String(a.stack).endsWith(u.replace(/^.+\n.+\n/,""))&&(a.stack+=`
-`+u):a.stack=u}catch{}}throw a}}_request(r,o){typeof r=="string"?(o=o||{},o.url=r):o=r||{},o=Co(this.defaults,o);const{transitional:a,paramsSerializer:l,headers:u}=o;a!==void 0&&ls.assertOptions(a,{silentJSONParsing:Vn.transitional(Vn.boolean),forcedJSONParsing:Vn.transitional(Vn.boolean),clarifyTimeoutError:Vn.transitional(Vn.boolean)},!1),l!=null&&(V.isFunction(l)?o.paramsSerializer={serialize:l}:ls.assertOptions(l,{encode:Vn.function,serialize:Vn.function},!0)),o.allowAbsoluteUrls!==void 0||(this.defaults.allowAbsoluteUrls!==void 0?o.allowAbsoluteUrls=this.defaults.allowAbsoluteUrls:o.allowAbsoluteUrls=!0),ls.assertOptions(o,{baseUrl:Vn.spelling("baseURL"),withXsrfToken:Vn.spelling("withXSRFToken")},!0),o.method=(o.method||this.defaults.method||"get").toLowerCase();let c=u&&V.merge(u.common,u[o.method]);u&&V.forEach(["delete","get","head","post","put","patch","common"],C=>{delete u[C]}),o.headers=Jt.concat(c,u);const f=[];let p=!0;this.interceptors.request.forEach(function(E){typeof E.runWhen=="function"&&E.runWhen(o)===!1||(p=p&&E.synchronous,f.unshift(E.fulfilled,E.rejected))});const m=[];this.interceptors.response.forEach(function(E){m.push(E.fulfilled,E.rejected)});let v,w=0,S;if(!p){const C=[bm.bind(this),void 0];for(C.unshift.apply(C,f),C.push.apply(C,m),S=C.length,v=Promise.resolve(o);w<S;)v=v.then(C[w++],C[w++]);return v}S=f.length;let R=o;for(w=0;w<S;){const C=f[w++],E=f[w++];try{R=C(R)}catch(k){E.call(this,k);break}}try{v=bm.call(this,R)}catch(C){return Promise.reject(C)}for(w=0,S=m.length;w<S;)v=v.then(m[w++],m[w++]);return v}getUri(r){r=Co(this.defaults,r);const o=Gg(r.baseURL,r.url,r.allowAbsoluteUrls);return Bg(o,r.params,r.paramsSerializer)}};V.forEach(["delete","get","head","options"],function(r){Eo.prototype[r]=function(o,a){return this.request(Co(a||{},{method:r,url:o,data:(a||{}).data}))}});V.forEach(["post","put","patch"],function(r){function o(a){return function(u,c,f){return this.request(Co(f||{},{method:r,headers:a?{"Content-Type":"multipart/form-data"}:{},url:u,data:c}))}}Eo.prototype[r]=o(),Eo.prototype[r+"Form"]=o(!0)});let lC=class Zg{constructor(r){if(typeof r!="function")throw new TypeError("executor must be a function.");let o;this.promise=new Promise(function(u){o=u});const a=this;this.promise.then(l=>{if(!a._listeners)return;let u=a._listeners.length;for(;u-- >0;)a._listeners[u](l);a._listeners=null}),this.promise.then=l=>{let u;const c=new Promise(f=>{a.subscribe(f),u=f}).then(l);return c.cancel=function(){a.unsubscribe(u)},c},r(function(u,c,f){a.reason||(a.reason=new gi(u,c,f),o(a.reason))})}throwIfRequested(){if(this.reason)throw this.reason}subscribe(r){if(this.reason){r(this.reason);return}this._listeners?this._listeners.push(r):this._listeners=[r]}unsubscribe(r){if(!this._listeners)return;const o=this._listeners.indexOf(r);o!==-1&&this._listeners.splice(o,1)}toAbortSignal(){const r=new AbortController,o=a=>{r.abort(a)};return this.subscribe(o),r.signal.unsubscribe=()=>this.unsubscribe(o),r.signal}static source(){let r;return{token:new Zg(function(l){r=l}),cancel:r}}};function sC(t){return function(o){return t.apply(null,o)}}function uC(t){return V.isObject(t)&&t.isAxiosError===!0}const dd={Continue:100,SwitchingProtocols:101,Processing:102,EarlyHints:103,Ok:200,Created:201,Accepted:202,NonAuthoritativeInformation:203,NoContent:204,ResetContent:205,PartialContent:206,MultiStatus:207,AlreadyReported:208,ImUsed:226,MultipleChoices:300,MovedPermanently:301,Found:302,SeeOther:303,NotModified:304,UseProxy:305,Unused:306,TemporaryRedirect:307,PermanentRedirect:308,BadRequest:400,Unauthorized:401,PaymentRequired:402,Forbidden:403,NotFound:404,MethodNotAllowed:405,NotAcceptable:406,ProxyAuthenticationRequired:407,RequestTimeout:408,Conflict:409,Gone:410,LengthRequired:411,PreconditionFailed:412,PayloadTooLarge:413,UriTooLong:414,UnsupportedMediaType:415,RangeNotSatisfiable:416,ExpectationFailed:417,ImATeapot:418,MisdirectedRequest:421,UnprocessableEntity:422,Locked:423,FailedDependency:424,TooEarly:425,UpgradeRequired:426,PreconditionRequired:428,TooManyRequests:429,RequestHeaderFieldsTooLarge:431,UnavailableForLegalReasons:451,InternalServerError:500,NotImplemented:501,BadGateway:502,ServiceUnavailable:503,GatewayTimeout:504,HttpVersionNotSupported:505,VariantAlsoNegotiates:506,InsufficientStorage:507,LoopDetected:508,NotExtended:510,NetworkAuthenticationRequired:511};Object.entries(dd).forEach(([t,r])=>{dd[r]=t});function ev(t){const r=new Eo(t),o=Tg(Eo.prototype.request,r);return V.extend(o,Eo.prototype,r,{allOwnKeys:!0}),V.extend(o,r,null,{allOwnKeys:!0}),o.create=function(l){return ev(Co(t,l))},o}const pt=ev(Da);pt.Axios=Eo;pt.CanceledError=gi;pt.CancelToken=lC;pt.isCancel=Wg;pt.VERSION=Jg;pt.toFormData=Ds;pt.AxiosError=Fe;pt.Cancel=pt.CanceledError;pt.all=function(r){return Promise.all(r)};pt.spread=sC;pt.isAxiosError=uC;pt.mergeConfig=Co;pt.AxiosHeaders=Jt;pt.formToJSON=t=>Vg(V.isHTMLForm(t)?new FormData(t):t);pt.getAdapter=Xg.getAdapter;pt.HttpStatusCode=dd;pt.default=pt;const{Axios:jP,AxiosError:TP,CanceledError:_P,isCancel:AP,CancelToken:DP,VERSION:OP,all:LP,Cancel:MP,isAxiosError:FP,spread:IP,toFormData:zP,AxiosHeaders:UP,HttpStatusCode:$P,formToJSON:BP,getAdapter:HP,mergeConfig:VP}=pt,ct=pt.create({baseURL:"http://localhost:8000"});ct.interceptors.request.use(t=>{const r=localStorage.getItem("token");return r&&t.headers&&(t.headers.Authorization=`Bearer ${r}`),t},t=>Promise.reject(t));const cC=async(t,r)=>{const o=new FormData;return o.append("username",t),o.append("password",r),(await ct.post("/token",o)).data},dC=async t=>(await ct.post("/register",t)).data,fC=async()=>(await ct.get("/me")).data,pC=async()=>(await ct.get("/users")).data,Hd=async t=>{const r=t?`/folders?parent_id=${t}`:"/folders";return(await ct.get(r)).data},hC=async t=>(await ct.post("/folders",t)).data,mC=async t=>{const r=t?`/documents?folder_id=${t}`:"/documents";return(await ct.get(r)).data},gC=async(t,r,o)=>{const a=new FormData;return a.append("file",t),a.append("folder_id",r),(await ct.post("/documents",a,{headers:{"Content-Type":"multipart/form-data"}})).data},vC=async t=>(await ct.delete(`/documents/${t}`)).data,yC=async()=>(await ct.get("/approval-forms")).data,wC=async t=>(await ct.post("/approval-forms",t)).data,xC=async t=>(await ct.delete(`/approval-forms/${t}`)).data,SC=async()=>(await ct.get("/approval-routes")).data,EC=async t=>(await ct.post("/approval-routes",t)).data,CC=async t=>(await ct.delete(`/approval-routes/${t}`)).data,tv=async()=>(await ct.get("/applications")).data,nv=async()=>(await ct.get("/applications/for-approval")).data,kC=async t=>(await ct.delete(`/applications/${t}`)).data,RC=async t=>(await ct.post("/applications/submit",{application_id:t})).data,bC=async(t,r)=>(await ct.post("/applications/approve",{application_id:t,comment:r})).data,NC=async(t,r)=>(await ct.post("/applications/reject",{application_id:t,comment:r})).data,rv=y.createContext(void 0),PC=({children:t})=>{const[r,o]=y.useState(null),[a,l]=y.useState(!0),[u,c]=y.useState(null);y.useEffect(()=>{localStorage.getItem("token")?f():l(!1)},[]);const f=async()=>{try{const S=await fC();o(S)}catch(S){console.error("Failed to fetch current user:",S),localStorage.removeItem("token")}finally{l(!1)}},p=async(S,R)=>{var C,E;try{l(!0),c(null);const k=await cC(S,R);localStorage.setItem("token",k.access_token),await f()}catch(k){throw c(((E=(C=k.response)==null?void 0:C.data)==null?void 0:E.detail)||"Login failed"),l(!1),k}},m=async S=>{var R,C;try{l(!0),c(null),await dC(S),await p(S.username,S.password)}catch(E){throw c(((C=(R=E.response)==null?void 0:R.data)==null?void 0:C.detail)||"Registration failed"),l(!1),E}},v=()=>{localStorage.removeItem("token"),o(null)},w=()=>{c(null)};return g.jsx(rv.Provider,{value:{user:r,loading:a,error:u,login:p,register:m,logout:v,clearError:w},children:t})},jo=()=>{const t=y.useContext(rv);if(t===void 0)throw new Error("useAuth must be used within an AuthProvider");return t};function Pm(t,r){if(typeof t=="function")return t(r);t!=null&&(t.current=r)}function ov(...t){return r=>{let o=!1;const a=t.map(l=>{const u=Pm(l,r);return!o&&typeof u=="function"&&(o=!0),u});if(o)return()=>{for(let l=0;l<a.length;l++){const u=a[l];typeof u=="function"?u():Pm(t[l],null)}}}}function ut(...t){return y.useCallback(ov(...t),t)}function di(t){const r=TC(t),o=y.forwardRef((a,l)=>{const{children:u,...c}=a,f=y.Children.toArray(u),p=f.find(AC);if(p){const m=p.props.children,v=f.map(w=>w===p?y.Children.count(m)>1?y.Children.only(null):y.isValidElement(m)?m.props.children:null:w);return g.jsx(r,{...c,ref:l,children:y.isValidElement(m)?y.cloneElement(m,void 0,v):null})}return g.jsx(r,{...c,ref:l,children:u})});return o.displayName=`${t}.Slot`,o}var jC=di("Slot");function TC(t){const r=y.forwardRef((o,a)=>{const{children:l,...u}=o;if(y.isValidElement(l)){const c=OC(l),f=DC(u,l.props);return l.type!==y.Fragment&&(f.ref=a?ov(a,c):c),y.cloneElement(l,f)}return y.Children.count(l)>1?y.Children.only(null):null});return r.displayName=`${t}.SlotClone`,r}var _C=Symbol("radix.slottable");function AC(t){return y.isValidElement(t)&&typeof t.type=="function"&&"__radixId"in t.type&&t.type.__radixId===_C}function DC(t,r){const o={...r};for(const a in r){const l=t[a],u=r[a];/^on[A-Z]/.test(a)?l&&u?o[a]=(...f)=>{u(...f),l(...f)}:l&&(o[a]=l):a==="style"?o[a]={...l,...u}:a==="className"&&(o[a]=[l,u].filter(Boolean).join(" "))}return{...t,...o}}function OC(t){var a,l;let r=(a=Object.getOwnPropertyDescriptor(t.props,"ref"))==null?void 0:a.get,o=r&&"isReactWarning"in r&&r.isReactWarning;return o?t.ref:(r=(l=Object.getOwnPropertyDescriptor(t,"ref"))==null?void 0:l.get,o=r&&"isReactWarning"in r&&r.isReactWarning,o?t.props.ref:t.props.ref||t.ref)}function iv(t){var r,o,a="";if(typeof t=="string"||typeof t=="number")a+=t;else if(typeof t=="object")if(Array.isArray(t)){var l=t.length;for(r=0;r<l;r++)t[r]&&(o=iv(t[r]))&&(a&&(a+=" "),a+=o)}else for(o in t)t[o]&&(a&&(a+=" "),a+=o);return a}function av(){for(var t,r,o=0,a="",l=arguments.length;o<l;o++)(t=arguments[o])&&(r=iv(t))&&(a&&(a+=" "),a+=r);return a}const jm=t=>typeof t=="boolean"?`${t}`:t===0?"0":t,Tm=av,Ms=(t,r)=>o=>{var a;if((r==null?void 0:r.variants)==null)return Tm(t,o==null?void 0:o.class,o==null?void 0:o.className);const{variants:l,defaultVariants:u}=r,c=Object.keys(l).map(m=>{const v=o==null?void 0:o[m],w=u==null?void 0:u[m];if(v===null)return null;const S=jm(v)||jm(w);return l[m][S]}),f=o&&Object.entries(o).reduce((m,v)=>{let[w,S]=v;return S===void 0||(m[w]=S),m},{}),p=r==null||(a=r.compoundVariants)===null||a===void 0?void 0:a.reduce((m,v)=>{let{class:w,className:S,...R}=v;return Object.entries(R).every(C=>{let[E,k]=C;return Array.isArray(k)?k.includes({...u,...f}[E]):{...u,...f}[E]===k})?[...m,w,S]:m},[]);return Tm(t,c,p,o==null?void 0:o.class,o==null?void 0:o.className)},Vd="-",LC=t=>{const r=FC(t),{conflictingClassGroups:o,conflictingClassGroupModifiers:a}=t;return{getClassGroupId:c=>{const f=c.split(Vd);return f[0]===""&&f.length!==1&&f.shift(),lv(f,r)||MC(c)},getConflictingClassGroupIds:(c,f)=>{const p=o[c]||[];return f&&a[c]?[...p,...a[c]]:p}}},lv=(t,r)=>{var c;if(t.length===0)return r.classGroupId;const o=t[0],a=r.nextPart.get(o),l=a?lv(t.slice(1),a):void 0;if(l)return l;if(r.validators.length===0)return;const u=t.join(Vd);return(c=r.validators.find(({validator:f})=>f(u)))==null?void 0:c.classGroupId},_m=/^\[(.+)\]$/,MC=t=>{if(_m.test(t)){const r=_m.exec(t)[1],o=r==null?void 0:r.substring(0,r.indexOf(":"));if(o)return"arbitrary.."+o}},FC=t=>{const{theme:r,classGroups:o}=t,a={nextPart:new Map,validators:[]};for(const l in o)fd(o[l],a,l,r);return a},fd=(t,r,o,a)=>{t.forEach(l=>{if(typeof l=="string"){const u=l===""?r:Am(r,l);u.classGroupId=o;return}if(typeof l=="function"){if(IC(l)){fd(l(a),r,o,a);return}r.validators.push({validator:l,classGroupId:o});return}Object.entries(l).forEach(([u,c])=>{fd(c,Am(r,u),o,a)})})},Am=(t,r)=>{let o=t;return r.split(Vd).forEach(a=>{o.nextPart.has(a)||o.nextPart.set(a,{nextPart:new Map,validators:[]}),o=o.nextPart.get(a)}),o},IC=t=>t.isThemeGetter,zC=t=>{if(t<1)return{get:()=>{},set:()=>{}};let r=0,o=new Map,a=new Map;const l=(u,c)=>{o.set(u,c),r++,r>t&&(r=0,a=o,o=new Map)};return{get(u){let c=o.get(u);if(c!==void 0)return c;if((c=a.get(u))!==void 0)return l(u,c),c},set(u,c){o.has(u)?o.set(u,c):l(u,c)}}},pd="!",hd=":",UC=hd.length,$C=t=>{const{prefix:r,experimentalParseClassName:o}=t;let a=l=>{const u=[];let c=0,f=0,p=0,m;for(let C=0;C<l.length;C++){let E=l[C];if(c===0&&f===0){if(E===hd){u.push(l.slice(p,C)),p=C+UC;continue}if(E==="/"){m=C;continue}}E==="["?c++:E==="]"?c--:E==="("?f++:E===")"&&f--}const v=u.length===0?l:l.substring(p),w=BC(v),S=w!==v,R=m&&m>p?m-p:void 0;return{modifiers:u,hasImportantModifier:S,baseClassName:w,maybePostfixModifierPosition:R}};if(r){const l=r+hd,u=a;a=c=>c.startsWith(l)?u(c.substring(l.length)):{isExternal:!0,modifiers:[],hasImportantModifier:!1,baseClassName:c,maybePostfixModifierPosition:void 0}}if(o){const l=a;a=u=>o({className:u,parseClassName:l})}return a},BC=t=>t.endsWith(pd)?t.substring(0,t.length-1):t.startsWith(pd)?t.substring(1):t,HC=t=>{const r=Object.fromEntries(t.orderSensitiveModifiers.map(a=>[a,!0]));return a=>{if(a.length<=1)return a;const l=[];let u=[];return a.forEach(c=>{c[0]==="["||r[c]?(l.push(...u.sort(),c),u=[]):u.push(c)}),l.push(...u.sort()),l}},VC=t=>({cache:zC(t.cacheSize),parseClassName:$C(t),sortModifiers:HC(t),...LC(t)}),WC=/\s+/,KC=(t,r)=>{const{parseClassName:o,getClassGroupId:a,getConflictingClassGroupIds:l,sortModifiers:u}=r,c=[],f=t.trim().split(WC);let p="";for(let m=f.length-1;m>=0;m-=1){const v=f[m],{isExternal:w,modifiers:S,hasImportantModifier:R,baseClassName:C,maybePostfixModifierPosition:E}=o(v);if(w){p=v+(p.length>0?" "+p:p);continue}let k=!!E,b=a(k?C.substring(0,E):C);if(!b){if(!k){p=v+(p.length>0?" "+p:p);continue}if(b=a(C),!b){p=v+(p.length>0?" "+p:p);continue}k=!1}const T=u(S).join(":"),P=R?T+pd:T,j=P+b;if(c.includes(j))continue;c.push(j);const F=l(b,k);for(let _=0;_<F.length;++_){const W=F[_];c.push(P+W)}p=v+(p.length>0?" "+p:p)}return p};function GC(){let t=0,r,o,a="";for(;t<arguments.length;)(r=arguments[t++])&&(o=sv(r))&&(a&&(a+=" "),a+=o);return a}const sv=t=>{if(typeof t=="string")return t;let r,o="";for(let a=0;a<t.length;a++)t[a]&&(r=sv(t[a]))&&(o&&(o+=" "),o+=r);return o};function qC(t,...r){let o,a,l,u=c;function c(p){const m=r.reduce((v,w)=>w(v),t());return o=VC(m),a=o.cache.get,l=o.cache.set,u=f,f(p)}function f(p){const m=a(p);if(m)return m;const v=KC(p,o);return l(p,v),v}return function(){return u(GC.apply(null,arguments))}}const xt=t=>{const r=o=>o[t]||[];return r.isThemeGetter=!0,r},uv=/^\[(?:(\w[\w-]*):)?(.+)\]$/i,cv=/^\((?:(\w[\w-]*):)?(.+)\)$/i,YC=/^\d+\/\d+$/,QC=/^(\d+(\.\d+)?)?(xs|sm|md|lg|xl)$/,XC=/\d+(%|px|r?em|[sdl]?v([hwib]|min|max)|pt|pc|in|cm|mm|cap|ch|ex|r?lh|cq(w|h|i|b|min|max))|\b(calc|min|max|clamp)\(.+\)|^0$/,JC=/^(rgba?|hsla?|hwb|(ok)?(lab|lch))\(.+\)$/,ZC=/^(inset_)?-?((\d+)?\.?(\d+)[a-z]+|0)_-?((\d+)?\.?(\d+)[a-z]+|0)/,ek=/^(url|image|image-set|cross-fade|element|(repeating-)?(linear|radial|conic)-gradient)\(.+\)$/,ri=t=>YC.test(t),ze=t=>!!t&&!Number.isNaN(Number(t)),Lr=t=>!!t&&Number.isInteger(Number(t)),Vc=t=>t.endsWith("%")&&ze(t.slice(0,-1)),ar=t=>QC.test(t),tk=()=>!0,nk=t=>XC.test(t)&&!JC.test(t),dv=()=>!1,rk=t=>ZC.test(t),ok=t=>ek.test(t),ik=t=>!he(t)&&!me(t),ak=t=>vi(t,hv,dv),he=t=>uv.test(t),yo=t=>vi(t,mv,nk),Wc=t=>vi(t,dk,ze),Dm=t=>vi(t,fv,dv),lk=t=>vi(t,pv,ok),ql=t=>vi(t,gv,rk),me=t=>cv.test(t),ya=t=>yi(t,mv),sk=t=>yi(t,fk),Om=t=>yi(t,fv),uk=t=>yi(t,hv),ck=t=>yi(t,pv),Yl=t=>yi(t,gv,!0),vi=(t,r,o)=>{const a=uv.exec(t);return a?a[1]?r(a[1]):o(a[2]):!1},yi=(t,r,o=!1)=>{const a=cv.exec(t);return a?a[1]?r(a[1]):o:!1},fv=t=>t==="position"||t==="percentage",pv=t=>t==="image"||t==="url",hv=t=>t==="length"||t==="size"||t==="bg-size",mv=t=>t==="length",dk=t=>t==="number",fk=t=>t==="family-name",gv=t=>t==="shadow",pk=()=>{const t=xt("color"),r=xt("font"),o=xt("text"),a=xt("font-weight"),l=xt("tracking"),u=xt("leading"),c=xt("breakpoint"),f=xt("container"),p=xt("spacing"),m=xt("radius"),v=xt("shadow"),w=xt("inset-shadow"),S=xt("text-shadow"),R=xt("drop-shadow"),C=xt("blur"),E=xt("perspective"),k=xt("aspect"),b=xt("ease"),T=xt("animate"),P=()=>["auto","avoid","all","avoid-page","page","left","right","column"],j=()=>["center","top","bottom","left","right","top-left","left-top","top-right","right-top","bottom-right","right-bottom","bottom-left","left-bottom"],F=()=>[...j(),me,he],_=()=>["auto","hidden","clip","visible","scroll"],W=()=>["auto","contain","none"],U=()=>[me,he,p],Y=()=>[ri,"full","auto",...U()],oe=()=>[Lr,"none","subgrid",me,he],Re=()=>["auto",{span:["full",Lr,me,he]},Lr,me,he],Te=()=>[Lr,"auto",me,he],ae=()=>["auto","min","max","fr",me,he],le=()=>["start","end","center","between","around","evenly","stretch","baseline","center-safe","end-safe"],Se=()=>["start","end","center","stretch","center-safe","end-safe"],X=()=>["auto",...U()],ie=()=>[ri,"auto","full","dvw","dvh","lvw","lvh","svw","svh","min","max","fit",...U()],M=()=>[t,me,he],ee=()=>[...j(),Om,Dm,{position:[me,he]}],Q=()=>["no-repeat",{repeat:["","x","y","space","round"]}],O=()=>["auto","cover","contain",uk,ak,{size:[me,he]}],K=()=>[Vc,ya,yo],se=()=>["","none","full",m,me,he],ce=()=>["",ze,ya,yo],_e=()=>["solid","dashed","dotted","double"],je=()=>["normal","multiply","screen","overlay","darken","lighten","color-dodge","color-burn","hard-light","soft-light","difference","exclusion","hue","saturation","color","luminosity"],te=()=>[ze,Vc,Om,Dm],ye=()=>["","none",C,me,he],Ae=()=>["none",ze,me,he],ve=()=>["none",ze,me,he],Le=()=>[ze,me,he],Ie=()=>[ri,"full",...U()];return{cacheSize:500,theme:{animate:["spin","ping","pulse","bounce"],aspect:["video"],blur:[ar],breakpoint:[ar],color:[tk],container:[ar],"drop-shadow":[ar],ease:["in","out","in-out"],font:[ik],"font-weight":["thin","extralight","light","normal","medium","semibold","bold","extrabold","black"],"inset-shadow":[ar],leading:["none","tight","snug","normal","relaxed","loose"],perspective:["dramatic","near","normal","midrange","distant","none"],radius:[ar],shadow:[ar],spacing:["px",ze],text:[ar],"text-shadow":[ar],tracking:["tighter","tight","normal","wide","wider","widest"]},classGroups:{aspect:[{aspect:["auto","square",ri,he,me,k]}],container:["container"],columns:[{columns:[ze,he,me,f]}],"break-after":[{"break-after":P()}],"break-before":[{"break-before":P()}],"break-inside":[{"break-inside":["auto","avoid","avoid-page","avoid-column"]}],"box-decoration":[{"box-decoration":["slice","clone"]}],box:[{box:["border","content"]}],display:["block","inline-block","inline","flex","inline-flex","table","inline-table","table-caption","table-cell","table-column","table-column-group","table-footer-group","table-header-group","table-row-group","table-row","flow-root","grid","inline-grid","contents","list-item","hidden"],sr:["sr-only","not-sr-only"],float:[{float:["right","left","none","start","end"]}],clear:[{clear:["left","right","both","none","start","end"]}],isolation:["isolate","isolation-auto"],"object-fit":[{object:["contain","cover","fill","none","scale-down"]}],"object-position":[{object:F()}],overflow:[{overflow:_()}],"overflow-x":[{"overflow-x":_()}],"overflow-y":[{"overflow-y":_()}],overscroll:[{overscroll:W()}],"overscroll-x":[{"overscroll-x":W()}],"overscroll-y":[{"overscroll-y":W()}],position:["static","fixed","absolute","relative","sticky"],inset:[{inset:Y()}],"inset-x":[{"inset-x":Y()}],"inset-y":[{"inset-y":Y()}],start:[{start:Y()}],end:[{end:Y()}],top:[{top:Y()}],right:[{right:Y()}],bottom:[{bottom:Y()}],left:[{left:Y()}],visibility:["visible","invisible","collapse"],z:[{z:[Lr,"auto",me,he]}],basis:[{basis:[ri,"full","auto",f,...U()]}],"flex-direction":[{flex:["row","row-reverse","col","col-reverse"]}],"flex-wrap":[{flex:["nowrap","wrap","wrap-reverse"]}],flex:[{flex:[ze,ri,"auto","initial","none",he]}],grow:[{grow:["",ze,me,he]}],shrink:[{shrink:["",ze,me,he]}],order:[{order:[Lr,"first","last","none",me,he]}],"grid-cols":[{"grid-cols":oe()}],"col-start-end":[{col:Re()}],"col-start":[{"col-start":Te()}],"col-end":[{"col-end":Te()}],"grid-rows":[{"grid-rows":oe()}],"row-start-end":[{row:Re()}],"row-start":[{"row-start":Te()}],"row-end":[{"row-end":Te()}],"grid-flow":[{"grid-flow":["row","col","dense","row-dense","col-dense"]}],"auto-cols":[{"auto-cols":ae()}],"auto-rows":[{"auto-rows":ae()}],gap:[{gap:U()}],"gap-x":[{"gap-x":U()}],"gap-y":[{"gap-y":U()}],"justify-content":[{justify:[...le(),"normal"]}],"justify-items":[{"justify-items":[...Se(),"normal"]}],"justify-self":[{"justify-self":["auto",...Se()]}],"align-content":[{content:["normal",...le()]}],"align-items":[{items:[...Se(),{baseline:["","last"]}]}],"align-self":[{self:["auto",...Se(),{baseline:["","last"]}]}],"place-content":[{"place-content":le()}],"place-items":[{"place-items":[...Se(),"baseline"]}],"place-self":[{"place-self":["auto",...Se()]}],p:[{p:U()}],px:[{px:U()}],py:[{py:U()}],ps:[{ps:U()}],pe:[{pe:U()}],pt:[{pt:U()}],pr:[{pr:U()}],pb:[{pb:U()}],pl:[{pl:U()}],m:[{m:X()}],mx:[{mx:X()}],my:[{my:X()}],ms:[{ms:X()}],me:[{me:X()}],mt:[{mt:X()}],mr:[{mr:X()}],mb:[{mb:X()}],ml:[{ml:X()}],"space-x":[{"space-x":U()}],"space-x-reverse":["space-x-reverse"],"space-y":[{"space-y":U()}],"space-y-reverse":["space-y-reverse"],size:[{size:ie()}],w:[{w:[f,"screen",...ie()]}],"min-w":[{"min-w":[f,"screen","none",...ie()]}],"max-w":[{"max-w":[f,"screen","none","prose",{screen:[c]},...ie()]}],h:[{h:["screen",...ie()]}],"min-h":[{"min-h":["screen","none",...ie()]}],"max-h":[{"max-h":["screen",...ie()]}],"font-size":[{text:["base",o,ya,yo]}],"font-smoothing":["antialiased","subpixel-antialiased"],"font-style":["italic","not-italic"],"font-weight":[{font:[a,me,Wc]}],"font-stretch":[{"font-stretch":["ultra-condensed","extra-condensed","condensed","semi-condensed","normal","semi-expanded","expanded","extra-expanded","ultra-expanded",Vc,he]}],"font-family":[{font:[sk,he,r]}],"fvn-normal":["normal-nums"],"fvn-ordinal":["ordinal"],"fvn-slashed-zero":["slashed-zero"],"fvn-figure":["lining-nums","oldstyle-nums"],"fvn-spacing":["proportional-nums","tabular-nums"],"fvn-fraction":["diagonal-fractions","stacked-fractions"],tracking:[{tracking:[l,me,he]}],"line-clamp":[{"line-clamp":[ze,"none",me,Wc]}],leading:[{leading:[u,...U()]}],"list-image":[{"list-image":["none",me,he]}],"list-style-position":[{list:["inside","outside"]}],"list-style-type":[{list:["disc","decimal","none",me,he]}],"text-alignment":[{text:["left","center","right","justify","start","end"]}],"placeholder-color":[{placeholder:M()}],"text-color":[{text:M()}],"text-decoration":["underline","overline","line-through","no-underline"],"text-decoration-style":[{decoration:[..._e(),"wavy"]}],"text-decoration-thickness":[{decoration:[ze,"from-font","auto",me,yo]}],"text-decoration-color":[{decoration:M()}],"underline-offset":[{"underline-offset":[ze,"auto",me,he]}],"text-transform":["uppercase","lowercase","capitalize","normal-case"],"text-overflow":["truncate","text-ellipsis","text-clip"],"text-wrap":[{text:["wrap","nowrap","balance","pretty"]}],indent:[{indent:U()}],"vertical-align":[{align:["baseline","top","middle","bottom","text-top","text-bottom","sub","super",me,he]}],whitespace:[{whitespace:["normal","nowrap","pre","pre-line","pre-wrap","break-spaces"]}],break:[{break:["normal","words","all","keep"]}],wrap:[{wrap:["break-word","anywhere","normal"]}],hyphens:[{hyphens:["none","manual","auto"]}],content:[{content:["none",me,he]}],"bg-attachment":[{bg:["fixed","local","scroll"]}],"bg-clip":[{"bg-clip":["border","padding","content","text"]}],"bg-origin":[{"bg-origin":["border","padding","content"]}],"bg-position":[{bg:ee()}],"bg-repeat":[{bg:Q()}],"bg-size":[{bg:O()}],"bg-image":[{bg:["none",{linear:[{to:["t","tr","r","br","b","bl","l","tl"]},Lr,me,he],radial:["",me,he],conic:[Lr,me,he]},ck,lk]}],"bg-color":[{bg:M()}],"gradient-from-pos":[{from:K()}],"gradient-via-pos":[{via:K()}],"gradient-to-pos":[{to:K()}],"gradient-from":[{from:M()}],"gradient-via":[{via:M()}],"gradient-to":[{to:M()}],rounded:[{rounded:se()}],"rounded-s":[{"rounded-s":se()}],"rounded-e":[{"rounded-e":se()}],"rounded-t":[{"rounded-t":se()}],"rounded-r":[{"rounded-r":se()}],"rounded-b":[{"rounded-b":se()}],"rounded-l":[{"rounded-l":se()}],"rounded-ss":[{"rounded-ss":se()}],"rounded-se":[{"rounded-se":se()}],"rounded-ee":[{"rounded-ee":se()}],"rounded-es":[{"rounded-es":se()}],"rounded-tl":[{"rounded-tl":se()}],"rounded-tr":[{"rounded-tr":se()}],"rounded-br":[{"rounded-br":se()}],"rounded-bl":[{"rounded-bl":se()}],"border-w":[{border:ce()}],"border-w-x":[{"border-x":ce()}],"border-w-y":[{"border-y":ce()}],"border-w-s":[{"border-s":ce()}],"border-w-e":[{"border-e":ce()}],"border-w-t":[{"border-t":ce()}],"border-w-r":[{"border-r":ce()}],"border-w-b":[{"border-b":ce()}],"border-w-l":[{"border-l":ce()}],"divide-x":[{"divide-x":ce()}],"divide-x-reverse":["divide-x-reverse"],"divide-y":[{"divide-y":ce()}],"divide-y-reverse":["divide-y-reverse"],"border-style":[{border:[..._e(),"hidden","none"]}],"divide-style":[{divide:[..._e(),"hidden","none"]}],"border-color":[{border:M()}],"border-color-x":[{"border-x":M()}],"border-color-y":[{"border-y":M()}],"border-color-s":[{"border-s":M()}],"border-color-e":[{"border-e":M()}],"border-color-t":[{"border-t":M()}],"border-color-r":[{"border-r":M()}],"border-color-b":[{"border-b":M()}],"border-color-l":[{"border-l":M()}],"divide-color":[{divide:M()}],"outline-style":[{outline:[..._e(),"none","hidden"]}],"outline-offset":[{"outline-offset":[ze,me,he]}],"outline-w":[{outline:["",ze,ya,yo]}],"outline-color":[{outline:M()}],shadow:[{shadow:["","none",v,Yl,ql]}],"shadow-color":[{shadow:M()}],"inset-shadow":[{"inset-shadow":["none",w,Yl,ql]}],"inset-shadow-color":[{"inset-shadow":M()}],"ring-w":[{ring:ce()}],"ring-w-inset":["ring-inset"],"ring-color":[{ring:M()}],"ring-offset-w":[{"ring-offset":[ze,yo]}],"ring-offset-color":[{"ring-offset":M()}],"inset-ring-w":[{"inset-ring":ce()}],"inset-ring-color":[{"inset-ring":M()}],"text-shadow":[{"text-shadow":["none",S,Yl,ql]}],"text-shadow-color":[{"text-shadow":M()}],opacity:[{opacity:[ze,me,he]}],"mix-blend":[{"mix-blend":[...je(),"plus-darker","plus-lighter"]}],"bg-blend":[{"bg-blend":je()}],"mask-clip":[{"mask-clip":["border","padding","content","fill","stroke","view"]},"mask-no-clip"],"mask-composite":[{mask:["add","subtract","intersect","exclude"]}],"mask-image-linear-pos":[{"mask-linear":[ze]}],"mask-image-linear-from-pos":[{"mask-linear-from":te()}],"mask-image-linear-to-pos":[{"mask-linear-to":te()}],"mask-image-linear-from-color":[{"mask-linear-from":M()}],"mask-image-linear-to-color":[{"mask-linear-to":M()}],"mask-image-t-from-pos":[{"mask-t-from":te()}],"mask-image-t-to-pos":[{"mask-t-to":te()}],"mask-image-t-from-color":[{"mask-t-from":M()}],"mask-image-t-to-color":[{"mask-t-to":M()}],"mask-image-r-from-pos":[{"mask-r-from":te()}],"mask-image-r-to-pos":[{"mask-r-to":te()}],"mask-image-r-from-color":[{"mask-r-from":M()}],"mask-image-r-to-color":[{"mask-r-to":M()}],"mask-image-b-from-pos":[{"mask-b-from":te()}],"mask-image-b-to-pos":[{"mask-b-to":te()}],"mask-image-b-from-color":[{"mask-b-from":M()}],"mask-image-b-to-color":[{"mask-b-to":M()}],"mask-image-l-from-pos":[{"mask-l-from":te()}],"mask-image-l-to-pos":[{"mask-l-to":te()}],"mask-image-l-from-color":[{"mask-l-from":M()}],"mask-image-l-to-color":[{"mask-l-to":M()}],"mask-image-x-from-pos":[{"mask-x-from":te()}],"mask-image-x-to-pos":[{"mask-x-to":te()}],"mask-image-x-from-color":[{"mask-x-from":M()}],"mask-image-x-to-color":[{"mask-x-to":M()}],"mask-image-y-from-pos":[{"mask-y-from":te()}],"mask-image-y-to-pos":[{"mask-y-to":te()}],"mask-image-y-from-color":[{"mask-y-from":M()}],"mask-image-y-to-color":[{"mask-y-to":M()}],"mask-image-radial":[{"mask-radial":[me,he]}],"mask-image-radial-from-pos":[{"mask-radial-from":te()}],"mask-image-radial-to-pos":[{"mask-radial-to":te()}],"mask-image-radial-from-color":[{"mask-radial-from":M()}],"mask-image-radial-to-color":[{"mask-radial-to":M()}],"mask-image-radial-shape":[{"mask-radial":["circle","ellipse"]}],"mask-image-radial-size":[{"mask-radial":[{closest:["side","corner"],farthest:["side","corner"]}]}],"mask-image-radial-pos":[{"mask-radial-at":j()}],"mask-image-conic-pos":[{"mask-conic":[ze]}],"mask-image-conic-from-pos":[{"mask-conic-from":te()}],"mask-image-conic-to-pos":[{"mask-conic-to":te()}],"mask-image-conic-from-color":[{"mask-conic-from":M()}],"mask-image-conic-to-color":[{"mask-conic-to":M()}],"mask-mode":[{mask:["alpha","luminance","match"]}],"mask-origin":[{"mask-origin":["border","padding","content","fill","stroke","view"]}],"mask-position":[{mask:ee()}],"mask-repeat":[{mask:Q()}],"mask-size":[{mask:O()}],"mask-type":[{"mask-type":["alpha","luminance"]}],"mask-image":[{mask:["none",me,he]}],filter:[{filter:["","none",me,he]}],blur:[{blur:ye()}],brightness:[{brightness:[ze,me,he]}],contrast:[{contrast:[ze,me,he]}],"drop-shadow":[{"drop-shadow":["","none",R,Yl,ql]}],"drop-shadow-color":[{"drop-shadow":M()}],grayscale:[{grayscale:["",ze,me,he]}],"hue-rotate":[{"hue-rotate":[ze,me,he]}],invert:[{invert:["",ze,me,he]}],saturate:[{saturate:[ze,me,he]}],sepia:[{sepia:["",ze,me,he]}],"backdrop-filter":[{"backdrop-filter":["","none",me,he]}],"backdrop-blur":[{"backdrop-blur":ye()}],"backdrop-brightness":[{"backdrop-brightness":[ze,me,he]}],"backdrop-contrast":[{"backdrop-contrast":[ze,me,he]}],"backdrop-grayscale":[{"backdrop-grayscale":["",ze,me,he]}],"backdrop-hue-rotate":[{"backdrop-hue-rotate":[ze,me,he]}],"backdrop-invert":[{"backdrop-invert":["",ze,me,he]}],"backdrop-opacity":[{"backdrop-opacity":[ze,me,he]}],"backdrop-saturate":[{"backdrop-saturate":[ze,me,he]}],"backdrop-sepia":[{"backdrop-sepia":["",ze,me,he]}],"border-collapse":[{border:["collapse","separate"]}],"border-spacing":[{"border-spacing":U()}],"border-spacing-x":[{"border-spacing-x":U()}],"border-spacing-y":[{"border-spacing-y":U()}],"table-layout":[{table:["auto","fixed"]}],caption:[{caption:["top","bottom"]}],transition:[{transition:["","all","colors","opacity","shadow","transform","none",me,he]}],"transition-behavior":[{transition:["normal","discrete"]}],duration:[{duration:[ze,"initial",me,he]}],ease:[{ease:["linear","initial",b,me,he]}],delay:[{delay:[ze,me,he]}],animate:[{animate:["none",T,me,he]}],backface:[{backface:["hidden","visible"]}],perspective:[{perspective:[E,me,he]}],"perspective-origin":[{"perspective-origin":F()}],rotate:[{rotate:Ae()}],"rotate-x":[{"rotate-x":Ae()}],"rotate-y":[{"rotate-y":Ae()}],"rotate-z":[{"rotate-z":Ae()}],scale:[{scale:ve()}],"scale-x":[{"scale-x":ve()}],"scale-y":[{"scale-y":ve()}],"scale-z":[{"scale-z":ve()}],"scale-3d":["scale-3d"],skew:[{skew:Le()}],"skew-x":[{"skew-x":Le()}],"skew-y":[{"skew-y":Le()}],transform:[{transform:[me,he,"","none","gpu","cpu"]}],"transform-origin":[{origin:F()}],"transform-style":[{transform:["3d","flat"]}],translate:[{translate:Ie()}],"translate-x":[{"translate-x":Ie()}],"translate-y":[{"translate-y":Ie()}],"translate-z":[{"translate-z":Ie()}],"translate-none":["translate-none"],accent:[{accent:M()}],appearance:[{appearance:["none","auto"]}],"caret-color":[{caret:M()}],"color-scheme":[{scheme:["normal","dark","light","light-dark","only-dark","only-light"]}],cursor:[{cursor:["auto","default","pointer","wait","text","move","help","not-allowed","none","context-menu","progress","cell","crosshair","vertical-text","alias","copy","no-drop","grab","grabbing","all-scroll","col-resize","row-resize","n-resize","e-resize","s-resize","w-resize","ne-resize","nw-resize","se-resize","sw-resize","ew-resize","ns-resize","nesw-resize","nwse-resize","zoom-in","zoom-out",me,he]}],"field-sizing":[{"field-sizing":["fixed","content"]}],"pointer-events":[{"pointer-events":["auto","none"]}],resize:[{resize:["none","","y","x"]}],"scroll-behavior":[{scroll:["auto","smooth"]}],"scroll-m":[{"scroll-m":U()}],"scroll-mx":[{"scroll-mx":U()}],"scroll-my":[{"scroll-my":U()}],"scroll-ms":[{"scroll-ms":U()}],"scroll-me":[{"scroll-me":U()}],"scroll-mt":[{"scroll-mt":U()}],"scroll-mr":[{"scroll-mr":U()}],"scroll-mb":[{"scroll-mb":U()}],"scroll-ml":[{"scroll-ml":U()}],"scroll-p":[{"scroll-p":U()}],"scroll-px":[{"scroll-px":U()}],"scroll-py":[{"scroll-py":U()}],"scroll-ps":[{"scroll-ps":U()}],"scroll-pe":[{"scroll-pe":U()}],"scroll-pt":[{"scroll-pt":U()}],"scroll-pr":[{"scroll-pr":U()}],"scroll-pb":[{"scroll-pb":U()}],"scroll-pl":[{"scroll-pl":U()}],"snap-align":[{snap:["start","end","center","align-none"]}],"snap-stop":[{snap:["normal","always"]}],"snap-type":[{snap:["none","x","y","both"]}],"snap-strictness":[{snap:["mandatory","proximity"]}],touch:[{touch:["auto","none","manipulation"]}],"touch-x":[{"touch-pan":["x","left","right"]}],"touch-y":[{"touch-pan":["y","up","down"]}],"touch-pz":["touch-pinch-zoom"],select:[{select:["none","text","all","auto"]}],"will-change":[{"will-change":["auto","scroll","contents","transform",me,he]}],fill:[{fill:["none",...M()]}],"stroke-w":[{stroke:[ze,ya,yo,Wc]}],stroke:[{stroke:["none",...M()]}],"forced-color-adjust":[{"forced-color-adjust":["auto","none"]}]},conflictingClassGroups:{overflow:["overflow-x","overflow-y"],overscroll:["overscroll-x","overscroll-y"],inset:["inset-x","inset-y","start","end","top","right","bottom","left"],"inset-x":["right","left"],"inset-y":["top","bottom"],flex:["basis","grow","shrink"],gap:["gap-x","gap-y"],p:["px","py","ps","pe","pt","pr","pb","pl"],px:["pr","pl"],py:["pt","pb"],m:["mx","my","ms","me","mt","mr","mb","ml"],mx:["mr","ml"],my:["mt","mb"],size:["w","h"],"font-size":["leading"],"fvn-normal":["fvn-ordinal","fvn-slashed-zero","fvn-figure","fvn-spacing","fvn-fraction"],"fvn-ordinal":["fvn-normal"],"fvn-slashed-zero":["fvn-normal"],"fvn-figure":["fvn-normal"],"fvn-spacing":["fvn-normal"],"fvn-fraction":["fvn-normal"],"line-clamp":["display","overflow"],rounded:["rounded-s","rounded-e","rounded-t","rounded-r","rounded-b","rounded-l","rounded-ss","rounded-se","rounded-ee","rounded-es","rounded-tl","rounded-tr","rounded-br","rounded-bl"],"rounded-s":["rounded-ss","rounded-es"],"rounded-e":["rounded-se","rounded-ee"],"rounded-t":["rounded-tl","rounded-tr"],"rounded-r":["rounded-tr","rounded-br"],"rounded-b":["rounded-br","rounded-bl"],"rounded-l":["rounded-tl","rounded-bl"],"border-spacing":["border-spacing-x","border-spacing-y"],"border-w":["border-w-x","border-w-y","border-w-s","border-w-e","border-w-t","border-w-r","border-w-b","border-w-l"],"border-w-x":["border-w-r","border-w-l"],"border-w-y":["border-w-t","border-w-b"],"border-color":["border-color-x","border-color-y","border-color-s","border-color-e","border-color-t","border-color-r","border-color-b","border-color-l"],"border-color-x":["border-color-r","border-color-l"],"border-color-y":["border-color-t","border-color-b"],translate:["translate-x","translate-y","translate-none"],"translate-none":["translate","translate-x","translate-y","translate-z"],"scroll-m":["scroll-mx","scroll-my","scroll-ms","scroll-me","scroll-mt","scroll-mr","scroll-mb","scroll-ml"],"scroll-mx":["scroll-mr","scroll-ml"],"scroll-my":["scroll-mt","scroll-mb"],"scroll-p":["scroll-px","scroll-py","scroll-ps","scroll-pe","scroll-pt","scroll-pr","scroll-pb","scroll-pl"],"scroll-px":["scroll-pr","scroll-pl"],"scroll-py":["scroll-pt","scroll-pb"],touch:["touch-x","touch-y","touch-pz"],"touch-x":["touch"],"touch-y":["touch"],"touch-pz":["touch"]},conflictingClassGroupModifiers:{"font-size":["leading"]},orderSensitiveModifiers:["*","**","after","backdrop","before","details-content","file","first-letter","first-line","marker","placeholder","selection"]}},hk=qC(pk);function Qe(...t){return hk(av(t))}const mk=Ms("inline-flex items-center justify-center gap-2 whitespace-nowrap rounded-md text-sm font-medium transition-colors focus-visible:outline-none focus-visible:ring-1 focus-visible:ring-zinc-950 disabled:pointer-events-none disabled:opacity-50 [&_svg]:pointer-events-none [&_svg]:size-4 [&_svg]:shrink-0 dark:focus-visible:ring-zinc-300",{variants:{variant:{default:"bg-zinc-900 text-zinc-50 shadow hover:bg-zinc-900/90 dark:bg-zinc-50 dark:text-zinc-900 dark:hover:bg-zinc-50/90",destructive:"bg-red-500 text-zinc-50 shadow-sm hover:bg-red-500/90 dark:bg-red-900 dark:text-zinc-50 dark:hover:bg-red-900/90",outline:"border border-zinc-200 bg-white shadow-sm hover:bg-zinc-100 hover:text-zinc-900 dark:border-zinc-800 dark:bg-zinc-950 dark:hover:bg-zinc-800 dark:hover:text-zinc-50",secondary:"bg-zinc-100 text-zinc-900 shadow-sm hover:bg-zinc-100/80 dark:bg-zinc-800 dark:text-zinc-50 dark:hover:bg-zinc-800/80",ghost:"hover:bg-zinc-100 hover:text-zinc-900 dark:hover:bg-zinc-800 dark:hover:text-zinc-50",link:"text-zinc-900 underline-offset-4 hover:underline dark:text-zinc-50"},size:{default:"h-9 px-4 py-2",sm:"h-8 rounded-md px-3 text-xs",lg:"h-10 rounded-md px-8",icon:"h-9 w-9"}},defaultVariants:{variant:"default",size:"default"}}),Be=y.forwardRef(({className:t,variant:r,size:o,asChild:a=!1,...l},u)=>{const c=a?jC:"button";return g.jsx(c,{className:Qe(mk({variant:r,size:o,className:t})),ref:u,...l})});Be.displayName="Button";/**
+`+u):a.stack=u}catch{}}throw a}}_request(r,o){typeof r=="string"?(o=o||{},o.url=r):o=r||{},o=Co(this.defaults,o);const{transitional:a,paramsSerializer:l,headers:u}=o;a!==void 0&&ls.assertOptions(a,{silentJSONParsing:Vn.transitional(Vn.boolean),forcedJSONParsing:Vn.transitional(Vn.boolean),clarifyTimeoutError:Vn.transitional(Vn.boolean)},!1),l!=null&&(V.isFunction(l)?o.paramsSerializer={serialize:l}:ls.assertOptions(l,{encode:Vn.function,serialize:Vn.function},!0)),o.allowAbsoluteUrls!==void 0||(this.defaults.allowAbsoluteUrls!==void 0?o.allowAbsoluteUrls=this.defaults.allowAbsoluteUrls:o.allowAbsoluteUrls=!0),ls.assertOptions(o,{baseUrl:Vn.spelling("baseURL"),withXsrfToken:Vn.spelling("withXSRFToken")},!0),o.method=(o.method||this.defaults.method||"get").toLowerCase();let c=u&&V.merge(u.common,u[o.method]);u&&V.forEach(["delete","get","head","post","put","patch","common"],C=>{delete u[C]}),o.headers=Jt.concat(c,u);const f=[];let p=!0;this.interceptors.request.forEach(function(E){typeof E.runWhen=="function"&&E.runWhen(o)===!1||(p=p&&E.synchronous,f.unshift(E.fulfilled,E.rejected))});const m=[];this.interceptors.response.forEach(function(E){m.push(E.fulfilled,E.rejected)});let v,w=0,S;if(!p){const C=[bm.bind(this),void 0];for(C.unshift.apply(C,f),C.push.apply(C,m),S=C.length,v=Promise.resolve(o);w<S;)v=v.then(C[w++],C[w++]);return v}S=f.length;let R=o;for(w=0;w<S;){const C=f[w++],E=f[w++];try{R=C(R)}catch(k){E.call(this,k);break}}try{v=bm.call(this,R)}catch(C){return Promise.reject(C)}for(w=0,S=m.length;w<S;)v=v.then(m[w++],m[w++]);return v}getUri(r){r=Co(this.defaults,r);const o=Gg(r.baseURL,r.url,r.allowAbsoluteUrls);return Bg(o,r.params,r.paramsSerializer)}};V.forEach(["delete","get","head","options"],function(r){Eo.prototype[r]=function(o,a){return this.request(Co(a||{},{method:r,url:o,data:(a||{}).data}))}});V.forEach(["post","put","patch"],function(r){function o(a){return function(u,c,f){return this.request(Co(f||{},{method:r,headers:a?{"Content-Type":"multipart/form-data"}:{},url:u,data:c}))}}Eo.prototype[r]=o(),Eo.prototype[r+"Form"]=o(!0)});let lC=class Zg{constructor(r){if(typeof r!="function")throw new TypeError("executor must be a function.");let o;this.promise=new Promise(function(u){o=u});const a=this;this.promise.then(l=>{if(!a._listeners)return;let u=a._listeners.length;for(;u-- >0;)a._listeners[u](l);a._listeners=null}),this.promise.then=l=>{let u;const c=new Promise(f=>{a.subscribe(f),u=f}).then(l);return c.cancel=function(){a.unsubscribe(u)},c},r(function(u,c,f){a.reason||(a.reason=new gi(u,c,f),o(a.reason))})}throwIfRequested(){if(this.reason)throw this.reason}subscribe(r){if(this.reason){r(this.reason);return}this._listeners?this._listeners.push(r):this._listeners=[r]}unsubscribe(r){if(!this._listeners)return;const o=this._listeners.indexOf(r);o!==-1&&this._listeners.splice(o,1)}toAbortSignal(){const r=new AbortController,o=a=>{r.abort(a)};return this.subscribe(o),r.signal.unsubscribe=()=>this.unsubscribe(o),r.signal}static source(){let r;return{token:new Zg(function(l){r=l}),cancel:r}}};function sC(t){return function(o){return t.apply(null,o)}}function uC(t){return V.isObject(t)&&t.isAxiosError===!0}const dd={Continue:100,SwitchingProtocols:101,Processing:102,EarlyHints:103,Ok:200,Created:201,Accepted:202,NonAuthoritativeInformation:203,NoContent:204,ResetContent:205,PartialContent:206,MultiStatus:207,AlreadyReported:208,ImUsed:226,MultipleChoices:300,MovedPermanently:301,Found:302,SeeOther:303,NotModified:304,UseProxy:305,Unused:306,TemporaryRedirect:307,PermanentRedirect:308,BadRequest:400,Unauthorized:401,PaymentRequired:402,Forbidden:403,NotFound:404,MethodNotAllowed:405,NotAcceptable:406,ProxyAuthenticationRequired:407,RequestTimeout:408,Conflict:409,Gone:410,LengthRequired:411,PreconditionFailed:412,PayloadTooLarge:413,UriTooLong:414,UnsupportedMediaType:415,RangeNotSatisfiable:416,ExpectationFailed:417,ImATeapot:418,MisdirectedRequest:421,UnprocessableEntity:422,Locked:423,FailedDependency:424,TooEarly:425,UpgradeRequired:426,PreconditionRequired:428,TooManyRequests:429,RequestHeaderFieldsTooLarge:431,UnavailableForLegalReasons:451,InternalServerError:500,NotImplemented:501,BadGateway:502,ServiceUnavailable:503,GatewayTimeout:504,HttpVersionNotSupported:505,VariantAlsoNegotiates:506,InsufficientStorage:507,LoopDetected:508,NotExtended:510,NetworkAuthenticationRequired:511};Object.entries(dd).forEach(([t,r])=>{dd[r]=t});function ev(t){const r=new Eo(t),o=Tg(Eo.prototype.request,r);return V.extend(o,Eo.prototype,r,{allOwnKeys:!0}),V.extend(o,r,null,{allOwnKeys:!0}),o.create=function(l){return ev(Co(t,l))},o}const pt=ev(Da);pt.Axios=Eo;pt.CanceledError=gi;pt.CancelToken=lC;pt.isCancel=Wg;pt.VERSION=Jg;pt.toFormData=Ds;pt.AxiosError=Fe;pt.Cancel=pt.CanceledError;pt.all=function(r){return Promise.all(r)};pt.spread=sC;pt.isAxiosError=uC;pt.mergeConfig=Co;pt.AxiosHeaders=Jt;pt.formToJSON=t=>Vg(V.isHTMLForm(t)?new FormData(t):t);pt.getAdapter=Xg.getAdapter;pt.HttpStatusCode=dd;pt.default=pt;const{Axios:jP,AxiosError:TP,CanceledError:_P,isCancel:AP,CancelToken:DP,VERSION:OP,all:LP,Cancel:MP,isAxiosError:FP,spread:IP,toFormData:zP,AxiosHeaders:UP,HttpStatusCode:$P,formToJSON:BP,getAdapter:HP,mergeConfig:VP}=pt,ct=pt.create({baseURL:"http://localhost:8000"});ct.interceptors.request.use(t=>{const r=localStorage.getItem("token");return r&&t.headers&&(t.headers.Authorization=`Bearer ${r}`),t},t=>Promise.reject(t));const cC=async(t,r)=>{const o=new FormData;return o.append("username",t),o.append("password",r),(await ct.post("/token",o)).data},dC=async t=>(await ct.post("/register",t)).data,fC=async()=>(await ct.get("/me")).data,pC=async()=>(await ct.get("/users")).data,Hd=async t=>{const r=t?`/folders?parent_id=${t}`:"/folders";return(await ct.get(r)).data},hC=async t=>(await ct.post("/folders",t)).data,mC=async t=>{const r=t?`/documents?folder_id=${t}`:"/documents";return(await ct.get(r)).data},gC=async(t,r,o)=>{const a=new FormData;return a.append("file",t),a.append("folder_id",r),(await ct.post("/documents",a,{headers:{"Content-Type":"multipart/form-data"}})).data},hD=async t=>(await ct.get(`/documents/${t}/content`,{responseType:"blob"})).data,vC=async t=>(await ct.delete(`/documents/${t}`)).data,yC=async()=>(await ct.get("/approval-forms")).data,wC=async t=>(await ct.post("/approval-forms",t)).data,xC=async t=>(await ct.delete(`/approval-forms/${t}`)).data,SC=async()=>(await ct.get("/approval-routes")).data,EC=async t=>(await ct.post("/approval-routes",t)).data,CC=async t=>(await ct.delete(`/approval-routes/${t}`)).data,tv=async()=>(await ct.get("/applications")).data,nv=async()=>(await ct.get("/applications/for-approval")).data,kC=async t=>(await ct.delete(`/applications/${t}`)).data,RC=async t=>(await ct.post("/applications/submit",{application_id:t})).data,bC=async(t,r)=>(await ct.post("/applications/approve",{application_id:t,comment:r})).data,NC=async(t,r)=>(await ct.post("/applications/reject",{application_id:t,comment:r})).data,rv=y.createContext(void 0),PC=({children:t})=>{const[r,o]=y.useState(null),[a,l]=y.useState(!0),[u,c]=y.useState(null);y.useEffect(()=>{localStorage.getItem("token")?f():l(!1)},[]);const f=async()=>{try{const S=await fC();o(S)}catch(S){console.error("Failed to fetch current user:",S),localStorage.removeItem("token")}finally{l(!1)}},p=async(S,R)=>{var C,E;try{l(!0),c(null);const k=await cC(S,R);localStorage.setItem("token",k.access_token),await f()}catch(k){throw c(((E=(C=k.response)==null?void 0:C.data)==null?void 0:E.detail)||"Login failed"),l(!1),k}},m=async S=>{var R,C;try{l(!0),c(null),await dC(S),await p(S.username,S.password)}catch(E){throw c(((C=(R=E.response)==null?void 0:R.data)==null?void 0:C.detail)||"Registration failed"),l(!1),E}},v=()=>{localStorage.removeItem("token"),o(null)},w=()=>{c(null)};return g.jsx(rv.Provider,{value:{user:r,loading:a,error:u,login:p,register:m,logout:v,clearError:w},children:t})},jo=()=>{const t=y.useContext(rv);if(t===void 0)throw new Error("useAuth must be used within an AuthProvider");return t};function Pm(t,r){if(typeof t=="function")return t(r);t!=null&&(t.current=r)}function ov(...t){return r=>{let o=!1;const a=t.map(l=>{const u=Pm(l,r);return!o&&typeof u=="function"&&(o=!0),u});if(o)return()=>{for(let l=0;l<a.length;l++){const u=a[l];typeof u=="function"?u():Pm(t[l],null)}}}}function ut(...t){return y.useCallback(ov(...t),t)}function di(t){const r=TC(t),o=y.forwardRef((a,l)=>{const{children:u,...c}=a,f=y.Children.toArray(u),p=f.find(AC);if(p){const m=p.props.children,v=f.map(w=>w===p?y.Children.count(m)>1?y.Children.only(null):y.isValidElement(m)?m.props.children:null:w);return g.jsx(r,{...c,ref:l,children:y.isValidElement(m)?y.cloneElement(m,void 0,v):null})}return g.jsx(r,{...c,ref:l,children:u})});return o.displayName=`${t}.Slot`,o}var jC=di("Slot");function TC(t){const r=y.forwardRef((o,a)=>{const{children:l,...u}=o;if(y.isValidElement(l)){const c=OC(l),f=DC(u,l.props);return l.type!==y.Fragment&&(f.ref=a?ov(a,c):c),y.cloneElement(l,f)}return y.Children.count(l)>1?y.Children.only(null):null});return r.displayName=`${t}.SlotClone`,r}var _C=Symbol("radix.slottable");function AC(t){return y.isValidElement(t)&&typeof t.type=="function"&&"__radixId"in t.type&&t.type.__radixId===_C}function DC(t,r){const o={...r};for(const a in r){const l=t[a],u=r[a];/^on[A-Z]/.test(a)?l&&u?o[a]=(...f)=>{u(...f),l(...f)}:l&&(o[a]=l):a==="style"?o[a]={...l,...u}:a==="className"&&(o[a]=[l,u].filter(Boolean).join(" "))}return{...t,...o}}function OC(t){var a,l;let r=(a=Object.getOwnPropertyDescriptor(t.props,"ref"))==null?void 0:a.get,o=r&&"isReactWarning"in r&&r.isReactWarning;return o?t.ref:(r=(l=Object.getOwnPropertyDescriptor(t,"ref"))==null?void 0:l.get,o=r&&"isReactWarning"in r&&r.isReactWarning,o?t.props.ref:t.props.ref||t.ref)}function iv(t){var r,o,a="";if(typeof t=="string"||typeof t=="number")a+=t;else if(typeof t=="object")if(Array.isArray(t)){var l=t.length;for(r=0;r<l;r++)t[r]&&(o=iv(t[r]))&&(a&&(a+=" "),a+=o)}else for(o in t)t[o]&&(a&&(a+=" "),a+=o);return a}function av(){for(var t,r,o=0,a="",l=arguments.length;o<l;o++)(t=arguments[o])&&(r=iv(t))&&(a&&(a+=" "),a+=r);return a}const jm=t=>typeof t=="boolean"?`${t}`:t===0?"0":t,Tm=av,Ms=(t,r)=>o=>{var a;if((r==null?void 0:r.variants)==null)return Tm(t,o==null?void 0:o.class,o==null?void 0:o.className);const{variants:l,defaultVariants:u}=r,c=Object.keys(l).map(m=>{const v=o==null?void 0:o[m],w=u==null?void 0:u[m];if(v===null)return null;const S=jm(v)||jm(w);return l[m][S]}),f=o&&Object.entries(o).reduce((m,v)=>{let[w,S]=v;return S===void 0||(m[w]=S),m},{}),p=r==null||(a=r.compoundVariants)===null||a===void 0?void 0:a.reduce((m,v)=>{let{class:w,className:S,...R}=v;return Object.entries(R).every(C=>{let[E,k]=C;return Array.isArray(k)?k.includes({...u,...f}[E]):{...u,...f}[E]===k})?[...m,w,S]:m},[]);return Tm(t,c,p,o==null?void 0:o.class,o==null?void 0:o.className)},Vd="-",LC=t=>{const r=FC(t),{conflictingClassGroups:o,conflictingClassGroupModifiers:a}=t;return{getClassGroupId:c=>{const f=c.split(Vd);return f[0]===""&&f.length!==1&&f.shift(),lv(f,r)||MC(c)},getConflictingClassGroupIds:(c,f)=>{const p=o[c]||[];return f&&a[c]?[...p,...a[c]]:p}}},lv=(t,r)=>{var c;if(t.length===0)return r.classGroupId;const o=t[0],a=r.nextPart.get(o),l=a?lv(t.slice(1),a):void 0;if(l)return l;if(r.validators.length===0)return;const u=t.join(Vd);return(c=r.validators.find(({validator:f})=>f(u)))==null?void 0:c.classGroupId},_m=/^\[(.+)\]$/,MC=t=>{if(_m.test(t)){const r=_m.exec(t)[1],o=r==null?void 0:r.substring(0,r.indexOf(":"));if(o)return"arbitrary.."+o}},FC=t=>{const{theme:r,classGroups:o}=t,a={nextPart:new Map,validators:[]};for(const l in o)fd(o[l],a,l,r);return a},fd=(t,r,o,a)=>{t.forEach(l=>{if(typeof l=="string"){const u=l===""?r:Am(r,l);u.classGroupId=o;return}if(typeof l=="function"){if(IC(l)){fd(l(a),r,o,a);return}r.validators.push({validator:l,classGroupId:o});return}Object.entries(l).forEach(([u,c])=>{fd(c,Am(r,u),o,a)})})},Am=(t,r)=>{let o=t;return r.split(Vd).forEach(a=>{o.nextPart.has(a)||o.nextPart.set(a,{nextPart:new Map,validators:[]}),o=o.nextPart.get(a)}),o},IC=t=>t.isThemeGetter,zC=t=>{if(t<1)return{get:()=>{},set:()=>{}};let r=0,o=new Map,a=new Map;const l=(u,c)=>{o.set(u,c),r++,r>t&&(r=0,a=o,o=new Map)};return{get(u){let c=o.get(u);if(c!==void 0)return c;if((c=a.get(u))!==void 0)return l(u,c),c},set(u,c){o.has(u)?o.set(u,c):l(u,c)}}},pd="!",hd=":",UC=hd.length,$C=t=>{const{prefix:r,experimentalParseClassName:o}=t;let a=l=>{const u=[];let c=0,f=0,p=0,m;for(let C=0;C<l.length;C++){let E=l[C];if(c===0&&f===0){if(E===hd){u.push(l.slice(p,C)),p=C+UC;continue}if(E==="/"){m=C;continue}}E==="["?c++:E==="]"?c--:E==="("?f++:E===")"&&f--}const v=u.length===0?l:l.substring(p),w=BC(v),S=w!==v,R=m&&m>p?m-p:void 0;return{modifiers:u,hasImportantModifier:S,baseClassName:w,maybePostfixModifierPosition:R}};if(r){const l=r+hd,u=a;a=c=>c.startsWith(l)?u(c.substring(l.length)):{isExternal:!0,modifiers:[],hasImportantModifier:!1,baseClassName:c,maybePostfixModifierPosition:void 0}}if(o){const l=a;a=u=>o({className:u,parseClassName:l})}return a},BC=t=>t.endsWith(pd)?t.substring(0,t.length-1):t.startsWith(pd)?t.substring(1):t,HC=t=>{const r=Object.fromEntries(t.orderSensitiveModifiers.map(a=>[a,!0]));return a=>{if(a.length<=1)return a;const l=[];let u=[];return a.forEach(c=>{c[0]==="["||r[c]?(l.push(...u.sort(),c),u=[]):u.push(c)}),l.push(...u.sort()),l}},VC=t=>({cache:zC(t.cacheSize),parseClassName:$C(t),sortModifiers:HC(t),...LC(t)}),WC=/\s+/,KC=(t,r)=>{const{parseClassName:o,getClassGroupId:a,getConflictingClassGroupIds:l,sortModifiers:u}=r,c=[],f=t.trim().split(WC);let p="";for(let m=f.length-1;m>=0;m-=1){const v=f[m],{isExternal:w,modifiers:S,hasImportantModifier:R,baseClassName:C,maybePostfixModifierPosition:E}=o(v);if(w){p=v+(p.length>0?" "+p:p);continue}let k=!!E,b=a(k?C.substring(0,E):C);if(!b){if(!k){p=v+(p.length>0?" "+p:p);continue}if(b=a(C),!b){p=v+(p.length>0?" "+p:p);continue}k=!1}const T=u(S).join(":"),P=R?T+pd:T,j=P+b;if(c.includes(j))continue;c.push(j);const F=l(b,k);for(let _=0;_<F.length;++_){const W=F[_];c.push(P+W)}p=v+(p.length>0?" "+p:p)}return p};function GC(){let t=0,r,o,a="";for(;t<arguments.length;)(r=arguments[t++])&&(o=sv(r))&&(a&&(a+=" "),a+=o);return a}const sv=t=>{if(typeof t=="string")return t;let r,o="";for(let a=0;a<t.length;a++)t[a]&&(r=sv(t[a]))&&(o&&(o+=" "),o+=r);return o};function qC(t,...r){let o,a,l,u=c;function c(p){const m=r.reduce((v,w)=>w(v),t());return o=VC(m),a=o.cache.get,l=o.cache.set,u=f,f(p)}function f(p){const m=a(p);if(m)return m;const v=KC(p,o);return l(p,v),v}return function(){return u(GC.apply(null,arguments))}}const xt=t=>{const r=o=>o[t]||[];return r.isThemeGetter=!0,r},uv=/^\[(?:(\w[\w-]*):)?(.+)\]$/i,cv=/^\((?:(\w[\w-]*):)?(.+)\)$/i,YC=/^\d+\/\d+$/,QC=/^(\d+(\.\d+)?)?(xs|sm|md|lg|xl)$/,XC=/\d+(%|px|r?em|[sdl]?v([hwib]|min|max)|pt|pc|in|cm|mm|cap|ch|ex|r?lh|cq(w|h|i|b|min|max))|\b(calc|min|max|clamp)\(.+\)|^0$/,JC=/^(rgba?|hsla?|hwb|(ok)?(lab|lch))\(.+\)$/,ZC=/^(inset_)?-?((\d+)?\.?(\d+)[a-z]+|0)_-?((\d+)?\.?(\d+)[a-z]+|0)/,ek=/^(url|image|image-set|cross-fade|element|(repeating-)?(linear|radial|conic)-gradient)\(.+\)$/,ri=t=>YC.test(t),ze=t=>!!t&&!Number.isNaN(Number(t)),Lr=t=>!!t&&Number.isInteger(Number(t)),Vc=t=>t.endsWith("%")&&ze(t.slice(0,-1)),ar=t=>QC.test(t),tk=()=>!0,nk=t=>XC.test(t)&&!JC.test(t),dv=()=>!1,rk=t=>ZC.test(t),ok=t=>ek.test(t),ik=t=>!he(t)&&!me(t),ak=t=>vi(t,hv,dv),he=t=>uv.test(t),yo=t=>vi(t,mv,nk),Wc=t=>vi(t,dk,ze),Dm=t=>vi(t,fv,dv),lk=t=>vi(t,pv,ok),ql=t=>vi(t,gv,rk),me=t=>cv.test(t),ya=t=>yi(t,mv),sk=t=>yi(t,fk),Om=t=>yi(t,fv),uk=t=>yi(t,hv),ck=t=>yi(t,pv),Yl=t=>yi(t,gv,!0),vi=(t,r,o)=>{const a=uv.exec(t);return a?a[1]?r(a[1]):o(a[2]):!1},yi=(t,r,o=!1)=>{const a=cv.exec(t);return a?a[1]?r(a[1]):o:!1},fv=t=>t==="position"||t==="percentage",pv=t=>t==="image"||t==="url",hv=t=>t==="length"||t==="size"||t==="bg-size",mv=t=>t==="length",dk=t=>t==="number",fk=t=>t==="family-name",gv=t=>t==="shadow",pk=()=>{const t=xt("color"),r=xt("font"),o=xt("text"),a=xt("font-weight"),l=xt("tracking"),u=xt("leading"),c=xt("breakpoint"),f=xt("container"),p=xt("spacing"),m=xt("radius"),v=xt("shadow"),w=xt("inset-shadow"),S=xt("text-shadow"),R=xt("drop-shadow"),C=xt("blur"),E=xt("perspective"),k=xt("aspect"),b=xt("ease"),T=xt("animate"),P=()=>["auto","avoid","all","avoid-page","page","left","right","column"],j=()=>["center","top","bottom","left","right","top-left","left-top","top-right","right-top","bottom-right","right-bottom","bottom-left","left-bottom"],F=()=>[...j(),me,he],_=()=>["auto","hidden","clip","visible","scroll"],W=()=>["auto","contain","none"],U=()=>[me,he,p],Y=()=>[ri,"full","auto",...U()],oe=()=>[Lr,"none","subgrid",me,he],Re=()=>["auto",{span:["full",Lr,me,he]},Lr,me,he],Te=()=>[Lr,"auto",me,he],ae=()=>["auto","min","max","fr",me,he],le=()=>["start","end","center","between","around","evenly","stretch","baseline","center-safe","end-safe"],Se=()=>["start","end","center","stretch","center-safe","end-safe"],X=()=>["auto",...U()],ie=()=>[ri,"auto","full","dvw","dvh","lvw","lvh","svw","svh","min","max","fit",...U()],M=()=>[t,me,he],ee=()=>[...j(),Om,Dm,{position:[me,he]}],Q=()=>["no-repeat",{repeat:["","x","y","space","round"]}],O=()=>["auto","cover","contain",uk,ak,{size:[me,he]}],K=()=>[Vc,ya,yo],se=()=>["","none","full",m,me,he],ce=()=>["",ze,ya,yo],_e=()=>["solid","dashed","dotted","double"],je=()=>["normal","multiply","screen","overlay","darken","lighten","color-dodge","color-burn","hard-light","soft-light","difference","exclusion","hue","saturation","color","luminosity"],te=()=>[ze,Vc,Om,Dm],ye=()=>["","none",C,me,he],Ae=()=>["none",ze,me,he],ve=()=>["none",ze,me,he],Le=()=>[ze,me,he],Ie=()=>[ri,"full",...U()];return{cacheSize:500,theme:{animate:["spin","ping","pulse","bounce"],aspect:["video"],blur:[ar],breakpoint:[ar],color:[tk],container:[ar],"drop-shadow":[ar],ease:["in","out","in-out"],font:[ik],"font-weight":["thin","extralight","light","normal","medium","semibold","bold","extrabold","black"],"inset-shadow":[ar],leading:["none","tight","snug","normal","relaxed","loose"],perspective:["dramatic","near","normal","midrange","distant","none"],radius:[ar],shadow:[ar],spacing:["px",ze],text:[ar],"text-shadow":[ar],tracking:["tighter","tight","normal","wide","wider","widest"]},classGroups:{aspect:[{aspect:["auto","square",ri,he,me,k]}],container:["container"],columns:[{columns:[ze,he,me,f]}],"break-after":[{"break-after":P()}],"break-before":[{"break-before":P()}],"break-inside":[{"break-inside":["auto","avoid","avoid-page","avoid-column"]}],"box-decoration":[{"box-decoration":["slice","clone"]}],box:[{box:["border","content"]}],display:["block","inline-block","inline","flex","inline-flex","table","inline-table","table-caption","table-cell","table-column","table-column-group","table-footer-group","table-header-group","table-row-group","table-row","flow-root","grid","inline-grid","contents","list-item","hidden"],sr:["sr-only","not-sr-only"],float:[{float:["right","left","none","start","end"]}],clear:[{clear:["left","right","both","none","start","end"]}],isolation:["isolate","isolation-auto"],"object-fit":[{object:["contain","cover","fill","none","scale-down"]}],"object-position":[{object:F()}],overflow:[{overflow:_()}],"overflow-x":[{"overflow-x":_()}],"overflow-y":[{"overflow-y":_()}],overscroll:[{overscroll:W()}],"overscroll-x":[{"overscroll-x":W()}],"overscroll-y":[{"overscroll-y":W()}],position:["static","fixed","absolute","relative","sticky"],inset:[{inset:Y()}],"inset-x":[{"inset-x":Y()}],"inset-y":[{"inset-y":Y()}],start:[{start:Y()}],end:[{end:Y()}],top:[{top:Y()}],right:[{right:Y()}],bottom:[{bottom:Y()}],left:[{left:Y()}],visibility:["visible","invisible","collapse"],z:[{z:[Lr,"auto",me,he]}],basis:[{basis:[ri,"full","auto",f,...U()]}],"flex-direction":[{flex:["row","row-reverse","col","col-reverse"]}],"flex-wrap":[{flex:["nowrap","wrap","wrap-reverse"]}],flex:[{flex:[ze,ri,"auto","initial","none",he]}],grow:[{grow:["",ze,me,he]}],shrink:[{shrink:["",ze,me,he]}],order:[{order:[Lr,"first","last","none",me,he]}],"grid-cols":[{"grid-cols":oe()}],"col-start-end":[{col:Re()}],"col-start":[{"col-start":Te()}],"col-end":[{"col-end":Te()}],"grid-rows":[{"grid-rows":oe()}],"row-start-end":[{row:Re()}],"row-start":[{"row-start":Te()}],"row-end":[{"row-end":Te()}],"grid-flow":[{"grid-flow":["row","col","dense","row-dense","col-dense"]}],"auto-cols":[{"auto-cols":ae()}],"auto-rows":[{"auto-rows":ae()}],gap:[{gap:U()}],"gap-x":[{"gap-x":U()}],"gap-y":[{"gap-y":U()}],"justify-content":[{justify:[...le(),"normal"]}],"justify-items":[{"justify-items":[...Se(),"normal"]}],"justify-self":[{"justify-self":["auto",...Se()]}],"align-content":[{content:["normal",...le()]}],"align-items":[{items:[...Se(),{baseline:["","last"]}]}],"align-self":[{self:["auto",...Se(),{baseline:["","last"]}]}],"place-content":[{"place-content":le()}],"place-items":[{"place-items":[...Se(),"baseline"]}],"place-self":[{"place-self":["auto",...Se()]}],p:[{p:U()}],px:[{px:U()}],py:[{py:U()}],ps:[{ps:U()}],pe:[{pe:U()}],pt:[{pt:U()}],pr:[{pr:U()}],pb:[{pb:U()}],pl:[{pl:U()}],m:[{m:X()}],mx:[{mx:X()}],my:[{my:X()}],ms:[{ms:X()}],me:[{me:X()}],mt:[{mt:X()}],mr:[{mr:X()}],mb:[{mb:X()}],ml:[{ml:X()}],"space-x":[{"space-x":U()}],"space-x-reverse":["space-x-reverse"],"space-y":[{"space-y":U()}],"space-y-reverse":["space-y-reverse"],size:[{size:ie()}],w:[{w:[f,"screen",...ie()]}],"min-w":[{"min-w":[f,"screen","none",...ie()]}],"max-w":[{"max-w":[f,"screen","none","prose",{screen:[c]},...ie()]}],h:[{h:["screen",...ie()]}],"min-h":[{"min-h":["screen","none",...ie()]}],"max-h":[{"max-h":["screen",...ie()]}],"font-size":[{text:["base",o,ya,yo]}],"font-smoothing":["antialiased","subpixel-antialiased"],"font-style":["italic","not-italic"],"font-weight":[{font:[a,me,Wc]}],"font-stretch":[{"font-stretch":["ultra-condensed","extra-condensed","condensed","semi-condensed","normal","semi-expanded","expanded","extra-expanded","ultra-expanded",Vc,he]}],"font-family":[{font:[sk,he,r]}],"fvn-normal":["normal-nums"],"fvn-ordinal":["ordinal"],"fvn-slashed-zero":["slashed-zero"],"fvn-figure":["lining-nums","oldstyle-nums"],"fvn-spacing":["proportional-nums","tabular-nums"],"fvn-fraction":["diagonal-fractions","stacked-fractions"],tracking:[{tracking:[l,me,he]}],"line-clamp":[{"line-clamp":[ze,"none",me,Wc]}],leading:[{leading:[u,...U()]}],"list-image":[{"list-image":["none",me,he]}],"list-style-position":[{list:["inside","outside"]}],"list-style-type":[{list:["disc","decimal","none",me,he]}],"text-alignment":[{text:["left","center","right","justify","start","end"]}],"placeholder-color":[{placeholder:M()}],"text-color":[{text:M()}],"text-decoration":["underline","overline","line-through","no-underline"],"text-decoration-style":[{decoration:[..._e(),"wavy"]}],"text-decoration-thickness":[{decoration:[ze,"from-font","auto",me,yo]}],"text-decoration-color":[{decoration:M()}],"underline-offset":[{"underline-offset":[ze,"auto",me,he]}],"text-transform":["uppercase","lowercase","capitalize","normal-case"],"text-overflow":["truncate","text-ellipsis","text-clip"],"text-wrap":[{text:["wrap","nowrap","balance","pretty"]}],indent:[{indent:U()}],"vertical-align":[{align:["baseline","top","middle","bottom","text-top","text-bottom","sub","super",me,he]}],whitespace:[{whitespace:["normal","nowrap","pre","pre-line","pre-wrap","break-spaces"]}],break:[{break:["normal","words","all","keep"]}],wrap:[{wrap:["break-word","anywhere","normal"]}],hyphens:[{hyphens:["none","manual","auto"]}],content:[{content:["none",me,he]}],"bg-attachment":[{bg:["fixed","local","scroll"]}],"bg-clip":[{"bg-clip":["border","padding","content","text"]}],"bg-origin":[{"bg-origin":["border","padding","content"]}],"bg-position":[{bg:ee()}],"bg-repeat":[{bg:Q()}],"bg-size":[{bg:O()}],"bg-image":[{bg:["none",{linear:[{to:["t","tr","r","br","b","bl","l","tl"]},Lr,me,he],radial:["",me,he],conic:[Lr,me,he]},ck,lk]}],"bg-color":[{bg:M()}],"gradient-from-pos":[{from:K()}],"gradient-via-pos":[{via:K()}],"gradient-to-pos":[{to:K()}],"gradient-from":[{from:M()}],"gradient-via":[{via:M()}],"gradient-to":[{to:M()}],rounded:[{rounded:se()}],"rounded-s":[{"rounded-s":se()}],"rounded-e":[{"rounded-e":se()}],"rounded-t":[{"rounded-t":se()}],"rounded-r":[{"rounded-r":se()}],"rounded-b":[{"rounded-b":se()}],"rounded-l":[{"rounded-l":se()}],"rounded-ss":[{"rounded-ss":se()}],"rounded-se":[{"rounded-se":se()}],"rounded-ee":[{"rounded-ee":se()}],"rounded-es":[{"rounded-es":se()}],"rounded-tl":[{"rounded-tl":se()}],"rounded-tr":[{"rounded-tr":se()}],"rounded-br":[{"rounded-br":se()}],"rounded-bl":[{"rounded-bl":se()}],"border-w":[{border:ce()}],"border-w-x":[{"border-x":ce()}],"border-w-y":[{"border-y":ce()}],"border-w-s":[{"border-s":ce()}],"border-w-e":[{"border-e":ce()}],"border-w-t":[{"border-t":ce()}],"border-w-r":[{"border-r":ce()}],"border-w-b":[{"border-b":ce()}],"border-w-l":[{"border-l":ce()}],"divide-x":[{"divide-x":ce()}],"divide-x-reverse":["divide-x-reverse"],"divide-y":[{"divide-y":ce()}],"divide-y-reverse":["divide-y-reverse"],"border-style":[{border:[..._e(),"hidden","none"]}],"divide-style":[{divide:[..._e(),"hidden","none"]}],"border-color":[{border:M()}],"border-color-x":[{"border-x":M()}],"border-color-y":[{"border-y":M()}],"border-color-s":[{"border-s":M()}],"border-color-e":[{"border-e":M()}],"border-color-t":[{"border-t":M()}],"border-color-r":[{"border-r":M()}],"border-color-b":[{"border-b":M()}],"border-color-l":[{"border-l":M()}],"divide-color":[{divide:M()}],"outline-style":[{outline:[..._e(),"none","hidden"]}],"outline-offset":[{"outline-offset":[ze,me,he]}],"outline-w":[{outline:["",ze,ya,yo]}],"outline-color":[{outline:M()}],shadow:[{shadow:["","none",v,Yl,ql]}],"shadow-color":[{shadow:M()}],"inset-shadow":[{"inset-shadow":["none",w,Yl,ql]}],"inset-shadow-color":[{"inset-shadow":M()}],"ring-w":[{ring:ce()}],"ring-w-inset":["ring-inset"],"ring-color":[{ring:M()}],"ring-offset-w":[{"ring-offset":[ze,yo]}],"ring-offset-color":[{"ring-offset":M()}],"inset-ring-w":[{"inset-ring":ce()}],"inset-ring-color":[{"inset-ring":M()}],"text-shadow":[{"text-shadow":["none",S,Yl,ql]}],"text-shadow-color":[{"text-shadow":M()}],opacity:[{opacity:[ze,me,he]}],"mix-blend":[{"mix-blend":[...je(),"plus-darker","plus-lighter"]}],"bg-blend":[{"bg-blend":je()}],"mask-clip":[{"mask-clip":["border","padding","content","fill","stroke","view"]},"mask-no-clip"],"mask-composite":[{mask:["add","subtract","intersect","exclude"]}],"mask-image-linear-pos":[{"mask-linear":[ze]}],"mask-image-linear-from-pos":[{"mask-linear-from":te()}],"mask-image-linear-to-pos":[{"mask-linear-to":te()}],"mask-image-linear-from-color":[{"mask-linear-from":M()}],"mask-image-linear-to-color":[{"mask-linear-to":M()}],"mask-image-t-from-pos":[{"mask-t-from":te()}],"mask-image-t-to-pos":[{"mask-t-to":te()}],"mask-image-t-from-color":[{"mask-t-from":M()}],"mask-image-t-to-color":[{"mask-t-to":M()}],"mask-image-r-from-pos":[{"mask-r-from":te()}],"mask-image-r-to-pos":[{"mask-r-to":te()}],"mask-image-r-from-color":[{"mask-r-from":M()}],"mask-image-r-to-color":[{"mask-r-to":M()}],"mask-image-b-from-pos":[{"mask-b-from":te()}],"mask-image-b-to-pos":[{"mask-b-to":te()}],"mask-image-b-from-color":[{"mask-b-from":M()}],"mask-image-b-to-color":[{"mask-b-to":M()}],"mask-image-l-from-pos":[{"mask-l-from":te()}],"mask-image-l-to-pos":[{"mask-l-to":te()}],"mask-image-l-from-color":[{"mask-l-from":M()}],"mask-image-l-to-color":[{"mask-l-to":M()}],"mask-image-x-from-pos":[{"mask-x-from":te()}],"mask-image-x-to-pos":[{"mask-x-to":te()}],"mask-image-x-from-color":[{"mask-x-from":M()}],"mask-image-x-to-color":[{"mask-x-to":M()}],"mask-image-y-from-pos":[{"mask-y-from":te()}],"mask-image-y-to-pos":[{"mask-y-to":te()}],"mask-image-y-from-color":[{"mask-y-from":M()}],"mask-image-y-to-color":[{"mask-y-to":M()}],"mask-image-radial":[{"mask-radial":[me,he]}],"mask-image-radial-from-pos":[{"mask-radial-from":te()}],"mask-image-radial-to-pos":[{"mask-radial-to":te()}],"mask-image-radial-from-color":[{"mask-radial-from":M()}],"mask-image-radial-to-color":[{"mask-radial-to":M()}],"mask-image-radial-shape":[{"mask-radial":["circle","ellipse"]}],"mask-image-radial-size":[{"mask-radial":[{closest:["side","corner"],farthest:["side","corner"]}]}],"mask-image-radial-pos":[{"mask-radial-at":j()}],"mask-image-conic-pos":[{"mask-conic":[ze]}],"mask-image-conic-from-pos":[{"mask-conic-from":te()}],"mask-image-conic-to-pos":[{"mask-conic-to":te()}],"mask-image-conic-from-color":[{"mask-conic-from":M()}],"mask-image-conic-to-color":[{"mask-conic-to":M()}],"mask-mode":[{mask:["alpha","luminance","match"]}],"mask-origin":[{"mask-origin":["border","padding","content","fill","stroke","view"]}],"mask-position":[{mask:ee()}],"mask-repeat":[{mask:Q()}],"mask-size":[{mask:O()}],"mask-type":[{"mask-type":["alpha","luminance"]}],"mask-image":[{mask:["none",me,he]}],filter:[{filter:["","none",me,he]}],blur:[{blur:ye()}],brightness:[{brightness:[ze,me,he]}],contrast:[{contrast:[ze,me,he]}],"drop-shadow":[{"drop-shadow":["","none",R,Yl,ql]}],"drop-shadow-color":[{"drop-shadow":M()}],grayscale:[{grayscale:["",ze,me,he]}],"hue-rotate":[{"hue-rotate":[ze,me,he]}],invert:[{invert:["",ze,me,he]}],saturate:[{saturate:[ze,me,he]}],sepia:[{sepia:["",ze,me,he]}],"backdrop-filter":[{"backdrop-filter":["","none",me,he]}],"backdrop-blur":[{"backdrop-blur":ye()}],"backdrop-brightness":[{"backdrop-brightness":[ze,me,he]}],"backdrop-contrast":[{"backdrop-contrast":[ze,me,he]}],"backdrop-grayscale":[{"backdrop-grayscale":["",ze,me,he]}],"backdrop-hue-rotate":[{"backdrop-hue-rotate":[ze,me,he]}],"backdrop-invert":[{"backdrop-invert":["",ze,me,he]}],"backdrop-opacity":[{"backdrop-opacity":[ze,me,he]}],"backdrop-saturate":[{"backdrop-saturate":[ze,me,he]}],"backdrop-sepia":[{"backdrop-sepia":["",ze,me,he]}],"border-collapse":[{border:["collapse","separate"]}],"border-spacing":[{"border-spacing":U()}],"border-spacing-x":[{"border-spacing-x":U()}],"border-spacing-y":[{"border-spacing-y":U()}],"table-layout":[{table:["auto","fixed"]}],caption:[{caption:["top","bottom"]}],transition:[{transition:["","all","colors","opacity","shadow","transform","none",me,he]}],"transition-behavior":[{transition:["normal","discrete"]}],duration:[{duration:[ze,"initial",me,he]}],ease:[{ease:["linear","initial",b,me,he]}],delay:[{delay:[ze,me,he]}],animate:[{animate:["none",T,me,he]}],backface:[{backface:["hidden","visible"]}],perspective:[{perspective:[E,me,he]}],"perspective-origin":[{"perspective-origin":F()}],rotate:[{rotate:Ae()}],"rotate-x":[{"rotate-x":Ae()}],"rotate-y":[{"rotate-y":Ae()}],"rotate-z":[{"rotate-z":Ae()}],scale:[{scale:ve()}],"scale-x":[{"scale-x":ve()}],"scale-y":[{"scale-y":ve()}],"scale-z":[{"scale-z":ve()}],"scale-3d":["scale-3d"],skew:[{skew:Le()}],"skew-x":[{"skew-x":Le()}],"skew-y":[{"skew-y":Le()}],transform:[{transform:[me,he,"","none","gpu","cpu"]}],"transform-origin":[{origin:F()}],"transform-style":[{transform:["3d","flat"]}],translate:[{translate:Ie()}],"translate-x":[{"translate-x":Ie()}],"translate-y":[{"translate-y":Ie()}],"translate-z":[{"translate-z":Ie()}],"translate-none":["translate-none"],accent:[{accent:M()}],appearance:[{appearance:["none","auto"]}],"caret-color":[{caret:M()}],"color-scheme":[{scheme:["normal","dark","light","light-dark","only-dark","only-light"]}],cursor:[{cursor:["auto","default","pointer","wait","text","move","help","not-allowed","none","context-menu","progress","cell","crosshair","vertical-text","alias","copy","no-drop","grab","grabbing","all-scroll","col-resize","row-resize","n-resize","e-resize","s-resize","w-resize","ne-resize","nw-resize","se-resize","sw-resize","ew-resize","ns-resize","nesw-resize","nwse-resize","zoom-in","zoom-out",me,he]}],"field-sizing":[{"field-sizing":["fixed","content"]}],"pointer-events":[{"pointer-events":["auto","none"]}],resize:[{resize:["none","","y","x"]}],"scroll-behavior":[{scroll:["auto","smooth"]}],"scroll-m":[{"scroll-m":U()}],"scroll-mx":[{"scroll-mx":U()}],"scroll-my":[{"scroll-my":U()}],"scroll-ms":[{"scroll-ms":U()}],"scroll-me":[{"scroll-me":U()}],"scroll-mt":[{"scroll-mt":U()}],"scroll-mr":[{"scroll-mr":U()}],"scroll-mb":[{"scroll-mb":U()}],"scroll-ml":[{"scroll-ml":U()}],"scroll-p":[{"scroll-p":U()}],"scroll-px":[{"scroll-px":U()}],"scroll-py":[{"scroll-py":U()}],"scroll-ps":[{"scroll-ps":U()}],"scroll-pe":[{"scroll-pe":U()}],"scroll-pt":[{"scroll-pt":U()}],"scroll-pr":[{"scroll-pr":U()}],"scroll-pb":[{"scroll-pb":U()}],"scroll-pl":[{"scroll-pl":U()}],"snap-align":[{snap:["start","end","center","align-none"]}],"snap-stop":[{snap:["normal","always"]}],"snap-type":[{snap:["none","x","y","both"]}],"snap-strictness":[{snap:["mandatory","proximity"]}],touch:[{touch:["auto","none","manipulation"]}],"touch-x":[{"touch-pan":["x","left","right"]}],"touch-y":[{"touch-pan":["y","up","down"]}],"touch-pz":["touch-pinch-zoom"],select:[{select:["none","text","all","auto"]}],"will-change":[{"will-change":["auto","scroll","contents","transform",me,he]}],fill:[{fill:["none",...M()]}],"stroke-w":[{stroke:[ze,ya,yo,Wc]}],stroke:[{stroke:["none",...M()]}],"forced-color-adjust":[{"forced-color-adjust":["auto","none"]}]},conflictingClassGroups:{overflow:["overflow-x","overflow-y"],overscroll:["overscroll-x","overscroll-y"],inset:["inset-x","inset-y","start","end","top","right","bottom","left"],"inset-x":["right","left"],"inset-y":["top","bottom"],flex:["basis","grow","shrink"],gap:["gap-x","gap-y"],p:["px","py","ps","pe","pt","pr","pb","pl"],px:["pr","pl"],py:["pt","pb"],m:["mx","my","ms","me","mt","mr","mb","ml"],mx:["mr","ml"],my:["mt","mb"],size:["w","h"],"font-size":["leading"],"fvn-normal":["fvn-ordinal","fvn-slashed-zero","fvn-figure","fvn-spacing","fvn-fraction"],"fvn-ordinal":["fvn-normal"],"fvn-slashed-zero":["fvn-normal"],"fvn-figure":["fvn-normal"],"fvn-spacing":["fvn-normal"],"fvn-fraction":["fvn-normal"],"line-clamp":["display","overflow"],rounded:["rounded-s","rounded-e","rounded-t","rounded-r","rounded-b","rounded-l","rounded-ss","rounded-se","rounded-ee","rounded-es","rounded-tl","rounded-tr","rounded-br","rounded-bl"],"rounded-s":["rounded-ss","rounded-es"],"rounded-e":["rounded-se","rounded-ee"],"rounded-t":["rounded-tl","rounded-tr"],"rounded-r":["rounded-tr","rounded-br"],"rounded-b":["rounded-br","rounded-bl"],"rounded-l":["rounded-tl","rounded-bl"],"border-spacing":["border-spacing-x","border-spacing-y"],"border-w":["border-w-x","border-w-y","border-w-s","border-w-e","border-w-t","border-w-r","border-w-b","border-w-l"],"border-w-x":["border-w-r","border-w-l"],"border-w-y":["border-w-t","border-w-b"],"border-color":["border-color-x","border-color-y","border-color-s","border-color-e","border-color-t","border-color-r","border-color-b","border-color-l"],"border-color-x":["border-color-r","border-color-l"],"border-color-y":["border-color-t","border-color-b"],translate:["translate-x","translate-y","translate-none"],"translate-none":["translate","translate-x","translate-y","translate-z"],"scroll-m":["scroll-mx","scroll-my","scroll-ms","scroll-me","scroll-mt","scroll-mr","scroll-mb","scroll-ml"],"scroll-mx":["scroll-mr","scroll-ml"],"scroll-my":["scroll-mt","scroll-mb"],"scroll-p":["scroll-px","scroll-py","scroll-ps","scroll-pe","scroll-pt","scroll-pr","scroll-pb","scroll-pl"],"scroll-px":["scroll-pr","scroll-pl"],"scroll-py":["scroll-pt","scroll-pb"],touch:["touch-x","touch-y","touch-pz"],"touch-x":["touch"],"touch-y":["touch"],"touch-pz":["touch"]},conflictingClassGroupModifiers:{"font-size":["leading"]},orderSensitiveModifiers:["*","**","after","backdrop","before","details-content","file","first-letter","first-line","marker","placeholder","selection"]}},hk=qC(pk);function Qe(...t){return hk(av(t))}const mk=Ms("inline-flex items-center justify-center gap-2 whitespace-nowrap rounded-md text-sm font-medium transition-colors focus-visible:outline-none focus-visible:ring-1 focus-visible:ring-zinc-950 disabled:pointer-events-none disabled:opacity-50 [&_svg]:pointer-events-none [&_svg]:size-4 [&_svg]:shrink-0 dark:focus-visible:ring-zinc-300",{variants:{variant:{default:"bg-zinc-900 text-zinc-50 shadow hover:bg-zinc-900/90 dark:bg-zinc-50 dark:text-zinc-900 dark:hover:bg-zinc-50/90",destructive:"bg-red-500 text-zinc-50 shadow-sm hover:bg-red-500/90 dark:bg-red-900 dark:text-zinc-50 dark:hover:bg-red-900/90",outline:"border border-zinc-200 bg-white shadow-sm hover:bg-zinc-100 hover:text-zinc-900 dark:border-zinc-800 dark:bg-zinc-950 dark:hover:bg-zinc-800 dark:hover:text-zinc-50",secondary:"bg-zinc-100 text-zinc-900 shadow-sm hover:bg-zinc-100/80 dark:bg-zinc-800 dark:text-zinc-50 dark:hover:bg-zinc-800/80",ghost:"hover:bg-zinc-100 hover:text-zinc-900 dark:hover:bg-zinc-800 dark:hover:text-zinc-50",link:"text-zinc-900 underline-offset-4 hover:underline dark:text-zinc-50"},size:{default:"h-9 px-4 py-2",sm:"h-8 rounded-md px-3 text-xs",lg:"h-10 rounded-md px-8",icon:"h-9 w-9"}},defaultVariants:{variant:"default",size:"default"}}),Be=y.forwardRef(({className:t,variant:r,size:o,asChild:a=!1,...l},u)=>{const c=a?jC:"button";return g.jsx(c,{className:Qe(mk({variant:r,size:o,className:t})),ref:u,...l})});Be.displayName="Button";/**
  * @license lucide-react v0.364.0 - ISC
  *
  * This source code is licensed under the ISC license.
@@ -222,4 +222,4 @@ Please change the parent <Route path="${T}"> to <Route path="${T==="/"?"*":`${T}
 
 If you want to hide the \`${r.titleName}\`, you can wrap it with our VisuallyHidden component.
 
-For more information, see https://radix-ui.com/primitives/docs/components/${r.docsSlug}`;return y.useEffect(()=>{t&&(document.getElementById(t)||console.error(o))},[o,t]),null},ib="DialogDescriptionWarning",ab=({contentRef:t,descriptionId:r})=>{const a=`Warning: Missing \`Description\` or \`aria-describedby={undefined}\` for {${ty(ib).contentName}}.`;return y.useEffect(()=>{var u;const l=(u=t.current)==null?void 0:u.getAttribute("aria-describedby");r&&l&&(document.getElementById(r)||console.warn(a))},[a,t,r]),null},lb=$v,sb=Hv,ub=Wv,ny=Kv,ry=Gv,oy=Yv,iy=Xv,cb=Zv;const La=lb,$s=sb,db=ub,ay=y.forwardRef(({className:t,...r},o)=>g.jsx(ny,{ref:o,className:Qe("fixed inset-0 z-50 bg-black/80  data-[state=open]:animate-in data-[state=closed]:animate-out data-[state=closed]:fade-out-0 data-[state=open]:fade-in-0",t),...r}));ay.displayName=ny.displayName;const Si=y.forwardRef(({className:t,children:r,...o},a)=>g.jsxs(db,{children:[g.jsx(ay,{}),g.jsxs(ry,{ref:a,className:Qe("fixed left-[50%] top-[50%] z-50 grid w-full max-w-lg translate-x-[-50%] translate-y-[-50%] gap-4 border border-zinc-200 bg-white p-6 shadow-lg duration-200 data-[state=open]:animate-in data-[state=closed]:animate-out data-[state=closed]:fade-out-0 data-[state=open]:fade-in-0 data-[state=closed]:zoom-out-95 data-[state=open]:zoom-in-95 data-[state=closed]:slide-out-to-left-1/2 data-[state=closed]:slide-out-to-top-[48%] data-[state=open]:slide-in-from-left-1/2 data-[state=open]:slide-in-from-top-[48%] sm:rounded-lg dark:border-zinc-800 dark:bg-zinc-950",t),...o,children:[r,g.jsxs(cb,{className:"absolute right-4 top-4 rounded-sm opacity-70 ring-offset-white transition-opacity hover:opacity-100 focus:outline-none focus:ring-2 focus:ring-zinc-950 focus:ring-offset-2 disabled:pointer-events-none data-[state=open]:bg-zinc-100 data-[state=open]:text-zinc-500 dark:ring-offset-zinc-950 dark:focus:ring-zinc-300 dark:data-[state=open]:bg-zinc-800 dark:data-[state=open]:text-zinc-400",children:[g.jsx(kv,{className:"h-4 w-4"}),g.jsx("span",{className:"sr-only",children:"Close"})]})]})]}));Si.displayName=ry.displayName;const Ei=({className:t,...r})=>g.jsx("div",{className:Qe("flex flex-col space-y-1.5 text-center sm:text-left",t),...r});Ei.displayName="DialogHeader";const ly=({className:t,...r})=>g.jsx("div",{className:Qe("flex flex-col-reverse sm:flex-row sm:justify-end sm:space-x-2",t),...r});ly.displayName="DialogFooter";const Ci=y.forwardRef(({className:t,...r},o)=>g.jsx(oy,{ref:o,className:Qe("text-lg font-semibold leading-none tracking-tight",t),...r}));Ci.displayName=oy.displayName;const fb=y.forwardRef(({className:t,...r},o)=>g.jsx(iy,{ref:o,className:Qe("text-sm text-zinc-500 dark:text-zinc-400",t),...r}));fb.displayName=iy.displayName;const pb=()=>{const[t,r]=y.useState([]),[o,a]=y.useState(!0),[l,u]=y.useState(""),[c,f]=y.useState(null),[p,m]=y.useState(!1);y.useEffect(()=>{v()},[c]);const v=async()=>{try{a(!0);const C=await Hd(c||void 0);r(C)}catch(C){console.error("Error fetching folders:",C)}finally{a(!1)}},w=async()=>{if(l.trim())try{await hC({name:l,parent_id:c||void 0}),u(""),m(!1),v()}catch(C){console.error("Error creating folder:",C)}},S=C=>{f(C)},R=()=>{f(null)};return g.jsxs("div",{className:"space-y-6",children:[g.jsxs("div",{className:"flex justify-between items-center",children:[g.jsxs("div",{children:[g.jsx("h1",{className:"text-3xl font-bold",children:"Folders"}),g.jsx("p",{className:"text-gray-500 mt-1",children:"Manage your document folders"})]}),g.jsxs(La,{open:p,onOpenChange:m,children:[g.jsx($s,{asChild:!0,children:g.jsxs(Be,{children:[g.jsx(Fs,{className:"mr-2 h-4 w-4"}),"New Folder"]})}),g.jsxs(Si,{children:[g.jsx(Ei,{children:g.jsx(Ci,{children:"Create New Folder"})}),g.jsx("div",{className:"grid gap-4 py-4",children:g.jsxs("div",{className:"grid gap-2",children:[g.jsx("label",{htmlFor:"name",children:"Folder Name"}),g.jsx(vn,{id:"name",value:l,onChange:C=>u(C.target.value),placeholder:"Enter folder name"})]})}),g.jsx(Be,{onClick:w,children:"Create Folder"})]})]})]}),c&&g.jsx(Be,{variant:"outline",onClick:R,children:"Back to Parent Folder"}),o?g.jsx("div",{className:"text-center py-10",children:"Loading folders..."}):t.length===0?g.jsx("div",{className:"text-center py-10 text-gray-500",children:"No folders found. Create a new folder to get started."}):g.jsx("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-4",children:t.map(C=>g.jsxs(Gt,{className:"cursor-pointer hover:bg-gray-50 transition-colors",onClick:()=>S(C.id),children:[g.jsx(qt,{className:"pb-2",children:g.jsxs(Yt,{className:"flex items-center",children:[g.jsx(Wd,{className:"mr-2 h-5 w-5 text-blue-500"}),C.name]})}),g.jsx(Qt,{children:g.jsxs("p",{className:"text-sm text-gray-500",children:["Created: ",new Date(C.created_at).toLocaleDateString()]})})]},C.id))})]})};function Gm(t,[r,o]){return Math.min(o,Math.max(r,t))}function sy(t){const r=t+"CollectionProvider",[o,a]=xi(r),[l,u]=o(r,{collectionRef:{current:null},itemMap:new Map}),c=E=>{const{scope:k,children:b}=E,T=Mr.useRef(null),P=Mr.useRef(new Map).current;return g.jsx(l,{scope:k,itemMap:P,collectionRef:T,children:b})};c.displayName=r;const f=t+"CollectionSlot",p=di(f),m=Mr.forwardRef((E,k)=>{const{scope:b,children:T}=E,P=u(f,b),j=ut(k,P.collectionRef);return g.jsx(p,{ref:j,children:T})});m.displayName=f;const v=t+"CollectionItemSlot",w="data-radix-collection-item",S=di(v),R=Mr.forwardRef((E,k)=>{const{scope:b,children:T,...P}=E,j=Mr.useRef(null),F=ut(k,j),_=u(v,b);return Mr.useEffect(()=>(_.itemMap.set(j,{ref:j,...P}),()=>void _.itemMap.delete(j))),g.jsx(S,{[w]:"",ref:F,children:T})});R.displayName=v;function C(E){const k=u(t+"CollectionConsumer",E);return Mr.useCallback(()=>{const T=k.collectionRef.current;if(!T)return[];const P=Array.from(T.querySelectorAll(`[${w}]`));return Array.from(k.itemMap.values()).sort((_,W)=>P.indexOf(_.ref.current)-P.indexOf(W.ref.current))},[k.collectionRef,k.itemMap])}return[{Provider:c,Slot:m,ItemSlot:R},C,a]}var hb=y.createContext(void 0);function tf(t){const r=y.useContext(hb);return t||r||"ltr"}const mb=["top","right","bottom","left"],Vr=Math.min,ln=Math.max,ys=Math.round,ts=Math.floor,Gn=t=>({x:t,y:t}),gb={left:"right",right:"left",bottom:"top",top:"bottom"},vb={start:"end",end:"start"};function vd(t,r,o){return ln(t,Vr(r,o))}function lr(t,r){return typeof t=="function"?t(r):t}function sr(t){return t.split("-")[0]}function ki(t){return t.split("-")[1]}function nf(t){return t==="x"?"y":"x"}function rf(t){return t==="y"?"height":"width"}function Wr(t){return["top","bottom"].includes(sr(t))?"y":"x"}function of(t){return nf(Wr(t))}function yb(t,r,o){o===void 0&&(o=!1);const a=ki(t),l=of(t),u=rf(l);let c=l==="x"?a===(o?"end":"start")?"right":"left":a==="start"?"bottom":"top";return r.reference[u]>r.floating[u]&&(c=ws(c)),[c,ws(c)]}function wb(t){const r=ws(t);return[yd(t),r,yd(r)]}function yd(t){return t.replace(/start|end/g,r=>vb[r])}function xb(t,r,o){const a=["left","right"],l=["right","left"],u=["top","bottom"],c=["bottom","top"];switch(t){case"top":case"bottom":return o?r?l:a:r?a:l;case"left":case"right":return r?u:c;default:return[]}}function Sb(t,r,o,a){const l=ki(t);let u=xb(sr(t),o==="start",a);return l&&(u=u.map(c=>c+"-"+l),r&&(u=u.concat(u.map(yd)))),u}function ws(t){return t.replace(/left|right|bottom|top/g,r=>gb[r])}function Eb(t){return{top:0,right:0,bottom:0,left:0,...t}}function uy(t){return typeof t!="number"?Eb(t):{top:t,right:t,bottom:t,left:t}}function xs(t){const{x:r,y:o,width:a,height:l}=t;return{width:a,height:l,top:o,left:r,right:r+a,bottom:o+l,x:r,y:o}}function qm(t,r,o){let{reference:a,floating:l}=t;const u=Wr(r),c=of(r),f=rf(c),p=sr(r),m=u==="y",v=a.x+a.width/2-l.width/2,w=a.y+a.height/2-l.height/2,S=a[f]/2-l[f]/2;let R;switch(p){case"top":R={x:v,y:a.y-l.height};break;case"bottom":R={x:v,y:a.y+a.height};break;case"right":R={x:a.x+a.width,y:w};break;case"left":R={x:a.x-l.width,y:w};break;default:R={x:a.x,y:a.y}}switch(ki(r)){case"start":R[c]-=S*(o&&m?-1:1);break;case"end":R[c]+=S*(o&&m?-1:1);break}return R}const Cb=async(t,r,o)=>{const{placement:a="bottom",strategy:l="absolute",middleware:u=[],platform:c}=o,f=u.filter(Boolean),p=await(c.isRTL==null?void 0:c.isRTL(r));let m=await c.getElementRects({reference:t,floating:r,strategy:l}),{x:v,y:w}=qm(m,a,p),S=a,R={},C=0;for(let E=0;E<f.length;E++){const{name:k,fn:b}=f[E],{x:T,y:P,data:j,reset:F}=await b({x:v,y:w,initialPlacement:a,placement:S,strategy:l,middlewareData:R,rects:m,platform:c,elements:{reference:t,floating:r}});v=T??v,w=P??w,R={...R,[k]:{...R[k],...j}},F&&C<=50&&(C++,typeof F=="object"&&(F.placement&&(S=F.placement),F.rects&&(m=F.rects===!0?await c.getElementRects({reference:t,floating:r,strategy:l}):F.rects),{x:v,y:w}=qm(m,S,p)),E=-1)}return{x:v,y:w,placement:S,strategy:l,middlewareData:R}};async function Pa(t,r){var o;r===void 0&&(r={});const{x:a,y:l,platform:u,rects:c,elements:f,strategy:p}=t,{boundary:m="clippingAncestors",rootBoundary:v="viewport",elementContext:w="floating",altBoundary:S=!1,padding:R=0}=lr(r,t),C=uy(R),k=f[S?w==="floating"?"reference":"floating":w],b=xs(await u.getClippingRect({element:(o=await(u.isElement==null?void 0:u.isElement(k)))==null||o?k:k.contextElement||await(u.getDocumentElement==null?void 0:u.getDocumentElement(f.floating)),boundary:m,rootBoundary:v,strategy:p})),T=w==="floating"?{x:a,y:l,width:c.floating.width,height:c.floating.height}:c.reference,P=await(u.getOffsetParent==null?void 0:u.getOffsetParent(f.floating)),j=await(u.isElement==null?void 0:u.isElement(P))?await(u.getScale==null?void 0:u.getScale(P))||{x:1,y:1}:{x:1,y:1},F=xs(u.convertOffsetParentRelativeRectToViewportRelativeRect?await u.convertOffsetParentRelativeRectToViewportRelativeRect({elements:f,rect:T,offsetParent:P,strategy:p}):T);return{top:(b.top-F.top+C.top)/j.y,bottom:(F.bottom-b.bottom+C.bottom)/j.y,left:(b.left-F.left+C.left)/j.x,right:(F.right-b.right+C.right)/j.x}}const kb=t=>({name:"arrow",options:t,async fn(r){const{x:o,y:a,placement:l,rects:u,platform:c,elements:f,middlewareData:p}=r,{element:m,padding:v=0}=lr(t,r)||{};if(m==null)return{};const w=uy(v),S={x:o,y:a},R=of(l),C=rf(R),E=await c.getDimensions(m),k=R==="y",b=k?"top":"left",T=k?"bottom":"right",P=k?"clientHeight":"clientWidth",j=u.reference[C]+u.reference[R]-S[R]-u.floating[C],F=S[R]-u.reference[R],_=await(c.getOffsetParent==null?void 0:c.getOffsetParent(m));let W=_?_[P]:0;(!W||!await(c.isElement==null?void 0:c.isElement(_)))&&(W=f.floating[P]||u.floating[C]);const U=j/2-F/2,Y=W/2-E[C]/2-1,oe=Vr(w[b],Y),Re=Vr(w[T],Y),Te=oe,ae=W-E[C]-Re,le=W/2-E[C]/2+U,Se=vd(Te,le,ae),X=!p.arrow&&ki(l)!=null&&le!==Se&&u.reference[C]/2-(le<Te?oe:Re)-E[C]/2<0,ie=X?le<Te?le-Te:le-ae:0;return{[R]:S[R]+ie,data:{[R]:Se,centerOffset:le-Se-ie,...X&&{alignmentOffset:ie}},reset:X}}}),Rb=function(t){return t===void 0&&(t={}),{name:"flip",options:t,async fn(r){var o,a;const{placement:l,middlewareData:u,rects:c,initialPlacement:f,platform:p,elements:m}=r,{mainAxis:v=!0,crossAxis:w=!0,fallbackPlacements:S,fallbackStrategy:R="bestFit",fallbackAxisSideDirection:C="none",flipAlignment:E=!0,...k}=lr(t,r);if((o=u.arrow)!=null&&o.alignmentOffset)return{};const b=sr(l),T=Wr(f),P=sr(f)===f,j=await(p.isRTL==null?void 0:p.isRTL(m.floating)),F=S||(P||!E?[ws(f)]:wb(f)),_=C!=="none";!S&&_&&F.push(...Sb(f,E,C,j));const W=[f,...F],U=await Pa(r,k),Y=[];let oe=((a=u.flip)==null?void 0:a.overflows)||[];if(v&&Y.push(U[b]),w){const le=yb(l,c,j);Y.push(U[le[0]],U[le[1]])}if(oe=[...oe,{placement:l,overflows:Y}],!Y.every(le=>le<=0)){var Re,Te;const le=(((Re=u.flip)==null?void 0:Re.index)||0)+1,Se=W[le];if(Se)return{data:{index:le,overflows:oe},reset:{placement:Se}};let X=(Te=oe.filter(ie=>ie.overflows[0]<=0).sort((ie,M)=>ie.overflows[1]-M.overflows[1])[0])==null?void 0:Te.placement;if(!X)switch(R){case"bestFit":{var ae;const ie=(ae=oe.filter(M=>{if(_){const ee=Wr(M.placement);return ee===T||ee==="y"}return!0}).map(M=>[M.placement,M.overflows.filter(ee=>ee>0).reduce((ee,Q)=>ee+Q,0)]).sort((M,ee)=>M[1]-ee[1])[0])==null?void 0:ae[0];ie&&(X=ie);break}case"initialPlacement":X=f;break}if(l!==X)return{reset:{placement:X}}}return{}}}};function Ym(t,r){return{top:t.top-r.height,right:t.right-r.width,bottom:t.bottom-r.height,left:t.left-r.width}}function Qm(t){return mb.some(r=>t[r]>=0)}const bb=function(t){return t===void 0&&(t={}),{name:"hide",options:t,async fn(r){const{rects:o}=r,{strategy:a="referenceHidden",...l}=lr(t,r);switch(a){case"referenceHidden":{const u=await Pa(r,{...l,elementContext:"reference"}),c=Ym(u,o.reference);return{data:{referenceHiddenOffsets:c,referenceHidden:Qm(c)}}}case"escaped":{const u=await Pa(r,{...l,altBoundary:!0}),c=Ym(u,o.floating);return{data:{escapedOffsets:c,escaped:Qm(c)}}}default:return{}}}}};async function Nb(t,r){const{placement:o,platform:a,elements:l}=t,u=await(a.isRTL==null?void 0:a.isRTL(l.floating)),c=sr(o),f=ki(o),p=Wr(o)==="y",m=["left","top"].includes(c)?-1:1,v=u&&p?-1:1,w=lr(r,t);let{mainAxis:S,crossAxis:R,alignmentAxis:C}=typeof w=="number"?{mainAxis:w,crossAxis:0,alignmentAxis:null}:{mainAxis:w.mainAxis||0,crossAxis:w.crossAxis||0,alignmentAxis:w.alignmentAxis};return f&&typeof C=="number"&&(R=f==="end"?C*-1:C),p?{x:R*v,y:S*m}:{x:S*m,y:R*v}}const Pb=function(t){return t===void 0&&(t=0),{name:"offset",options:t,async fn(r){var o,a;const{x:l,y:u,placement:c,middlewareData:f}=r,p=await Nb(r,t);return c===((o=f.offset)==null?void 0:o.placement)&&(a=f.arrow)!=null&&a.alignmentOffset?{}:{x:l+p.x,y:u+p.y,data:{...p,placement:c}}}}},jb=function(t){return t===void 0&&(t={}),{name:"shift",options:t,async fn(r){const{x:o,y:a,placement:l}=r,{mainAxis:u=!0,crossAxis:c=!1,limiter:f={fn:k=>{let{x:b,y:T}=k;return{x:b,y:T}}},...p}=lr(t,r),m={x:o,y:a},v=await Pa(r,p),w=Wr(sr(l)),S=nf(w);let R=m[S],C=m[w];if(u){const k=S==="y"?"top":"left",b=S==="y"?"bottom":"right",T=R+v[k],P=R-v[b];R=vd(T,R,P)}if(c){const k=w==="y"?"top":"left",b=w==="y"?"bottom":"right",T=C+v[k],P=C-v[b];C=vd(T,C,P)}const E=f.fn({...r,[S]:R,[w]:C});return{...E,data:{x:E.x-o,y:E.y-a,enabled:{[S]:u,[w]:c}}}}}},Tb=function(t){return t===void 0&&(t={}),{options:t,fn(r){const{x:o,y:a,placement:l,rects:u,middlewareData:c}=r,{offset:f=0,mainAxis:p=!0,crossAxis:m=!0}=lr(t,r),v={x:o,y:a},w=Wr(l),S=nf(w);let R=v[S],C=v[w];const E=lr(f,r),k=typeof E=="number"?{mainAxis:E,crossAxis:0}:{mainAxis:0,crossAxis:0,...E};if(p){const P=S==="y"?"height":"width",j=u.reference[S]-u.floating[P]+k.mainAxis,F=u.reference[S]+u.reference[P]-k.mainAxis;R<j?R=j:R>F&&(R=F)}if(m){var b,T;const P=S==="y"?"width":"height",j=["top","left"].includes(sr(l)),F=u.reference[w]-u.floating[P]+(j&&((b=c.offset)==null?void 0:b[w])||0)+(j?0:k.crossAxis),_=u.reference[w]+u.reference[P]+(j?0:((T=c.offset)==null?void 0:T[w])||0)-(j?k.crossAxis:0);C<F?C=F:C>_&&(C=_)}return{[S]:R,[w]:C}}}},_b=function(t){return t===void 0&&(t={}),{name:"size",options:t,async fn(r){var o,a;const{placement:l,rects:u,platform:c,elements:f}=r,{apply:p=()=>{},...m}=lr(t,r),v=await Pa(r,m),w=sr(l),S=ki(l),R=Wr(l)==="y",{width:C,height:E}=u.floating;let k,b;w==="top"||w==="bottom"?(k=w,b=S===(await(c.isRTL==null?void 0:c.isRTL(f.floating))?"start":"end")?"left":"right"):(b=w,k=S==="end"?"top":"bottom");const T=E-v.top-v.bottom,P=C-v.left-v.right,j=Vr(E-v[k],T),F=Vr(C-v[b],P),_=!r.middlewareData.shift;let W=j,U=F;if((o=r.middlewareData.shift)!=null&&o.enabled.x&&(U=P),(a=r.middlewareData.shift)!=null&&a.enabled.y&&(W=T),_&&!S){const oe=ln(v.left,0),Re=ln(v.right,0),Te=ln(v.top,0),ae=ln(v.bottom,0);R?U=C-2*(oe!==0||Re!==0?oe+Re:ln(v.left,v.right)):W=E-2*(Te!==0||ae!==0?Te+ae:ln(v.top,v.bottom))}await p({...r,availableWidth:U,availableHeight:W});const Y=await c.getDimensions(f.floating);return C!==Y.width||E!==Y.height?{reset:{rects:!0}}:{}}}};function Bs(){return typeof window<"u"}function Ri(t){return cy(t)?(t.nodeName||"").toLowerCase():"#document"}function sn(t){var r;return(t==null||(r=t.ownerDocument)==null?void 0:r.defaultView)||window}function Yn(t){var r;return(r=(cy(t)?t.ownerDocument:t.document)||window.document)==null?void 0:r.documentElement}function cy(t){return Bs()?t instanceof Node||t instanceof sn(t).Node:!1}function Tn(t){return Bs()?t instanceof Element||t instanceof sn(t).Element:!1}function qn(t){return Bs()?t instanceof HTMLElement||t instanceof sn(t).HTMLElement:!1}function Xm(t){return!Bs()||typeof ShadowRoot>"u"?!1:t instanceof ShadowRoot||t instanceof sn(t).ShadowRoot}function Ma(t){const{overflow:r,overflowX:o,overflowY:a,display:l}=_n(t);return/auto|scroll|overlay|hidden|clip/.test(r+a+o)&&!["inline","contents"].includes(l)}function Ab(t){return["table","td","th"].includes(Ri(t))}function Hs(t){return[":popover-open",":modal"].some(r=>{try{return t.matches(r)}catch{return!1}})}function af(t){const r=lf(),o=Tn(t)?_n(t):t;return["transform","translate","scale","rotate","perspective"].some(a=>o[a]?o[a]!=="none":!1)||(o.containerType?o.containerType!=="normal":!1)||!r&&(o.backdropFilter?o.backdropFilter!=="none":!1)||!r&&(o.filter?o.filter!=="none":!1)||["transform","translate","scale","rotate","perspective","filter"].some(a=>(o.willChange||"").includes(a))||["paint","layout","strict","content"].some(a=>(o.contain||"").includes(a))}function Db(t){let r=Kr(t);for(;qn(r)&&!fi(r);){if(af(r))return r;if(Hs(r))return null;r=Kr(r)}return null}function lf(){return typeof CSS>"u"||!CSS.supports?!1:CSS.supports("-webkit-backdrop-filter","none")}function fi(t){return["html","body","#document"].includes(Ri(t))}function _n(t){return sn(t).getComputedStyle(t)}function Vs(t){return Tn(t)?{scrollLeft:t.scrollLeft,scrollTop:t.scrollTop}:{scrollLeft:t.scrollX,scrollTop:t.scrollY}}function Kr(t){if(Ri(t)==="html")return t;const r=t.assignedSlot||t.parentNode||Xm(t)&&t.host||Yn(t);return Xm(r)?r.host:r}function dy(t){const r=Kr(t);return fi(r)?t.ownerDocument?t.ownerDocument.body:t.body:qn(r)&&Ma(r)?r:dy(r)}function ja(t,r,o){var a;r===void 0&&(r=[]),o===void 0&&(o=!0);const l=dy(t),u=l===((a=t.ownerDocument)==null?void 0:a.body),c=sn(l);if(u){const f=wd(c);return r.concat(c,c.visualViewport||[],Ma(l)?l:[],f&&o?ja(f):[])}return r.concat(l,ja(l,[],o))}function wd(t){return t.parent&&Object.getPrototypeOf(t.parent)?t.frameElement:null}function fy(t){const r=_n(t);let o=parseFloat(r.width)||0,a=parseFloat(r.height)||0;const l=qn(t),u=l?t.offsetWidth:o,c=l?t.offsetHeight:a,f=ys(o)!==u||ys(a)!==c;return f&&(o=u,a=c),{width:o,height:a,$:f}}function sf(t){return Tn(t)?t:t.contextElement}function ci(t){const r=sf(t);if(!qn(r))return Gn(1);const o=r.getBoundingClientRect(),{width:a,height:l,$:u}=fy(r);let c=(u?ys(o.width):o.width)/a,f=(u?ys(o.height):o.height)/l;return(!c||!Number.isFinite(c))&&(c=1),(!f||!Number.isFinite(f))&&(f=1),{x:c,y:f}}const Ob=Gn(0);function py(t){const r=sn(t);return!lf()||!r.visualViewport?Ob:{x:r.visualViewport.offsetLeft,y:r.visualViewport.offsetTop}}function Lb(t,r,o){return r===void 0&&(r=!1),!o||r&&o!==sn(t)?!1:r}function Ro(t,r,o,a){r===void 0&&(r=!1),o===void 0&&(o=!1);const l=t.getBoundingClientRect(),u=sf(t);let c=Gn(1);r&&(a?Tn(a)&&(c=ci(a)):c=ci(t));const f=Lb(u,o,a)?py(u):Gn(0);let p=(l.left+f.x)/c.x,m=(l.top+f.y)/c.y,v=l.width/c.x,w=l.height/c.y;if(u){const S=sn(u),R=a&&Tn(a)?sn(a):a;let C=S,E=wd(C);for(;E&&a&&R!==C;){const k=ci(E),b=E.getBoundingClientRect(),T=_n(E),P=b.left+(E.clientLeft+parseFloat(T.paddingLeft))*k.x,j=b.top+(E.clientTop+parseFloat(T.paddingTop))*k.y;p*=k.x,m*=k.y,v*=k.x,w*=k.y,p+=P,m+=j,C=sn(E),E=wd(C)}}return xs({width:v,height:w,x:p,y:m})}function uf(t,r){const o=Vs(t).scrollLeft;return r?r.left+o:Ro(Yn(t)).left+o}function hy(t,r,o){o===void 0&&(o=!1);const a=t.getBoundingClientRect(),l=a.left+r.scrollLeft-(o?0:uf(t,a)),u=a.top+r.scrollTop;return{x:l,y:u}}function Mb(t){let{elements:r,rect:o,offsetParent:a,strategy:l}=t;const u=l==="fixed",c=Yn(a),f=r?Hs(r.floating):!1;if(a===c||f&&u)return o;let p={scrollLeft:0,scrollTop:0},m=Gn(1);const v=Gn(0),w=qn(a);if((w||!w&&!u)&&((Ri(a)!=="body"||Ma(c))&&(p=Vs(a)),qn(a))){const R=Ro(a);m=ci(a),v.x=R.x+a.clientLeft,v.y=R.y+a.clientTop}const S=c&&!w&&!u?hy(c,p,!0):Gn(0);return{width:o.width*m.x,height:o.height*m.y,x:o.x*m.x-p.scrollLeft*m.x+v.x+S.x,y:o.y*m.y-p.scrollTop*m.y+v.y+S.y}}function Fb(t){return Array.from(t.getClientRects())}function Ib(t){const r=Yn(t),o=Vs(t),a=t.ownerDocument.body,l=ln(r.scrollWidth,r.clientWidth,a.scrollWidth,a.clientWidth),u=ln(r.scrollHeight,r.clientHeight,a.scrollHeight,a.clientHeight);let c=-o.scrollLeft+uf(t);const f=-o.scrollTop;return _n(a).direction==="rtl"&&(c+=ln(r.clientWidth,a.clientWidth)-l),{width:l,height:u,x:c,y:f}}function zb(t,r){const o=sn(t),a=Yn(t),l=o.visualViewport;let u=a.clientWidth,c=a.clientHeight,f=0,p=0;if(l){u=l.width,c=l.height;const m=lf();(!m||m&&r==="fixed")&&(f=l.offsetLeft,p=l.offsetTop)}return{width:u,height:c,x:f,y:p}}function Ub(t,r){const o=Ro(t,!0,r==="fixed"),a=o.top+t.clientTop,l=o.left+t.clientLeft,u=qn(t)?ci(t):Gn(1),c=t.clientWidth*u.x,f=t.clientHeight*u.y,p=l*u.x,m=a*u.y;return{width:c,height:f,x:p,y:m}}function Jm(t,r,o){let a;if(r==="viewport")a=zb(t,o);else if(r==="document")a=Ib(Yn(t));else if(Tn(r))a=Ub(r,o);else{const l=py(t);a={x:r.x-l.x,y:r.y-l.y,width:r.width,height:r.height}}return xs(a)}function my(t,r){const o=Kr(t);return o===r||!Tn(o)||fi(o)?!1:_n(o).position==="fixed"||my(o,r)}function $b(t,r){const o=r.get(t);if(o)return o;let a=ja(t,[],!1).filter(f=>Tn(f)&&Ri(f)!=="body"),l=null;const u=_n(t).position==="fixed";let c=u?Kr(t):t;for(;Tn(c)&&!fi(c);){const f=_n(c),p=af(c);!p&&f.position==="fixed"&&(l=null),(u?!p&&!l:!p&&f.position==="static"&&!!l&&["absolute","fixed"].includes(l.position)||Ma(c)&&!p&&my(t,c))?a=a.filter(v=>v!==c):l=f,c=Kr(c)}return r.set(t,a),a}function Bb(t){let{element:r,boundary:o,rootBoundary:a,strategy:l}=t;const c=[...o==="clippingAncestors"?Hs(r)?[]:$b(r,this._c):[].concat(o),a],f=c[0],p=c.reduce((m,v)=>{const w=Jm(r,v,l);return m.top=ln(w.top,m.top),m.right=Vr(w.right,m.right),m.bottom=Vr(w.bottom,m.bottom),m.left=ln(w.left,m.left),m},Jm(r,f,l));return{width:p.right-p.left,height:p.bottom-p.top,x:p.left,y:p.top}}function Hb(t){const{width:r,height:o}=fy(t);return{width:r,height:o}}function Vb(t,r,o){const a=qn(r),l=Yn(r),u=o==="fixed",c=Ro(t,!0,u,r);let f={scrollLeft:0,scrollTop:0};const p=Gn(0);if(a||!a&&!u)if((Ri(r)!=="body"||Ma(l))&&(f=Vs(r)),a){const S=Ro(r,!0,u,r);p.x=S.x+r.clientLeft,p.y=S.y+r.clientTop}else l&&(p.x=uf(l));const m=l&&!a&&!u?hy(l,f):Gn(0),v=c.left+f.scrollLeft-p.x-m.x,w=c.top+f.scrollTop-p.y-m.y;return{x:v,y:w,width:c.width,height:c.height}}function Zc(t){return _n(t).position==="static"}function Zm(t,r){if(!qn(t)||_n(t).position==="fixed")return null;if(r)return r(t);let o=t.offsetParent;return Yn(t)===o&&(o=o.ownerDocument.body),o}function gy(t,r){const o=sn(t);if(Hs(t))return o;if(!qn(t)){let l=Kr(t);for(;l&&!fi(l);){if(Tn(l)&&!Zc(l))return l;l=Kr(l)}return o}let a=Zm(t,r);for(;a&&Ab(a)&&Zc(a);)a=Zm(a,r);return a&&fi(a)&&Zc(a)&&!af(a)?o:a||Db(t)||o}const Wb=async function(t){const r=this.getOffsetParent||gy,o=this.getDimensions,a=await o(t.floating);return{reference:Vb(t.reference,await r(t.floating),t.strategy),floating:{x:0,y:0,width:a.width,height:a.height}}};function Kb(t){return _n(t).direction==="rtl"}const Gb={convertOffsetParentRelativeRectToViewportRelativeRect:Mb,getDocumentElement:Yn,getClippingRect:Bb,getOffsetParent:gy,getElementRects:Wb,getClientRects:Fb,getDimensions:Hb,getScale:ci,isElement:Tn,isRTL:Kb};function vy(t,r){return t.x===r.x&&t.y===r.y&&t.width===r.width&&t.height===r.height}function qb(t,r){let o=null,a;const l=Yn(t);function u(){var f;clearTimeout(a),(f=o)==null||f.disconnect(),o=null}function c(f,p){f===void 0&&(f=!1),p===void 0&&(p=1),u();const m=t.getBoundingClientRect(),{left:v,top:w,width:S,height:R}=m;if(f||r(),!S||!R)return;const C=ts(w),E=ts(l.clientWidth-(v+S)),k=ts(l.clientHeight-(w+R)),b=ts(v),P={rootMargin:-C+"px "+-E+"px "+-k+"px "+-b+"px",threshold:ln(0,Vr(1,p))||1};let j=!0;function F(_){const W=_[0].intersectionRatio;if(W!==p){if(!j)return c();W?c(!1,W):a=setTimeout(()=>{c(!1,1e-7)},1e3)}W===1&&!vy(m,t.getBoundingClientRect())&&c(),j=!1}try{o=new IntersectionObserver(F,{...P,root:l.ownerDocument})}catch{o=new IntersectionObserver(F,P)}o.observe(t)}return c(!0),u}function Yb(t,r,o,a){a===void 0&&(a={});const{ancestorScroll:l=!0,ancestorResize:u=!0,elementResize:c=typeof ResizeObserver=="function",layoutShift:f=typeof IntersectionObserver=="function",animationFrame:p=!1}=a,m=sf(t),v=l||u?[...m?ja(m):[],...ja(r)]:[];v.forEach(b=>{l&&b.addEventListener("scroll",o,{passive:!0}),u&&b.addEventListener("resize",o)});const w=m&&f?qb(m,o):null;let S=-1,R=null;c&&(R=new ResizeObserver(b=>{let[T]=b;T&&T.target===m&&R&&(R.unobserve(r),cancelAnimationFrame(S),S=requestAnimationFrame(()=>{var P;(P=R)==null||P.observe(r)})),o()}),m&&!p&&R.observe(m),R.observe(r));let C,E=p?Ro(t):null;p&&k();function k(){const b=Ro(t);E&&!vy(E,b)&&o(),E=b,C=requestAnimationFrame(k)}return o(),()=>{var b;v.forEach(T=>{l&&T.removeEventListener("scroll",o),u&&T.removeEventListener("resize",o)}),w==null||w(),(b=R)==null||b.disconnect(),R=null,p&&cancelAnimationFrame(C)}}const Qb=Pb,Xb=jb,Jb=Rb,Zb=_b,eN=bb,eg=kb,tN=Tb,nN=(t,r,o)=>{const a=new Map,l={platform:Gb,...o},u={...l.platform,_c:a};return Cb(t,r,{...l,platform:u})};var cs=typeof document<"u"?y.useLayoutEffect:y.useEffect;function Ss(t,r){if(t===r)return!0;if(typeof t!=typeof r)return!1;if(typeof t=="function"&&t.toString()===r.toString())return!0;let o,a,l;if(t&&r&&typeof t=="object"){if(Array.isArray(t)){if(o=t.length,o!==r.length)return!1;for(a=o;a--!==0;)if(!Ss(t[a],r[a]))return!1;return!0}if(l=Object.keys(t),o=l.length,o!==Object.keys(r).length)return!1;for(a=o;a--!==0;)if(!{}.hasOwnProperty.call(r,l[a]))return!1;for(a=o;a--!==0;){const u=l[a];if(!(u==="_owner"&&t.$$typeof)&&!Ss(t[u],r[u]))return!1}return!0}return t!==t&&r!==r}function yy(t){return typeof window>"u"?1:(t.ownerDocument.defaultView||window).devicePixelRatio||1}function tg(t,r){const o=yy(t);return Math.round(r*o)/o}function ed(t){const r=y.useRef(t);return cs(()=>{r.current=t}),r}function rN(t){t===void 0&&(t={});const{placement:r="bottom",strategy:o="absolute",middleware:a=[],platform:l,elements:{reference:u,floating:c}={},transform:f=!0,whileElementsMounted:p,open:m}=t,[v,w]=y.useState({x:0,y:0,strategy:o,placement:r,middlewareData:{},isPositioned:!1}),[S,R]=y.useState(a);Ss(S,a)||R(a);const[C,E]=y.useState(null),[k,b]=y.useState(null),T=y.useCallback(M=>{M!==_.current&&(_.current=M,E(M))},[]),P=y.useCallback(M=>{M!==W.current&&(W.current=M,b(M))},[]),j=u||C,F=c||k,_=y.useRef(null),W=y.useRef(null),U=y.useRef(v),Y=p!=null,oe=ed(p),Re=ed(l),Te=ed(m),ae=y.useCallback(()=>{if(!_.current||!W.current)return;const M={placement:r,strategy:o,middleware:S};Re.current&&(M.platform=Re.current),nN(_.current,W.current,M).then(ee=>{const Q={...ee,isPositioned:Te.current!==!1};le.current&&!Ss(U.current,Q)&&(U.current=Q,hi.flushSync(()=>{w(Q)}))})},[S,r,o,Re,Te]);cs(()=>{m===!1&&U.current.isPositioned&&(U.current.isPositioned=!1,w(M=>({...M,isPositioned:!1})))},[m]);const le=y.useRef(!1);cs(()=>(le.current=!0,()=>{le.current=!1}),[]),cs(()=>{if(j&&(_.current=j),F&&(W.current=F),j&&F){if(oe.current)return oe.current(j,F,ae);ae()}},[j,F,ae,oe,Y]);const Se=y.useMemo(()=>({reference:_,floating:W,setReference:T,setFloating:P}),[T,P]),X=y.useMemo(()=>({reference:j,floating:F}),[j,F]),ie=y.useMemo(()=>{const M={position:o,left:0,top:0};if(!X.floating)return M;const ee=tg(X.floating,v.x),Q=tg(X.floating,v.y);return f?{...M,transform:"translate("+ee+"px, "+Q+"px)",...yy(X.floating)>=1.5&&{willChange:"transform"}}:{position:o,left:ee,top:Q}},[o,f,X.floating,v.x,v.y]);return y.useMemo(()=>({...v,update:ae,refs:Se,elements:X,floatingStyles:ie}),[v,ae,Se,X,ie])}const oN=t=>{function r(o){return{}.hasOwnProperty.call(o,"current")}return{name:"arrow",options:t,fn(o){const{element:a,padding:l}=typeof t=="function"?t(o):t;return a&&r(a)?a.current!=null?eg({element:a.current,padding:l}).fn(o):{}:a?eg({element:a,padding:l}).fn(o):{}}}},iN=(t,r)=>({...Qb(t),options:[t,r]}),aN=(t,r)=>({...Xb(t),options:[t,r]}),lN=(t,r)=>({...tN(t),options:[t,r]}),sN=(t,r)=>({...Jb(t),options:[t,r]}),uN=(t,r)=>({...Zb(t),options:[t,r]}),cN=(t,r)=>({...eN(t),options:[t,r]}),dN=(t,r)=>({...oN(t),options:[t,r]});var fN="Arrow",wy=y.forwardRef((t,r)=>{const{children:o,width:a=10,height:l=5,...u}=t;return g.jsx(qe.svg,{...u,ref:r,width:a,height:l,viewBox:"0 0 30 10",preserveAspectRatio:"none",children:t.asChild?o:g.jsx("polygon",{points:"0,0 30,0 15,10"})})});wy.displayName=fN;var pN=wy;function hN(t){const[r,o]=y.useState(void 0);return At(()=>{if(t){o({width:t.offsetWidth,height:t.offsetHeight});const a=new ResizeObserver(l=>{if(!Array.isArray(l)||!l.length)return;const u=l[0];let c,f;if("borderBoxSize"in u){const p=u.borderBoxSize,m=Array.isArray(p)?p[0]:p;c=m.inlineSize,f=m.blockSize}else c=t.offsetWidth,f=t.offsetHeight;o({width:c,height:f})});return a.observe(t,{box:"border-box"}),()=>a.unobserve(t)}else o(void 0)},[t]),r}var cf="Popper",[xy,Sy]=xi(cf),[mN,Ey]=xy(cf),Cy=t=>{const{__scopePopper:r,children:o}=t,[a,l]=y.useState(null);return g.jsx(mN,{scope:r,anchor:a,onAnchorChange:l,children:o})};Cy.displayName=cf;var ky="PopperAnchor",Ry=y.forwardRef((t,r)=>{const{__scopePopper:o,virtualRef:a,...l}=t,u=Ey(ky,o),c=y.useRef(null),f=ut(r,c);return y.useEffect(()=>{u.onAnchorChange((a==null?void 0:a.current)||c.current)}),a?null:g.jsx(qe.div,{...l,ref:f})});Ry.displayName=ky;var df="PopperContent",[gN,vN]=xy(df),by=y.forwardRef((t,r)=>{var te,ye,Ae,ve,Le,Ie;const{__scopePopper:o,side:a="bottom",sideOffset:l=0,align:u="center",alignOffset:c=0,arrowPadding:f=0,avoidCollisions:p=!0,collisionBoundary:m=[],collisionPadding:v=0,sticky:w="partial",hideWhenDetached:S=!1,updatePositionStrategy:R="optimized",onPlaced:C,...E}=t,k=Ey(df,o),[b,T]=y.useState(null),P=ut(r,ht=>T(ht)),[j,F]=y.useState(null),_=hN(j),W=(_==null?void 0:_.width)??0,U=(_==null?void 0:_.height)??0,Y=a+(u!=="center"?"-"+u:""),oe=typeof v=="number"?v:{top:0,right:0,bottom:0,left:0,...v},Re=Array.isArray(m)?m:[m],Te=Re.length>0,ae={padding:oe,boundary:Re.filter(wN),altBoundary:Te},{refs:le,floatingStyles:Se,placement:X,isPositioned:ie,middlewareData:M}=rN({strategy:"fixed",placement:Y,whileElementsMounted:(...ht)=>Yb(...ht,{animationFrame:R==="always"}),elements:{reference:k.anchor},middleware:[iN({mainAxis:l+U,alignmentAxis:c}),p&&aN({mainAxis:!0,crossAxis:!1,limiter:w==="partial"?lN():void 0,...ae}),p&&sN({...ae}),uN({...ae,apply:({elements:ht,rects:it,availableWidth:Mn,availableHeight:Fn})=>{const{width:un,height:To}=it.reference,In=ht.floating.style;In.setProperty("--radix-popper-available-width",`${Mn}px`),In.setProperty("--radix-popper-available-height",`${Fn}px`),In.setProperty("--radix-popper-anchor-width",`${un}px`),In.setProperty("--radix-popper-anchor-height",`${To}px`)}}),j&&dN({element:j,padding:f}),xN({arrowWidth:W,arrowHeight:U}),S&&cN({strategy:"referenceHidden",...ae})]}),[ee,Q]=jy(X),O=Hr(C);At(()=>{ie&&(O==null||O())},[ie,O]);const K=(te=M.arrow)==null?void 0:te.x,se=(ye=M.arrow)==null?void 0:ye.y,ce=((Ae=M.arrow)==null?void 0:Ae.centerOffset)!==0,[_e,je]=y.useState();return At(()=>{b&&je(window.getComputedStyle(b).zIndex)},[b]),g.jsx("div",{ref:le.setFloating,"data-radix-popper-content-wrapper":"",style:{...Se,transform:ie?Se.transform:"translate(0, -200%)",minWidth:"max-content",zIndex:_e,"--radix-popper-transform-origin":[(ve=M.transformOrigin)==null?void 0:ve.x,(Le=M.transformOrigin)==null?void 0:Le.y].join(" "),...((Ie=M.hide)==null?void 0:Ie.referenceHidden)&&{visibility:"hidden",pointerEvents:"none"}},dir:t.dir,children:g.jsx(gN,{scope:o,placedSide:ee,onArrowChange:F,arrowX:K,arrowY:se,shouldHideArrow:ce,children:g.jsx(qe.div,{"data-side":ee,"data-align":Q,...E,ref:P,style:{...E.style,animation:ie?void 0:"none"}})})})});by.displayName=df;var Ny="PopperArrow",yN={top:"bottom",right:"left",bottom:"top",left:"right"},Py=y.forwardRef(function(r,o){const{__scopePopper:a,...l}=r,u=vN(Ny,a),c=yN[u.placedSide];return g.jsx("span",{ref:u.onArrowChange,style:{position:"absolute",left:u.arrowX,top:u.arrowY,[c]:0,transformOrigin:{top:"",right:"0 0",bottom:"center 0",left:"100% 0"}[u.placedSide],transform:{top:"translateY(100%)",right:"translateY(50%) rotate(90deg) translateX(-50%)",bottom:"rotate(180deg)",left:"translateY(50%) rotate(-90deg) translateX(50%)"}[u.placedSide],visibility:u.shouldHideArrow?"hidden":void 0},children:g.jsx(pN,{...l,ref:o,style:{...l.style,display:"block"}})})});Py.displayName=Ny;function wN(t){return t!==null}var xN=t=>({name:"transformOrigin",options:t,fn(r){var k,b,T;const{placement:o,rects:a,middlewareData:l}=r,c=((k=l.arrow)==null?void 0:k.centerOffset)!==0,f=c?0:t.arrowWidth,p=c?0:t.arrowHeight,[m,v]=jy(o),w={start:"0%",center:"50%",end:"100%"}[v],S=(((b=l.arrow)==null?void 0:b.x)??0)+f/2,R=(((T=l.arrow)==null?void 0:T.y)??0)+p/2;let C="",E="";return m==="bottom"?(C=c?w:`${S}px`,E=`${-p}px`):m==="top"?(C=c?w:`${S}px`,E=`${a.floating.height+p}px`):m==="right"?(C=`${-p}px`,E=c?w:`${R}px`):m==="left"&&(C=`${a.floating.width+p}px`,E=c?w:`${R}px`),{data:{x:C,y:E}}}});function jy(t){const[r,o="center"]=t.split("-");return[r,o]}var SN=Cy,EN=Ry,CN=by,kN=Py;function RN(t){const r=y.useRef({value:t,previous:t});return y.useMemo(()=>(r.current.value!==t&&(r.current.previous=r.current.value,r.current.value=t),r.current.previous),[t])}var Ty=Object.freeze({position:"absolute",border:0,width:1,height:1,padding:0,margin:-1,overflow:"hidden",clip:"rect(0, 0, 0, 0)",whiteSpace:"nowrap",wordWrap:"normal"}),bN="VisuallyHidden",NN=y.forwardRef((t,r)=>g.jsx(qe.span,{...t,ref:r,style:{...Ty,...t.style}}));NN.displayName=bN;var PN=[" ","Enter","ArrowUp","ArrowDown"],jN=[" ","Enter"],bo="Select",[Ws,Ks,TN]=sy(bo),[bi,GP]=xi(bo,[TN,Sy]),Gs=Sy(),[_N,Yr]=bi(bo),[AN,DN]=bi(bo),_y=t=>{const{__scopeSelect:r,children:o,open:a,defaultOpen:l,onOpenChange:u,value:c,defaultValue:f,onValueChange:p,dir:m,name:v,autoComplete:w,disabled:S,required:R,form:C}=t,E=Gs(r),[k,b]=y.useState(null),[T,P]=y.useState(null),[j,F]=y.useState(!1),_=tf(m),[W,U]=Na({prop:a,defaultProp:l??!1,onChange:u,caller:bo}),[Y,oe]=Na({prop:c,defaultProp:f,onChange:p,caller:bo}),Re=y.useRef(null),Te=k?C||!!k.closest("form"):!0,[ae,le]=y.useState(new Set),Se=Array.from(ae).map(X=>X.props.value).join(";");return g.jsx(SN,{...E,children:g.jsxs(_N,{required:R,scope:r,trigger:k,onTriggerChange:b,valueNode:T,onValueNodeChange:P,valueNodeHasChildren:j,onValueNodeHasChildrenChange:F,contentId:Ur(),value:Y,onValueChange:oe,open:W,onOpenChange:U,dir:_,triggerPointerDownPosRef:Re,disabled:S,children:[g.jsx(Ws.Provider,{scope:r,children:g.jsx(AN,{scope:t.__scopeSelect,onNativeOptionAdd:y.useCallback(X=>{le(ie=>new Set(ie).add(X))},[]),onNativeOptionRemove:y.useCallback(X=>{le(ie=>{const M=new Set(ie);return M.delete(X),M})},[]),children:o})}),Te?g.jsxs(t0,{"aria-hidden":!0,required:R,tabIndex:-1,name:v,autoComplete:w,value:Y,onChange:X=>oe(X.target.value),disabled:S,form:C,children:[Y===void 0?g.jsx("option",{value:""}):null,Array.from(ae)]},Se):null]})})};_y.displayName=bo;var Ay="SelectTrigger",Dy=y.forwardRef((t,r)=>{const{__scopeSelect:o,disabled:a=!1,...l}=t,u=Gs(o),c=Yr(Ay,o),f=c.disabled||a,p=ut(r,c.onTriggerChange),m=Ks(o),v=y.useRef("touch"),[w,S,R]=r0(E=>{const k=m().filter(P=>!P.disabled),b=k.find(P=>P.value===c.value),T=o0(k,E,b);T!==void 0&&c.onValueChange(T.value)}),C=E=>{f||(c.onOpenChange(!0),R()),E&&(c.triggerPointerDownPosRef.current={x:Math.round(E.pageX),y:Math.round(E.pageY)})};return g.jsx(EN,{asChild:!0,...u,children:g.jsx(qe.button,{type:"button",role:"combobox","aria-controls":c.contentId,"aria-expanded":c.open,"aria-required":c.required,"aria-autocomplete":"none",dir:c.dir,"data-state":c.open?"open":"closed",disabled:f,"data-disabled":f?"":void 0,"data-placeholder":n0(c.value)?"":void 0,...l,ref:p,onClick:We(l.onClick,E=>{E.currentTarget.focus(),v.current!=="mouse"&&C(E)}),onPointerDown:We(l.onPointerDown,E=>{v.current=E.pointerType;const k=E.target;k.hasPointerCapture(E.pointerId)&&k.releasePointerCapture(E.pointerId),E.button===0&&E.ctrlKey===!1&&E.pointerType==="mouse"&&(C(E),E.preventDefault())}),onKeyDown:We(l.onKeyDown,E=>{const k=w.current!=="";!(E.ctrlKey||E.altKey||E.metaKey)&&E.key.length===1&&S(E.key),!(k&&E.key===" ")&&PN.includes(E.key)&&(C(),E.preventDefault())})})})});Dy.displayName=Ay;var Oy="SelectValue",Ly=y.forwardRef((t,r)=>{const{__scopeSelect:o,className:a,style:l,children:u,placeholder:c="",...f}=t,p=Yr(Oy,o),{onValueNodeHasChildrenChange:m}=p,v=u!==void 0,w=ut(r,p.onValueNodeChange);return At(()=>{m(v)},[m,v]),g.jsx(qe.span,{...f,ref:w,style:{pointerEvents:"none"},children:n0(p.value)?g.jsx(g.Fragment,{children:c}):u})});Ly.displayName=Oy;var ON="SelectIcon",My=y.forwardRef((t,r)=>{const{__scopeSelect:o,children:a,...l}=t;return g.jsx(qe.span,{"aria-hidden":!0,...l,ref:r,children:a||"▼"})});My.displayName=ON;var LN="SelectPortal",Fy=t=>g.jsx(Qd,{asChild:!0,...t});Fy.displayName=LN;var No="SelectContent",Iy=y.forwardRef((t,r)=>{const o=Yr(No,t.__scopeSelect),[a,l]=y.useState();if(At(()=>{l(new DocumentFragment)},[]),!o.open){const u=a;return u?hi.createPortal(g.jsx(zy,{scope:t.__scopeSelect,children:g.jsx(Ws.Slot,{scope:t.__scopeSelect,children:g.jsx("div",{children:t.children})})}),u):null}return g.jsx(Uy,{...t,ref:r})});Iy.displayName=No;var jn=10,[zy,Qr]=bi(No),MN="SelectContentImpl",FN=di("SelectContent.RemoveScroll"),Uy=y.forwardRef((t,r)=>{const{__scopeSelect:o,position:a="item-aligned",onCloseAutoFocus:l,onEscapeKeyDown:u,onPointerDownOutside:c,side:f,sideOffset:p,align:m,alignOffset:v,arrowPadding:w,collisionBoundary:S,collisionPadding:R,sticky:C,hideWhenDetached:E,avoidCollisions:k,...b}=t,T=Yr(No,o),[P,j]=y.useState(null),[F,_]=y.useState(null),W=ut(r,te=>j(te)),[U,Y]=y.useState(null),[oe,Re]=y.useState(null),Te=Ks(o),[ae,le]=y.useState(!1),Se=y.useRef(!1);y.useEffect(()=>{if(P)return zv(P)},[P]),Tv();const X=y.useCallback(te=>{const[ye,...Ae]=Te().map(Ie=>Ie.ref.current),[ve]=Ae.slice(-1),Le=document.activeElement;for(const Ie of te)if(Ie===Le||(Ie==null||Ie.scrollIntoView({block:"nearest"}),Ie===ye&&F&&(F.scrollTop=0),Ie===ve&&F&&(F.scrollTop=F.scrollHeight),Ie==null||Ie.focus(),document.activeElement!==Le))return},[Te,F]),ie=y.useCallback(()=>X([U,P]),[X,U,P]);y.useEffect(()=>{ae&&ie()},[ae,ie]);const{onOpenChange:M,triggerPointerDownPosRef:ee}=T;y.useEffect(()=>{if(P){let te={x:0,y:0};const ye=ve=>{var Le,Ie;te={x:Math.abs(Math.round(ve.pageX)-(((Le=ee.current)==null?void 0:Le.x)??0)),y:Math.abs(Math.round(ve.pageY)-(((Ie=ee.current)==null?void 0:Ie.y)??0))}},Ae=ve=>{te.x<=10&&te.y<=10?ve.preventDefault():P.contains(ve.target)||M(!1),document.removeEventListener("pointermove",ye),ee.current=null};return ee.current!==null&&(document.addEventListener("pointermove",ye),document.addEventListener("pointerup",Ae,{capture:!0,once:!0})),()=>{document.removeEventListener("pointermove",ye),document.removeEventListener("pointerup",Ae,{capture:!0})}}},[P,M,ee]),y.useEffect(()=>{const te=()=>M(!1);return window.addEventListener("blur",te),window.addEventListener("resize",te),()=>{window.removeEventListener("blur",te),window.removeEventListener("resize",te)}},[M]);const[Q,O]=r0(te=>{const ye=Te().filter(Le=>!Le.disabled),Ae=ye.find(Le=>Le.ref.current===document.activeElement),ve=o0(ye,te,Ae);ve&&setTimeout(()=>ve.ref.current.focus())}),K=y.useCallback((te,ye,Ae)=>{const ve=!Se.current&&!Ae;(T.value!==void 0&&T.value===ye||ve)&&(Y(te),ve&&(Se.current=!0))},[T.value]),se=y.useCallback(()=>P==null?void 0:P.focus(),[P]),ce=y.useCallback((te,ye,Ae)=>{const ve=!Se.current&&!Ae;(T.value!==void 0&&T.value===ye||ve)&&Re(te)},[T.value]),_e=a==="popper"?xd:$y,je=_e===xd?{side:f,sideOffset:p,align:m,alignOffset:v,arrowPadding:w,collisionBoundary:S,collisionPadding:R,sticky:C,hideWhenDetached:E,avoidCollisions:k}:{};return g.jsx(zy,{scope:o,content:P,viewport:F,onViewportChange:_,itemRefCallback:K,selectedItem:U,onItemLeave:se,itemTextRefCallback:ce,focusSelectedItem:ie,selectedItemText:oe,position:a,isPositioned:ae,searchRef:Q,children:g.jsx(Xd,{as:FN,allowPinchZoom:!0,children:g.jsx(Yd,{asChild:!0,trapped:T.open,onMountAutoFocus:te=>{te.preventDefault()},onUnmountAutoFocus:We(l,te=>{var ye;(ye=T.trigger)==null||ye.focus({preventScroll:!0}),te.preventDefault()}),children:g.jsx(qd,{asChild:!0,disableOutsidePointerEvents:!0,onEscapeKeyDown:u,onPointerDownOutside:c,onFocusOutside:te=>te.preventDefault(),onDismiss:()=>T.onOpenChange(!1),children:g.jsx(_e,{role:"listbox",id:T.contentId,"data-state":T.open?"open":"closed",dir:T.dir,onContextMenu:te=>te.preventDefault(),...b,...je,onPlaced:()=>le(!0),ref:W,style:{display:"flex",flexDirection:"column",outline:"none",...b.style},onKeyDown:We(b.onKeyDown,te=>{const ye=te.ctrlKey||te.altKey||te.metaKey;if(te.key==="Tab"&&te.preventDefault(),!ye&&te.key.length===1&&O(te.key),["ArrowUp","ArrowDown","Home","End"].includes(te.key)){let ve=Te().filter(Le=>!Le.disabled).map(Le=>Le.ref.current);if(["ArrowUp","End"].includes(te.key)&&(ve=ve.slice().reverse()),["ArrowUp","ArrowDown"].includes(te.key)){const Le=te.target,Ie=ve.indexOf(Le);ve=ve.slice(Ie+1)}setTimeout(()=>X(ve)),te.preventDefault()}})})})})})})});Uy.displayName=MN;var IN="SelectItemAlignedPosition",$y=y.forwardRef((t,r)=>{const{__scopeSelect:o,onPlaced:a,...l}=t,u=Yr(No,o),c=Qr(No,o),[f,p]=y.useState(null),[m,v]=y.useState(null),w=ut(r,W=>v(W)),S=Ks(o),R=y.useRef(!1),C=y.useRef(!0),{viewport:E,selectedItem:k,selectedItemText:b,focusSelectedItem:T}=c,P=y.useCallback(()=>{if(u.trigger&&u.valueNode&&f&&m&&E&&k&&b){const W=u.trigger.getBoundingClientRect(),U=m.getBoundingClientRect(),Y=u.valueNode.getBoundingClientRect(),oe=b.getBoundingClientRect();if(u.dir!=="rtl"){const Le=oe.left-U.left,Ie=Y.left-Le,ht=W.left-Ie,it=W.width+ht,Mn=Math.max(it,U.width),Fn=window.innerWidth-jn,un=Gm(Ie,[jn,Math.max(jn,Fn-Mn)]);f.style.minWidth=it+"px",f.style.left=un+"px"}else{const Le=U.right-oe.right,Ie=window.innerWidth-Y.right-Le,ht=window.innerWidth-W.right-Ie,it=W.width+ht,Mn=Math.max(it,U.width),Fn=window.innerWidth-jn,un=Gm(Ie,[jn,Math.max(jn,Fn-Mn)]);f.style.minWidth=it+"px",f.style.right=un+"px"}const Re=S(),Te=window.innerHeight-jn*2,ae=E.scrollHeight,le=window.getComputedStyle(m),Se=parseInt(le.borderTopWidth,10),X=parseInt(le.paddingTop,10),ie=parseInt(le.borderBottomWidth,10),M=parseInt(le.paddingBottom,10),ee=Se+X+ae+M+ie,Q=Math.min(k.offsetHeight*5,ee),O=window.getComputedStyle(E),K=parseInt(O.paddingTop,10),se=parseInt(O.paddingBottom,10),ce=W.top+W.height/2-jn,_e=Te-ce,je=k.offsetHeight/2,te=k.offsetTop+je,ye=Se+X+te,Ae=ee-ye;if(ye<=ce){const Le=Re.length>0&&k===Re[Re.length-1].ref.current;f.style.bottom="0px";const Ie=m.clientHeight-E.offsetTop-E.offsetHeight,ht=Math.max(_e,je+(Le?se:0)+Ie+ie),it=ye+ht;f.style.height=it+"px"}else{const Le=Re.length>0&&k===Re[0].ref.current;f.style.top="0px";const ht=Math.max(ce,Se+E.offsetTop+(Le?K:0)+je)+Ae;f.style.height=ht+"px",E.scrollTop=ye-ce+E.offsetTop}f.style.margin=`${jn}px 0`,f.style.minHeight=Q+"px",f.style.maxHeight=Te+"px",a==null||a(),requestAnimationFrame(()=>R.current=!0)}},[S,u.trigger,u.valueNode,f,m,E,k,b,u.dir,a]);At(()=>P(),[P]);const[j,F]=y.useState();At(()=>{m&&F(window.getComputedStyle(m).zIndex)},[m]);const _=y.useCallback(W=>{W&&C.current===!0&&(P(),T==null||T(),C.current=!1)},[P,T]);return g.jsx(UN,{scope:o,contentWrapper:f,shouldExpandOnScrollRef:R,onScrollButtonChange:_,children:g.jsx("div",{ref:p,style:{display:"flex",flexDirection:"column",position:"fixed",zIndex:j},children:g.jsx(qe.div,{...l,ref:w,style:{boxSizing:"border-box",maxHeight:"100%",...l.style}})})})});$y.displayName=IN;var zN="SelectPopperPosition",xd=y.forwardRef((t,r)=>{const{__scopeSelect:o,align:a="start",collisionPadding:l=jn,...u}=t,c=Gs(o);return g.jsx(CN,{...c,...u,ref:r,align:a,collisionPadding:l,style:{boxSizing:"border-box",...u.style,"--radix-select-content-transform-origin":"var(--radix-popper-transform-origin)","--radix-select-content-available-width":"var(--radix-popper-available-width)","--radix-select-content-available-height":"var(--radix-popper-available-height)","--radix-select-trigger-width":"var(--radix-popper-anchor-width)","--radix-select-trigger-height":"var(--radix-popper-anchor-height)"}})});xd.displayName=zN;var[UN,ff]=bi(No,{}),Sd="SelectViewport",By=y.forwardRef((t,r)=>{const{__scopeSelect:o,nonce:a,...l}=t,u=Qr(Sd,o),c=ff(Sd,o),f=ut(r,u.onViewportChange),p=y.useRef(0);return g.jsxs(g.Fragment,{children:[g.jsx("style",{dangerouslySetInnerHTML:{__html:"[data-radix-select-viewport]{scrollbar-width:none;-ms-overflow-style:none;-webkit-overflow-scrolling:touch;}[data-radix-select-viewport]::-webkit-scrollbar{display:none}"},nonce:a}),g.jsx(Ws.Slot,{scope:o,children:g.jsx(qe.div,{"data-radix-select-viewport":"",role:"presentation",...l,ref:f,style:{position:"relative",flex:1,overflow:"hidden auto",...l.style},onScroll:We(l.onScroll,m=>{const v=m.currentTarget,{contentWrapper:w,shouldExpandOnScrollRef:S}=c;if(S!=null&&S.current&&w){const R=Math.abs(p.current-v.scrollTop);if(R>0){const C=window.innerHeight-jn*2,E=parseFloat(w.style.minHeight),k=parseFloat(w.style.height),b=Math.max(E,k);if(b<C){const T=b+R,P=Math.min(C,T),j=T-P;w.style.height=P+"px",w.style.bottom==="0px"&&(v.scrollTop=j>0?j:0,w.style.justifyContent="flex-end")}}}p.current=v.scrollTop})})})]})});By.displayName=Sd;var Hy="SelectGroup",[$N,BN]=bi(Hy),HN=y.forwardRef((t,r)=>{const{__scopeSelect:o,...a}=t,l=Ur();return g.jsx($N,{scope:o,id:l,children:g.jsx(qe.div,{role:"group","aria-labelledby":l,...a,ref:r})})});HN.displayName=Hy;var Vy="SelectLabel",Wy=y.forwardRef((t,r)=>{const{__scopeSelect:o,...a}=t,l=BN(Vy,o);return g.jsx(qe.div,{id:l.id,...a,ref:r})});Wy.displayName=Vy;var Es="SelectItem",[VN,Ky]=bi(Es),Gy=y.forwardRef((t,r)=>{const{__scopeSelect:o,value:a,disabled:l=!1,textValue:u,...c}=t,f=Yr(Es,o),p=Qr(Es,o),m=f.value===a,[v,w]=y.useState(u??""),[S,R]=y.useState(!1),C=ut(r,T=>{var P;return(P=p.itemRefCallback)==null?void 0:P.call(p,T,a,l)}),E=Ur(),k=y.useRef("touch"),b=()=>{l||(f.onValueChange(a),f.onOpenChange(!1))};if(a==="")throw new Error("A <Select.Item /> must have a value prop that is not an empty string. This is because the Select value can be set to an empty string to clear the selection and show the placeholder.");return g.jsx(VN,{scope:o,value:a,disabled:l,textId:E,isSelected:m,onItemTextChange:y.useCallback(T=>{w(P=>P||((T==null?void 0:T.textContent)??"").trim())},[]),children:g.jsx(Ws.ItemSlot,{scope:o,value:a,disabled:l,textValue:v,children:g.jsx(qe.div,{role:"option","aria-labelledby":E,"data-highlighted":S?"":void 0,"aria-selected":m&&S,"data-state":m?"checked":"unchecked","aria-disabled":l||void 0,"data-disabled":l?"":void 0,tabIndex:l?void 0:-1,...c,ref:C,onFocus:We(c.onFocus,()=>R(!0)),onBlur:We(c.onBlur,()=>R(!1)),onClick:We(c.onClick,()=>{k.current!=="mouse"&&b()}),onPointerUp:We(c.onPointerUp,()=>{k.current==="mouse"&&b()}),onPointerDown:We(c.onPointerDown,T=>{k.current=T.pointerType}),onPointerMove:We(c.onPointerMove,T=>{var P;k.current=T.pointerType,l?(P=p.onItemLeave)==null||P.call(p):k.current==="mouse"&&T.currentTarget.focus({preventScroll:!0})}),onPointerLeave:We(c.onPointerLeave,T=>{var P;T.currentTarget===document.activeElement&&((P=p.onItemLeave)==null||P.call(p))}),onKeyDown:We(c.onKeyDown,T=>{var j;((j=p.searchRef)==null?void 0:j.current)!==""&&T.key===" "||(jN.includes(T.key)&&b(),T.key===" "&&T.preventDefault())})})})})});Gy.displayName=Es;var Ea="SelectItemText",qy=y.forwardRef((t,r)=>{const{__scopeSelect:o,className:a,style:l,...u}=t,c=Yr(Ea,o),f=Qr(Ea,o),p=Ky(Ea,o),m=DN(Ea,o),[v,w]=y.useState(null),S=ut(r,b=>w(b),p.onItemTextChange,b=>{var T;return(T=f.itemTextRefCallback)==null?void 0:T.call(f,b,p.value,p.disabled)}),R=v==null?void 0:v.textContent,C=y.useMemo(()=>g.jsx("option",{value:p.value,disabled:p.disabled,children:R},p.value),[p.disabled,p.value,R]),{onNativeOptionAdd:E,onNativeOptionRemove:k}=m;return At(()=>(E(C),()=>k(C)),[E,k,C]),g.jsxs(g.Fragment,{children:[g.jsx(qe.span,{id:p.textId,...u,ref:S}),p.isSelected&&c.valueNode&&!c.valueNodeHasChildren?hi.createPortal(u.children,c.valueNode):null]})});qy.displayName=Ea;var Yy="SelectItemIndicator",Qy=y.forwardRef((t,r)=>{const{__scopeSelect:o,...a}=t;return Ky(Yy,o).isSelected?g.jsx(qe.span,{"aria-hidden":!0,...a,ref:r}):null});Qy.displayName=Yy;var Ed="SelectScrollUpButton",Xy=y.forwardRef((t,r)=>{const o=Qr(Ed,t.__scopeSelect),a=ff(Ed,t.__scopeSelect),[l,u]=y.useState(!1),c=ut(r,a.onScrollButtonChange);return At(()=>{if(o.viewport&&o.isPositioned){let f=function(){const m=p.scrollTop>0;u(m)};const p=o.viewport;return f(),p.addEventListener("scroll",f),()=>p.removeEventListener("scroll",f)}},[o.viewport,o.isPositioned]),l?g.jsx(Zy,{...t,ref:c,onAutoScroll:()=>{const{viewport:f,selectedItem:p}=o;f&&p&&(f.scrollTop=f.scrollTop-p.offsetHeight)}}):null});Xy.displayName=Ed;var Cd="SelectScrollDownButton",Jy=y.forwardRef((t,r)=>{const o=Qr(Cd,t.__scopeSelect),a=ff(Cd,t.__scopeSelect),[l,u]=y.useState(!1),c=ut(r,a.onScrollButtonChange);return At(()=>{if(o.viewport&&o.isPositioned){let f=function(){const m=p.scrollHeight-p.clientHeight,v=Math.ceil(p.scrollTop)<m;u(v)};const p=o.viewport;return f(),p.addEventListener("scroll",f),()=>p.removeEventListener("scroll",f)}},[o.viewport,o.isPositioned]),l?g.jsx(Zy,{...t,ref:c,onAutoScroll:()=>{const{viewport:f,selectedItem:p}=o;f&&p&&(f.scrollTop=f.scrollTop+p.offsetHeight)}}):null});Jy.displayName=Cd;var Zy=y.forwardRef((t,r)=>{const{__scopeSelect:o,onAutoScroll:a,...l}=t,u=Qr("SelectScrollButton",o),c=y.useRef(null),f=Ks(o),p=y.useCallback(()=>{c.current!==null&&(window.clearInterval(c.current),c.current=null)},[]);return y.useEffect(()=>()=>p(),[p]),At(()=>{var v;const m=f().find(w=>w.ref.current===document.activeElement);(v=m==null?void 0:m.ref.current)==null||v.scrollIntoView({block:"nearest"})},[f]),g.jsx(qe.div,{"aria-hidden":!0,...l,ref:r,style:{flexShrink:0,...l.style},onPointerDown:We(l.onPointerDown,()=>{c.current===null&&(c.current=window.setInterval(a,50))}),onPointerMove:We(l.onPointerMove,()=>{var m;(m=u.onItemLeave)==null||m.call(u),c.current===null&&(c.current=window.setInterval(a,50))}),onPointerLeave:We(l.onPointerLeave,()=>{p()})})}),WN="SelectSeparator",e0=y.forwardRef((t,r)=>{const{__scopeSelect:o,...a}=t;return g.jsx(qe.div,{"aria-hidden":!0,...a,ref:r})});e0.displayName=WN;var kd="SelectArrow",KN=y.forwardRef((t,r)=>{const{__scopeSelect:o,...a}=t,l=Gs(o),u=Yr(kd,o),c=Qr(kd,o);return u.open&&c.position==="popper"?g.jsx(kN,{...l,...a,ref:r}):null});KN.displayName=kd;var GN="SelectBubbleInput",t0=y.forwardRef(({__scopeSelect:t,value:r,...o},a)=>{const l=y.useRef(null),u=ut(a,l),c=RN(r);return y.useEffect(()=>{const f=l.current;if(!f)return;const p=window.HTMLSelectElement.prototype,v=Object.getOwnPropertyDescriptor(p,"value").set;if(c!==r&&v){const w=new Event("change",{bubbles:!0});v.call(f,r),f.dispatchEvent(w)}},[c,r]),g.jsx(qe.select,{...o,style:{...Ty,...o.style},ref:u,defaultValue:r})});t0.displayName=GN;function n0(t){return t===""||t===void 0}function r0(t){const r=Hr(t),o=y.useRef(""),a=y.useRef(0),l=y.useCallback(c=>{const f=o.current+c;r(f),function p(m){o.current=m,window.clearTimeout(a.current),m!==""&&(a.current=window.setTimeout(()=>p(""),1e3))}(f)},[r]),u=y.useCallback(()=>{o.current="",window.clearTimeout(a.current)},[]);return y.useEffect(()=>()=>window.clearTimeout(a.current),[]),[o,l,u]}function o0(t,r,o){const l=r.length>1&&Array.from(r).every(m=>m===r[0])?r[0]:r,u=o?t.indexOf(o):-1;let c=qN(t,Math.max(u,0));l.length===1&&(c=c.filter(m=>m!==o));const p=c.find(m=>m.textValue.toLowerCase().startsWith(l.toLowerCase()));return p!==o?p:void 0}function qN(t,r){return t.map((o,a)=>t[(r+a)%t.length])}var YN=_y,i0=Dy,QN=Ly,XN=My,JN=Fy,a0=Iy,ZN=By,l0=Wy,s0=Gy,eP=qy,tP=Qy,u0=Xy,c0=Jy,d0=e0;const Rd=YN,bd=QN,Cs=y.forwardRef(({className:t,children:r,...o},a)=>g.jsxs(i0,{ref:a,className:Qe("flex h-9 w-full items-center justify-between whitespace-nowrap rounded-md border border-zinc-200 bg-transparent px-3 py-2 text-sm shadow-sm ring-offset-white data-[placeholder]:text-zinc-500 focus:outline-none focus:ring-1 focus:ring-zinc-950 disabled:cursor-not-allowed disabled:opacity-50 [&>span]:line-clamp-1 dark:border-zinc-800 dark:ring-offset-zinc-950 dark:data-[placeholder]:text-zinc-400 dark:focus:ring-zinc-300",t),...o,children:[r,g.jsx(XN,{asChild:!0,children:g.jsx(yv,{className:"h-4 w-4 opacity-50"})})]}));Cs.displayName=i0.displayName;const f0=y.forwardRef(({className:t,...r},o)=>g.jsx(u0,{ref:o,className:Qe("flex cursor-default items-center justify-center py-1",t),...r,children:g.jsx(wk,{className:"h-4 w-4"})}));f0.displayName=u0.displayName;const p0=y.forwardRef(({className:t,...r},o)=>g.jsx(c0,{ref:o,className:Qe("flex cursor-default items-center justify-center py-1",t),...r,children:g.jsx(yv,{className:"h-4 w-4"})}));p0.displayName=c0.displayName;const ks=y.forwardRef(({className:t,children:r,position:o="popper",...a},l)=>g.jsx(JN,{children:g.jsxs(a0,{ref:l,className:Qe("relative z-50 max-h-[--radix-select-content-available-height] min-w-[8rem] overflow-y-auto overflow-x-hidden rounded-md border border-zinc-200 bg-white text-zinc-950 shadow-md data-[state=open]:animate-in data-[state=closed]:animate-out data-[state=closed]:fade-out-0 data-[state=open]:fade-in-0 data-[state=closed]:zoom-out-95 data-[state=open]:zoom-in-95 data-[side=bottom]:slide-in-from-top-2 data-[side=left]:slide-in-from-right-2 data-[side=right]:slide-in-from-left-2 data-[side=top]:slide-in-from-bottom-2 origin-[--radix-select-content-transform-origin] dark:border-zinc-800 dark:bg-zinc-950 dark:text-zinc-50",o==="popper"&&"data-[side=bottom]:translate-y-1 data-[side=left]:-translate-x-1 data-[side=right]:translate-x-1 data-[side=top]:-translate-y-1",t),position:o,...a,children:[g.jsx(f0,{}),g.jsx(ZN,{className:Qe("p-1",o==="popper"&&"h-[var(--radix-select-trigger-height)] w-full min-w-[var(--radix-select-trigger-width)]"),children:r}),g.jsx(p0,{})]})}));ks.displayName=a0.displayName;const nP=y.forwardRef(({className:t,...r},o)=>g.jsx(l0,{ref:o,className:Qe("px-2 py-1.5 text-sm font-semibold",t),...r}));nP.displayName=l0.displayName;const Ca=y.forwardRef(({className:t,children:r,...o},a)=>g.jsxs(s0,{ref:a,className:Qe("relative flex w-full cursor-default select-none items-center rounded-sm py-1.5 pl-2 pr-8 text-sm outline-none focus:bg-zinc-100 focus:text-zinc-900 data-[disabled]:pointer-events-none data-[disabled]:opacity-50 dark:focus:bg-zinc-800 dark:focus:text-zinc-50",t),...o,children:[g.jsx("span",{className:"absolute right-2 flex h-3.5 w-3.5 items-center justify-center",children:g.jsx(tP,{children:g.jsx(vv,{className:"h-4 w-4"})})}),g.jsx(eP,{children:r})]}));Ca.displayName=s0.displayName;const rP=y.forwardRef(({className:t,...r},o)=>g.jsx(d0,{ref:o,className:Qe("-mx-1 my-1 h-px bg-zinc-100 dark:bg-zinc-800",t),...r}));rP.displayName=d0.displayName;const oP=()=>{const[t,r]=y.useState([]),[o,a]=y.useState([]),[l,u]=y.useState(!0),[c,f]=y.useState(null),[p,m]=y.useState(""),[v,w]=y.useState(!1),[S,R]=y.useState(null);y.useEffect(()=>{C(),E()},[S]);const C=async()=>{try{u(!0);const j=await mC(S||void 0);r(j)}catch(j){console.error("Error fetching documents:",j)}finally{u(!1)}},E=async()=>{try{const F=await Hd();a(F),F.length>0&&!p&&m(F[0].id)}catch(j){console.error("Error fetching folders:",j)}},k=j=>{j.target.files&&j.target.files.length>0&&f(j.target.files[0])},b=async()=>{if(!(!c||!p))try{await gC(c,p),f(null),w(!1),C()}catch(j){console.error("Error uploading document:",j)}},T=async j=>{try{await vC(j),C()}catch(F){console.error("Error deleting document:",F)}},P=j=>{if(j===0)return"0 Bytes";const F=1024,_=["Bytes","KB","MB","GB"],W=Math.floor(Math.log(j)/Math.log(F));return parseFloat((j/Math.pow(F,W)).toFixed(2))+" "+_[W]};return g.jsxs("div",{className:"space-y-6",children:[g.jsxs("div",{className:"flex justify-between items-center",children:[g.jsxs("div",{children:[g.jsx("h1",{className:"text-3xl font-bold",children:"Documents"}),g.jsx("p",{className:"text-gray-500 mt-1",children:"Manage your documents"})]}),g.jsxs(La,{open:v,onOpenChange:w,children:[g.jsx($s,{asChild:!0,children:g.jsxs(Be,{children:[g.jsx(Fs,{className:"mr-2 h-4 w-4"}),"Upload Document"]})}),g.jsxs(Si,{children:[g.jsx(Ei,{children:g.jsx(Ci,{children:"Upload New Document"})}),g.jsxs("div",{className:"grid gap-4 py-4",children:[g.jsxs("div",{className:"grid gap-2",children:[g.jsx(Mt,{htmlFor:"folder",children:"Select Folder"}),g.jsxs(Rd,{value:p,onValueChange:m,children:[g.jsx(Cs,{children:g.jsx(bd,{placeholder:"Select a folder"})}),g.jsx(ks,{children:o.map(j=>g.jsx(Ca,{value:j.id,children:j.name},j.id))})]})]}),g.jsxs("div",{className:"grid gap-2",children:[g.jsx(Mt,{htmlFor:"file",children:"Document File"}),g.jsx(vn,{id:"file",type:"file",onChange:k})]})]}),g.jsx(Be,{onClick:b,disabled:!c||!p,children:"Upload Document"})]})]})]}),g.jsxs("div",{className:"grid gap-4",children:[g.jsx(Mt,{children:"Filter by Folder"}),g.jsxs(Rd,{value:S||"all",onValueChange:j=>R(j==="all"?null:j),children:[g.jsx(Cs,{children:g.jsx(bd,{placeholder:"All Folders"})}),g.jsxs(ks,{children:[g.jsx(Ca,{value:"all",children:"All Folders"}),o.map(j=>g.jsx(Ca,{value:j.id,children:j.name},j.id))]})]})]}),l?g.jsx("div",{className:"text-center py-10",children:"Loading documents..."}):t.length===0?g.jsx("div",{className:"text-center py-10 text-gray-500",children:"No documents found. Upload a document to get started."}):g.jsx("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-4",children:t.map(j=>g.jsxs(Gt,{className:"overflow-hidden",children:[g.jsx(qt,{className:"pb-2",children:g.jsxs(Yt,{className:"flex items-center text-base",children:[g.jsx(xv,{className:"mr-2 h-5 w-5 text-blue-500"}),j.name]})}),g.jsxs(Qt,{children:[g.jsxs("div",{className:"text-sm text-gray-500 space-y-1",children:[g.jsxs("p",{children:["Size: ",P(j.file_size)]}),g.jsxs("p",{children:["Type: ",j.file_type]}),g.jsxs("p",{children:["Created: ",new Date(j.created_at).toLocaleDateString()]})]}),g.jsxs("div",{className:"flex space-x-2 mt-4",children:[g.jsx(Be,{variant:"outline",size:"sm",asChild:!0,children:g.jsxs("a",{href:`http://localhost:8000${j.file_path.replace("uploads","/uploads")}`,target:"_blank",rel:"noopener noreferrer",children:[g.jsx(Ek,{className:"mr-1 h-4 w-4"}),"Download"]})}),g.jsxs(Be,{variant:"outline",size:"sm",onClick:()=>T(j.id),children:[g.jsx(Is,{className:"mr-1 h-4 w-4"}),"Delete"]})]})]})]},j.id))})]})},qs=y.forwardRef(({className:t,...r},o)=>g.jsx("textarea",{className:Qe("flex min-h-[60px] w-full rounded-md border border-zinc-200 bg-transparent px-3 py-2 text-base shadow-sm placeholder:text-zinc-500 focus-visible:outline-none focus-visible:ring-1 focus-visible:ring-zinc-950 disabled:cursor-not-allowed disabled:opacity-50 md:text-sm dark:border-zinc-800 dark:placeholder:text-zinc-400 dark:focus-visible:ring-zinc-300",t),ref:o,...r}));qs.displayName="Textarea";const iP=()=>{const[t,r]=y.useState([]),[o,a]=y.useState([]),[l,u]=y.useState(!0),[c,f]=y.useState(""),[p,m]=y.useState(""),[v,w]=y.useState(""),[S,R]=y.useState(!1),C=qr();y.useEffect(()=>{E(),k()},[]);const E=async()=>{try{u(!0);const j=await yC();r(j)}catch(j){console.error("Error fetching approval forms:",j)}finally{u(!1)}},k=async()=>{try{const F=await Hd();a(F),F.length>0&&!v&&w(F[0].id)}catch(j){console.error("Error fetching folders:",j)}},b=async()=>{if(c.trim())try{await wC({name:c,description:p,fields:[],target_folder_id:v||null}),f(""),m(""),R(!1),E()}catch(j){console.error("Error creating approval form:",j)}},T=async j=>{try{await xC(j),E()}catch(F){console.error("Error deleting approval form:",F)}},P=j=>{C(`/approval-forms/${j}`)};return g.jsxs("div",{className:"space-y-6",children:[g.jsxs("div",{className:"flex justify-between items-center",children:[g.jsxs("div",{children:[g.jsx("h1",{className:"text-3xl font-bold",children:"Approval Forms"}),g.jsx("p",{className:"text-gray-500 mt-1",children:"Manage your approval forms"})]}),g.jsxs(La,{open:S,onOpenChange:R,children:[g.jsx($s,{asChild:!0,children:g.jsxs(Be,{children:[g.jsx(Fs,{className:"mr-2 h-4 w-4"}),"New Form"]})}),g.jsxs(Si,{children:[g.jsx(Ei,{children:g.jsx(Ci,{children:"Create New Approval Form"})}),g.jsxs("div",{className:"grid gap-4 py-4",children:[g.jsxs("div",{className:"grid gap-2",children:[g.jsx(Mt,{htmlFor:"name",children:"Form Name"}),g.jsx(vn,{id:"name",value:c,onChange:j=>f(j.target.value),placeholder:"Enter form name"})]}),g.jsxs("div",{className:"grid gap-2",children:[g.jsx(Mt,{htmlFor:"description",children:"Description"}),g.jsx(qs,{id:"description",value:p,onChange:j=>m(j.target.value),placeholder:"Enter form description"})]}),g.jsxs("div",{className:"grid gap-2",children:[g.jsx(Mt,{htmlFor:"folder",children:"Target Folder (for approved documents)"}),g.jsxs(Rd,{value:v,onValueChange:w,children:[g.jsx(Cs,{children:g.jsx(bd,{placeholder:"Select a folder"})}),g.jsx(ks,{children:o.map(j=>g.jsx(Ca,{value:j.id,children:j.name},j.id))})]})]})]}),g.jsx(Be,{onClick:b,disabled:!c.trim(),children:"Create Form"})]})]})]}),l?g.jsx("div",{className:"text-center py-10",children:"Loading approval forms..."}):t.length===0?g.jsx("div",{className:"text-center py-10 text-gray-500",children:"No approval forms found. Create a new form to get started."}):g.jsx("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-4",children:t.map(j=>g.jsxs(Gt,{children:[g.jsxs(qt,{children:[g.jsxs(Yt,{className:"flex items-center",children:[g.jsx(Sk,{className:"mr-2 h-5 w-5 text-blue-500"}),j.name]}),g.jsx(Br,{children:j.description})]}),g.jsx(Qt,{children:g.jsxs("div",{className:"text-sm text-gray-500",children:[g.jsxs("p",{children:["Fields: ",j.fields.length]}),g.jsxs("p",{children:["Created: ",new Date(j.created_at).toLocaleDateString()]})]})}),g.jsxs(wi,{className:"flex justify-end space-x-2",children:[g.jsxs(Be,{variant:"outline",size:"sm",onClick:()=>P(j.id),children:[g.jsx(Cv,{className:"mr-1 h-4 w-4"}),"Edit"]}),g.jsxs(Be,{variant:"outline",size:"sm",onClick:()=>T(j.id),children:[g.jsx(Is,{className:"mr-1 h-4 w-4"}),"Delete"]})]})]},j.id))})]})},aP=()=>{const[t,r]=y.useState([]),[o,a]=y.useState([]),[l,u]=y.useState(!0),[c,f]=y.useState(""),[p,m]=y.useState(""),[v,w]=y.useState(!1),S=qr();y.useEffect(()=>{R(),C()},[]);const R=async()=>{try{u(!0);const P=await SC();r(P)}catch(P){console.error("Error fetching approval routes:",P)}finally{u(!1)}},C=async()=>{try{const P=await pC();a(P)}catch(P){console.error("Error fetching users:",P)}},E=async()=>{if(c.trim())try{await EC({name:c,description:p,steps:[]}),f(""),m(""),w(!1),R()}catch(P){console.error("Error creating approval route:",P)}},k=async P=>{try{await CC(P),R()}catch(j){console.error("Error deleting approval route:",j)}},b=P=>{S(`/approval-routes/${P}`)},T=P=>{const j=o.find(F=>F.id===P);return j?j.full_name||j.username:"Unknown User"};return g.jsxs("div",{className:"space-y-6",children:[g.jsxs("div",{className:"flex justify-between items-center",children:[g.jsxs("div",{children:[g.jsx("h1",{className:"text-3xl font-bold",children:"Approval Routes"}),g.jsx("p",{className:"text-gray-500 mt-1",children:"Manage your approval workflows"})]}),g.jsxs(La,{open:v,onOpenChange:w,children:[g.jsx($s,{asChild:!0,children:g.jsxs(Be,{children:[g.jsx(Fs,{className:"mr-2 h-4 w-4"}),"New Route"]})}),g.jsxs(Si,{children:[g.jsx(Ei,{children:g.jsx(Ci,{children:"Create New Approval Route"})}),g.jsxs("div",{className:"grid gap-4 py-4",children:[g.jsxs("div",{className:"grid gap-2",children:[g.jsx(Mt,{htmlFor:"name",children:"Route Name"}),g.jsx(vn,{id:"name",value:c,onChange:P=>f(P.target.value),placeholder:"Enter route name"})]}),g.jsxs("div",{className:"grid gap-2",children:[g.jsx(Mt,{htmlFor:"description",children:"Description"}),g.jsx(qs,{id:"description",value:p,onChange:P=>m(P.target.value),placeholder:"Enter route description"})]})]}),g.jsx(Be,{onClick:E,disabled:!c.trim(),children:"Create Route"})]})]})]}),l?g.jsx("div",{className:"text-center py-10",children:"Loading approval routes..."}):t.length===0?g.jsx("div",{className:"text-center py-10 text-gray-500",children:"No approval routes found. Create a new route to get started."}):g.jsx("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-4",children:t.map(P=>g.jsxs(Gt,{children:[g.jsxs(qt,{children:[g.jsxs(Yt,{className:"flex items-center",children:[g.jsx(Sv,{className:"mr-2 h-5 w-5 text-blue-500"}),P.name]}),g.jsx(Br,{children:P.description})]}),g.jsxs(Qt,{children:[g.jsxs("div",{className:"text-sm text-gray-500",children:[g.jsxs("p",{children:["Steps: ",P.steps.length]}),g.jsxs("p",{children:["Created: ",new Date(P.created_at).toLocaleDateString()]})]}),P.steps.length>0&&g.jsxs("div",{className:"mt-4",children:[g.jsx("h4",{className:"text-sm font-medium mb-2",children:"Approval Flow:"}),g.jsx("div",{className:"space-y-2",children:P.steps.map((j,F)=>g.jsxs("div",{className:"flex items-center",children:[g.jsx("div",{className:"w-6 h-6 rounded-full bg-blue-100 text-blue-600 flex items-center justify-center text-xs font-medium",children:j.step_number}),g.jsx("div",{className:"ml-2",children:T(j.approver_id)})]},F))})]})]}),g.jsxs(wi,{className:"flex justify-end space-x-2",children:[g.jsxs(Be,{variant:"outline",size:"sm",onClick:()=>b(P.id),children:[g.jsx(Cv,{className:"mr-1 h-4 w-4"}),"Edit"]}),g.jsxs(Be,{variant:"outline",size:"sm",onClick:()=>k(P.id),children:[g.jsx(Is,{className:"mr-1 h-4 w-4"}),"Delete"]})]})]},P.id))})]})};var td="rovingFocusGroup.onEntryFocus",lP={bubbles:!1,cancelable:!0},Fa="RovingFocusGroup",[Nd,h0,sP]=sy(Fa),[uP,m0]=xi(Fa,[sP]),[cP,dP]=uP(Fa),g0=y.forwardRef((t,r)=>g.jsx(Nd.Provider,{scope:t.__scopeRovingFocusGroup,children:g.jsx(Nd.Slot,{scope:t.__scopeRovingFocusGroup,children:g.jsx(fP,{...t,ref:r})})}));g0.displayName=Fa;var fP=y.forwardRef((t,r)=>{const{__scopeRovingFocusGroup:o,orientation:a,loop:l=!1,dir:u,currentTabStopId:c,defaultCurrentTabStopId:f,onCurrentTabStopIdChange:p,onEntryFocus:m,preventScrollOnEntryFocus:v=!1,...w}=t,S=y.useRef(null),R=ut(r,S),C=tf(u),[E,k]=Na({prop:c,defaultProp:f??null,onChange:p,caller:Fa}),[b,T]=y.useState(!1),P=Hr(m),j=h0(o),F=y.useRef(!1),[_,W]=y.useState(0);return y.useEffect(()=>{const U=S.current;if(U)return U.addEventListener(td,P),()=>U.removeEventListener(td,P)},[P]),g.jsx(cP,{scope:o,orientation:a,dir:C,loop:l,currentTabStopId:E,onItemFocus:y.useCallback(U=>k(U),[k]),onItemShiftTab:y.useCallback(()=>T(!0),[]),onFocusableItemAdd:y.useCallback(()=>W(U=>U+1),[]),onFocusableItemRemove:y.useCallback(()=>W(U=>U-1),[]),children:g.jsx(qe.div,{tabIndex:b||_===0?-1:0,"data-orientation":a,...w,ref:R,style:{outline:"none",...t.style},onMouseDown:We(t.onMouseDown,()=>{F.current=!0}),onFocus:We(t.onFocus,U=>{const Y=!F.current;if(U.target===U.currentTarget&&Y&&!b){const oe=new CustomEvent(td,lP);if(U.currentTarget.dispatchEvent(oe),!oe.defaultPrevented){const Re=j().filter(X=>X.focusable),Te=Re.find(X=>X.active),ae=Re.find(X=>X.id===E),Se=[Te,ae,...Re].filter(Boolean).map(X=>X.ref.current);w0(Se,v)}}F.current=!1}),onBlur:We(t.onBlur,()=>T(!1))})})}),v0="RovingFocusGroupItem",y0=y.forwardRef((t,r)=>{const{__scopeRovingFocusGroup:o,focusable:a=!0,active:l=!1,tabStopId:u,children:c,...f}=t,p=Ur(),m=u||p,v=dP(v0,o),w=v.currentTabStopId===m,S=h0(o),{onFocusableItemAdd:R,onFocusableItemRemove:C,currentTabStopId:E}=v;return y.useEffect(()=>{if(a)return R(),()=>C()},[a,R,C]),g.jsx(Nd.ItemSlot,{scope:o,id:m,focusable:a,active:l,children:g.jsx(qe.span,{tabIndex:w?0:-1,"data-orientation":v.orientation,...f,ref:r,onMouseDown:We(t.onMouseDown,k=>{a?v.onItemFocus(m):k.preventDefault()}),onFocus:We(t.onFocus,()=>v.onItemFocus(m)),onKeyDown:We(t.onKeyDown,k=>{if(k.key==="Tab"&&k.shiftKey){v.onItemShiftTab();return}if(k.target!==k.currentTarget)return;const b=mP(k,v.orientation,v.dir);if(b!==void 0){if(k.metaKey||k.ctrlKey||k.altKey||k.shiftKey)return;k.preventDefault();let P=S().filter(j=>j.focusable).map(j=>j.ref.current);if(b==="last")P.reverse();else if(b==="prev"||b==="next"){b==="prev"&&P.reverse();const j=P.indexOf(k.currentTarget);P=v.loop?gP(P,j+1):P.slice(j+1)}setTimeout(()=>w0(P))}}),children:typeof c=="function"?c({isCurrentTabStop:w,hasTabStop:E!=null}):c})})});y0.displayName=v0;var pP={ArrowLeft:"prev",ArrowUp:"prev",ArrowRight:"next",ArrowDown:"next",PageUp:"first",Home:"first",PageDown:"last",End:"last"};function hP(t,r){return r!=="rtl"?t:t==="ArrowLeft"?"ArrowRight":t==="ArrowRight"?"ArrowLeft":t}function mP(t,r,o){const a=hP(t.key,o);if(!(r==="vertical"&&["ArrowLeft","ArrowRight"].includes(a))&&!(r==="horizontal"&&["ArrowUp","ArrowDown"].includes(a)))return pP[a]}function w0(t,r=!1){const o=document.activeElement;for(const a of t)if(a===o||(a.focus({preventScroll:r}),document.activeElement!==o))return}function gP(t,r){return t.map((o,a)=>t[(r+a)%t.length])}var vP=g0,yP=y0,Ys="Tabs",[wP,qP]=xi(Ys,[m0]),x0=m0(),[xP,pf]=wP(Ys),S0=y.forwardRef((t,r)=>{const{__scopeTabs:o,value:a,onValueChange:l,defaultValue:u,orientation:c="horizontal",dir:f,activationMode:p="automatic",...m}=t,v=tf(f),[w,S]=Na({prop:a,onChange:l,defaultProp:u??"",caller:Ys});return g.jsx(xP,{scope:o,baseId:Ur(),value:w,onValueChange:S,orientation:c,dir:v,activationMode:p,children:g.jsx(qe.div,{dir:v,"data-orientation":c,...m,ref:r})})});S0.displayName=Ys;var E0="TabsList",C0=y.forwardRef((t,r)=>{const{__scopeTabs:o,loop:a=!0,...l}=t,u=pf(E0,o),c=x0(o);return g.jsx(vP,{asChild:!0,...c,orientation:u.orientation,dir:u.dir,loop:a,children:g.jsx(qe.div,{role:"tablist","aria-orientation":u.orientation,...l,ref:r})})});C0.displayName=E0;var k0="TabsTrigger",R0=y.forwardRef((t,r)=>{const{__scopeTabs:o,value:a,disabled:l=!1,...u}=t,c=pf(k0,o),f=x0(o),p=P0(c.baseId,a),m=j0(c.baseId,a),v=a===c.value;return g.jsx(yP,{asChild:!0,...f,focusable:!l,active:v,children:g.jsx(qe.button,{type:"button",role:"tab","aria-selected":v,"aria-controls":m,"data-state":v?"active":"inactive","data-disabled":l?"":void 0,disabled:l,id:p,...u,ref:r,onMouseDown:We(t.onMouseDown,w=>{!l&&w.button===0&&w.ctrlKey===!1?c.onValueChange(a):w.preventDefault()}),onKeyDown:We(t.onKeyDown,w=>{[" ","Enter"].includes(w.key)&&c.onValueChange(a)}),onFocus:We(t.onFocus,()=>{const w=c.activationMode!=="manual";!v&&!l&&w&&c.onValueChange(a)})})})});R0.displayName=k0;var b0="TabsContent",N0=y.forwardRef((t,r)=>{const{__scopeTabs:o,value:a,forceMount:l,children:u,...c}=t,f=pf(b0,o),p=P0(f.baseId,a),m=j0(f.baseId,a),v=a===f.value,w=y.useRef(v);return y.useEffect(()=>{const S=requestAnimationFrame(()=>w.current=!1);return()=>cancelAnimationFrame(S)},[]),g.jsx(Oa,{present:l||v,children:({present:S})=>g.jsx(qe.div,{"data-state":v?"active":"inactive","data-orientation":f.orientation,role:"tabpanel","aria-labelledby":p,hidden:!S,id:m,tabIndex:0,...c,ref:r,style:{...t.style,animationDuration:w.current?"0s":void 0},children:S&&u})})});N0.displayName=b0;function P0(t,r){return`${t}-trigger-${r}`}function j0(t,r){return`${t}-content-${r}`}var SP=S0,T0=C0,_0=R0,A0=N0;const EP=SP,D0=y.forwardRef(({className:t,...r},o)=>g.jsx(T0,{ref:o,className:Qe("inline-flex h-9 items-center justify-center rounded-lg bg-zinc-100 p-1 text-zinc-500 dark:bg-zinc-800 dark:text-zinc-400",t),...r}));D0.displayName=T0.displayName;const Pd=y.forwardRef(({className:t,...r},o)=>g.jsx(_0,{ref:o,className:Qe("inline-flex items-center justify-center whitespace-nowrap rounded-md px-3 py-1 text-sm font-medium ring-offset-white transition-all focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-zinc-950 focus-visible:ring-offset-2 disabled:pointer-events-none disabled:opacity-50 data-[state=active]:bg-white data-[state=active]:text-zinc-950 data-[state=active]:shadow dark:ring-offset-zinc-950 dark:focus-visible:ring-zinc-300 dark:data-[state=active]:bg-zinc-950 dark:data-[state=active]:text-zinc-50",t),...r}));Pd.displayName=_0.displayName;const jd=y.forwardRef(({className:t,...r},o)=>g.jsx(A0,{ref:o,className:Qe("mt-2 ring-offset-white focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-zinc-950 focus-visible:ring-offset-2 dark:ring-offset-zinc-950 dark:focus-visible:ring-zinc-300",t),...r}));jd.displayName=A0.displayName;const CP=Ms("inline-flex items-center rounded-md border border-zinc-200 px-2.5 py-0.5 text-xs font-semibold transition-colors focus:outline-none focus:ring-2 focus:ring-zinc-950 focus:ring-offset-2 dark:border-zinc-800 dark:focus:ring-zinc-300",{variants:{variant:{default:"border-transparent bg-zinc-900 text-zinc-50 shadow hover:bg-zinc-900/80 dark:bg-zinc-50 dark:text-zinc-900 dark:hover:bg-zinc-50/80",secondary:"border-transparent bg-zinc-100 text-zinc-900 hover:bg-zinc-100/80 dark:bg-zinc-800 dark:text-zinc-50 dark:hover:bg-zinc-800/80",destructive:"border-transparent bg-red-500 text-zinc-50 shadow hover:bg-red-500/80 dark:bg-red-900 dark:text-zinc-50 dark:hover:bg-red-900/80",outline:"text-zinc-950 dark:text-zinc-50"}},defaultVariants:{variant:"default"}});function wa({className:t,variant:r,...o}){return g.jsx("div",{className:Qe(CP({variant:r}),t),...o})}const kP=()=>{const[t,r]=y.useState([]),[o,a]=y.useState([]),[l,u]=y.useState(!0),[c,f]=y.useState("my-applications"),[p,m]=y.useState(null),[v,w]=y.useState(!1),[S,R]=y.useState(""),[C,E]=y.useState(null);y.useEffect(()=>{c==="my-applications"?k():b()},[c]);const k=async()=>{try{u(!0);const U=await tv();r(U)}catch(U){console.error("Error fetching my applications:",U)}finally{u(!1)}},b=async()=>{try{u(!0);const U=await nv();a(U)}catch(U){console.error("Error fetching pending approvals:",U)}finally{u(!1)}},T=async U=>{try{await RC(U),k()}catch(Y){console.error("Error submitting application:",Y)}},P=async U=>{try{await kC(U),k()}catch(Y){console.error("Error deleting application:",Y)}},j=(U,Y)=>{m(U),E(Y),R(""),w(!0)},F=async()=>{if(!(!p||!C))try{C==="approve"?await bC(p.id,S):await NC(p.id,S),w(!1),b()}catch(U){console.error(`Error ${C}ing application:`,U)}},_=U=>{switch(U){case"DRAFT":return g.jsx(wa,{variant:"outline",children:"Draft"});case"PENDING":return g.jsx(wa,{variant:"secondary",children:"Pending"});case"APPROVED":return g.jsx(wa,{className:"bg-green-100 text-green-800",children:"Approved"});case"REJECTED":return g.jsx(wa,{variant:"destructive",children:"Rejected"});default:return g.jsx(wa,{children:U})}},W=(U,Y=!1)=>l?g.jsx("div",{className:"text-center py-10",children:"Loading applications..."}):U.length===0?g.jsx("div",{className:"text-center py-10 text-gray-500",children:Y?"No applications pending your approval.":"No applications found. Start a new application from the approval forms page."}):g.jsx("div",{className:"grid grid-cols-1 gap-4",children:U.map(oe=>g.jsxs(Gt,{children:[g.jsx(qt,{children:g.jsxs("div",{className:"flex justify-between items-start",children:[g.jsxs("div",{children:[g.jsxs(Yt,{className:"flex items-center",children:[g.jsx(wv,{className:"mr-2 h-5 w-5 text-blue-500"}),oe.form_name]}),g.jsxs(Br,{children:["Route: ",oe.route_name," | Submitted: ",new Date(oe.created_at).toLocaleDateString()]})]}),g.jsx("div",{children:_(oe.status)})]})}),g.jsx(Qt,{children:g.jsx("div",{className:"text-sm text-gray-500",children:Y?g.jsxs("p",{children:["Applicant: ",oe.applicant_name]}):g.jsxs("p",{children:["Status: Step ",oe.current_step," of ",oe.approval_history.length]})})}),g.jsx(wi,{className:"flex justify-end space-x-2",children:Y?g.jsxs(g.Fragment,{children:[g.jsxs(Be,{variant:"outline",size:"sm",onClick:()=>j(oe,"reject"),children:[g.jsx(kv,{className:"mr-1 h-4 w-4"}),"Reject"]}),g.jsxs(Be,{variant:"default",size:"sm",onClick:()=>j(oe,"approve"),children:[g.jsx(vv,{className:"mr-1 h-4 w-4"}),"Approve"]})]}):g.jsx(g.Fragment,{children:oe.status==="DRAFT"&&g.jsxs(g.Fragment,{children:[g.jsxs(Be,{variant:"outline",size:"sm",onClick:()=>P(oe.id),children:[g.jsx(Is,{className:"mr-1 h-4 w-4"}),"Delete"]}),g.jsx(Be,{variant:"default",size:"sm",onClick:()=>T(oe.id),children:"Submit"})]})})})]},oe.id))});return g.jsxs("div",{className:"space-y-6",children:[g.jsxs("div",{children:[g.jsx("h1",{className:"text-3xl font-bold",children:"Applications"}),g.jsx("p",{className:"text-gray-500 mt-1",children:"Manage your approval applications"})]}),g.jsxs(EP,{value:c,onValueChange:f,children:[g.jsxs(D0,{children:[g.jsx(Pd,{value:"my-applications",children:"My Applications"}),g.jsx(Pd,{value:"pending-approvals",children:"Pending Approvals"})]}),g.jsx(jd,{value:"my-applications",className:"mt-6",children:W(t)}),g.jsx(jd,{value:"pending-approvals",className:"mt-6",children:W(o,!0)})]}),g.jsx(La,{open:v,onOpenChange:w,children:g.jsxs(Si,{children:[g.jsx(Ei,{children:g.jsx(Ci,{children:C==="approve"?"Approve Application":"Reject Application"})}),g.jsxs("div",{className:"py-4",children:[g.jsx("label",{htmlFor:"comment",className:"text-sm font-medium",children:"Comment (Optional)"}),g.jsx(qs,{id:"comment",value:S,onChange:U=>R(U.target.value),placeholder:"Add a comment...",className:"mt-2"})]}),g.jsxs(ly,{children:[g.jsx(Be,{variant:"outline",onClick:()=>w(!1),children:"Cancel"}),g.jsx(Be,{variant:C==="approve"?"default":"destructive",onClick:F,children:C==="approve"?"Approve":"Reject"})]})]})})]})},RP=({children:t})=>{const{user:r,loading:o}=jo();return o?g.jsx("div",{className:"flex h-screen items-center justify-center",children:"Loading..."}):r?g.jsx(g.Fragment,{children:t}):g.jsx(Fd,{to:"/login",replace:!0})},ng=({children:t})=>{const{user:r,loading:o}=jo();return o?g.jsx("div",{className:"flex h-screen items-center justify-center",children:"Loading..."}):r?g.jsx(Fd,{to:"/dashboard",replace:!0}):g.jsx(g.Fragment,{children:t})};function bP(){const r=x1([{path:"/",element:g.jsx(Fd,{to:"/login",replace:!0})},{path:"/login",element:g.jsx(ng,{children:g.jsx(Fk,{})})},{path:"/register",element:g.jsx(ng,{children:g.jsx(zk,{})})},{path:"/",element:g.jsx(RP,{children:g.jsx(jk,{})}),children:[{path:"dashboard",element:g.jsx(Uk,{})},{path:"folders",element:g.jsx(pb,{})},{path:"documents",element:g.jsx(oP,{})},{path:"approval-forms",element:g.jsx(iP,{})},{path:"approval-routes",element:g.jsx(aP,{})},{path:"applications",element:g.jsx(kP,{})}]}]);return g.jsx(PC,{children:g.jsx(D1,{router:r})})}kx.createRoot(document.getElementById("root")).render(g.jsx(y.StrictMode,{children:g.jsx(bP,{})}));
+For more information, see https://radix-ui.com/primitives/docs/components/${r.docsSlug}`;return y.useEffect(()=>{t&&(document.getElementById(t)||console.error(o))},[o,t]),null},ib="DialogDescriptionWarning",ab=({contentRef:t,descriptionId:r})=>{const a=`Warning: Missing \`Description\` or \`aria-describedby={undefined}\` for {${ty(ib).contentName}}.`;return y.useEffect(()=>{var u;const l=(u=t.current)==null?void 0:u.getAttribute("aria-describedby");r&&l&&(document.getElementById(r)||console.warn(a))},[a,t,r]),null},lb=$v,sb=Hv,ub=Wv,ny=Kv,ry=Gv,oy=Yv,iy=Xv,cb=Zv;const La=lb,$s=sb,db=ub,ay=y.forwardRef(({className:t,...r},o)=>g.jsx(ny,{ref:o,className:Qe("fixed inset-0 z-50 bg-black/80  data-[state=open]:animate-in data-[state=closed]:animate-out data-[state=closed]:fade-out-0 data-[state=open]:fade-in-0",t),...r}));ay.displayName=ny.displayName;const Si=y.forwardRef(({className:t,children:r,...o},a)=>g.jsxs(db,{children:[g.jsx(ay,{}),g.jsxs(ry,{ref:a,className:Qe("fixed left-[50%] top-[50%] z-50 grid w-full max-w-lg translate-x-[-50%] translate-y-[-50%] gap-4 border border-zinc-200 bg-white p-6 shadow-lg duration-200 data-[state=open]:animate-in data-[state=closed]:animate-out data-[state=closed]:fade-out-0 data-[state=open]:fade-in-0 data-[state=closed]:zoom-out-95 data-[state=open]:zoom-in-95 data-[state=closed]:slide-out-to-left-1/2 data-[state=closed]:slide-out-to-top-[48%] data-[state=open]:slide-in-from-left-1/2 data-[state=open]:slide-in-from-top-[48%] sm:rounded-lg dark:border-zinc-800 dark:bg-zinc-950",t),...o,children:[r,g.jsxs(cb,{className:"absolute right-4 top-4 rounded-sm opacity-70 ring-offset-white transition-opacity hover:opacity-100 focus:outline-none focus:ring-2 focus:ring-zinc-950 focus:ring-offset-2 disabled:pointer-events-none data-[state=open]:bg-zinc-100 data-[state=open]:text-zinc-500 dark:ring-offset-zinc-950 dark:focus:ring-zinc-300 dark:data-[state=open]:bg-zinc-800 dark:data-[state=open]:text-zinc-400",children:[g.jsx(kv,{className:"h-4 w-4"}),g.jsx("span",{className:"sr-only",children:"Close"})]})]})]}));Si.displayName=ry.displayName;const Ei=({className:t,...r})=>g.jsx("div",{className:Qe("flex flex-col space-y-1.5 text-center sm:text-left",t),...r});Ei.displayName="DialogHeader";const ly=({className:t,...r})=>g.jsx("div",{className:Qe("flex flex-col-reverse sm:flex-row sm:justify-end sm:space-x-2",t),...r});ly.displayName="DialogFooter";const Ci=y.forwardRef(({className:t,...r},o)=>g.jsx(oy,{ref:o,className:Qe("text-lg font-semibold leading-none tracking-tight",t),...r}));Ci.displayName=oy.displayName;const fb=y.forwardRef(({className:t,...r},o)=>g.jsx(iy,{ref:o,className:Qe("text-sm text-zinc-500 dark:text-zinc-400",t),...r}));fb.displayName=iy.displayName;const pb=()=>{const[t,r]=y.useState([]),[o,a]=y.useState(!0),[l,u]=y.useState(""),[c,f]=y.useState(null),[p,m]=y.useState(!1);y.useEffect(()=>{v()},[c]);const v=async()=>{try{a(!0);const C=await Hd(c||void 0);r(C)}catch(C){console.error("Error fetching folders:",C)}finally{a(!1)}},w=async()=>{if(l.trim())try{await hC({name:l,parent_id:c||void 0}),u(""),m(!1),v()}catch(C){console.error("Error creating folder:",C)}},S=C=>{f(C)},R=()=>{f(null)};return g.jsxs("div",{className:"space-y-6",children:[g.jsxs("div",{className:"flex justify-between items-center",children:[g.jsxs("div",{children:[g.jsx("h1",{className:"text-3xl font-bold",children:"Folders"}),g.jsx("p",{className:"text-gray-500 mt-1",children:"Manage your document folders"})]}),g.jsxs(La,{open:p,onOpenChange:m,children:[g.jsx($s,{asChild:!0,children:g.jsxs(Be,{children:[g.jsx(Fs,{className:"mr-2 h-4 w-4"}),"New Folder"]})}),g.jsxs(Si,{children:[g.jsx(Ei,{children:g.jsx(Ci,{children:"Create New Folder"})}),g.jsx("div",{className:"grid gap-4 py-4",children:g.jsxs("div",{className:"grid gap-2",children:[g.jsx("label",{htmlFor:"name",children:"Folder Name"}),g.jsx(vn,{id:"name",value:l,onChange:C=>u(C.target.value),placeholder:"Enter folder name"})]})}),g.jsx(Be,{onClick:w,children:"Create Folder"})]})]})]}),c&&g.jsx(Be,{variant:"outline",onClick:R,children:"Back to Parent Folder"}),o?g.jsx("div",{className:"text-center py-10",children:"Loading folders..."}):t.length===0?g.jsx("div",{className:"text-center py-10 text-gray-500",children:"No folders found. Create a new folder to get started."}):g.jsx("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-4",children:t.map(C=>g.jsxs(Gt,{className:"cursor-pointer hover:bg-gray-50 transition-colors",onClick:()=>S(C.id),children:[g.jsx(qt,{className:"pb-2",children:g.jsxs(Yt,{className:"flex items-center",children:[g.jsx(Wd,{className:"mr-2 h-5 w-5 text-blue-500"}),C.name]})}),g.jsx(Qt,{children:g.jsxs("p",{className:"text-sm text-gray-500",children:["Created: ",new Date(C.created_at).toLocaleDateString()]})})]},C.id))})]})};function Gm(t,[r,o]){return Math.min(o,Math.max(r,t))}function sy(t){const r=t+"CollectionProvider",[o,a]=xi(r),[l,u]=o(r,{collectionRef:{current:null},itemMap:new Map}),c=E=>{const{scope:k,children:b}=E,T=Mr.useRef(null),P=Mr.useRef(new Map).current;return g.jsx(l,{scope:k,itemMap:P,collectionRef:T,children:b})};c.displayName=r;const f=t+"CollectionSlot",p=di(f),m=Mr.forwardRef((E,k)=>{const{scope:b,children:T}=E,P=u(f,b),j=ut(k,P.collectionRef);return g.jsx(p,{ref:j,children:T})});m.displayName=f;const v=t+"CollectionItemSlot",w="data-radix-collection-item",S=di(v),R=Mr.forwardRef((E,k)=>{const{scope:b,children:T,...P}=E,j=Mr.useRef(null),F=ut(k,j),_=u(v,b);return Mr.useEffect(()=>(_.itemMap.set(j,{ref:j,...P}),()=>void _.itemMap.delete(j))),g.jsx(S,{[w]:"",ref:F,children:T})});R.displayName=v;function C(E){const k=u(t+"CollectionConsumer",E);return Mr.useCallback(()=>{const T=k.collectionRef.current;if(!T)return[];const P=Array.from(T.querySelectorAll(`[${w}]`));return Array.from(k.itemMap.values()).sort((_,W)=>P.indexOf(_.ref.current)-P.indexOf(W.ref.current))},[k.collectionRef,k.itemMap])}return[{Provider:c,Slot:m,ItemSlot:R},C,a]}var hb=y.createContext(void 0);function tf(t){const r=y.useContext(hb);return t||r||"ltr"}const mb=["top","right","bottom","left"],Vr=Math.min,ln=Math.max,ys=Math.round,ts=Math.floor,Gn=t=>({x:t,y:t}),gb={left:"right",right:"left",bottom:"top",top:"bottom"},vb={start:"end",end:"start"};function vd(t,r,o){return ln(t,Vr(r,o))}function lr(t,r){return typeof t=="function"?t(r):t}function sr(t){return t.split("-")[0]}function ki(t){return t.split("-")[1]}function nf(t){return t==="x"?"y":"x"}function rf(t){return t==="y"?"height":"width"}function Wr(t){return["top","bottom"].includes(sr(t))?"y":"x"}function of(t){return nf(Wr(t))}function yb(t,r,o){o===void 0&&(o=!1);const a=ki(t),l=of(t),u=rf(l);let c=l==="x"?a===(o?"end":"start")?"right":"left":a==="start"?"bottom":"top";return r.reference[u]>r.floating[u]&&(c=ws(c)),[c,ws(c)]}function wb(t){const r=ws(t);return[yd(t),r,yd(r)]}function yd(t){return t.replace(/start|end/g,r=>vb[r])}function xb(t,r,o){const a=["left","right"],l=["right","left"],u=["top","bottom"],c=["bottom","top"];switch(t){case"top":case"bottom":return o?r?l:a:r?a:l;case"left":case"right":return r?u:c;default:return[]}}function Sb(t,r,o,a){const l=ki(t);let u=xb(sr(t),o==="start",a);return l&&(u=u.map(c=>c+"-"+l),r&&(u=u.concat(u.map(yd)))),u}function ws(t){return t.replace(/left|right|bottom|top/g,r=>gb[r])}function Eb(t){return{top:0,right:0,bottom:0,left:0,...t}}function uy(t){return typeof t!="number"?Eb(t):{top:t,right:t,bottom:t,left:t}}function xs(t){const{x:r,y:o,width:a,height:l}=t;return{width:a,height:l,top:o,left:r,right:r+a,bottom:o+l,x:r,y:o}}function qm(t,r,o){let{reference:a,floating:l}=t;const u=Wr(r),c=of(r),f=rf(c),p=sr(r),m=u==="y",v=a.x+a.width/2-l.width/2,w=a.y+a.height/2-l.height/2,S=a[f]/2-l[f]/2;let R;switch(p){case"top":R={x:v,y:a.y-l.height};break;case"bottom":R={x:v,y:a.y+a.height};break;case"right":R={x:a.x+a.width,y:w};break;case"left":R={x:a.x-l.width,y:w};break;default:R={x:a.x,y:a.y}}switch(ki(r)){case"start":R[c]-=S*(o&&m?-1:1);break;case"end":R[c]+=S*(o&&m?-1:1);break}return R}const Cb=async(t,r,o)=>{const{placement:a="bottom",strategy:l="absolute",middleware:u=[],platform:c}=o,f=u.filter(Boolean),p=await(c.isRTL==null?void 0:c.isRTL(r));let m=await c.getElementRects({reference:t,floating:r,strategy:l}),{x:v,y:w}=qm(m,a,p),S=a,R={},C=0;for(let E=0;E<f.length;E++){const{name:k,fn:b}=f[E],{x:T,y:P,data:j,reset:F}=await b({x:v,y:w,initialPlacement:a,placement:S,strategy:l,middlewareData:R,rects:m,platform:c,elements:{reference:t,floating:r}});v=T??v,w=P??w,R={...R,[k]:{...R[k],...j}},F&&C<=50&&(C++,typeof F=="object"&&(F.placement&&(S=F.placement),F.rects&&(m=F.rects===!0?await c.getElementRects({reference:t,floating:r,strategy:l}):F.rects),{x:v,y:w}=qm(m,S,p)),E=-1)}return{x:v,y:w,placement:S,strategy:l,middlewareData:R}};async function Pa(t,r){var o;r===void 0&&(r={});const{x:a,y:l,platform:u,rects:c,elements:f,strategy:p}=t,{boundary:m="clippingAncestors",rootBoundary:v="viewport",elementContext:w="floating",altBoundary:S=!1,padding:R=0}=lr(r,t),C=uy(R),k=f[S?w==="floating"?"reference":"floating":w],b=xs(await u.getClippingRect({element:(o=await(u.isElement==null?void 0:u.isElement(k)))==null||o?k:k.contextElement||await(u.getDocumentElement==null?void 0:u.getDocumentElement(f.floating)),boundary:m,rootBoundary:v,strategy:p})),T=w==="floating"?{x:a,y:l,width:c.floating.width,height:c.floating.height}:c.reference,P=await(u.getOffsetParent==null?void 0:u.getOffsetParent(f.floating)),j=await(u.isElement==null?void 0:u.isElement(P))?await(u.getScale==null?void 0:u.getScale(P))||{x:1,y:1}:{x:1,y:1},F=xs(u.convertOffsetParentRelativeRectToViewportRelativeRect?await u.convertOffsetParentRelativeRectToViewportRelativeRect({elements:f,rect:T,offsetParent:P,strategy:p}):T);return{top:(b.top-F.top+C.top)/j.y,bottom:(F.bottom-b.bottom+C.bottom)/j.y,left:(b.left-F.left+C.left)/j.x,right:(F.right-b.right+C.right)/j.x}}const kb=t=>({name:"arrow",options:t,async fn(r){const{x:o,y:a,placement:l,rects:u,platform:c,elements:f,middlewareData:p}=r,{element:m,padding:v=0}=lr(t,r)||{};if(m==null)return{};const w=uy(v),S={x:o,y:a},R=of(l),C=rf(R),E=await c.getDimensions(m),k=R==="y",b=k?"top":"left",T=k?"bottom":"right",P=k?"clientHeight":"clientWidth",j=u.reference[C]+u.reference[R]-S[R]-u.floating[C],F=S[R]-u.reference[R],_=await(c.getOffsetParent==null?void 0:c.getOffsetParent(m));let W=_?_[P]:0;(!W||!await(c.isElement==null?void 0:c.isElement(_)))&&(W=f.floating[P]||u.floating[C]);const U=j/2-F/2,Y=W/2-E[C]/2-1,oe=Vr(w[b],Y),Re=Vr(w[T],Y),Te=oe,ae=W-E[C]-Re,le=W/2-E[C]/2+U,Se=vd(Te,le,ae),X=!p.arrow&&ki(l)!=null&&le!==Se&&u.reference[C]/2-(le<Te?oe:Re)-E[C]/2<0,ie=X?le<Te?le-Te:le-ae:0;return{[R]:S[R]+ie,data:{[R]:Se,centerOffset:le-Se-ie,...X&&{alignmentOffset:ie}},reset:X}}}),Rb=function(t){return t===void 0&&(t={}),{name:"flip",options:t,async fn(r){var o,a;const{placement:l,middlewareData:u,rects:c,initialPlacement:f,platform:p,elements:m}=r,{mainAxis:v=!0,crossAxis:w=!0,fallbackPlacements:S,fallbackStrategy:R="bestFit",fallbackAxisSideDirection:C="none",flipAlignment:E=!0,...k}=lr(t,r);if((o=u.arrow)!=null&&o.alignmentOffset)return{};const b=sr(l),T=Wr(f),P=sr(f)===f,j=await(p.isRTL==null?void 0:p.isRTL(m.floating)),F=S||(P||!E?[ws(f)]:wb(f)),_=C!=="none";!S&&_&&F.push(...Sb(f,E,C,j));const W=[f,...F],U=await Pa(r,k),Y=[];let oe=((a=u.flip)==null?void 0:a.overflows)||[];if(v&&Y.push(U[b]),w){const le=yb(l,c,j);Y.push(U[le[0]],U[le[1]])}if(oe=[...oe,{placement:l,overflows:Y}],!Y.every(le=>le<=0)){var Re,Te;const le=(((Re=u.flip)==null?void 0:Re.index)||0)+1,Se=W[le];if(Se)return{data:{index:le,overflows:oe},reset:{placement:Se}};let X=(Te=oe.filter(ie=>ie.overflows[0]<=0).sort((ie,M)=>ie.overflows[1]-M.overflows[1])[0])==null?void 0:Te.placement;if(!X)switch(R){case"bestFit":{var ae;const ie=(ae=oe.filter(M=>{if(_){const ee=Wr(M.placement);return ee===T||ee==="y"}return!0}).map(M=>[M.placement,M.overflows.filter(ee=>ee>0).reduce((ee,Q)=>ee+Q,0)]).sort((M,ee)=>M[1]-ee[1])[0])==null?void 0:ae[0];ie&&(X=ie);break}case"initialPlacement":X=f;break}if(l!==X)return{reset:{placement:X}}}return{}}}};function Ym(t,r){return{top:t.top-r.height,right:t.right-r.width,bottom:t.bottom-r.height,left:t.left-r.width}}function Qm(t){return mb.some(r=>t[r]>=0)}const bb=function(t){return t===void 0&&(t={}),{name:"hide",options:t,async fn(r){const{rects:o}=r,{strategy:a="referenceHidden",...l}=lr(t,r);switch(a){case"referenceHidden":{const u=await Pa(r,{...l,elementContext:"reference"}),c=Ym(u,o.reference);return{data:{referenceHiddenOffsets:c,referenceHidden:Qm(c)}}}case"escaped":{const u=await Pa(r,{...l,altBoundary:!0}),c=Ym(u,o.floating);return{data:{escapedOffsets:c,escaped:Qm(c)}}}default:return{}}}}};async function Nb(t,r){const{placement:o,platform:a,elements:l}=t,u=await(a.isRTL==null?void 0:a.isRTL(l.floating)),c=sr(o),f=ki(o),p=Wr(o)==="y",m=["left","top"].includes(c)?-1:1,v=u&&p?-1:1,w=lr(r,t);let{mainAxis:S,crossAxis:R,alignmentAxis:C}=typeof w=="number"?{mainAxis:w,crossAxis:0,alignmentAxis:null}:{mainAxis:w.mainAxis||0,crossAxis:w.crossAxis||0,alignmentAxis:w.alignmentAxis};return f&&typeof C=="number"&&(R=f==="end"?C*-1:C),p?{x:R*v,y:S*m}:{x:S*m,y:R*v}}const Pb=function(t){return t===void 0&&(t=0),{name:"offset",options:t,async fn(r){var o,a;const{x:l,y:u,placement:c,middlewareData:f}=r,p=await Nb(r,t);return c===((o=f.offset)==null?void 0:o.placement)&&(a=f.arrow)!=null&&a.alignmentOffset?{}:{x:l+p.x,y:u+p.y,data:{...p,placement:c}}}}},jb=function(t){return t===void 0&&(t={}),{name:"shift",options:t,async fn(r){const{x:o,y:a,placement:l}=r,{mainAxis:u=!0,crossAxis:c=!1,limiter:f={fn:k=>{let{x:b,y:T}=k;return{x:b,y:T}}},...p}=lr(t,r),m={x:o,y:a},v=await Pa(r,p),w=Wr(sr(l)),S=nf(w);let R=m[S],C=m[w];if(u){const k=S==="y"?"top":"left",b=S==="y"?"bottom":"right",T=R+v[k],P=R-v[b];R=vd(T,R,P)}if(c){const k=w==="y"?"top":"left",b=w==="y"?"bottom":"right",T=C+v[k],P=C-v[b];C=vd(T,C,P)}const E=f.fn({...r,[S]:R,[w]:C});return{...E,data:{x:E.x-o,y:E.y-a,enabled:{[S]:u,[w]:c}}}}}},Tb=function(t){return t===void 0&&(t={}),{options:t,fn(r){const{x:o,y:a,placement:l,rects:u,middlewareData:c}=r,{offset:f=0,mainAxis:p=!0,crossAxis:m=!0}=lr(t,r),v={x:o,y:a},w=Wr(l),S=nf(w);let R=v[S],C=v[w];const E=lr(f,r),k=typeof E=="number"?{mainAxis:E,crossAxis:0}:{mainAxis:0,crossAxis:0,...E};if(p){const P=S==="y"?"height":"width",j=u.reference[S]-u.floating[P]+k.mainAxis,F=u.reference[S]+u.reference[P]-k.mainAxis;R<j?R=j:R>F&&(R=F)}if(m){var b,T;const P=S==="y"?"width":"height",j=["top","left"].includes(sr(l)),F=u.reference[w]-u.floating[P]+(j&&((b=c.offset)==null?void 0:b[w])||0)+(j?0:k.crossAxis),_=u.reference[w]+u.reference[P]+(j?0:((T=c.offset)==null?void 0:T[w])||0)-(j?k.crossAxis:0);C<F?C=F:C>_&&(C=_)}return{[S]:R,[w]:C}}}},_b=function(t){return t===void 0&&(t={}),{name:"size",options:t,async fn(r){var o,a;const{placement:l,rects:u,platform:c,elements:f}=r,{apply:p=()=>{},...m}=lr(t,r),v=await Pa(r,m),w=sr(l),S=ki(l),R=Wr(l)==="y",{width:C,height:E}=u.floating;let k,b;w==="top"||w==="bottom"?(k=w,b=S===(await(c.isRTL==null?void 0:c.isRTL(f.floating))?"start":"end")?"left":"right"):(b=w,k=S==="end"?"top":"bottom");const T=E-v.top-v.bottom,P=C-v.left-v.right,j=Vr(E-v[k],T),F=Vr(C-v[b],P),_=!r.middlewareData.shift;let W=j,U=F;if((o=r.middlewareData.shift)!=null&&o.enabled.x&&(U=P),(a=r.middlewareData.shift)!=null&&a.enabled.y&&(W=T),_&&!S){const oe=ln(v.left,0),Re=ln(v.right,0),Te=ln(v.top,0),ae=ln(v.bottom,0);R?U=C-2*(oe!==0||Re!==0?oe+Re:ln(v.left,v.right)):W=E-2*(Te!==0||ae!==0?Te+ae:ln(v.top,v.bottom))}await p({...r,availableWidth:U,availableHeight:W});const Y=await c.getDimensions(f.floating);return C!==Y.width||E!==Y.height?{reset:{rects:!0}}:{}}}};function Bs(){return typeof window<"u"}function Ri(t){return cy(t)?(t.nodeName||"").toLowerCase():"#document"}function sn(t){var r;return(t==null||(r=t.ownerDocument)==null?void 0:r.defaultView)||window}function Yn(t){var r;return(r=(cy(t)?t.ownerDocument:t.document)||window.document)==null?void 0:r.documentElement}function cy(t){return Bs()?t instanceof Node||t instanceof sn(t).Node:!1}function Tn(t){return Bs()?t instanceof Element||t instanceof sn(t).Element:!1}function qn(t){return Bs()?t instanceof HTMLElement||t instanceof sn(t).HTMLElement:!1}function Xm(t){return!Bs()||typeof ShadowRoot>"u"?!1:t instanceof ShadowRoot||t instanceof sn(t).ShadowRoot}function Ma(t){const{overflow:r,overflowX:o,overflowY:a,display:l}=_n(t);return/auto|scroll|overlay|hidden|clip/.test(r+a+o)&&!["inline","contents"].includes(l)}function Ab(t){return["table","td","th"].includes(Ri(t))}function Hs(t){return[":popover-open",":modal"].some(r=>{try{return t.matches(r)}catch{return!1}})}function af(t){const r=lf(),o=Tn(t)?_n(t):t;return["transform","translate","scale","rotate","perspective"].some(a=>o[a]?o[a]!=="none":!1)||(o.containerType?o.containerType!=="normal":!1)||!r&&(o.backdropFilter?o.backdropFilter!=="none":!1)||!r&&(o.filter?o.filter!=="none":!1)||["transform","translate","scale","rotate","perspective","filter"].some(a=>(o.willChange||"").includes(a))||["paint","layout","strict","content"].some(a=>(o.contain||"").includes(a))}function Db(t){let r=Kr(t);for(;qn(r)&&!fi(r);){if(af(r))return r;if(Hs(r))return null;r=Kr(r)}return null}function lf(){return typeof CSS>"u"||!CSS.supports?!1:CSS.supports("-webkit-backdrop-filter","none")}function fi(t){return["html","body","#document"].includes(Ri(t))}function _n(t){return sn(t).getComputedStyle(t)}function Vs(t){return Tn(t)?{scrollLeft:t.scrollLeft,scrollTop:t.scrollTop}:{scrollLeft:t.scrollX,scrollTop:t.scrollY}}function Kr(t){if(Ri(t)==="html")return t;const r=t.assignedSlot||t.parentNode||Xm(t)&&t.host||Yn(t);return Xm(r)?r.host:r}function dy(t){const r=Kr(t);return fi(r)?t.ownerDocument?t.ownerDocument.body:t.body:qn(r)&&Ma(r)?r:dy(r)}function ja(t,r,o){var a;r===void 0&&(r=[]),o===void 0&&(o=!0);const l=dy(t),u=l===((a=t.ownerDocument)==null?void 0:a.body),c=sn(l);if(u){const f=wd(c);return r.concat(c,c.visualViewport||[],Ma(l)?l:[],f&&o?ja(f):[])}return r.concat(l,ja(l,[],o))}function wd(t){return t.parent&&Object.getPrototypeOf(t.parent)?t.frameElement:null}function fy(t){const r=_n(t);let o=parseFloat(r.width)||0,a=parseFloat(r.height)||0;const l=qn(t),u=l?t.offsetWidth:o,c=l?t.offsetHeight:a,f=ys(o)!==u||ys(a)!==c;return f&&(o=u,a=c),{width:o,height:a,$:f}}function sf(t){return Tn(t)?t:t.contextElement}function ci(t){const r=sf(t);if(!qn(r))return Gn(1);const o=r.getBoundingClientRect(),{width:a,height:l,$:u}=fy(r);let c=(u?ys(o.width):o.width)/a,f=(u?ys(o.height):o.height)/l;return(!c||!Number.isFinite(c))&&(c=1),(!f||!Number.isFinite(f))&&(f=1),{x:c,y:f}}const Ob=Gn(0);function py(t){const r=sn(t);return!lf()||!r.visualViewport?Ob:{x:r.visualViewport.offsetLeft,y:r.visualViewport.offsetTop}}function Lb(t,r,o){return r===void 0&&(r=!1),!o||r&&o!==sn(t)?!1:r}function Ro(t,r,o,a){r===void 0&&(r=!1),o===void 0&&(o=!1);const l=t.getBoundingClientRect(),u=sf(t);let c=Gn(1);r&&(a?Tn(a)&&(c=ci(a)):c=ci(t));const f=Lb(u,o,a)?py(u):Gn(0);let p=(l.left+f.x)/c.x,m=(l.top+f.y)/c.y,v=l.width/c.x,w=l.height/c.y;if(u){const S=sn(u),R=a&&Tn(a)?sn(a):a;let C=S,E=wd(C);for(;E&&a&&R!==C;){const k=ci(E),b=E.getBoundingClientRect(),T=_n(E),P=b.left+(E.clientLeft+parseFloat(T.paddingLeft))*k.x,j=b.top+(E.clientTop+parseFloat(T.paddingTop))*k.y;p*=k.x,m*=k.y,v*=k.x,w*=k.y,p+=P,m+=j,C=sn(E),E=wd(C)}}return xs({width:v,height:w,x:p,y:m})}function uf(t,r){const o=Vs(t).scrollLeft;return r?r.left+o:Ro(Yn(t)).left+o}function hy(t,r,o){o===void 0&&(o=!1);const a=t.getBoundingClientRect(),l=a.left+r.scrollLeft-(o?0:uf(t,a)),u=a.top+r.scrollTop;return{x:l,y:u}}function Mb(t){let{elements:r,rect:o,offsetParent:a,strategy:l}=t;const u=l==="fixed",c=Yn(a),f=r?Hs(r.floating):!1;if(a===c||f&&u)return o;let p={scrollLeft:0,scrollTop:0},m=Gn(1);const v=Gn(0),w=qn(a);if((w||!w&&!u)&&((Ri(a)!=="body"||Ma(c))&&(p=Vs(a)),qn(a))){const R=Ro(a);m=ci(a),v.x=R.x+a.clientLeft,v.y=R.y+a.clientTop}const S=c&&!w&&!u?hy(c,p,!0):Gn(0);return{width:o.width*m.x,height:o.height*m.y,x:o.x*m.x-p.scrollLeft*m.x+v.x+S.x,y:o.y*m.y-p.scrollTop*m.y+v.y+S.y}}function Fb(t){return Array.from(t.getClientRects())}function Ib(t){const r=Yn(t),o=Vs(t),a=t.ownerDocument.body,l=ln(r.scrollWidth,r.clientWidth,a.scrollWidth,a.clientWidth),u=ln(r.scrollHeight,r.clientHeight,a.scrollHeight,a.clientHeight);let c=-o.scrollLeft+uf(t);const f=-o.scrollTop;return _n(a).direction==="rtl"&&(c+=ln(r.clientWidth,a.clientWidth)-l),{width:l,height:u,x:c,y:f}}function zb(t,r){const o=sn(t),a=Yn(t),l=o.visualViewport;let u=a.clientWidth,c=a.clientHeight,f=0,p=0;if(l){u=l.width,c=l.height;const m=lf();(!m||m&&r==="fixed")&&(f=l.offsetLeft,p=l.offsetTop)}return{width:u,height:c,x:f,y:p}}function Ub(t,r){const o=Ro(t,!0,r==="fixed"),a=o.top+t.clientTop,l=o.left+t.clientLeft,u=qn(t)?ci(t):Gn(1),c=t.clientWidth*u.x,f=t.clientHeight*u.y,p=l*u.x,m=a*u.y;return{width:c,height:f,x:p,y:m}}function Jm(t,r,o){let a;if(r==="viewport")a=zb(t,o);else if(r==="document")a=Ib(Yn(t));else if(Tn(r))a=Ub(r,o);else{const l=py(t);a={x:r.x-l.x,y:r.y-l.y,width:r.width,height:r.height}}return xs(a)}function my(t,r){const o=Kr(t);return o===r||!Tn(o)||fi(o)?!1:_n(o).position==="fixed"||my(o,r)}function $b(t,r){const o=r.get(t);if(o)return o;let a=ja(t,[],!1).filter(f=>Tn(f)&&Ri(f)!=="body"),l=null;const u=_n(t).position==="fixed";let c=u?Kr(t):t;for(;Tn(c)&&!fi(c);){const f=_n(c),p=af(c);!p&&f.position==="fixed"&&(l=null),(u?!p&&!l:!p&&f.position==="static"&&!!l&&["absolute","fixed"].includes(l.position)||Ma(c)&&!p&&my(t,c))?a=a.filter(v=>v!==c):l=f,c=Kr(c)}return r.set(t,a),a}function Bb(t){let{element:r,boundary:o,rootBoundary:a,strategy:l}=t;const c=[...o==="clippingAncestors"?Hs(r)?[]:$b(r,this._c):[].concat(o),a],f=c[0],p=c.reduce((m,v)=>{const w=Jm(r,v,l);return m.top=ln(w.top,m.top),m.right=Vr(w.right,m.right),m.bottom=Vr(w.bottom,m.bottom),m.left=ln(w.left,m.left),m},Jm(r,f,l));return{width:p.right-p.left,height:p.bottom-p.top,x:p.left,y:p.top}}function Hb(t){const{width:r,height:o}=fy(t);return{width:r,height:o}}function Vb(t,r,o){const a=qn(r),l=Yn(r),u=o==="fixed",c=Ro(t,!0,u,r);let f={scrollLeft:0,scrollTop:0};const p=Gn(0);if(a||!a&&!u)if((Ri(r)!=="body"||Ma(l))&&(f=Vs(r)),a){const S=Ro(r,!0,u,r);p.x=S.x+r.clientLeft,p.y=S.y+r.clientTop}else l&&(p.x=uf(l));const m=l&&!a&&!u?hy(l,f):Gn(0),v=c.left+f.scrollLeft-p.x-m.x,w=c.top+f.scrollTop-p.y-m.y;return{x:v,y:w,width:c.width,height:c.height}}function Zc(t){return _n(t).position==="static"}function Zm(t,r){if(!qn(t)||_n(t).position==="fixed")return null;if(r)return r(t);let o=t.offsetParent;return Yn(t)===o&&(o=o.ownerDocument.body),o}function gy(t,r){const o=sn(t);if(Hs(t))return o;if(!qn(t)){let l=Kr(t);for(;l&&!fi(l);){if(Tn(l)&&!Zc(l))return l;l=Kr(l)}return o}let a=Zm(t,r);for(;a&&Ab(a)&&Zc(a);)a=Zm(a,r);return a&&fi(a)&&Zc(a)&&!af(a)?o:a||Db(t)||o}const Wb=async function(t){const r=this.getOffsetParent||gy,o=this.getDimensions,a=await o(t.floating);return{reference:Vb(t.reference,await r(t.floating),t.strategy),floating:{x:0,y:0,width:a.width,height:a.height}}};function Kb(t){return _n(t).direction==="rtl"}const Gb={convertOffsetParentRelativeRectToViewportRelativeRect:Mb,getDocumentElement:Yn,getClippingRect:Bb,getOffsetParent:gy,getElementRects:Wb,getClientRects:Fb,getDimensions:Hb,getScale:ci,isElement:Tn,isRTL:Kb};function vy(t,r){return t.x===r.x&&t.y===r.y&&t.width===r.width&&t.height===r.height}function qb(t,r){let o=null,a;const l=Yn(t);function u(){var f;clearTimeout(a),(f=o)==null||f.disconnect(),o=null}function c(f,p){f===void 0&&(f=!1),p===void 0&&(p=1),u();const m=t.getBoundingClientRect(),{left:v,top:w,width:S,height:R}=m;if(f||r(),!S||!R)return;const C=ts(w),E=ts(l.clientWidth-(v+S)),k=ts(l.clientHeight-(w+R)),b=ts(v),P={rootMargin:-C+"px "+-E+"px "+-k+"px "+-b+"px",threshold:ln(0,Vr(1,p))||1};let j=!0;function F(_){const W=_[0].intersectionRatio;if(W!==p){if(!j)return c();W?c(!1,W):a=setTimeout(()=>{c(!1,1e-7)},1e3)}W===1&&!vy(m,t.getBoundingClientRect())&&c(),j=!1}try{o=new IntersectionObserver(F,{...P,root:l.ownerDocument})}catch{o=new IntersectionObserver(F,P)}o.observe(t)}return c(!0),u}function Yb(t,r,o,a){a===void 0&&(a={});const{ancestorScroll:l=!0,ancestorResize:u=!0,elementResize:c=typeof ResizeObserver=="function",layoutShift:f=typeof IntersectionObserver=="function",animationFrame:p=!1}=a,m=sf(t),v=l||u?[...m?ja(m):[],...ja(r)]:[];v.forEach(b=>{l&&b.addEventListener("scroll",o,{passive:!0}),u&&b.addEventListener("resize",o)});const w=m&&f?qb(m,o):null;let S=-1,R=null;c&&(R=new ResizeObserver(b=>{let[T]=b;T&&T.target===m&&R&&(R.unobserve(r),cancelAnimationFrame(S),S=requestAnimationFrame(()=>{var P;(P=R)==null||P.observe(r)})),o()}),m&&!p&&R.observe(m),R.observe(r));let C,E=p?Ro(t):null;p&&k();function k(){const b=Ro(t);E&&!vy(E,b)&&o(),E=b,C=requestAnimationFrame(k)}return o(),()=>{var b;v.forEach(T=>{l&&T.removeEventListener("scroll",o),u&&T.removeEventListener("resize",o)}),w==null||w(),(b=R)==null||b.disconnect(),R=null,p&&cancelAnimationFrame(C)}}const Qb=Pb,Xb=jb,Jb=Rb,Zb=_b,eN=bb,eg=kb,tN=Tb,nN=(t,r,o)=>{const a=new Map,l={platform:Gb,...o},u={...l.platform,_c:a};return Cb(t,r,{...l,platform:u})};var cs=typeof document<"u"?y.useLayoutEffect:y.useEffect;function Ss(t,r){if(t===r)return!0;if(typeof t!=typeof r)return!1;if(typeof t=="function"&&t.toString()===r.toString())return!0;let o,a,l;if(t&&r&&typeof t=="object"){if(Array.isArray(t)){if(o=t.length,o!==r.length)return!1;for(a=o;a--!==0;)if(!Ss(t[a],r[a]))return!1;return!0}if(l=Object.keys(t),o=l.length,o!==Object.keys(r).length)return!1;for(a=o;a--!==0;)if(!{}.hasOwnProperty.call(r,l[a]))return!1;for(a=o;a--!==0;){const u=l[a];if(!(u==="_owner"&&t.$$typeof)&&!Ss(t[u],r[u]))return!1}return!0}return t!==t&&r!==r}function yy(t){return typeof window>"u"?1:(t.ownerDocument.defaultView||window).devicePixelRatio||1}function tg(t,r){const o=yy(t);return Math.round(r*o)/o}function ed(t){const r=y.useRef(t);return cs(()=>{r.current=t}),r}function rN(t){t===void 0&&(t={});const{placement:r="bottom",strategy:o="absolute",middleware:a=[],platform:l,elements:{reference:u,floating:c}={},transform:f=!0,whileElementsMounted:p,open:m}=t,[v,w]=y.useState({x:0,y:0,strategy:o,placement:r,middlewareData:{},isPositioned:!1}),[S,R]=y.useState(a);Ss(S,a)||R(a);const[C,E]=y.useState(null),[k,b]=y.useState(null),T=y.useCallback(M=>{M!==_.current&&(_.current=M,E(M))},[]),P=y.useCallback(M=>{M!==W.current&&(W.current=M,b(M))},[]),j=u||C,F=c||k,_=y.useRef(null),W=y.useRef(null),U=y.useRef(v),Y=p!=null,oe=ed(p),Re=ed(l),Te=ed(m),ae=y.useCallback(()=>{if(!_.current||!W.current)return;const M={placement:r,strategy:o,middleware:S};Re.current&&(M.platform=Re.current),nN(_.current,W.current,M).then(ee=>{const Q={...ee,isPositioned:Te.current!==!1};le.current&&!Ss(U.current,Q)&&(U.current=Q,hi.flushSync(()=>{w(Q)}))})},[S,r,o,Re,Te]);cs(()=>{m===!1&&U.current.isPositioned&&(U.current.isPositioned=!1,w(M=>({...M,isPositioned:!1})))},[m]);const le=y.useRef(!1);cs(()=>(le.current=!0,()=>{le.current=!1}),[]),cs(()=>{if(j&&(_.current=j),F&&(W.current=F),j&&F){if(oe.current)return oe.current(j,F,ae);ae()}},[j,F,ae,oe,Y]);const Se=y.useMemo(()=>({reference:_,floating:W,setReference:T,setFloating:P}),[T,P]),X=y.useMemo(()=>({reference:j,floating:F}),[j,F]),ie=y.useMemo(()=>{const M={position:o,left:0,top:0};if(!X.floating)return M;const ee=tg(X.floating,v.x),Q=tg(X.floating,v.y);return f?{...M,transform:"translate("+ee+"px, "+Q+"px)",...yy(X.floating)>=1.5&&{willChange:"transform"}}:{position:o,left:ee,top:Q}},[o,f,X.floating,v.x,v.y]);return y.useMemo(()=>({...v,update:ae,refs:Se,elements:X,floatingStyles:ie}),[v,ae,Se,X,ie])}const oN=t=>{function r(o){return{}.hasOwnProperty.call(o,"current")}return{name:"arrow",options:t,fn(o){const{element:a,padding:l}=typeof t=="function"?t(o):t;return a&&r(a)?a.current!=null?eg({element:a.current,padding:l}).fn(o):{}:a?eg({element:a,padding:l}).fn(o):{}}}},iN=(t,r)=>({...Qb(t),options:[t,r]}),aN=(t,r)=>({...Xb(t),options:[t,r]}),lN=(t,r)=>({...tN(t),options:[t,r]}),sN=(t,r)=>({...Jb(t),options:[t,r]}),uN=(t,r)=>({...Zb(t),options:[t,r]}),cN=(t,r)=>({...eN(t),options:[t,r]}),dN=(t,r)=>({...oN(t),options:[t,r]});var fN="Arrow",wy=y.forwardRef((t,r)=>{const{children:o,width:a=10,height:l=5,...u}=t;return g.jsx(qe.svg,{...u,ref:r,width:a,height:l,viewBox:"0 0 30 10",preserveAspectRatio:"none",children:t.asChild?o:g.jsx("polygon",{points:"0,0 30,0 15,10"})})});wy.displayName=fN;var pN=wy;function hN(t){const[r,o]=y.useState(void 0);return At(()=>{if(t){o({width:t.offsetWidth,height:t.offsetHeight});const a=new ResizeObserver(l=>{if(!Array.isArray(l)||!l.length)return;const u=l[0];let c,f;if("borderBoxSize"in u){const p=u.borderBoxSize,m=Array.isArray(p)?p[0]:p;c=m.inlineSize,f=m.blockSize}else c=t.offsetWidth,f=t.offsetHeight;o({width:c,height:f})});return a.observe(t,{box:"border-box"}),()=>a.unobserve(t)}else o(void 0)},[t]),r}var cf="Popper",[xy,Sy]=xi(cf),[mN,Ey]=xy(cf),Cy=t=>{const{__scopePopper:r,children:o}=t,[a,l]=y.useState(null);return g.jsx(mN,{scope:r,anchor:a,onAnchorChange:l,children:o})};Cy.displayName=cf;var ky="PopperAnchor",Ry=y.forwardRef((t,r)=>{const{__scopePopper:o,virtualRef:a,...l}=t,u=Ey(ky,o),c=y.useRef(null),f=ut(r,c);return y.useEffect(()=>{u.onAnchorChange((a==null?void 0:a.current)||c.current)}),a?null:g.jsx(qe.div,{...l,ref:f})});Ry.displayName=ky;var df="PopperContent",[gN,vN]=xy(df),by=y.forwardRef((t,r)=>{var te,ye,Ae,ve,Le,Ie;const{__scopePopper:o,side:a="bottom",sideOffset:l=0,align:u="center",alignOffset:c=0,arrowPadding:f=0,avoidCollisions:p=!0,collisionBoundary:m=[],collisionPadding:v=0,sticky:w="partial",hideWhenDetached:S=!1,updatePositionStrategy:R="optimized",onPlaced:C,...E}=t,k=Ey(df,o),[b,T]=y.useState(null),P=ut(r,ht=>T(ht)),[j,F]=y.useState(null),_=hN(j),W=(_==null?void 0:_.width)??0,U=(_==null?void 0:_.height)??0,Y=a+(u!=="center"?"-"+u:""),oe=typeof v=="number"?v:{top:0,right:0,bottom:0,left:0,...v},Re=Array.isArray(m)?m:[m],Te=Re.length>0,ae={padding:oe,boundary:Re.filter(wN),altBoundary:Te},{refs:le,floatingStyles:Se,placement:X,isPositioned:ie,middlewareData:M}=rN({strategy:"fixed",placement:Y,whileElementsMounted:(...ht)=>Yb(...ht,{animationFrame:R==="always"}),elements:{reference:k.anchor},middleware:[iN({mainAxis:l+U,alignmentAxis:c}),p&&aN({mainAxis:!0,crossAxis:!1,limiter:w==="partial"?lN():void 0,...ae}),p&&sN({...ae}),uN({...ae,apply:({elements:ht,rects:it,availableWidth:Mn,availableHeight:Fn})=>{const{width:un,height:To}=it.reference,In=ht.floating.style;In.setProperty("--radix-popper-available-width",`${Mn}px`),In.setProperty("--radix-popper-available-height",`${Fn}px`),In.setProperty("--radix-popper-anchor-width",`${un}px`),In.setProperty("--radix-popper-anchor-height",`${To}px`)}}),j&&dN({element:j,padding:f}),xN({arrowWidth:W,arrowHeight:U}),S&&cN({strategy:"referenceHidden",...ae})]}),[ee,Q]=jy(X),O=Hr(C);At(()=>{ie&&(O==null||O())},[ie,O]);const K=(te=M.arrow)==null?void 0:te.x,se=(ye=M.arrow)==null?void 0:ye.y,ce=((Ae=M.arrow)==null?void 0:Ae.centerOffset)!==0,[_e,je]=y.useState();return At(()=>{b&&je(window.getComputedStyle(b).zIndex)},[b]),g.jsx("div",{ref:le.setFloating,"data-radix-popper-content-wrapper":"",style:{...Se,transform:ie?Se.transform:"translate(0, -200%)",minWidth:"max-content",zIndex:_e,"--radix-popper-transform-origin":[(ve=M.transformOrigin)==null?void 0:ve.x,(Le=M.transformOrigin)==null?void 0:Le.y].join(" "),...((Ie=M.hide)==null?void 0:Ie.referenceHidden)&&{visibility:"hidden",pointerEvents:"none"}},dir:t.dir,children:g.jsx(gN,{scope:o,placedSide:ee,onArrowChange:F,arrowX:K,arrowY:se,shouldHideArrow:ce,children:g.jsx(qe.div,{"data-side":ee,"data-align":Q,...E,ref:P,style:{...E.style,animation:ie?void 0:"none"}})})})});by.displayName=df;var Ny="PopperArrow",yN={top:"bottom",right:"left",bottom:"top",left:"right"},Py=y.forwardRef(function(r,o){const{__scopePopper:a,...l}=r,u=vN(Ny,a),c=yN[u.placedSide];return g.jsx("span",{ref:u.onArrowChange,style:{position:"absolute",left:u.arrowX,top:u.arrowY,[c]:0,transformOrigin:{top:"",right:"0 0",bottom:"center 0",left:"100% 0"}[u.placedSide],transform:{top:"translateY(100%)",right:"translateY(50%) rotate(90deg) translateX(-50%)",bottom:"rotate(180deg)",left:"translateY(50%) rotate(-90deg) translateX(50%)"}[u.placedSide],visibility:u.shouldHideArrow?"hidden":void 0},children:g.jsx(pN,{...l,ref:o,style:{...l.style,display:"block"}})})});Py.displayName=Ny;function wN(t){return t!==null}var xN=t=>({name:"transformOrigin",options:t,fn(r){var k,b,T;const{placement:o,rects:a,middlewareData:l}=r,c=((k=l.arrow)==null?void 0:k.centerOffset)!==0,f=c?0:t.arrowWidth,p=c?0:t.arrowHeight,[m,v]=jy(o),w={start:"0%",center:"50%",end:"100%"}[v],S=(((b=l.arrow)==null?void 0:b.x)??0)+f/2,R=(((T=l.arrow)==null?void 0:T.y)??0)+p/2;let C="",E="";return m==="bottom"?(C=c?w:`${S}px`,E=`${-p}px`):m==="top"?(C=c?w:`${S}px`,E=`${a.floating.height+p}px`):m==="right"?(C=`${-p}px`,E=c?w:`${R}px`):m==="left"&&(C=`${a.floating.width+p}px`,E=c?w:`${R}px`),{data:{x:C,y:E}}}});function jy(t){const[r,o="center"]=t.split("-");return[r,o]}var SN=Cy,EN=Ry,CN=by,kN=Py;function RN(t){const r=y.useRef({value:t,previous:t});return y.useMemo(()=>(r.current.value!==t&&(r.current.previous=r.current.value,r.current.value=t),r.current.previous),[t])}var Ty=Object.freeze({position:"absolute",border:0,width:1,height:1,padding:0,margin:-1,overflow:"hidden",clip:"rect(0, 0, 0, 0)",whiteSpace:"nowrap",wordWrap:"normal"}),bN="VisuallyHidden",NN=y.forwardRef((t,r)=>g.jsx(qe.span,{...t,ref:r,style:{...Ty,...t.style}}));NN.displayName=bN;var PN=[" ","Enter","ArrowUp","ArrowDown"],jN=[" ","Enter"],bo="Select",[Ws,Ks,TN]=sy(bo),[bi,GP]=xi(bo,[TN,Sy]),Gs=Sy(),[_N,Yr]=bi(bo),[AN,DN]=bi(bo),_y=t=>{const{__scopeSelect:r,children:o,open:a,defaultOpen:l,onOpenChange:u,value:c,defaultValue:f,onValueChange:p,dir:m,name:v,autoComplete:w,disabled:S,required:R,form:C}=t,E=Gs(r),[k,b]=y.useState(null),[T,P]=y.useState(null),[j,F]=y.useState(!1),_=tf(m),[W,U]=Na({prop:a,defaultProp:l??!1,onChange:u,caller:bo}),[Y,oe]=Na({prop:c,defaultProp:f,onChange:p,caller:bo}),Re=y.useRef(null),Te=k?C||!!k.closest("form"):!0,[ae,le]=y.useState(new Set),Se=Array.from(ae).map(X=>X.props.value).join(";");return g.jsx(SN,{...E,children:g.jsxs(_N,{required:R,scope:r,trigger:k,onTriggerChange:b,valueNode:T,onValueNodeChange:P,valueNodeHasChildren:j,onValueNodeHasChildrenChange:F,contentId:Ur(),value:Y,onValueChange:oe,open:W,onOpenChange:U,dir:_,triggerPointerDownPosRef:Re,disabled:S,children:[g.jsx(Ws.Provider,{scope:r,children:g.jsx(AN,{scope:t.__scopeSelect,onNativeOptionAdd:y.useCallback(X=>{le(ie=>new Set(ie).add(X))},[]),onNativeOptionRemove:y.useCallback(X=>{le(ie=>{const M=new Set(ie);return M.delete(X),M})},[]),children:o})}),Te?g.jsxs(t0,{"aria-hidden":!0,required:R,tabIndex:-1,name:v,autoComplete:w,value:Y,onChange:X=>oe(X.target.value),disabled:S,form:C,children:[Y===void 0?g.jsx("option",{value:""}):null,Array.from(ae)]},Se):null]})})};_y.displayName=bo;var Ay="SelectTrigger",Dy=y.forwardRef((t,r)=>{const{__scopeSelect:o,disabled:a=!1,...l}=t,u=Gs(o),c=Yr(Ay,o),f=c.disabled||a,p=ut(r,c.onTriggerChange),m=Ks(o),v=y.useRef("touch"),[w,S,R]=r0(E=>{const k=m().filter(P=>!P.disabled),b=k.find(P=>P.value===c.value),T=o0(k,E,b);T!==void 0&&c.onValueChange(T.value)}),C=E=>{f||(c.onOpenChange(!0),R()),E&&(c.triggerPointerDownPosRef.current={x:Math.round(E.pageX),y:Math.round(E.pageY)})};return g.jsx(EN,{asChild:!0,...u,children:g.jsx(qe.button,{type:"button",role:"combobox","aria-controls":c.contentId,"aria-expanded":c.open,"aria-required":c.required,"aria-autocomplete":"none",dir:c.dir,"data-state":c.open?"open":"closed",disabled:f,"data-disabled":f?"":void 0,"data-placeholder":n0(c.value)?"":void 0,...l,ref:p,onClick:We(l.onClick,E=>{E.currentTarget.focus(),v.current!=="mouse"&&C(E)}),onPointerDown:We(l.onPointerDown,E=>{v.current=E.pointerType;const k=E.target;k.hasPointerCapture(E.pointerId)&&k.releasePointerCapture(E.pointerId),E.button===0&&E.ctrlKey===!1&&E.pointerType==="mouse"&&(C(E),E.preventDefault())}),onKeyDown:We(l.onKeyDown,E=>{const k=w.current!=="";!(E.ctrlKey||E.altKey||E.metaKey)&&E.key.length===1&&S(E.key),!(k&&E.key===" ")&&PN.includes(E.key)&&(C(),E.preventDefault())})})})});Dy.displayName=Ay;var Oy="SelectValue",Ly=y.forwardRef((t,r)=>{const{__scopeSelect:o,className:a,style:l,children:u,placeholder:c="",...f}=t,p=Yr(Oy,o),{onValueNodeHasChildrenChange:m}=p,v=u!==void 0,w=ut(r,p.onValueNodeChange);return At(()=>{m(v)},[m,v]),g.jsx(qe.span,{...f,ref:w,style:{pointerEvents:"none"},children:n0(p.value)?g.jsx(g.Fragment,{children:c}):u})});Ly.displayName=Oy;var ON="SelectIcon",My=y.forwardRef((t,r)=>{const{__scopeSelect:o,children:a,...l}=t;return g.jsx(qe.span,{"aria-hidden":!0,...l,ref:r,children:a||"▼"})});My.displayName=ON;var LN="SelectPortal",Fy=t=>g.jsx(Qd,{asChild:!0,...t});Fy.displayName=LN;var No="SelectContent",Iy=y.forwardRef((t,r)=>{const o=Yr(No,t.__scopeSelect),[a,l]=y.useState();if(At(()=>{l(new DocumentFragment)},[]),!o.open){const u=a;return u?hi.createPortal(g.jsx(zy,{scope:t.__scopeSelect,children:g.jsx(Ws.Slot,{scope:t.__scopeSelect,children:g.jsx("div",{children:t.children})})}),u):null}return g.jsx(Uy,{...t,ref:r})});Iy.displayName=No;var jn=10,[zy,Qr]=bi(No),MN="SelectContentImpl",FN=di("SelectContent.RemoveScroll"),Uy=y.forwardRef((t,r)=>{const{__scopeSelect:o,position:a="item-aligned",onCloseAutoFocus:l,onEscapeKeyDown:u,onPointerDownOutside:c,side:f,sideOffset:p,align:m,alignOffset:v,arrowPadding:w,collisionBoundary:S,collisionPadding:R,sticky:C,hideWhenDetached:E,avoidCollisions:k,...b}=t,T=Yr(No,o),[P,j]=y.useState(null),[F,_]=y.useState(null),W=ut(r,te=>j(te)),[U,Y]=y.useState(null),[oe,Re]=y.useState(null),Te=Ks(o),[ae,le]=y.useState(!1),Se=y.useRef(!1);y.useEffect(()=>{if(P)return zv(P)},[P]),Tv();const X=y.useCallback(te=>{const[ye,...Ae]=Te().map(Ie=>Ie.ref.current),[ve]=Ae.slice(-1),Le=document.activeElement;for(const Ie of te)if(Ie===Le||(Ie==null||Ie.scrollIntoView({block:"nearest"}),Ie===ye&&F&&(F.scrollTop=0),Ie===ve&&F&&(F.scrollTop=F.scrollHeight),Ie==null||Ie.focus(),document.activeElement!==Le))return},[Te,F]),ie=y.useCallback(()=>X([U,P]),[X,U,P]);y.useEffect(()=>{ae&&ie()},[ae,ie]);const{onOpenChange:M,triggerPointerDownPosRef:ee}=T;y.useEffect(()=>{if(P){let te={x:0,y:0};const ye=ve=>{var Le,Ie;te={x:Math.abs(Math.round(ve.pageX)-(((Le=ee.current)==null?void 0:Le.x)??0)),y:Math.abs(Math.round(ve.pageY)-(((Ie=ee.current)==null?void 0:Ie.y)??0))}},Ae=ve=>{te.x<=10&&te.y<=10?ve.preventDefault():P.contains(ve.target)||M(!1),document.removeEventListener("pointermove",ye),ee.current=null};return ee.current!==null&&(document.addEventListener("pointermove",ye),document.addEventListener("pointerup",Ae,{capture:!0,once:!0})),()=>{document.removeEventListener("pointermove",ye),document.removeEventListener("pointerup",Ae,{capture:!0})}}},[P,M,ee]),y.useEffect(()=>{const te=()=>M(!1);return window.addEventListener("blur",te),window.addEventListener("resize",te),()=>{window.removeEventListener("blur",te),window.removeEventListener("resize",te)}},[M]);const[Q,O]=r0(te=>{const ye=Te().filter(Le=>!Le.disabled),Ae=ye.find(Le=>Le.ref.current===document.activeElement),ve=o0(ye,te,Ae);ve&&setTimeout(()=>ve.ref.current.focus())}),K=y.useCallback((te,ye,Ae)=>{const ve=!Se.current&&!Ae;(T.value!==void 0&&T.value===ye||ve)&&(Y(te),ve&&(Se.current=!0))},[T.value]),se=y.useCallback(()=>P==null?void 0:P.focus(),[P]),ce=y.useCallback((te,ye,Ae)=>{const ve=!Se.current&&!Ae;(T.value!==void 0&&T.value===ye||ve)&&Re(te)},[T.value]),_e=a==="popper"?xd:$y,je=_e===xd?{side:f,sideOffset:p,align:m,alignOffset:v,arrowPadding:w,collisionBoundary:S,collisionPadding:R,sticky:C,hideWhenDetached:E,avoidCollisions:k}:{};return g.jsx(zy,{scope:o,content:P,viewport:F,onViewportChange:_,itemRefCallback:K,selectedItem:U,onItemLeave:se,itemTextRefCallback:ce,focusSelectedItem:ie,selectedItemText:oe,position:a,isPositioned:ae,searchRef:Q,children:g.jsx(Xd,{as:FN,allowPinchZoom:!0,children:g.jsx(Yd,{asChild:!0,trapped:T.open,onMountAutoFocus:te=>{te.preventDefault()},onUnmountAutoFocus:We(l,te=>{var ye;(ye=T.trigger)==null||ye.focus({preventScroll:!0}),te.preventDefault()}),children:g.jsx(qd,{asChild:!0,disableOutsidePointerEvents:!0,onEscapeKeyDown:u,onPointerDownOutside:c,onFocusOutside:te=>te.preventDefault(),onDismiss:()=>T.onOpenChange(!1),children:g.jsx(_e,{role:"listbox",id:T.contentId,"data-state":T.open?"open":"closed",dir:T.dir,onContextMenu:te=>te.preventDefault(),...b,...je,onPlaced:()=>le(!0),ref:W,style:{display:"flex",flexDirection:"column",outline:"none",...b.style},onKeyDown:We(b.onKeyDown,te=>{const ye=te.ctrlKey||te.altKey||te.metaKey;if(te.key==="Tab"&&te.preventDefault(),!ye&&te.key.length===1&&O(te.key),["ArrowUp","ArrowDown","Home","End"].includes(te.key)){let ve=Te().filter(Le=>!Le.disabled).map(Le=>Le.ref.current);if(["ArrowUp","End"].includes(te.key)&&(ve=ve.slice().reverse()),["ArrowUp","ArrowDown"].includes(te.key)){const Le=te.target,Ie=ve.indexOf(Le);ve=ve.slice(Ie+1)}setTimeout(()=>X(ve)),te.preventDefault()}})})})})})})});Uy.displayName=MN;var IN="SelectItemAlignedPosition",$y=y.forwardRef((t,r)=>{const{__scopeSelect:o,onPlaced:a,...l}=t,u=Yr(No,o),c=Qr(No,o),[f,p]=y.useState(null),[m,v]=y.useState(null),w=ut(r,W=>v(W)),S=Ks(o),R=y.useRef(!1),C=y.useRef(!0),{viewport:E,selectedItem:k,selectedItemText:b,focusSelectedItem:T}=c,P=y.useCallback(()=>{if(u.trigger&&u.valueNode&&f&&m&&E&&k&&b){const W=u.trigger.getBoundingClientRect(),U=m.getBoundingClientRect(),Y=u.valueNode.getBoundingClientRect(),oe=b.getBoundingClientRect();if(u.dir!=="rtl"){const Le=oe.left-U.left,Ie=Y.left-Le,ht=W.left-Ie,it=W.width+ht,Mn=Math.max(it,U.width),Fn=window.innerWidth-jn,un=Gm(Ie,[jn,Math.max(jn,Fn-Mn)]);f.style.minWidth=it+"px",f.style.left=un+"px"}else{const Le=U.right-oe.right,Ie=window.innerWidth-Y.right-Le,ht=window.innerWidth-W.right-Ie,it=W.width+ht,Mn=Math.max(it,U.width),Fn=window.innerWidth-jn,un=Gm(Ie,[jn,Math.max(jn,Fn-Mn)]);f.style.minWidth=it+"px",f.style.right=un+"px"}const Re=S(),Te=window.innerHeight-jn*2,ae=E.scrollHeight,le=window.getComputedStyle(m),Se=parseInt(le.borderTopWidth,10),X=parseInt(le.paddingTop,10),ie=parseInt(le.borderBottomWidth,10),M=parseInt(le.paddingBottom,10),ee=Se+X+ae+M+ie,Q=Math.min(k.offsetHeight*5,ee),O=window.getComputedStyle(E),K=parseInt(O.paddingTop,10),se=parseInt(O.paddingBottom,10),ce=W.top+W.height/2-jn,_e=Te-ce,je=k.offsetHeight/2,te=k.offsetTop+je,ye=Se+X+te,Ae=ee-ye;if(ye<=ce){const Le=Re.length>0&&k===Re[Re.length-1].ref.current;f.style.bottom="0px";const Ie=m.clientHeight-E.offsetTop-E.offsetHeight,ht=Math.max(_e,je+(Le?se:0)+Ie+ie),it=ye+ht;f.style.height=it+"px"}else{const Le=Re.length>0&&k===Re[0].ref.current;f.style.top="0px";const ht=Math.max(ce,Se+E.offsetTop+(Le?K:0)+je)+Ae;f.style.height=ht+"px",E.scrollTop=ye-ce+E.offsetTop}f.style.margin=`${jn}px 0`,f.style.minHeight=Q+"px",f.style.maxHeight=Te+"px",a==null||a(),requestAnimationFrame(()=>R.current=!0)}},[S,u.trigger,u.valueNode,f,m,E,k,b,u.dir,a]);At(()=>P(),[P]);const[j,F]=y.useState();At(()=>{m&&F(window.getComputedStyle(m).zIndex)},[m]);const _=y.useCallback(W=>{W&&C.current===!0&&(P(),T==null||T(),C.current=!1)},[P,T]);return g.jsx(UN,{scope:o,contentWrapper:f,shouldExpandOnScrollRef:R,onScrollButtonChange:_,children:g.jsx("div",{ref:p,style:{display:"flex",flexDirection:"column",position:"fixed",zIndex:j},children:g.jsx(qe.div,{...l,ref:w,style:{boxSizing:"border-box",maxHeight:"100%",...l.style}})})})});$y.displayName=IN;var zN="SelectPopperPosition",xd=y.forwardRef((t,r)=>{const{__scopeSelect:o,align:a="start",collisionPadding:l=jn,...u}=t,c=Gs(o);return g.jsx(CN,{...c,...u,ref:r,align:a,collisionPadding:l,style:{boxSizing:"border-box",...u.style,"--radix-select-content-transform-origin":"var(--radix-popper-transform-origin)","--radix-select-content-available-width":"var(--radix-popper-available-width)","--radix-select-content-available-height":"var(--radix-popper-available-height)","--radix-select-trigger-width":"var(--radix-popper-anchor-width)","--radix-select-trigger-height":"var(--radix-popper-anchor-height)"}})});xd.displayName=zN;var[UN,ff]=bi(No,{}),Sd="SelectViewport",By=y.forwardRef((t,r)=>{const{__scopeSelect:o,nonce:a,...l}=t,u=Qr(Sd,o),c=ff(Sd,o),f=ut(r,u.onViewportChange),p=y.useRef(0);return g.jsxs(g.Fragment,{children:[g.jsx("style",{dangerouslySetInnerHTML:{__html:"[data-radix-select-viewport]{scrollbar-width:none;-ms-overflow-style:none;-webkit-overflow-scrolling:touch;}[data-radix-select-viewport]::-webkit-scrollbar{display:none}"},nonce:a}),g.jsx(Ws.Slot,{scope:o,children:g.jsx(qe.div,{"data-radix-select-viewport":"",role:"presentation",...l,ref:f,style:{position:"relative",flex:1,overflow:"hidden auto",...l.style},onScroll:We(l.onScroll,m=>{const v=m.currentTarget,{contentWrapper:w,shouldExpandOnScrollRef:S}=c;if(S!=null&&S.current&&w){const R=Math.abs(p.current-v.scrollTop);if(R>0){const C=window.innerHeight-jn*2,E=parseFloat(w.style.minHeight),k=parseFloat(w.style.height),b=Math.max(E,k);if(b<C){const T=b+R,P=Math.min(C,T),j=T-P;w.style.height=P+"px",w.style.bottom==="0px"&&(v.scrollTop=j>0?j:0,w.style.justifyContent="flex-end")}}}p.current=v.scrollTop})})})]})});By.displayName=Sd;var Hy="SelectGroup",[$N,BN]=bi(Hy),HN=y.forwardRef((t,r)=>{const{__scopeSelect:o,...a}=t,l=Ur();return g.jsx($N,{scope:o,id:l,children:g.jsx(qe.div,{role:"group","aria-labelledby":l,...a,ref:r})})});HN.displayName=Hy;var Vy="SelectLabel",Wy=y.forwardRef((t,r)=>{const{__scopeSelect:o,...a}=t,l=BN(Vy,o);return g.jsx(qe.div,{id:l.id,...a,ref:r})});Wy.displayName=Vy;var Es="SelectItem",[VN,Ky]=bi(Es),Gy=y.forwardRef((t,r)=>{const{__scopeSelect:o,value:a,disabled:l=!1,textValue:u,...c}=t,f=Yr(Es,o),p=Qr(Es,o),m=f.value===a,[v,w]=y.useState(u??""),[S,R]=y.useState(!1),C=ut(r,T=>{var P;return(P=p.itemRefCallback)==null?void 0:P.call(p,T,a,l)}),E=Ur(),k=y.useRef("touch"),b=()=>{l||(f.onValueChange(a),f.onOpenChange(!1))};if(a==="")throw new Error("A <Select.Item /> must have a value prop that is not an empty string. This is because the Select value can be set to an empty string to clear the selection and show the placeholder.");return g.jsx(VN,{scope:o,value:a,disabled:l,textId:E,isSelected:m,onItemTextChange:y.useCallback(T=>{w(P=>P||((T==null?void 0:T.textContent)??"").trim())},[]),children:g.jsx(Ws.ItemSlot,{scope:o,value:a,disabled:l,textValue:v,children:g.jsx(qe.div,{role:"option","aria-labelledby":E,"data-highlighted":S?"":void 0,"aria-selected":m&&S,"data-state":m?"checked":"unchecked","aria-disabled":l||void 0,"data-disabled":l?"":void 0,tabIndex:l?void 0:-1,...c,ref:C,onFocus:We(c.onFocus,()=>R(!0)),onBlur:We(c.onBlur,()=>R(!1)),onClick:We(c.onClick,()=>{k.current!=="mouse"&&b()}),onPointerUp:We(c.onPointerUp,()=>{k.current==="mouse"&&b()}),onPointerDown:We(c.onPointerDown,T=>{k.current=T.pointerType}),onPointerMove:We(c.onPointerMove,T=>{var P;k.current=T.pointerType,l?(P=p.onItemLeave)==null||P.call(p):k.current==="mouse"&&T.currentTarget.focus({preventScroll:!0})}),onPointerLeave:We(c.onPointerLeave,T=>{var P;T.currentTarget===document.activeElement&&((P=p.onItemLeave)==null||P.call(p))}),onKeyDown:We(c.onKeyDown,T=>{var j;((j=p.searchRef)==null?void 0:j.current)!==""&&T.key===" "||(jN.includes(T.key)&&b(),T.key===" "&&T.preventDefault())})})})})});Gy.displayName=Es;var Ea="SelectItemText",qy=y.forwardRef((t,r)=>{const{__scopeSelect:o,className:a,style:l,...u}=t,c=Yr(Ea,o),f=Qr(Ea,o),p=Ky(Ea,o),m=DN(Ea,o),[v,w]=y.useState(null),S=ut(r,b=>w(b),p.onItemTextChange,b=>{var T;return(T=f.itemTextRefCallback)==null?void 0:T.call(f,b,p.value,p.disabled)}),R=v==null?void 0:v.textContent,C=y.useMemo(()=>g.jsx("option",{value:p.value,disabled:p.disabled,children:R},p.value),[p.disabled,p.value,R]),{onNativeOptionAdd:E,onNativeOptionRemove:k}=m;return At(()=>(E(C),()=>k(C)),[E,k,C]),g.jsxs(g.Fragment,{children:[g.jsx(qe.span,{id:p.textId,...u,ref:S}),p.isSelected&&c.valueNode&&!c.valueNodeHasChildren?hi.createPortal(u.children,c.valueNode):null]})});qy.displayName=Ea;var Yy="SelectItemIndicator",Qy=y.forwardRef((t,r)=>{const{__scopeSelect:o,...a}=t;return Ky(Yy,o).isSelected?g.jsx(qe.span,{"aria-hidden":!0,...a,ref:r}):null});Qy.displayName=Yy;var Ed="SelectScrollUpButton",Xy=y.forwardRef((t,r)=>{const o=Qr(Ed,t.__scopeSelect),a=ff(Ed,t.__scopeSelect),[l,u]=y.useState(!1),c=ut(r,a.onScrollButtonChange);return At(()=>{if(o.viewport&&o.isPositioned){let f=function(){const m=p.scrollTop>0;u(m)};const p=o.viewport;return f(),p.addEventListener("scroll",f),()=>p.removeEventListener("scroll",f)}},[o.viewport,o.isPositioned]),l?g.jsx(Zy,{...t,ref:c,onAutoScroll:()=>{const{viewport:f,selectedItem:p}=o;f&&p&&(f.scrollTop=f.scrollTop-p.offsetHeight)}}):null});Xy.displayName=Ed;var Cd="SelectScrollDownButton",Jy=y.forwardRef((t,r)=>{const o=Qr(Cd,t.__scopeSelect),a=ff(Cd,t.__scopeSelect),[l,u]=y.useState(!1),c=ut(r,a.onScrollButtonChange);return At(()=>{if(o.viewport&&o.isPositioned){let f=function(){const m=p.scrollHeight-p.clientHeight,v=Math.ceil(p.scrollTop)<m;u(v)};const p=o.viewport;return f(),p.addEventListener("scroll",f),()=>p.removeEventListener("scroll",f)}},[o.viewport,o.isPositioned]),l?g.jsx(Zy,{...t,ref:c,onAutoScroll:()=>{const{viewport:f,selectedItem:p}=o;f&&p&&(f.scrollTop=f.scrollTop+p.offsetHeight)}}):null});Jy.displayName=Cd;var Zy=y.forwardRef((t,r)=>{const{__scopeSelect:o,onAutoScroll:a,...l}=t,u=Qr("SelectScrollButton",o),c=y.useRef(null),f=Ks(o),p=y.useCallback(()=>{c.current!==null&&(window.clearInterval(c.current),c.current=null)},[]);return y.useEffect(()=>()=>p(),[p]),At(()=>{var v;const m=f().find(w=>w.ref.current===document.activeElement);(v=m==null?void 0:m.ref.current)==null||v.scrollIntoView({block:"nearest"})},[f]),g.jsx(qe.div,{"aria-hidden":!0,...l,ref:r,style:{flexShrink:0,...l.style},onPointerDown:We(l.onPointerDown,()=>{c.current===null&&(c.current=window.setInterval(a,50))}),onPointerMove:We(l.onPointerMove,()=>{var m;(m=u.onItemLeave)==null||m.call(u),c.current===null&&(c.current=window.setInterval(a,50))}),onPointerLeave:We(l.onPointerLeave,()=>{p()})})}),WN="SelectSeparator",e0=y.forwardRef((t,r)=>{const{__scopeSelect:o,...a}=t;return g.jsx(qe.div,{"aria-hidden":!0,...a,ref:r})});e0.displayName=WN;var kd="SelectArrow",KN=y.forwardRef((t,r)=>{const{__scopeSelect:o,...a}=t,l=Gs(o),u=Yr(kd,o),c=Qr(kd,o);return u.open&&c.position==="popper"?g.jsx(kN,{...l,...a,ref:r}):null});KN.displayName=kd;var GN="SelectBubbleInput",t0=y.forwardRef(({__scopeSelect:t,value:r,...o},a)=>{const l=y.useRef(null),u=ut(a,l),c=RN(r);return y.useEffect(()=>{const f=l.current;if(!f)return;const p=window.HTMLSelectElement.prototype,v=Object.getOwnPropertyDescriptor(p,"value").set;if(c!==r&&v){const w=new Event("change",{bubbles:!0});v.call(f,r),f.dispatchEvent(w)}},[c,r]),g.jsx(qe.select,{...o,style:{...Ty,...o.style},ref:u,defaultValue:r})});t0.displayName=GN;function n0(t){return t===""||t===void 0}function r0(t){const r=Hr(t),o=y.useRef(""),a=y.useRef(0),l=y.useCallback(c=>{const f=o.current+c;r(f),function p(m){o.current=m,window.clearTimeout(a.current),m!==""&&(a.current=window.setTimeout(()=>p(""),1e3))}(f)},[r]),u=y.useCallback(()=>{o.current="",window.clearTimeout(a.current)},[]);return y.useEffect(()=>()=>window.clearTimeout(a.current),[]),[o,l,u]}function o0(t,r,o){const l=r.length>1&&Array.from(r).every(m=>m===r[0])?r[0]:r,u=o?t.indexOf(o):-1;let c=qN(t,Math.max(u,0));l.length===1&&(c=c.filter(m=>m!==o));const p=c.find(m=>m.textValue.toLowerCase().startsWith(l.toLowerCase()));return p!==o?p:void 0}function qN(t,r){return t.map((o,a)=>t[(r+a)%t.length])}var YN=_y,i0=Dy,QN=Ly,XN=My,JN=Fy,a0=Iy,ZN=By,l0=Wy,s0=Gy,eP=qy,tP=Qy,u0=Xy,c0=Jy,d0=e0;const Rd=YN,bd=QN,Cs=y.forwardRef(({className:t,children:r,...o},a)=>g.jsxs(i0,{ref:a,className:Qe("flex h-9 w-full items-center justify-between whitespace-nowrap rounded-md border border-zinc-200 bg-transparent px-3 py-2 text-sm shadow-sm ring-offset-white data-[placeholder]:text-zinc-500 focus:outline-none focus:ring-1 focus:ring-zinc-950 disabled:cursor-not-allowed disabled:opacity-50 [&>span]:line-clamp-1 dark:border-zinc-800 dark:ring-offset-zinc-950 dark:data-[placeholder]:text-zinc-400 dark:focus:ring-zinc-300",t),...o,children:[r,g.jsx(XN,{asChild:!0,children:g.jsx(yv,{className:"h-4 w-4 opacity-50"})})]}));Cs.displayName=i0.displayName;const f0=y.forwardRef(({className:t,...r},o)=>g.jsx(u0,{ref:o,className:Qe("flex cursor-default items-center justify-center py-1",t),...r,children:g.jsx(wk,{className:"h-4 w-4"})}));f0.displayName=u0.displayName;const p0=y.forwardRef(({className:t,...r},o)=>g.jsx(c0,{ref:o,className:Qe("flex cursor-default items-center justify-center py-1",t),...r,children:g.jsx(yv,{className:"h-4 w-4"})}));p0.displayName=c0.displayName;const ks=y.forwardRef(({className:t,children:r,position:o="popper",...a},l)=>g.jsx(JN,{children:g.jsxs(a0,{ref:l,className:Qe("relative z-50 max-h-[--radix-select-content-available-height] min-w-[8rem] overflow-y-auto overflow-x-hidden rounded-md border border-zinc-200 bg-white text-zinc-950 shadow-md data-[state=open]:animate-in data-[state=closed]:animate-out data-[state=closed]:fade-out-0 data-[state=open]:fade-in-0 data-[state=closed]:zoom-out-95 data-[state=open]:zoom-in-95 data-[side=bottom]:slide-in-from-top-2 data-[side=left]:slide-in-from-right-2 data-[side=right]:slide-in-from-left-2 data-[side=top]:slide-in-from-bottom-2 origin-[--radix-select-content-transform-origin] dark:border-zinc-800 dark:bg-zinc-950 dark:text-zinc-50",o==="popper"&&"data-[side=bottom]:translate-y-1 data-[side=left]:-translate-x-1 data-[side=right]:translate-x-1 data-[side=top]:-translate-y-1",t),position:o,...a,children:[g.jsx(f0,{}),g.jsx(ZN,{className:Qe("p-1",o==="popper"&&"h-[var(--radix-select-trigger-height)] w-full min-w-[var(--radix-select-trigger-width)]"),children:r}),g.jsx(p0,{})]})}));ks.displayName=a0.displayName;const nP=y.forwardRef(({className:t,...r},o)=>g.jsx(l0,{ref:o,className:Qe("px-2 py-1.5 text-sm font-semibold",t),...r}));nP.displayName=l0.displayName;const Ca=y.forwardRef(({className:t,children:r,...o},a)=>g.jsxs(s0,{ref:a,className:Qe("relative flex w-full cursor-default select-none items-center rounded-sm py-1.5 pl-2 pr-8 text-sm outline-none focus:bg-zinc-100 focus:text-zinc-900 data-[disabled]:pointer-events-none data-[disabled]:opacity-50 dark:focus:bg-zinc-800 dark:focus:text-zinc-50",t),...o,children:[g.jsx("span",{className:"absolute right-2 flex h-3.5 w-3.5 items-center justify-center",children:g.jsx(tP,{children:g.jsx(vv,{className:"h-4 w-4"})})}),g.jsx(eP,{children:r})]}));Ca.displayName=s0.displayName;const rP=y.forwardRef(({className:t,...r},o)=>g.jsx(d0,{ref:o,className:Qe("-mx-1 my-1 h-px bg-zinc-100 dark:bg-zinc-800",t),...r}));rP.displayName=d0.displayName;const oP=()=>{const[t,r]=y.useState([]),[o,a]=y.useState([]),[l,u]=y.useState(!0),[c,f]=y.useState(null),[p,m]=y.useState(""),[v,w]=y.useState(!1),[S,R]=y.useState(null);y.useEffect(()=>{C(),E()},[S]);const C=async()=>{try{u(!0);const j=await mC(S||void 0);r(j)}catch(j){console.error("Error fetching documents:",j)}finally{u(!1)}},E=async()=>{try{const F=await Hd();a(F),F.length>0&&!p&&m(F[0].id)}catch(j){console.error("Error fetching folders:",j)}},k=j=>{j.target.files&&j.target.files.length>0&&f(j.target.files[0])},b=async()=>{if(!(!c||!p))try{await gC(c,p),f(null),w(!1),C()}catch(j){console.error("Error uploading document:",j)}},T=async j=>{try{await vC(j),C()}catch(F){console.error("Error deleting document:",F)}},zD=async j=>{try{const F=await hD(j.id),_=URL.createObjectURL(F);window.open(_,"_blank","noopener,noreferrer"),setTimeout(()=>URL.revokeObjectURL(_),6e4)}catch(F){console.error("Error downloading document:",F)}},P=j=>{if(j===0)return"0 Bytes";const F=1024,_=["Bytes","KB","MB","GB"],W=Math.floor(Math.log(j)/Math.log(F));return parseFloat((j/Math.pow(F,W)).toFixed(2))+" "+_[W]};return g.jsxs("div",{className:"space-y-6",children:[g.jsxs("div",{className:"flex justify-between items-center",children:[g.jsxs("div",{children:[g.jsx("h1",{className:"text-3xl font-bold",children:"Documents"}),g.jsx("p",{className:"text-gray-500 mt-1",children:"Manage your documents"})]}),g.jsxs(La,{open:v,onOpenChange:w,children:[g.jsx($s,{asChild:!0,children:g.jsxs(Be,{children:[g.jsx(Fs,{className:"mr-2 h-4 w-4"}),"Upload Document"]})}),g.jsxs(Si,{children:[g.jsx(Ei,{children:g.jsx(Ci,{children:"Upload New Document"})}),g.jsxs("div",{className:"grid gap-4 py-4",children:[g.jsxs("div",{className:"grid gap-2",children:[g.jsx(Mt,{htmlFor:"folder",children:"Select Folder"}),g.jsxs(Rd,{value:p,onValueChange:m,children:[g.jsx(Cs,{children:g.jsx(bd,{placeholder:"Select a folder"})}),g.jsx(ks,{children:o.map(j=>g.jsx(Ca,{value:j.id,children:j.name},j.id))})]})]}),g.jsxs("div",{className:"grid gap-2",children:[g.jsx(Mt,{htmlFor:"file",children:"Document File"}),g.jsx(vn,{id:"file",type:"file",onChange:k})]})]}),g.jsx(Be,{onClick:b,disabled:!c||!p,children:"Upload Document"})]})]})]}),g.jsxs("div",{className:"grid gap-4",children:[g.jsx(Mt,{children:"Filter by Folder"}),g.jsxs(Rd,{value:S||"all",onValueChange:j=>R(j==="all"?null:j),children:[g.jsx(Cs,{children:g.jsx(bd,{placeholder:"All Folders"})}),g.jsxs(ks,{children:[g.jsx(Ca,{value:"all",children:"All Folders"}),o.map(j=>g.jsx(Ca,{value:j.id,children:j.name},j.id))]})]})]}),l?g.jsx("div",{className:"text-center py-10",children:"Loading documents..."}):t.length===0?g.jsx("div",{className:"text-center py-10 text-gray-500",children:"No documents found. Upload a document to get started."}):g.jsx("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-4",children:t.map(j=>g.jsxs(Gt,{className:"overflow-hidden",children:[g.jsx(qt,{className:"pb-2",children:g.jsxs(Yt,{className:"flex items-center text-base",children:[g.jsx(xv,{className:"mr-2 h-5 w-5 text-blue-500"}),j.name]})}),g.jsxs(Qt,{children:[g.jsxs("div",{className:"text-sm text-gray-500 space-y-1",children:[g.jsxs("p",{children:["Size: ",P(j.file_size)]}),g.jsxs("p",{children:["Type: ",j.file_type]}),g.jsxs("p",{children:["Created: ",new Date(j.created_at).toLocaleDateString()]})]}),g.jsxs("div",{className:"flex space-x-2 mt-4",children:[g.jsxs(Be,{variant:"outline",size:"sm",onClick:()=>zD(j),children:[g.jsx(Ek,{className:"mr-1 h-4 w-4"}),"Download"]}),g.jsxs(Be,{variant:"outline",size:"sm",onClick:()=>T(j.id),children:[g.jsx(Is,{className:"mr-1 h-4 w-4"}),"Delete"]})]})]})]},j.id))})]})},qs=y.forwardRef(({className:t,...r},o)=>g.jsx("textarea",{className:Qe("flex min-h-[60px] w-full rounded-md border border-zinc-200 bg-transparent px-3 py-2 text-base shadow-sm placeholder:text-zinc-500 focus-visible:outline-none focus-visible:ring-1 focus-visible:ring-zinc-950 disabled:cursor-not-allowed disabled:opacity-50 md:text-sm dark:border-zinc-800 dark:placeholder:text-zinc-400 dark:focus-visible:ring-zinc-300",t),ref:o,...r}));qs.displayName="Textarea";const iP=()=>{const[t,r]=y.useState([]),[o,a]=y.useState([]),[l,u]=y.useState(!0),[c,f]=y.useState(""),[p,m]=y.useState(""),[v,w]=y.useState(""),[S,R]=y.useState(!1),C=qr();y.useEffect(()=>{E(),k()},[]);const E=async()=>{try{u(!0);const j=await yC();r(j)}catch(j){console.error("Error fetching approval forms:",j)}finally{u(!1)}},k=async()=>{try{const F=await Hd();a(F),F.length>0&&!v&&w(F[0].id)}catch(j){console.error("Error fetching folders:",j)}},b=async()=>{if(c.trim())try{await wC({name:c,description:p,fields:[],target_folder_id:v||null}),f(""),m(""),R(!1),E()}catch(j){console.error("Error creating approval form:",j)}},T=async j=>{try{await xC(j),E()}catch(F){console.error("Error deleting approval form:",F)}},P=j=>{C(`/approval-forms/${j}`)};return g.jsxs("div",{className:"space-y-6",children:[g.jsxs("div",{className:"flex justify-between items-center",children:[g.jsxs("div",{children:[g.jsx("h1",{className:"text-3xl font-bold",children:"Approval Forms"}),g.jsx("p",{className:"text-gray-500 mt-1",children:"Manage your approval forms"})]}),g.jsxs(La,{open:S,onOpenChange:R,children:[g.jsx($s,{asChild:!0,children:g.jsxs(Be,{children:[g.jsx(Fs,{className:"mr-2 h-4 w-4"}),"New Form"]})}),g.jsxs(Si,{children:[g.jsx(Ei,{children:g.jsx(Ci,{children:"Create New Approval Form"})}),g.jsxs("div",{className:"grid gap-4 py-4",children:[g.jsxs("div",{className:"grid gap-2",children:[g.jsx(Mt,{htmlFor:"name",children:"Form Name"}),g.jsx(vn,{id:"name",value:c,onChange:j=>f(j.target.value),placeholder:"Enter form name"})]}),g.jsxs("div",{className:"grid gap-2",children:[g.jsx(Mt,{htmlFor:"description",children:"Description"}),g.jsx(qs,{id:"description",value:p,onChange:j=>m(j.target.value),placeholder:"Enter form description"})]}),g.jsxs("div",{className:"grid gap-2",children:[g.jsx(Mt,{htmlFor:"folder",children:"Target Folder (for approved documents)"}),g.jsxs(Rd,{value:v,onValueChange:w,children:[g.jsx(Cs,{children:g.jsx(bd,{placeholder:"Select a folder"})}),g.jsx(ks,{children:o.map(j=>g.jsx(Ca,{value:j.id,children:j.name},j.id))})]})]})]}),g.jsx(Be,{onClick:b,disabled:!c.trim(),children:"Create Form"})]})]})]}),l?g.jsx("div",{className:"text-center py-10",children:"Loading approval forms..."}):t.length===0?g.jsx("div",{className:"text-center py-10 text-gray-500",children:"No approval forms found. Create a new form to get started."}):g.jsx("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-4",children:t.map(j=>g.jsxs(Gt,{children:[g.jsxs(qt,{children:[g.jsxs(Yt,{className:"flex items-center",children:[g.jsx(Sk,{className:"mr-2 h-5 w-5 text-blue-500"}),j.name]}),g.jsx(Br,{children:j.description})]}),g.jsx(Qt,{children:g.jsxs("div",{className:"text-sm text-gray-500",children:[g.jsxs("p",{children:["Fields: ",j.fields.length]}),g.jsxs("p",{children:["Created: ",new Date(j.created_at).toLocaleDateString()]})]})}),g.jsxs(wi,{className:"flex justify-end space-x-2",children:[g.jsxs(Be,{variant:"outline",size:"sm",onClick:()=>P(j.id),children:[g.jsx(Cv,{className:"mr-1 h-4 w-4"}),"Edit"]}),g.jsxs(Be,{variant:"outline",size:"sm",onClick:()=>T(j.id),children:[g.jsx(Is,{className:"mr-1 h-4 w-4"}),"Delete"]})]})]},j.id))})]})},aP=()=>{const[t,r]=y.useState([]),[o,a]=y.useState([]),[l,u]=y.useState(!0),[c,f]=y.useState(""),[p,m]=y.useState(""),[v,w]=y.useState(!1),S=qr();y.useEffect(()=>{R(),C()},[]);const R=async()=>{try{u(!0);const P=await SC();r(P)}catch(P){console.error("Error fetching approval routes:",P)}finally{u(!1)}},C=async()=>{try{const P=await pC();a(P)}catch(P){console.error("Error fetching users:",P)}},E=async()=>{if(c.trim())try{await EC({name:c,description:p,steps:[]}),f(""),m(""),w(!1),R()}catch(P){console.error("Error creating approval route:",P)}},k=async P=>{try{await CC(P),R()}catch(j){console.error("Error deleting approval route:",j)}},b=P=>{S(`/approval-routes/${P}`)},T=P=>{const j=o.find(F=>F.id===P);return j?j.full_name||j.username:"Unknown User"};return g.jsxs("div",{className:"space-y-6",children:[g.jsxs("div",{className:"flex justify-between items-center",children:[g.jsxs("div",{children:[g.jsx("h1",{className:"text-3xl font-bold",children:"Approval Routes"}),g.jsx("p",{className:"text-gray-500 mt-1",children:"Manage your approval workflows"})]}),g.jsxs(La,{open:v,onOpenChange:w,children:[g.jsx($s,{asChild:!0,children:g.jsxs(Be,{children:[g.jsx(Fs,{className:"mr-2 h-4 w-4"}),"New Route"]})}),g.jsxs(Si,{children:[g.jsx(Ei,{children:g.jsx(Ci,{children:"Create New Approval Route"})}),g.jsxs("div",{className:"grid gap-4 py-4",children:[g.jsxs("div",{className:"grid gap-2",children:[g.jsx(Mt,{htmlFor:"name",children:"Route Name"}),g.jsx(vn,{id:"name",value:c,onChange:P=>f(P.target.value),placeholder:"Enter route name"})]}),g.jsxs("div",{className:"grid gap-2",children:[g.jsx(Mt,{htmlFor:"description",children:"Description"}),g.jsx(qs,{id:"description",value:p,onChange:P=>m(P.target.value),placeholder:"Enter route description"})]})]}),g.jsx(Be,{onClick:E,disabled:!c.trim(),children:"Create Route"})]})]})]}),l?g.jsx("div",{className:"text-center py-10",children:"Loading approval routes..."}):t.length===0?g.jsx("div",{className:"text-center py-10 text-gray-500",children:"No approval routes found. Create a new route to get started."}):g.jsx("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-4",children:t.map(P=>g.jsxs(Gt,{children:[g.jsxs(qt,{children:[g.jsxs(Yt,{className:"flex items-center",children:[g.jsx(Sv,{className:"mr-2 h-5 w-5 text-blue-500"}),P.name]}),g.jsx(Br,{children:P.description})]}),g.jsxs(Qt,{children:[g.jsxs("div",{className:"text-sm text-gray-500",children:[g.jsxs("p",{children:["Steps: ",P.steps.length]}),g.jsxs("p",{children:["Created: ",new Date(P.created_at).toLocaleDateString()]})]}),P.steps.length>0&&g.jsxs("div",{className:"mt-4",children:[g.jsx("h4",{className:"text-sm font-medium mb-2",children:"Approval Flow:"}),g.jsx("div",{className:"space-y-2",children:P.steps.map((j,F)=>g.jsxs("div",{className:"flex items-center",children:[g.jsx("div",{className:"w-6 h-6 rounded-full bg-blue-100 text-blue-600 flex items-center justify-center text-xs font-medium",children:j.step_number}),g.jsx("div",{className:"ml-2",children:T(j.approver_id)})]},F))})]})]}),g.jsxs(wi,{className:"flex justify-end space-x-2",children:[g.jsxs(Be,{variant:"outline",size:"sm",onClick:()=>b(P.id),children:[g.jsx(Cv,{className:"mr-1 h-4 w-4"}),"Edit"]}),g.jsxs(Be,{variant:"outline",size:"sm",onClick:()=>k(P.id),children:[g.jsx(Is,{className:"mr-1 h-4 w-4"}),"Delete"]})]})]},P.id))})]})};var td="rovingFocusGroup.onEntryFocus",lP={bubbles:!1,cancelable:!0},Fa="RovingFocusGroup",[Nd,h0,sP]=sy(Fa),[uP,m0]=xi(Fa,[sP]),[cP,dP]=uP(Fa),g0=y.forwardRef((t,r)=>g.jsx(Nd.Provider,{scope:t.__scopeRovingFocusGroup,children:g.jsx(Nd.Slot,{scope:t.__scopeRovingFocusGroup,children:g.jsx(fP,{...t,ref:r})})}));g0.displayName=Fa;var fP=y.forwardRef((t,r)=>{const{__scopeRovingFocusGroup:o,orientation:a,loop:l=!1,dir:u,currentTabStopId:c,defaultCurrentTabStopId:f,onCurrentTabStopIdChange:p,onEntryFocus:m,preventScrollOnEntryFocus:v=!1,...w}=t,S=y.useRef(null),R=ut(r,S),C=tf(u),[E,k]=Na({prop:c,defaultProp:f??null,onChange:p,caller:Fa}),[b,T]=y.useState(!1),P=Hr(m),j=h0(o),F=y.useRef(!1),[_,W]=y.useState(0);return y.useEffect(()=>{const U=S.current;if(U)return U.addEventListener(td,P),()=>U.removeEventListener(td,P)},[P]),g.jsx(cP,{scope:o,orientation:a,dir:C,loop:l,currentTabStopId:E,onItemFocus:y.useCallback(U=>k(U),[k]),onItemShiftTab:y.useCallback(()=>T(!0),[]),onFocusableItemAdd:y.useCallback(()=>W(U=>U+1),[]),onFocusableItemRemove:y.useCallback(()=>W(U=>U-1),[]),children:g.jsx(qe.div,{tabIndex:b||_===0?-1:0,"data-orientation":a,...w,ref:R,style:{outline:"none",...t.style},onMouseDown:We(t.onMouseDown,()=>{F.current=!0}),onFocus:We(t.onFocus,U=>{const Y=!F.current;if(U.target===U.currentTarget&&Y&&!b){const oe=new CustomEvent(td,lP);if(U.currentTarget.dispatchEvent(oe),!oe.defaultPrevented){const Re=j().filter(X=>X.focusable),Te=Re.find(X=>X.active),ae=Re.find(X=>X.id===E),Se=[Te,ae,...Re].filter(Boolean).map(X=>X.ref.current);w0(Se,v)}}F.current=!1}),onBlur:We(t.onBlur,()=>T(!1))})})}),v0="RovingFocusGroupItem",y0=y.forwardRef((t,r)=>{const{__scopeRovingFocusGroup:o,focusable:a=!0,active:l=!1,tabStopId:u,children:c,...f}=t,p=Ur(),m=u||p,v=dP(v0,o),w=v.currentTabStopId===m,S=h0(o),{onFocusableItemAdd:R,onFocusableItemRemove:C,currentTabStopId:E}=v;return y.useEffect(()=>{if(a)return R(),()=>C()},[a,R,C]),g.jsx(Nd.ItemSlot,{scope:o,id:m,focusable:a,active:l,children:g.jsx(qe.span,{tabIndex:w?0:-1,"data-orientation":v.orientation,...f,ref:r,onMouseDown:We(t.onMouseDown,k=>{a?v.onItemFocus(m):k.preventDefault()}),onFocus:We(t.onFocus,()=>v.onItemFocus(m)),onKeyDown:We(t.onKeyDown,k=>{if(k.key==="Tab"&&k.shiftKey){v.onItemShiftTab();return}if(k.target!==k.currentTarget)return;const b=mP(k,v.orientation,v.dir);if(b!==void 0){if(k.metaKey||k.ctrlKey||k.altKey||k.shiftKey)return;k.preventDefault();let P=S().filter(j=>j.focusable).map(j=>j.ref.current);if(b==="last")P.reverse();else if(b==="prev"||b==="next"){b==="prev"&&P.reverse();const j=P.indexOf(k.currentTarget);P=v.loop?gP(P,j+1):P.slice(j+1)}setTimeout(()=>w0(P))}}),children:typeof c=="function"?c({isCurrentTabStop:w,hasTabStop:E!=null}):c})})});y0.displayName=v0;var pP={ArrowLeft:"prev",ArrowUp:"prev",ArrowRight:"next",ArrowDown:"next",PageUp:"first",Home:"first",PageDown:"last",End:"last"};function hP(t,r){return r!=="rtl"?t:t==="ArrowLeft"?"ArrowRight":t==="ArrowRight"?"ArrowLeft":t}function mP(t,r,o){const a=hP(t.key,o);if(!(r==="vertical"&&["ArrowLeft","ArrowRight"].includes(a))&&!(r==="horizontal"&&["ArrowUp","ArrowDown"].includes(a)))return pP[a]}function w0(t,r=!1){const o=document.activeElement;for(const a of t)if(a===o||(a.focus({preventScroll:r}),document.activeElement!==o))return}function gP(t,r){return t.map((o,a)=>t[(r+a)%t.length])}var vP=g0,yP=y0,Ys="Tabs",[wP,qP]=xi(Ys,[m0]),x0=m0(),[xP,pf]=wP(Ys),S0=y.forwardRef((t,r)=>{const{__scopeTabs:o,value:a,onValueChange:l,defaultValue:u,orientation:c="horizontal",dir:f,activationMode:p="automatic",...m}=t,v=tf(f),[w,S]=Na({prop:a,onChange:l,defaultProp:u??"",caller:Ys});return g.jsx(xP,{scope:o,baseId:Ur(),value:w,onValueChange:S,orientation:c,dir:v,activationMode:p,children:g.jsx(qe.div,{dir:v,"data-orientation":c,...m,ref:r})})});S0.displayName=Ys;var E0="TabsList",C0=y.forwardRef((t,r)=>{const{__scopeTabs:o,loop:a=!0,...l}=t,u=pf(E0,o),c=x0(o);return g.jsx(vP,{asChild:!0,...c,orientation:u.orientation,dir:u.dir,loop:a,children:g.jsx(qe.div,{role:"tablist","aria-orientation":u.orientation,...l,ref:r})})});C0.displayName=E0;var k0="TabsTrigger",R0=y.forwardRef((t,r)=>{const{__scopeTabs:o,value:a,disabled:l=!1,...u}=t,c=pf(k0,o),f=x0(o),p=P0(c.baseId,a),m=j0(c.baseId,a),v=a===c.value;return g.jsx(yP,{asChild:!0,...f,focusable:!l,active:v,children:g.jsx(qe.button,{type:"button",role:"tab","aria-selected":v,"aria-controls":m,"data-state":v?"active":"inactive","data-disabled":l?"":void 0,disabled:l,id:p,...u,ref:r,onMouseDown:We(t.onMouseDown,w=>{!l&&w.button===0&&w.ctrlKey===!1?c.onValueChange(a):w.preventDefault()}),onKeyDown:We(t.onKeyDown,w=>{[" ","Enter"].includes(w.key)&&c.onValueChange(a)}),onFocus:We(t.onFocus,()=>{const w=c.activationMode!=="manual";!v&&!l&&w&&c.onValueChange(a)})})})});R0.displayName=k0;var b0="TabsContent",N0=y.forwardRef((t,r)=>{const{__scopeTabs:o,value:a,forceMount:l,children:u,...c}=t,f=pf(b0,o),p=P0(f.baseId,a),m=j0(f.baseId,a),v=a===f.value,w=y.useRef(v);return y.useEffect(()=>{const S=requestAnimationFrame(()=>w.current=!1);return()=>cancelAnimationFrame(S)},[]),g.jsx(Oa,{present:l||v,children:({present:S})=>g.jsx(qe.div,{"data-state":v?"active":"inactive","data-orientation":f.orientation,role:"tabpanel","aria-labelledby":p,hidden:!S,id:m,tabIndex:0,...c,ref:r,style:{...t.style,animationDuration:w.current?"0s":void 0},children:S&&u})})});N0.displayName=b0;function P0(t,r){return`${t}-trigger-${r}`}function j0(t,r){return`${t}-content-${r}`}var SP=S0,T0=C0,_0=R0,A0=N0;const EP=SP,D0=y.forwardRef(({className:t,...r},o)=>g.jsx(T0,{ref:o,className:Qe("inline-flex h-9 items-center justify-center rounded-lg bg-zinc-100 p-1 text-zinc-500 dark:bg-zinc-800 dark:text-zinc-400",t),...r}));D0.displayName=T0.displayName;const Pd=y.forwardRef(({className:t,...r},o)=>g.jsx(_0,{ref:o,className:Qe("inline-flex items-center justify-center whitespace-nowrap rounded-md px-3 py-1 text-sm font-medium ring-offset-white transition-all focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-zinc-950 focus-visible:ring-offset-2 disabled:pointer-events-none disabled:opacity-50 data-[state=active]:bg-white data-[state=active]:text-zinc-950 data-[state=active]:shadow dark:ring-offset-zinc-950 dark:focus-visible:ring-zinc-300 dark:data-[state=active]:bg-zinc-950 dark:data-[state=active]:text-zinc-50",t),...r}));Pd.displayName=_0.displayName;const jd=y.forwardRef(({className:t,...r},o)=>g.jsx(A0,{ref:o,className:Qe("mt-2 ring-offset-white focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-zinc-950 focus-visible:ring-offset-2 dark:ring-offset-zinc-950 dark:focus-visible:ring-zinc-300",t),...r}));jd.displayName=A0.displayName;const CP=Ms("inline-flex items-center rounded-md border border-zinc-200 px-2.5 py-0.5 text-xs font-semibold transition-colors focus:outline-none focus:ring-2 focus:ring-zinc-950 focus:ring-offset-2 dark:border-zinc-800 dark:focus:ring-zinc-300",{variants:{variant:{default:"border-transparent bg-zinc-900 text-zinc-50 shadow hover:bg-zinc-900/80 dark:bg-zinc-50 dark:text-zinc-900 dark:hover:bg-zinc-50/80",secondary:"border-transparent bg-zinc-100 text-zinc-900 hover:bg-zinc-100/80 dark:bg-zinc-800 dark:text-zinc-50 dark:hover:bg-zinc-800/80",destructive:"border-transparent bg-red-500 text-zinc-50 shadow hover:bg-red-500/80 dark:bg-red-900 dark:text-zinc-50 dark:hover:bg-red-900/80",outline:"text-zinc-950 dark:text-zinc-50"}},defaultVariants:{variant:"default"}});function wa({className:t,variant:r,...o}){return g.jsx("div",{className:Qe(CP({variant:r}),t),...o})}const kP=()=>{const[t,r]=y.useState([]),[o,a]=y.useState([]),[l,u]=y.useState(!0),[c,f]=y.useState("my-applications"),[p,m]=y.useState(null),[v,w]=y.useState(!1),[S,R]=y.useState(""),[C,E]=y.useState(null);y.useEffect(()=>{c==="my-applications"?k():b()},[c]);const k=async()=>{try{u(!0);const U=await tv();r(U)}catch(U){console.error("Error fetching my applications:",U)}finally{u(!1)}},b=async()=>{try{u(!0);const U=await nv();a(U)}catch(U){console.error("Error fetching pending approvals:",U)}finally{u(!1)}},T=async U=>{try{await RC(U),k()}catch(Y){console.error("Error submitting application:",Y)}},P=async U=>{try{await kC(U),k()}catch(Y){console.error("Error deleting application:",Y)}},j=(U,Y)=>{m(U),E(Y),R(""),w(!0)},F=async()=>{if(!(!p||!C))try{C==="approve"?await bC(p.id,S):await NC(p.id,S),w(!1),b()}catch(U){console.error(`Error ${C}ing application:`,U)}},_=U=>{switch(U){case"DRAFT":return g.jsx(wa,{variant:"outline",children:"Draft"});case"PENDING":return g.jsx(wa,{variant:"secondary",children:"Pending"});case"APPROVED":return g.jsx(wa,{className:"bg-green-100 text-green-800",children:"Approved"});case"REJECTED":return g.jsx(wa,{variant:"destructive",children:"Rejected"});default:return g.jsx(wa,{children:U})}},W=(U,Y=!1)=>l?g.jsx("div",{className:"text-center py-10",children:"Loading applications..."}):U.length===0?g.jsx("div",{className:"text-center py-10 text-gray-500",children:Y?"No applications pending your approval.":"No applications found. Start a new application from the approval forms page."}):g.jsx("div",{className:"grid grid-cols-1 gap-4",children:U.map(oe=>g.jsxs(Gt,{children:[g.jsx(qt,{children:g.jsxs("div",{className:"flex justify-between items-start",children:[g.jsxs("div",{children:[g.jsxs(Yt,{className:"flex items-center",children:[g.jsx(wv,{className:"mr-2 h-5 w-5 text-blue-500"}),oe.form_name]}),g.jsxs(Br,{children:["Route: ",oe.route_name," | Submitted: ",new Date(oe.created_at).toLocaleDateString()]})]}),g.jsx("div",{children:_(oe.status)})]})}),g.jsx(Qt,{children:g.jsx("div",{className:"text-sm text-gray-500",children:Y?g.jsxs("p",{children:["Applicant: ",oe.applicant_name]}):g.jsxs("p",{children:["Status: Step ",oe.current_step," of ",oe.approval_history.length]})})}),g.jsx(wi,{className:"flex justify-end space-x-2",children:Y?g.jsxs(g.Fragment,{children:[g.jsxs(Be,{variant:"outline",size:"sm",onClick:()=>j(oe,"reject"),children:[g.jsx(kv,{className:"mr-1 h-4 w-4"}),"Reject"]}),g.jsxs(Be,{variant:"default",size:"sm",onClick:()=>j(oe,"approve"),children:[g.jsx(vv,{className:"mr-1 h-4 w-4"}),"Approve"]})]}):g.jsx(g.Fragment,{children:oe.status==="DRAFT"&&g.jsxs(g.Fragment,{children:[g.jsxs(Be,{variant:"outline",size:"sm",onClick:()=>P(oe.id),children:[g.jsx(Is,{className:"mr-1 h-4 w-4"}),"Delete"]}),g.jsx(Be,{variant:"default",size:"sm",onClick:()=>T(oe.id),children:"Submit"})]})})})]},oe.id))});return g.jsxs("div",{className:"space-y-6",children:[g.jsxs("div",{children:[g.jsx("h1",{className:"text-3xl font-bold",children:"Applications"}),g.jsx("p",{className:"text-gray-500 mt-1",children:"Manage your approval applications"})]}),g.jsxs(EP,{value:c,onValueChange:f,children:[g.jsxs(D0,{children:[g.jsx(Pd,{value:"my-applications",children:"My Applications"}),g.jsx(Pd,{value:"pending-approvals",children:"Pending Approvals"})]}),g.jsx(jd,{value:"my-applications",className:"mt-6",children:W(t)}),g.jsx(jd,{value:"pending-approvals",className:"mt-6",children:W(o,!0)})]}),g.jsx(La,{open:v,onOpenChange:w,children:g.jsxs(Si,{children:[g.jsx(Ei,{children:g.jsx(Ci,{children:C==="approve"?"Approve Application":"Reject Application"})}),g.jsxs("div",{className:"py-4",children:[g.jsx("label",{htmlFor:"comment",className:"text-sm font-medium",children:"Comment (Optional)"}),g.jsx(qs,{id:"comment",value:S,onChange:U=>R(U.target.value),placeholder:"Add a comment...",className:"mt-2"})]}),g.jsxs(ly,{children:[g.jsx(Be,{variant:"outline",onClick:()=>w(!1),children:"Cancel"}),g.jsx(Be,{variant:C==="approve"?"default":"destructive",onClick:F,children:C==="approve"?"Approve":"Reject"})]})]})})]})},RP=({children:t})=>{const{user:r,loading:o}=jo();return o?g.jsx("div",{className:"flex h-screen items-center justify-center",children:"Loading..."}):r?g.jsx(g.Fragment,{children:t}):g.jsx(Fd,{to:"/login",replace:!0})},ng=({children:t})=>{const{user:r,loading:o}=jo();return o?g.jsx("div",{className:"flex h-screen items-center justify-center",children:"Loading..."}):r?g.jsx(Fd,{to:"/dashboard",replace:!0}):g.jsx(g.Fragment,{children:t})};function bP(){const r=x1([{path:"/",element:g.jsx(Fd,{to:"/login",replace:!0})},{path:"/login",element:g.jsx(ng,{children:g.jsx(Fk,{})})},{path:"/register",element:g.jsx(ng,{children:g.jsx(zk,{})})},{path:"/",element:g.jsx(RP,{children:g.jsx(jk,{})}),children:[{path:"dashboard",element:g.jsx(Uk,{})},{path:"folders",element:g.jsx(pb,{})},{path:"documents",element:g.jsx(oP,{})},{path:"approval-forms",element:g.jsx(iP,{})},{path:"approval-routes",element:g.jsx(aP,{})},{path:"applications",element:g.jsx(kP,{})}]}]);return g.jsx(PC,{children:g.jsx(D1,{router:r})})}kx.createRoot(document.getElementById("root")).render(g.jsx(y.StrictMode,{children:g.jsx(bP,{})}));
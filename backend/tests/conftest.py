@@ -0,0 +1,96 @@
+"""
+Shared fixtures. The app keeps files relative to the working directory, so
+the tests run from a scratch directory; the store is the in-memory one
+unless DATABASE_URL is set. Supabase is never contacted.
+"""
+
+import os
+import tempfile
+import time
+import uuid
+from typing import Callable, Dict, Tuple
+import pytest
+
+_workdir = tempfile.mkdtemp(prefix="dms-tests-")
+os.makedirs(os.path.join(_workdir, "frontend", "assets"), exist_ok=True)
+os.chdir(_workdir)
+os.environ.setdefault("SUPABASE_URL", "http://supabase.test")
+os.environ.setdefault("SUPABASE_KEY", "test.key.value")
+os.environ.setdefault("SUPABASE_JWKS_URL", "")
+
+from fastapi.testclient import TestClient
+from app.main import app
+from app.models.models import User, UserRole
+from app.services import database
+from app.utils.auth import create_access_token
+
+FINISHED_STATUSES = ("completed", "failed", "skipped")
+
+
+def auth_headers(user: User) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {create_access_token({'sub': user.id})}"}
+
+
+def wait_for(condition: Callable[[], bool], timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timed out waiting for background work")
+        time.sleep(0.05)
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def admin_headers() -> Dict[str, str]:
+    return auth_headers(database.get_user_by_username("admin"))
+
+
+@pytest.fixture
+def make_user() -> Callable[..., Tuple[User, Dict[str, str]]]:
+    def make(role: UserRole = UserRole.USER) -> Tuple[User, Dict[str, str]]:
+        name = f"user-{uuid.uuid4().hex[:8]}"
+        user = database.create_user(name, f"{name}@example.com", "unused", name, role)
+        return user, auth_headers(user)
+    return make
+
+
+@pytest.fixture
+def make_folder(client, admin_headers) -> Callable[..., Dict]:
+    def make(name: str = "Folder", parent_id: str = None, headers: Dict[str, str] = None) -> Dict:
+        response = client.post(
+            "/api/folders/", json={"name": name, "parent_id": parent_id}, headers=headers or admin_headers
+        )
+        assert response.status_code == 200, response.text
+        return response.json()
+    return make
+
+
+@pytest.fixture
+def upload(client, admin_headers) -> Callable[..., Dict]:
+    def upload(folder_id: str, name: str, data: bytes, file_type: str = "application/octet-stream",
+               headers: Dict[str, str] = None) -> Dict:
+        response = client.post(
+            "/api/documents/", files={"file": (name, data, file_type)}, data={"folder_id": folder_id},
+            headers=headers or admin_headers
+        )
+        assert response.status_code == 200, response.text
+        return response.json()
+    return upload
+
+
+@pytest.fixture
+def processed(client, admin_headers) -> Callable[[str], Dict]:
+    """Wait until a document's background processing has finished and return it."""
+    def processed(document_id: str) -> Dict:
+        documents = []
+        def finished() -> bool:
+            documents.append(client.get(f"/api/documents/{document_id}", headers=admin_headers).json())
+            return documents[-1].get("processing_status") in FINISHED_STATUSES
+        wait_for(finished)
+        return documents[-1]
+    return processed
@@ -0,0 +1,199 @@
+import uuid
+from typing import Dict, Set
+from app.routers import applications as applications_router
+from app.services import database
+
+
+def make_route(client, headers, approver_ids, name="Route") -> Dict:
+    steps = [{"approver_id": approver_id, "order": order} for order, approver_id in enumerate(approver_ids)]
+    response = client.post("/api/approval-routes/", json={"name": name, "steps": steps}, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def submitted_application(client, admin_headers, route, applicant_headers) -> Dict:
+    form = client.post("/api/approval-forms/", json={"name": "Request"}, headers=admin_headers).json()
+    application = client.post(
+        "/api/applications/", json={"form_id": form["id"], "route_id": route["id"]}, headers=applicant_headers
+    ).json()
+    response = client.post("/api/applications/submit", json={"application_id": application["id"]},
+                           headers=applicant_headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def decide(client, application, headers, decision="approve"):
+    return client.post(f"/api/applications/{decision}", json={"application_id": application["id"]}, headers=headers)
+
+
+def approved_application(client, admin_headers, make_user, make_folder, form_data=None) -> Dict:
+    """An application by a fresh user, approved by the admin, whose form files it into a new folder."""
+    folder = make_folder("Approved applications")
+    _, applicant_headers = make_user()
+    admin = database.get_user_by_username("admin")
+    
+    form = client.post(
+        "/api/approval-forms/",
+        json={"name": "Expense claim", "target_folder_id": folder["id"]},
+        headers=admin_headers
+    ).json()
+    route = client.post(
+        "/api/approval-routes/",
+        json={"name": "Manager", "steps": [{"approver_id": admin.id, "order": 0}]},
+        headers=admin_headers
+    ).json()
+    application = client.post(
+        "/api/applications/",
+        json={"form_id": form["id"], "route_id": route["id"],
+              "form_data": form_data or {"amount": 1200, "purpose": "Laptop"}},
+        headers=applicant_headers
+    ).json()
+    client.post("/api/applications/submit", json={"application_id": application["id"]}, headers=applicant_headers)
+    response = client.post("/api/applications/approve", json={"application_id": application["id"]}, headers=admin_headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_approval_renders_pdf(client, admin_headers, make_user, make_folder, processed):
+    application = approved_application(client, admin_headers, make_user, make_folder)
+    assert application["status"] == "approved"
+    
+    document = processed(application["document_id"])
+    assert document["processing_status"] == "completed"
+    assert document["content_hash"]
+    
+    content = client.get(f"/api/documents/{document['id']}/content", headers=admin_headers)
+    assert content.status_code == 200
+    assert content.content.startswith(b"%PDF")
+    assert len(content.content) == document["file_size"] > 0
+
+
+def test_approved_application_is_searchable_before_rendering(client, admin_headers, make_user, make_folder,
+                                                             monkeypatch):
+    async def not_rendered(document):
+        pass
+    
+    monkeypatch.setattr(applications_router, "schedule_processing", not_rendered)
+    word = f"purpose{uuid.uuid4().hex}"
+    application = approved_application(client, admin_headers, make_user, make_folder, form_data={"purpose": word})
+    
+    results = client.get("/api/documents/search", params={"q": word}, headers=admin_headers).json()
+    assert [document["id"] for document in results] == [application["document_id"]]
+
+
+def test_metadata_cannot_render_another_users_application(client, admin_headers, make_user, make_folder, processed):
+    victim_application = approved_application(client, admin_headers, make_user, make_folder)
+    processed(victim_application["document_id"])
+    
+    attacker, attacker_headers = make_user()
+    folder = make_folder("Attacker", headers=attacker_headers)
+    # A document without content, like one whose application PDF has not been rendered.
+    document = database.create_document(
+        name="Bait", folder_id=folder["id"], file_path="/applications/bait.pdf",
+        file_type="application/pdf", file_size=0, created_by=attacker.id
+    )
+    response = client.put(
+        f"/api/documents/{document.id}",
+        json={"metadata": {"application_id": victim_application["id"]}},
+        headers=attacker_headers
+    )
+    assert response.status_code == 200, response.text
+    
+    assert client.post(f"/api/documents/{document.id}/process", headers=attacker_headers).status_code == 200
+    document = processed(document.id)
+    assert document["content_hash"] is None
+    assert document["file_size"] == 0
+
+
+def test_route_steps_carry_only_their_definition(client, admin_headers):
+    admin = database.get_user_by_username("admin")
+    route = client.post(
+        "/api/approval-routes/",
+        json={"name": "Two steps", "steps": [{"approver_id": admin.id, "order": 0}, {"approver_id": admin.id, "order": 1}]},
+        headers=admin_headers
+    ).json()
+    # Per-application progress lives in each application's step history.
+    assert [set(step) for step in route["steps"]] == [{"id", "approver_id", "order"}] * 2
+
+
+def test_route_steps_are_frozen_while_applications_are_pending(client, admin_headers, make_user):
+    first, first_headers = make_user()
+    second, second_headers = make_user()
+    _, applicant_headers = make_user()
+    route = make_route(client, admin_headers, [first.id, second.id])
+    application = submitted_application(client, admin_headers, route, applicant_headers)
+    assert decide(client, application, first_headers).status_code == 200
+    
+    swapped = [{"approver_id": second.id, "order": 0}, {"approver_id": first.id, "order": 1}]
+    url = f"/api/approval-routes/{route['id']}"
+    assert client.put(url, json={"steps": swapped}, headers=admin_headers).status_code == 409
+    renamed = client.put(url, json={"name": "Renamed"}, headers=admin_headers)
+    assert renamed.status_code == 200 and renamed.json()["steps"] == route["steps"]
+    assert decide(client, application, first_headers).status_code == 400
+    
+    finished = decide(client, application, second_headers).json()
+    assert finished["status"] == "approved"
+    response = client.put(url, json={"steps": swapped}, headers=admin_headers)
+    assert response.status_code == 200, response.text
+    # Steps keep their ids, so the finished history still names existing steps.
+    steps = response.json()["steps"]
+    assert [step["id"] for step in steps] == [step["id"] for step in route["steps"]]
+    assert [record["step_id"] for record in finished["step_history"]] == [step["id"] for step in steps]
+
+
+def inbox(client, headers) -> Set[str]:
+    response = client.get("/api/applications/for-approval", headers=headers)
+    assert response.status_code == 200, response.text
+    return {application["id"] for application in response.json()}
+
+
+def test_inbox_follows_applications_through_their_steps(client, admin_headers, make_user):
+    first, first_headers = make_user()
+    second, second_headers = make_user()
+    _, applicant_headers = make_user()
+    route = make_route(client, admin_headers, [first.id, second.id])
+    approved = submitted_application(client, admin_headers, route, applicant_headers)
+    rejected = submitted_application(client, admin_headers, route, applicant_headers)
+    assert inbox(client, first_headers) == {approved["id"], rejected["id"]}
+    assert inbox(client, second_headers) == set()
+    
+    assert decide(client, approved, first_headers).status_code == 200
+    assert inbox(client, first_headers) == {rejected["id"]}
+    assert inbox(client, second_headers) == {approved["id"]}
+    
+    assert decide(client, rejected, first_headers, "reject").status_code == 200
+    assert inbox(client, first_headers) == set()
+    assert inbox(client, second_headers) == {approved["id"]}
+    
+    assert decide(client, approved, second_headers).json()["status"] == "approved"
+    assert inbox(client, second_headers) == set()
+
+
+def test_inbox_follows_route_updates_and_deletion(client, admin_headers, make_user):
+    first, first_headers = make_user()
+    second, second_headers = make_user()
+    _, applicant_headers = make_user()
+    route = make_route(client, admin_headers, [first.id])
+    url = f"/api/approval-routes/{route['id']}"
+    
+    # Drafts are in nobody's inbox, and steps can still change under them.
+    form = client.post("/api/approval-forms/", json={"name": "Request"}, headers=admin_headers).json()
+    draft = client.post(
+        "/api/applications/", json={"form_id": form["id"], "route_id": route["id"]}, headers=applicant_headers
+    ).json()
+    response = client.put(url, json={"steps": [{"approver_id": second.id, "order": 0}]}, headers=admin_headers)
+    assert response.status_code == 200, response.text
+    submitted = client.post("/api/applications/submit", json={"application_id": draft["id"]},
+                            headers=applicant_headers)
+    assert submitted.status_code == 200, submitted.text
+    assert inbox(client, first_headers) == set()
+    assert inbox(client, second_headers) == {draft["id"]}
+    
+    assert client.put(url, json={"name": "Renamed"}, headers=admin_headers).status_code == 200
+    assert client.put(url, json={"steps": [{"approver_id": first.id, "order": 0}]},
+                      headers=admin_headers).status_code == 409
+    assert inbox(client, first_headers) == set()
+    assert inbox(client, second_headers) == {draft["id"]}
+    
+    assert client.delete(url, headers=admin_headers).status_code == 204
+    assert inbox(client, second_headers) == set()
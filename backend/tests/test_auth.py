@@ -0,0 +1,98 @@
+import threading
+import time
+from datetime import timedelta
+import anyio
+import pytest
+from fastapi import HTTPException
+from app.models.models import UserRole
+from app.services import database, repository
+from app.services.repository import repo
+from app.utils import auth
+from app.utils.auth import PasswordHasherPool, create_access_token
+from app.utils.cache import ExpiringCache
+
+
+def test_hasher_pool_queues_then_refuses():
+    pool = PasswordHasherPool(workers=1, max_queue=1)
+    release = threading.Event()
+    results = []
+    
+    async def main():
+        async def call(value):
+            results.append(await pool.run(lambda: release.wait(5) and value))
+        
+        async with anyio.create_task_group() as tasks:
+            tasks.start_soon(call, "running")
+            tasks.start_soon(call, "queued")
+            while pool.stats()["waiting"] < 1:
+                await anyio.sleep(0.01)
+            assert pool.stats()["running"] == 1
+            
+            with pytest.raises(HTTPException) as refused:
+                await pool.run(lambda: "refused")
+            assert refused.value.status_code == 503
+            assert refused.value.headers == {"Retry-After": "1"}
+            release.set()
+    
+    anyio.run(main)
+    assert results == ["running", "queued"]
+    stats = pool.stats()
+    assert (stats["completed"], stats["rejected"], stats["running"], stats["waiting"]) == (2, 1, 0, 0)
+
+
+def test_expiring_cache_evicts_least_recent_and_expired_entries():
+    cache = ExpiringCache(2)
+    later = time.time() + 60
+    cache.put("a", 1, later)
+    cache.put("b", 2, later)
+    assert cache.get("a") == 1
+    cache.put("c", 3, later)
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+    
+    cache.put("d", 4, time.time() - 1)
+    assert cache.get("d") is None
+    cache._entries["a"] = (time.time() - 1, 1)
+    assert cache.get("a") is None and len(cache) == 1
+
+
+def test_verified_tokens_are_not_decoded_again(client, make_user, monkeypatch):
+    _, headers = make_user()
+    decode = auth.jwt.decode
+    calls = []
+    
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return decode(*args, **kwargs)
+    monkeypatch.setattr(auth.jwt, "decode", counting_decode)
+    
+    for _ in range(3):
+        assert client.get("/api/folders/", headers=headers).status_code == 200
+    assert len(calls) == 1
+
+
+def test_expired_tokens_are_refused(client, make_user):
+    user, _ = make_user()
+    token = create_access_token({"sub": user.id}, expires_delta=timedelta(minutes=-1))
+    assert client.get("/api/folders/", headers={"Authorization": f"Bearer {token}"}).status_code == 401
+
+
+def test_user_changes_apply_to_cached_tokens(client, make_user):
+    user, headers = make_user(UserRole.ADMIN)
+    assert client.get("/api/users/", headers=headers).status_code == 200
+    
+    anyio.run(lambda: repo.users.update(user.id, role=UserRole.USER))
+    assert client.get("/api/users/", headers=headers).status_code == 403
+    
+    anyio.run(lambda: repo.users.delete(user.id))
+    assert client.get("/api/folders/", headers=headers).status_code == 401
+
+
+def test_changes_from_other_processes_apply_once_the_entry_expires(client, make_user, monkeypatch):
+    user, headers = make_user(UserRole.ADMIN)
+    assert client.get("/api/users/", headers=headers).status_code == 200
+    
+    # Another process changes the store directly; this one is not told.
+    database.update_user(user.id, role=UserRole.USER)
+    expired = time.time() + repository.USER_CACHE_TTL + 1
+    monkeypatch.setattr(time, "time", lambda: expired)
+    assert client.get("/api/users/", headers=headers).status_code == 403
@@ -0,0 +1,72 @@
+import uuid
+import pytest
+
+
+@pytest.fixture
+def content(client, admin_headers, make_folder, upload):
+    """GET the content of a fresh ten-byte document with extra request headers."""
+    folder = make_folder("Content")
+    # Unique content, so that no other document shares the blob and its mtime.
+    data = uuid.uuid4().hex[:10].encode()
+    document = upload(folder["id"], "digits.txt", data, "text/plain")
+
+    def content(**headers):
+        return client.get(f"/api/documents/{document['id']}/content", headers={**admin_headers, **headers})
+    content.data = data
+    return content
+
+
+def test_whole_file_carries_validators(content):
+    response = content()
+    assert response.status_code == 200
+    assert response.content == content.data
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["etag"] and response.headers["last-modified"]
+
+
+@pytest.mark.parametrize("header, status_code, body, content_range", [
+    ("bytes=2-5", 206, slice(2, 6), "bytes 2-5/10"),
+    ("bytes=7-", 206, slice(7, 10), "bytes 7-9/10"),
+    ("bytes=8-100", 206, slice(8, 10), "bytes 8-9/10"),
+    ("bytes=-3", 206, slice(7, 10), "bytes 7-9/10"),
+    ("bytes=-20", 206, slice(0, 10), "bytes 0-9/10"),
+    ("bytes=10-", 416, None, "bytes */10"),
+    ("bytes=10-5", 416, None, "bytes */10"),
+    ("bytes=-0", 416, None, "bytes */10"),
+    ("bytes=5-2", 200, slice(0, 10), None),
+    ("bytes=0-1,4-5", 200, slice(0, 10), None),
+    ("lines=0-1", 200, slice(0, 10), None),
+])
+def test_byte_ranges(content, header, status_code, body, content_range):
+    response = content(range=header)
+    assert response.status_code == status_code
+    assert response.headers.get("content-range") == content_range
+    if body is not None:
+        assert response.content == content.data[body]
+
+
+def test_matching_etag_is_not_modified(content):
+    etag = content().headers["etag"]
+    assert content(**{"if-none-match": etag}).status_code == 304
+    assert content(**{"if-none-match": f"W/{etag}"}).status_code == 304
+    assert content(**{"if-none-match": '"other"'}).status_code == 200
+
+
+def test_if_modified_since(content):
+    last_modified = content().headers["last-modified"]
+    assert content(**{"if-modified-since": last_modified}).status_code == 304
+    assert content(**{"if-modified-since": "Thu, 01 Jan 1970 00:00:00 GMT"}).status_code == 200
+    # If-None-Match takes precedence over If-Modified-Since.
+    assert content(**{"if-none-match": '"other"', "if-modified-since": last_modified}).status_code == 200
+
+
+def test_if_range_serves_the_range_only_while_the_validator_matches(content):
+    whole = content()
+    for validator in (whole.headers["etag"], whole.headers["last-modified"]):
+        response = content(range="bytes=0-1", **{"if-range": validator})
+        assert response.status_code == 206
+        assert response.content == content.data[:2]
+
+    response = content(range="bytes=0-1", **{"if-range": '"stale"'})
+    assert response.status_code == 200
+    assert response.content == content.data
@@ -0,0 +1,53 @@
+import hashlib
+import os
+import uuid
+from app.services.storage import artifact_path, blob_path
+
+
+def upload_version(client, headers, document_id, data):
+    response = client.post(
+        f"/api/documents/{document_id}/versions", files={"file": ("next.txt", data, "text/plain")}, headers=headers
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_identical_content_is_stored_once(client, admin_headers, make_folder, upload, processed):
+    data = f"shared {uuid.uuid4()}".encode()
+    content_hash = hashlib.sha256(data).hexdigest()
+    first = processed(upload(make_folder("First")["id"], "a.txt", data, "text/plain")["id"])
+    second = processed(upload(make_folder("Second")["id"], "b.txt", data, "text/plain")["id"])
+    
+    assert first["content_hash"] == second["content_hash"] == content_hash
+    assert first["file_path"] == second["file_path"] == blob_path(content_hash)
+    
+    # A new version of one document leaves the shared blob to the other.
+    upload_version(client, admin_headers, first["id"], f"changed {uuid.uuid4()}".encode())
+    assert client.delete(f"/api/documents/{first['id']}", headers=admin_headers).status_code == 204
+    assert os.path.exists(blob_path(content_hash))
+    
+    assert client.delete(f"/api/documents/{second['id']}", headers=admin_headers).status_code == 204
+    assert not os.path.exists(blob_path(content_hash))
+    assert not os.path.exists(artifact_path(blob_path(content_hash), "text"))
+
+
+def test_versions_share_blobs_until_the_document_is_deleted(client, admin_headers, make_folder, upload, processed):
+    original, changed = (f"{label} {uuid.uuid4()}".encode() for label in ("original", "changed"))
+    document = upload(make_folder("Versions")["id"], "notes.txt", original, "text/plain")
+    upload_version(client, admin_headers, document["id"], changed)
+    
+    restored = client.post(f"/api/documents/{document['id']}/versions/1/restore", headers=admin_headers).json()
+    assert restored["version"] == 3
+    assert restored["file_path"] == document["file_path"]
+    processed(document["id"])
+    
+    versions = client.get(f"/api/documents/{document['id']}/versions", headers=admin_headers).json()
+    hashes = [hashlib.sha256(content).hexdigest() for content in (original, changed)]
+    assert sorted((version["version"], version["content_hash"]) for version in versions) == [
+        (1, hashes[0]), (2, hashes[1]), (3, hashes[0])
+    ]
+    paths = [blob_path(content_hash) for content_hash in hashes]
+    assert all(os.path.exists(path) for path in paths)
+    
+    assert client.delete(f"/api/documents/{document['id']}", headers=admin_headers).status_code == 204
+    assert not any(os.path.exists(path) for path in paths)
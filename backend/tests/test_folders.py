@@ -0,0 +1,82 @@
+import os
+from app.services import deletion
+from app.services.storage import blob_path
+from tests.conftest import wait_for
+
+
+def documents_in(client, headers, folder_id):
+    return client.get("/api/documents/", params={"folder_id": folder_id}, headers=headers).json()
+
+
+def test_move_rejects_cycles_and_rewrites_paths(client, admin_headers, make_folder):
+    top = make_folder("Top")
+    middle = make_folder("Middle", top["id"])
+    leaf = make_folder("Leaf", middle["id"])
+    
+    for target in (top, middle, leaf):
+        response = client.post(f"/api/folders/{top['id']}/move", json={"parent_id": target["id"]}, headers=admin_headers)
+        assert response.status_code == 400
+    
+    moved = client.post(f"/api/folders/{middle['id']}/move", json={"parent_id": None}, headers=admin_headers).json()
+    assert moved["path"] == f"/{middle['id']}/"
+    assert client.get(f"/api/folders/{leaf['id']}", headers=admin_headers).json()["path"] == (
+        f"/{middle['id']}/{leaf['id']}/"
+    )
+    tree = client.get("/api/folders/tree", params={"root_id": top["id"]}, headers=admin_headers).json()
+    assert tree[0]["children"] == []
+
+
+def test_copy_duplicates_the_subtree_and_shares_files(client, admin_headers, make_folder, upload):
+    source = make_folder("Source")
+    child = make_folder("Child", source["id"])
+    target = make_folder("Target")
+    original = upload(child["id"], "shared.txt", b"copied content", "text/plain")
+    
+    response = client.post(
+        f"/api/folders/{source['id']}/copy", json={"parent_id": target["id"], "name": "Copy"}, headers=admin_headers
+    )
+    assert response.status_code == 200, response.text
+    copy = response.json()
+    assert copy["name"] == "Copy"
+    assert copy["path"] == f"{target['path']}{copy['id']}/"
+    
+    tree = client.get("/api/folders/tree", params={"root_id": copy["id"]}, headers=admin_headers).json()
+    [copied_child] = tree[0]["children"]
+    assert copied_child["name"] == "Child" and copied_child["id"] != child["id"]
+    [copied] = documents_in(client, admin_headers, copied_child["id"])
+    assert copied["id"] != original["id"]
+    assert (copied["file_path"], copied["content_hash"]) == (original["file_path"], original["content_hash"])
+    
+    # The copy keeps the content alive after the original is deleted.
+    assert client.delete(f"/api/documents/{original['id']}", headers=admin_headers).status_code == 204
+    assert client.get(f"/api/documents/{copied['id']}/content", headers=admin_headers).content == b"copied content"
+
+
+def test_delete_runs_as_a_job_over_the_whole_subtree(client, admin_headers, make_user, make_folder, upload,
+                                                     monkeypatch):
+    monkeypatch.setattr(deletion, "FOLDER_DELETE_BATCH_SIZE", 2)
+    top = make_folder("Doomed")
+    children = [make_folder(f"Child {index}", top["id"]) for index in range(3)]
+    grandchild = make_folder("Grandchild", children[0]["id"])
+    documents = [
+        upload(folder["id"], f"file-{index}.txt", f"doomed {folder['id']} {index}".encode(), "text/plain")
+        for folder in (top, grandchild, *children) for index in range(3)
+    ]
+    
+    response = client.delete(f"/api/folders/{top['id']}", headers=admin_headers)
+    assert response.status_code == 202
+    job = response.json()
+    assert job["kind"] == "delete_folder" and job["target_id"] == top["id"]
+    
+    url = f"/api/folders/jobs/{job['id']}"
+    wait_for(lambda: client.get(url, headers=admin_headers).json()["status"] == "completed")
+    assert client.get(url, headers=admin_headers).json()["progress"] == {
+        "folders_deleted": 5, "documents_deleted": len(documents)
+    }
+    for folder in (top, grandchild, *children):
+        assert client.get(f"/api/folders/{folder['id']}", headers=admin_headers).status_code == 404
+    assert not any(os.path.exists(blob_path(document["content_hash"])) for document in documents)
+    
+    # Jobs are visible to their creator and admins only.
+    _, headers = make_user()
+    assert client.get(url, headers=headers).status_code == 404
@@ -0,0 +1,58 @@
+def walk(client, url, headers, **params):
+    """Follow X-Next-Cursor through a listing and return the pages."""
+    pages = []
+    cursor = None
+    while True:
+        response = client.get(url, params={**params, **({"cursor": cursor} if cursor else {})}, headers=headers)
+        assert response.status_code == 200, response.text
+        pages.append(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return pages
+
+
+def test_documents_are_paged_by_cursor(client, admin_headers, make_folder, upload):
+    folder = make_folder("Paged")
+    ids = [upload(folder["id"], f"page-{index}.txt", f"page {folder['id']} {index}".encode(), "text/plain")["id"]
+           for index in range(5)]
+    
+    pages = walk(client, "/api/documents/", admin_headers, folder_id=folder["id"], limit=2)
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [document["id"] for page in pages for document in page] == ids
+    
+    projected = client.get(
+        "/api/documents/", params={"folder_id": folder["id"], "fields": "id,name"}, headers=admin_headers
+    ).json()
+    assert projected[0] == {"id": ids[0], "name": "page-0.txt"}
+    
+    assert client.get("/api/documents/", params={"fields": "secret"}, headers=admin_headers).status_code == 400
+    assert client.get("/api/documents/", params={"cursor": "not-a-cursor"}, headers=admin_headers).status_code == 400
+
+
+def test_documents_without_a_folder_span_the_callers_folders(client, admin_headers, make_user, make_folder, upload):
+    _, headers = make_user()
+    ids = [
+        upload(make_folder(f"Mine {index}", headers=headers)["id"], "mine.txt", f"mine {index}".encode(), "text/plain",
+               headers=headers)["id"]
+        for index in range(3)
+    ]
+    upload(make_folder("Not mine")["id"], "theirs.txt", b"theirs", "text/plain")
+    
+    pages = walk(client, "/api/documents/", headers, limit=2)
+    assert [document["id"] for page in pages for document in page] == ids
+    
+    second = client.get("/api/documents/", params={"offset": 1, "limit": 1}, headers=headers).json()
+    assert [document["id"] for document in second] == ids[1:2]
+    cursor = client.get("/api/documents/", params={"limit": 1}, headers=headers).headers["X-Next-Cursor"]
+    mixed = client.get("/api/documents/", params={"offset": 1, "cursor": cursor}, headers=headers)
+    assert mixed.status_code == 400
+
+
+def test_filtered_subfolders_are_paged_by_cursor(client, admin_headers, make_user, make_folder):
+    user, headers = make_user()
+    parent = make_folder("Parent")
+    children = [make_folder(f"Child {index}", parent["id"]) for index in range(5)]
+    client.post(f"/api/folders/{parent['id']}/access", json={"user_id": user.id, "permission": "read"}, headers=admin_headers)
+    
+    pages = walk(client, "/api/folders/", headers, parent_id=parent["id"], limit=3)
+    assert [folder["id"] for page in pages for folder in page] == [child["id"] for child in children]
@@ -0,0 +1,76 @@
+def test_grants_are_inherited_by_the_subtree(client, admin_headers, make_user, make_folder, upload):
+    user, headers = make_user()
+    top = make_folder("Top")
+    middle = make_folder("Middle", top["id"])
+    leaf = make_folder("Leaf", middle["id"])
+    other = make_folder("Other")
+    document = upload(leaf["id"], "leaf.txt", b"leaf", "text/plain")
+    upload(other["id"], "other.txt", b"other", "text/plain")
+    
+    assert client.get(f"/api/folders/{leaf['id']}", headers=headers).status_code == 403
+    
+    client.post(f"/api/folders/{top['id']}/access", json={"user_id": user.id, "permission": "read"}, headers=admin_headers)
+    assert client.get(f"/api/folders/{leaf['id']}", headers=headers).status_code == 200
+    assert client.put(f"/api/folders/{leaf['id']}", json={"name": "Renamed"}, headers=headers).status_code == 403
+    assert [d["id"] for d in client.get("/api/documents/", headers=headers).json()] == [document["id"]]
+    
+    # The strongest grant on any ancestor applies.
+    client.post(f"/api/folders/{middle['id']}/access", json={"user_id": user.id, "permission": "admin"}, headers=admin_headers)
+    assert client.put(f"/api/folders/{leaf['id']}", json={"name": "Renamed"}, headers=headers).status_code == 200
+    assert client.put(f"/api/folders/{top['id']}", json={"name": "Renamed"}, headers=headers).status_code == 403
+    
+    client.delete(f"/api/folders/{top['id']}/access/{user.id}", headers=admin_headers)
+    client.delete(f"/api/folders/{middle['id']}/access/{user.id}", headers=admin_headers)
+    assert client.get(f"/api/folders/{leaf['id']}", headers=headers).status_code == 403
+    assert client.get("/api/documents/", headers=headers).json() == []
+
+
+def test_checker_memoises_permissions(make_user, make_folder, monkeypatch):
+    import anyio
+    from app.services.repository import repo
+    from app.utils.permissions import FolderPermissionChecker
+    from app.models.models import FolderPermission
+    
+    user, _ = make_user()
+    folder = make_folder("Memo")
+    calls = []
+    lookup = repo.folders.effective_permission
+    
+    async def counting(folder_id, user_id):
+        calls.append(folder_id)
+        return await lookup(folder_id, user_id)
+    monkeypatch.setattr(repo.folders, "effective_permission", counting)
+    
+    async def check():
+        checker = FolderPermissionChecker(user)
+        for _ in range(5):
+            assert not await checker.has_permission(folder["id"], FolderPermission.READ)
+    anyio.run(check)
+    assert calls == [folder["id"]]
+
+
+def test_document_routes_check_the_documents_folder(client, admin_headers, make_user, make_folder, upload):
+    user, headers = make_user()
+    folder = make_folder("Documents")
+    document = upload(folder["id"], "report.txt", b"report", "text/plain")
+    url = f"/api/documents/{document['id']}"
+    
+    assert client.get("/api/documents/missing", headers=headers).status_code == 404
+    assert client.get(url, headers=headers).status_code == 403
+    assert client.get(f"{url}/content", headers=headers).status_code == 403
+    assert client.get(f"{url}/versions/1/content", headers=headers).status_code == 403
+    
+    client.post(f"/api/folders/{folder['id']}/access", json={"user_id": user.id, "permission": "read"}, headers=admin_headers)
+    assert client.get(url, headers=headers).json()["id"] == document["id"]
+    assert client.get(f"{url}/content", headers=headers).content == b"report"
+    assert len(client.get(f"{url}/versions", headers=headers).json()) == 1
+    assert client.put(url, json={"name": "renamed.txt"}, headers=headers).status_code == 403
+    assert client.post(f"{url}/process", headers=headers).status_code == 403
+    
+    client.post(f"/api/folders/{folder['id']}/access", json={"user_id": user.id, "permission": "write"}, headers=admin_headers)
+    assert client.put(url, json={"name": "renamed.txt"}, headers=headers).json()["name"] == "renamed.txt"
+    assert client.delete(url, headers=headers).status_code == 403
+    
+    client.post(f"/api/folders/{folder['id']}/access", json={"user_id": user.id, "permission": "admin"}, headers=admin_headers)
+    assert client.delete(url, headers=headers).status_code == 204
+    assert client.get(url, headers=headers).status_code == 404
@@ -0,0 +1,43 @@
+import os
+import threading
+import pytest
+from app.models.models import FolderPermission
+from app.services import database
+
+pytestmark = pytest.mark.skipif(not os.getenv("DATABASE_URL"), reason="needs DATABASE_URL")
+
+
+def test_setup_lock_makes_startups_take_turns():
+    from app.services.postgres import PostgresStore
+    
+    order = []
+    with database.store.setup_lock():
+        # A second process starting now blocks before touching the schema.
+        starting = threading.Thread(target=lambda: order.append(PostgresStore(database.database_url).close()))
+        starting.start()
+        starting.join(timeout=1)
+        assert starting.is_alive()
+        order.append("held")
+    starting.join(timeout=30)
+    assert order == ["held", None]
+
+
+def test_created_folder_is_granted_to_its_creator(make_user):
+    user, _ = make_user()
+    folder = database.create_folder("Granted", created_by=user.id)
+    assert database.get_folder_permission(folder.id, user.id) == FolderPermission.ADMIN
+    assert [access.user_id for access in folder.access_list] == [user.id]
+
+
+def test_blob_locks_are_shared_between_processes():
+    import psycopg
+    from app.services.postgres import BLOB_LOCKS
+    
+    def try_lock(key):
+        with psycopg.connect(database.database_url, autocommit=True) as conn:
+            return conn.execute("SELECT pg_try_advisory_lock(%s, hashtext(%s))", [BLOB_LOCKS, key]).fetchone()[0]
+    
+    with database.store.lock_blobs(["held-hash", "other-hash"]):
+        assert not try_lock("held-hash")
+        assert try_lock("free-hash")
+    assert try_lock("held-hash")
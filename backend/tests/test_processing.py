@@ -0,0 +1,55 @@
+import io
+import uuid
+from PIL import Image
+from app.services import processing
+from app.services.repository import repo
+from tests.conftest import wait_for
+
+
+def test_upload_derives_text_and_thumbnail(client, admin_headers, make_folder, upload, processed):
+    folder = make_folder("Processing")
+    word = f"zebra{uuid.uuid4().hex}"
+    image = io.BytesIO()
+    Image.new("RGB", (64, 48), "red").save(image, "PNG")
+    
+    text = upload(folder["id"], "notes.txt", f"quarterly {word} budget notes".encode(), "text/plain")
+    photo = upload(folder["id"], "photo.png", image.getvalue(), "image/png")
+    
+    text = processed(text["id"])
+    photo = processed(photo["id"])
+    assert text["processing_status"] == "completed"
+    assert "text" in text["artifacts"]
+    assert photo["processing_status"] == "completed"
+    assert "thumbnail" in photo["artifacts"]
+    
+    thumbnail = client.get(f"/api/documents/{photo['id']}/thumbnail", headers=admin_headers)
+    assert thumbnail.status_code == 200
+    assert thumbnail.content.startswith(b"\x89PNG")
+    
+    results = client.get("/api/documents/search", params={"q": word}, headers=admin_headers).json()
+    assert [document["id"] for document in results] == [text["id"]]
+
+
+def test_failure_of_a_replaced_version_is_not_recorded(client, admin_headers, make_folder, upload, processed,
+                                                        monkeypatch):
+    
+    folder = make_folder("Replaced")
+    document = processed(upload(folder["id"], "draft.txt", b"first draft", "text/plain")["id"])
+    
+    class ReplacedThenFailing:
+        @staticmethod
+        async def run_sync(func, path, file_type):
+            # A new version lands while the old one is being processed.
+            await repo.documents.add_version(
+                document["id"], file_path=f"{path}.replaced", file_type=file_type, file_size=1,
+                content_hash=None, created_by=document["created_by"]
+            )
+            raise RuntimeError("worker crashed")
+    
+    monkeypatch.setattr(processing, "to_process", ReplacedThenFailing)
+    assert client.post(f"/api/documents/{document['id']}/process", headers=admin_headers).status_code == 200
+    wait_for(lambda: not processing._jobs)
+    
+    current = client.get(f"/api/documents/{document['id']}", headers=admin_headers).json()
+    assert current["version"] == 2
+    assert current["processing_status"] != "failed"
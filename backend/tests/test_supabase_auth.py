@@ -0,0 +1,109 @@
+import time
+import uuid
+from datetime import datetime
+import anyio
+import httpx
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+from app.services import supabase_auth
+from app.services.supabase_auth import InvalidToken, SupabaseTokenVerifier
+
+JWKS_URL = "https://project.supabase.test/auth/v1/.well-known/jwks.json"
+
+
+def signing_key(kid):
+    private = rsa.generate_private_key(public_exponent=65537, key_size=2048).private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+    public = jwk.construct(private, "RS256").public_key().to_dict()
+    return private, {**public, "kid": kid, "alg": "RS256"}
+
+
+def token(key, kid=None, algorithm="RS256", **claims):
+    claims = {"sub": str(uuid.uuid4()), "aud": "authenticated", "exp": int(time.time()) + 300, **claims}
+    return jwt.encode(claims, key, algorithm=algorithm, headers={"kid": kid} if kid else None)
+
+
+@pytest.fixture
+def jwks(monkeypatch):
+    """A JWKS endpoint served in process; returns the published keys and the requests made."""
+    published, requests = [], []
+    
+    def handler(request):
+        requests.append(request.url)
+        return httpx.Response(200, json={"keys": published})
+    
+    client = httpx.AsyncClient
+    monkeypatch.setattr(
+        supabase_auth.httpx, "AsyncClient", lambda **kwargs: client(transport=httpx.MockTransport(handler), **kwargs)
+    )
+    return published, requests
+
+
+def test_tokens_are_verified_against_cached_signing_keys(jwks, monkeypatch):
+    published, requests = jwks
+    first_private, first_public = signing_key("first")
+    second_private, second_public = signing_key("second")
+    published.append(first_public)
+    verifier = SupabaseTokenVerifier(JWKS_URL, None, "authenticated")
+    
+    async def main():
+        await verifier.refresh_keys()
+        signed = token(first_private, "first")
+        assert (await verifier.claims(signed))["sub"] == jwt.get_unverified_claims(signed)["sub"]
+        await verifier.claims(signed)
+        assert len(requests) == 1
+        
+        # A rotated key is fetched once, on first sight.
+        monkeypatch.setattr(supabase_auth, "SUPABASE_JWKS_MIN_REFRESH", 0)
+        published.append(second_public)
+        await verifier.claims(token(second_private, "second"))
+        assert len(requests) == 2
+        
+        # Unknown keys do not trigger refreshes more often than the minimum interval.
+        monkeypatch.setattr(supabase_auth, "SUPABASE_JWKS_MIN_REFRESH", 60)
+        unknown_private, _ = signing_key("unknown")
+        with pytest.raises(InvalidToken):
+            await verifier.claims(token(unknown_private, "unknown"))
+        assert len(requests) == 2
+        
+        with pytest.raises(InvalidToken):
+            await verifier.claims(token(first_private, "first", aud="anon"))
+        with pytest.raises(InvalidToken):
+            await verifier.claims(token(first_private, "first", exp=int(time.time()) - 10))
+        with pytest.raises(InvalidToken):
+            await verifier.claims(token(second_private, "first"))
+    
+    anyio.run(main)
+
+
+def test_shared_secret_tokens_need_the_secret():
+    signed = token("project-secret", algorithm="HS256")
+    
+    with pytest.raises(InvalidToken):
+        anyio.run(SupabaseTokenVerifier(None, None, "authenticated").claims, signed)
+    claims = anyio.run(SupabaseTokenVerifier(None, "project-secret", "authenticated").claims, signed)
+    assert claims["sub"] == jwt.get_unverified_claims(signed)["sub"]
+
+
+def test_me_reads_the_profile_once(client, monkeypatch):
+    monkeypatch.setattr(supabase_auth.token_verifier, "jwt_secret", "project-secret")
+    signed = token("project-secret", algorithm="HS256")
+    user_id = jwt.get_unverified_claims(signed)["sub"]
+    fetched = []
+    
+    def fetch_profile(requested_id):
+        fetched.append(requested_id)
+        now = datetime.now().isoformat()
+        return {"id": requested_id, "username": "remote", "email": "remote@example.com", "role": "user",
+                "created_at": now, "updated_at": now}
+    monkeypatch.setattr(supabase_auth, "_fetch_profile", fetch_profile)
+    
+    for _ in range(2):
+        response = client.get("/api/me", headers={"Authorization": f"Bearer {signed}"})
+        assert response.status_code == 200, response.text
+        assert response.json()["id"] == user_id
+    assert fetched == [user_id]
+    assert client.get("/api/me", headers={"Authorization": "Bearer not-a-token"}).status_code == 401
@@ -0,0 +1,118 @@
+import os
+import time
+import uuid
+from datetime import datetime, timedelta
+import anyio
+from app.routers import documents as documents_router
+from app.services.storage import UPLOAD_SESSION_DIR, UPLOAD_SESSION_TTL
+from app.services.upload_sessions import sweep_upload_sessions
+
+
+def create_session(client, headers, folder_id, file_size):
+    response = client.post(
+        "/api/documents/uploads",
+        json={"name": "big.bin", "folder_id": folder_id, "file_type": "application/octet-stream",
+              "file_size": file_size},
+        headers=headers
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def put_chunk(client, headers, session, index, data):
+    return client.put(f"/api/documents/uploads/{session['id']}/chunks/{index}", content=data, headers=headers)
+
+
+def start_session(client, headers, folder_id, data):
+    session = create_session(client, headers, folder_id, len(data))
+    response = put_chunk(client, headers, session, 0, data)
+    assert response.status_code == 200, response.text
+    return session
+
+
+def test_chunks_resume_and_commit_into_a_document(client, admin_headers, make_folder, monkeypatch):
+    monkeypatch.setattr(documents_router, "UPLOAD_CHUNK_SIZE", 4)
+    folder = make_folder("Chunked")
+    data = uuid.uuid4().hex[:10].encode()
+    session = create_session(client, admin_headers, folder["id"], len(data))
+    assert (session["chunk_count"], session["received_chunks"]) == (3, [])
+    url = f"/api/documents/uploads/{session['id']}"
+    
+    for index in (0, 2):
+        response = put_chunk(client, admin_headers, session, index, data[index * 4:index * 4 + 4])
+        assert response.status_code == 200, response.text
+        assert response.json()["size"] == len(data[index * 4:index * 4 + 4])
+    
+    # A client that lost track of its progress asks which chunks arrived.
+    assert client.get(url, headers=admin_headers).json()["received_chunks"] == [0, 2]
+    response = client.post(f"{url}/commit", headers=admin_headers)
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Missing chunks: 1"
+    
+    assert put_chunk(client, admin_headers, session, 1, data[4:8]).status_code == 200
+    response = client.post(f"{url}/commit", headers=admin_headers)
+    assert response.status_code == 200, response.text
+    document = response.json()
+    assert (document["name"], document["file_size"]) == ("big.bin", len(data))
+    assert client.get(f"/api/documents/{document['id']}/content", headers=admin_headers).content == data
+    assert client.get(url, headers=admin_headers).status_code == 404
+    assert not os.path.exists(os.path.join(UPLOAD_SESSION_DIR, session["id"]))
+
+
+def test_chunks_of_the_wrong_size_are_rejected(client, admin_headers, make_folder, monkeypatch):
+    monkeypatch.setattr(documents_router, "UPLOAD_CHUNK_SIZE", 4)
+    folder = make_folder("Chunk sizes")
+    session = create_session(client, admin_headers, folder["id"], 10)
+    
+    assert put_chunk(client, admin_headers, session, 0, b"abc").status_code == 400
+    assert put_chunk(client, admin_headers, session, 0, b"abcde").status_code == 400
+    # The last chunk holds only what is left of the file.
+    assert put_chunk(client, admin_headers, session, 2, b"ijkl").status_code == 400
+    assert put_chunk(client, admin_headers, session, 3, b"mn").status_code == 400
+    
+    url = f"/api/documents/uploads/{session['id']}"
+    assert client.get(url, headers=admin_headers).json()["received_chunks"] == []
+    assert put_chunk(client, admin_headers, session, 2, b"ij").status_code == 200
+    assert client.get(url, headers=admin_headers).json()["received_chunks"] == [2]
+
+
+def test_abort_discards_the_session_and_its_chunks(client, admin_headers, make_folder, make_user):
+    folder = make_folder("Aborted")
+    session = start_session(client, admin_headers, folder["id"], b"abandoned")
+    url = f"/api/documents/uploads/{session['id']}"
+    
+    # Sessions belong to whoever started them.
+    _, other_headers = make_user()
+    assert client.delete(url, headers=other_headers).status_code == 404
+    
+    assert client.delete(url, headers=admin_headers).status_code == 204
+    assert client.get(url, headers=admin_headers).status_code == 404
+    assert client.post(f"{url}/commit", headers=admin_headers).status_code == 404
+    assert not os.path.exists(os.path.join(UPLOAD_SESSION_DIR, session["id"]))
+
+
+def test_sweep_removes_expired_sessions_and_their_chunks(client, admin_headers, make_folder):
+    folder = make_folder("Sessions")
+    session = start_session(client, admin_headers, folder["id"], b"partial")
+    url = f"/api/documents/uploads/{session['id']}"
+    chunks = os.path.join(UPLOAD_SESSION_DIR, session["id"])
+    
+    anyio.run(sweep_upload_sessions)
+    assert client.get(url, headers=admin_headers).json()["received_chunks"] == [0]
+    
+    expiry = datetime.fromisoformat(session["expires_at"])
+    assert anyio.run(sweep_upload_sessions, expiry + timedelta(seconds=1)) >= 1
+    assert client.get(url, headers=admin_headers).status_code == 404
+    assert not os.path.exists(chunks)
+
+
+def test_sweep_removes_chunks_without_a_session():
+    orphan = os.path.join(UPLOAD_SESSION_DIR, str(uuid.uuid4()))
+    os.makedirs(orphan)
+    with open(os.path.join(orphan, "00000000"), "wb") as chunk:
+        chunk.write(b"left behind")
+    idle = time.time() - UPLOAD_SESSION_TTL - 60
+    os.utime(orphan, (idle, idle))
+    
+    anyio.run(sweep_upload_sessions)
+    assert not os.path.exists(orphan)
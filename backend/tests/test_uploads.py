@@ -0,0 +1,80 @@
+import io
+import json
+import zipfile
+from app.routers import documents as documents_router
+from app.services import database, storage
+
+
+def zip_of(files):
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        for name, data in files.items():
+            zf.writestr(name, data)
+    return archive.getvalue()
+
+
+def batch_upload(client, headers, folder_id, files, **data):
+    response = client.post(
+        "/api/documents/batch",
+        files=[("files", file) for file in files],
+        data={"folder_id": folder_id, **data},
+        headers=headers
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_batch_upload_reports_failures_per_file(client, admin_headers, make_folder, monkeypatch):
+    folder = make_folder("Batch")
+    store_document = documents_router.store_document
+
+    async def failing_store_document(upload, name, **kwargs):
+        if name == "broken.txt":
+            raise RuntimeError("disk full")
+        return await store_document(upload, name=name, **kwargs)
+
+    monkeypatch.setattr(documents_router, "store_document", failing_store_document)
+    result = batch_upload(client, admin_headers, folder["id"], [
+        ("good.txt", b"good", "text/plain"),
+        ("broken.txt", b"broken", "text/plain"),
+    ], metadata=json.dumps({"tags": ["a"]}))
+
+    assert [document["name"] for document in result["documents"]] == ["good.txt"]
+    assert sorted(error["name"] for error in result["errors"]) == ["broken.txt"]
+
+
+def test_batch_upload_gives_each_document_its_own_metadata(client, admin_headers, make_folder):
+    folder = make_folder("Batch metadata")
+    result = batch_upload(client, admin_headers, folder["id"], [
+        ("one.txt", b"one", "text/plain"),
+        ("two.txt", b"two", "text/plain"),
+    ], metadata=json.dumps({"tags": ["shared"]}))
+
+    documents = [database.get_document_by_id(document["id"]) for document in result["documents"]]
+    assert documents[0].metadata == documents[1].metadata == {"tags": ["shared"]}
+    assert documents[0].metadata is not documents[1].metadata
+
+
+def test_archive_member_count_is_capped(client, admin_headers, make_folder, monkeypatch):
+    monkeypatch.setattr(storage, "MAX_ARCHIVE_MEMBERS", 2)
+    folder = make_folder("Archive members")
+    archive = zip_of({"a.txt": b"a", "b.txt": b"b", "c.txt": b"c", "d.txt": b"d"})
+
+    result = batch_upload(
+        client, admin_headers, folder["id"], [("files.zip", archive, "application/zip")], extract_archives="true"
+    )
+    assert sorted(document["name"] for document in result["documents"]) == ["a.txt", "b.txt"]
+    assert [error["name"] for error in result["errors"]] == ["c.txt"]
+
+
+def test_archive_total_size_is_capped(client, admin_headers, make_folder, monkeypatch):
+    monkeypatch.setattr(storage, "MAX_ARCHIVE_SIZE", 1500)
+    folder = make_folder("Archive size")
+    archive = zip_of({"a.txt": b"a" * 1000, "b.txt": b"b" * 1000, "c.txt": b"c" * 10})
+
+    result = batch_upload(
+        client, admin_headers, folder["id"], [("files.zip", archive, "application/zip")], extract_archives="true"
+    )
+    assert [document["name"] for document in result["documents"]] == ["a.txt"]
+    assert [error["name"] for error in result["errors"]] == ["b.txt"]
+    assert "Archive expands beyond" in result["errors"][0]["detail"]
@@ -65,6 +65,11 @@ export const getFolders = async (parentId?: string) => {
   return response.data;
 };
 
+export const getFolderTree = async (rootId?: string, depth?: number) => {
+  const response = await api.get('/folders/tree', { params: { root_id: rootId, depth } });
+  return response.data;
+};
+
 export const getFolder = async (folderId: string) => {
   const response = await api.get(`/folders/${folderId}`);
   return response.data;
@@ -80,11 +85,26 @@ export const updateFolder = async (folderId: string, folderData: any) => {
   return response.data;
 };
 
+export const moveFolder = async (folderId: string, parentId?: string) => {
+  const response = await api.post(`/folders/${folderId}/move`, { parent_id: parentId ?? null });
+  return response.data;
+};
+
+export const copyFolder = async (folderId: string, parentId?: string, name?: string) => {
+  const response = await api.post(`/folders/${folderId}/copy`, { parent_id: parentId ?? null, name });
+  return response.data;
+};
+
 export const deleteFolder = async (folderId: string) => {
   const response = await api.delete(`/folders/${folderId}`);
   return response.data;
 };
 
+export const getFolderJob = async (jobId: string) => {
+  const response = await api.get(`/folders/jobs/${jobId}`);
+  return response.data;
+};
+
 export const addFolderAccess = async (folderId: string, accessData: { user_id: string; permission: string }) => {
   const response = await api.post(`/folders/${folderId}/access`, accessData);
   return response.data;
@@ -124,6 +144,13 @@ export const uploadDocument = async (file: File, folderId: string, metadata?: an
   return response.data;
 };
 
+export const downloadDocument = async (documentId: string) => {
+  const response = await api.get(`/documents/${documentId}/content`, {
+    responseType: 'blob',
+  });
+  return response.data as Blob;
+};
+
 export const updateDocument = async (documentId: string, documentData: any) => {
   const response = await api.put(`/documents/${documentId}`, documentData);
   return response.data;
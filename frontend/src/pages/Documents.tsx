@@ -1,5 +1,5 @@
 import React, { useEffect, useState } from 'react';
-import { getDocuments, uploadDocument, deleteDocument } from '../lib/api';
+import { getDocuments, uploadDocument, deleteDocument, downloadDocument } from '../lib/api';
 import { Button } from '../components/ui/button';
 import { Card, CardContent, CardHeader, CardTitle } from '../components/ui/card';
 import { Dialog, DialogContent, DialogHeader, DialogTitle, DialogTrigger } from '../components/ui/dialog';
@@ -93,6 +93,17 @@ export const Documents: React.FC = () => {
     }
   };
 
+  const handleDownload = async (document: Document) => {
+    try {
+      const blob = await downloadDocument(document.id);
+      const url = URL.createObjectURL(blob);
+      window.open(url, '_blank', 'noopener,noreferrer');
+      setTimeout(() => URL.revokeObjectURL(url), 60000);
+    } catch (error) {
+      console.error('Error downloading document:', error);
+    }
+  };
+
   const formatFileSize = (bytes: number) => {
     if (bytes === 0) return '0 Bytes';
     const k = 1024;
@@ -187,11 +198,9 @@ export const Documents: React.FC = () => {
                   <p>Created: {new Date(document.created_at).toLocaleDateString()}</p>
                 </div>
                 <div className="flex space-x-2 mt-4">
-                  <Button variant="outline" size="sm" asChild>
-                    <a href={`${import.meta.env.VITE_API_URL || 'http://localhost:8000'}${document.file_path.replace('uploads', '/uploads')}`} target="_blank" rel="noopener noreferrer">
-                      <DownloadIcon className="mr-1 h-4 w-4" />
-                      Download
-                    </a>
+                  <Button variant="outline" size="sm" onClick={() => handleDownload(document)}>
+                    <DownloadIcon className="mr-1 h-4 w-4" />
+                    Download
                   </Button>
                   <Button variant="outline" size="sm" onClick={() => handleDelete(document.id)}>
                     <TrashIcon className="mr-1 h-4 w-4" />